@@ -395,7 +395,8 @@ export const getSkillDetail = async (
 export const getClusters = async (
   configName?: string
 ): Promise<ClusteringResponse> => {
-  const params = configName ? { config: configName } : undefined;
+  // all_skills is only returned on request (shown in the expandable lists)
+  const params = configName ? { config: configName, include_skills: true } : { include_skills: true };
   const response = await api.get('/api/clusters', { params });
   return response.data;
 };
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Measure bytes on the wire and latency of the dashboard's page loads.
+
+Replays the requests the frontend issues when the dashboard (and clusters
+page) is opened, in parallel like the browser does, under four scenarios:
+
+    identity     no compression (Accept-Encoding: identity)
+    gzip         Accept-Encoding: gzip
+    br           Accept-Encoding: br
+    revisit      br + If-None-Match with the ETags of the previous load
+                 (304 Not Modified while the data is unchanged)
+
+Every scenario reports bytes received (compressed body as sent) and
+p50/p95 latency per request and per full page load (all requests in
+parallel). Results are written to outputs/benchmarks/dashboard_payloads/.
+
+Usage:
+    python scripts/benchmark_dashboard_payloads.py --base-url http://localhost:8000 --loads 50
+"""
+
+import json
+import time
+import asyncio
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+# (name, path, params) — what frontend/app/page.tsx and clusters/page.tsx load
+DASHBOARD_REQUESTS: List[Tuple[str, str, Dict[str, Any]]] = [
+    ('stats', '/api/stats', {}),
+    ('stats/filtered', '/api/stats/filtered', {'country': 'CO', 'extraction_method': 'pipeline_a'}),
+    ('stats/by-country', '/api/stats/by-country', {}),
+    ('skills/top', '/api/skills/top', {'limit': 15}),
+    ('temporal/skills', '/api/temporal/skills', {}),
+    ('clusters', '/api/clusters', {'include_skills': 'true'}),
+]
+
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    'identity': {'accept_encoding': 'identity', 'conditional': False},
+    'gzip': {'accept_encoding': 'gzip', 'conditional': False},
+    'br': {'accept_encoding': 'br', 'conditional': False},
+    'revisit': {'accept_encoding': 'br, gzip', 'conditional': True},
+}
+
+
+def latency_stats(latencies_ms: List[float]) -> Dict[str, Optional[float]]:
+    if not latencies_ms:
+        return {'p50_ms': None, 'p95_ms': None}
+    arr = np.asarray(latencies_ms)
+    return {
+        'p50_ms': round(float(np.percentile(arr, 50)), 3),
+        'p95_ms': round(float(np.percentile(arr, 95)), 3)
+    }
+
+
+async def fetch(client: httpx.AsyncClient, path: str, params: Dict[str, Any],
+                headers: Dict[str, str]) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    async with client.stream('GET', path, params=params, headers=headers) as response:
+        # Raw bytes as sent on the wire (before decompression)
+        wire_bytes = 0
+        async for chunk in response.aiter_raw():
+            wire_bytes += len(chunk)
+    return {
+        'status': response.status_code,
+        'bytes': wire_bytes,
+        'ms': (time.perf_counter() - t0) * 1000,
+        'etag': response.headers.get('etag'),
+        'encoding': response.headers.get('content-encoding', 'identity')
+    }
+
+
+async def run_scenario(base_url: str, scenario: str, loads: int, timeout: float) -> Dict[str, Any]:
+    config = SCENARIOS[scenario]
+    samples: Dict[str, List[Dict[str, Any]]] = {name: [] for name, *_ in DASHBOARD_REQUESTS}
+    page_ms: List[float] = []
+    page_bytes: List[int] = []
+    etags: Dict[str, str] = {}
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+        if config['conditional']:
+            # First visit: collect the validators
+            for name, path, params in DASHBOARD_REQUESTS:
+                result = await fetch(client, path, params, {'Accept-Encoding': config['accept_encoding']})
+                if result['etag']:
+                    etags[name] = result['etag']
+
+        for _ in range(loads):
+            headers = {name: {'Accept-Encoding': config['accept_encoding']} for name, *_ in DASHBOARD_REQUESTS}
+            for name, etag in etags.items():
+                headers[name]['If-None-Match'] = etag
+
+            t0 = time.perf_counter()
+            results = await asyncio.gather(*(
+                fetch(client, path, params, headers[name]) for name, path, params in DASHBOARD_REQUESTS
+            ))
+            page_ms.append((time.perf_counter() - t0) * 1000)
+            page_bytes.append(sum(r['bytes'] for r in results))
+            for (name, *_), result in zip(DASHBOARD_REQUESTS, results):
+                samples[name].append(result)
+
+    return {
+        'scenario': scenario,
+        'loads': loads,
+        'page': {
+            'bytes': int(np.median(page_bytes)) if page_bytes else None,
+            **latency_stats(page_ms)
+        },
+        'by_request': {
+            name: {
+                'bytes': int(np.median([r['bytes'] for r in results])) if results else None,
+                'status': sorted({r['status'] for r in results}),
+                'encoding': sorted({r['encoding'] for r in results}),
+                **latency_stats([r['ms'] for r in results])
+            }
+            for name, results in samples.items()
+        }
+    }
+
+
+def print_scenario(result: Dict[str, Any], baseline_bytes: Optional[int]):
+    page = result['page']
+    saved = f"({(1 - page['bytes'] / baseline_bytes) * 100:.0f}% smaller)" if baseline_bytes and page['bytes'] is not None else ''
+    print(f"\n   {result['scenario']:<10} page: {page['bytes']:>10,} bytes {saved:<16} "
+          f"p50={page['p50_ms']}ms p95={page['p95_ms']}ms")
+    for name, stats in result['by_request'].items():
+        print(f"      {name:<20} {stats['bytes']:>10,} bytes  status={stats['status']} "
+              f"{','.join(stats['encoding']):<9} p50={stats['p50_ms']}ms p95={stats['p95_ms']}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard payload sizes and latency")
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--loads', type=int, default=50, help='Page loads per scenario')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='Comma-separated scenarios')
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--output-dir', default='outputs/benchmarks/dashboard_payloads')
+    args = parser.parse_args()
+
+    scenarios = args.scenarios.split(',')
+
+    print("=" * 80)
+    print(f"DASHBOARD PAYLOAD BENCHMARK → {args.base_url} ({args.loads} page loads per scenario)")
+    print("=" * 80)
+
+    results = []
+    baseline_bytes = None
+    for scenario in scenarios:
+        result = asyncio.run(run_scenario(args.base_url, scenario, args.loads, args.timeout))
+        if scenario == 'identity':
+            baseline_bytes = result['page']['bytes']
+        results.append(result)
+        print_scenario(result, baseline_bytes)
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'parameters': {'base_url': args.base_url, 'loads': args.loads, 'scenarios': scenarios},
+        'requests': [{'request': name, 'path': path, 'params': params} for name, path, params in DASHBOARD_REQUESTS],
+        'results': results
+    }
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"dashboard_payloads_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print()
+    print("=" * 80)
+    print(f"✅ Report saved: {output_path}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
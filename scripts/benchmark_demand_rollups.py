@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Benchmark the skill demand rollups (migration 015) behind /api/skills and /api/stats.
+
+For each scale (default 1× and 10× today's data):
+    1. Copy raw_jobs, cleaned_jobs and the three skill tables into a scratch
+       schema, each job repeated ``scale`` times under new job_ids (same skills,
+       countries and dates), with the same indexes as the live tables.
+    2. Build the rollups there with rebuild_demand_rollups() (backfill time).
+    3. Call the endpoint functions (response cache disabled) against the
+       scratch schema and record p50/p95 latency per request type; run the
+       queries the endpoints issued before the rollups for comparison.
+
+Results are written to outputs/benchmarks/demand_rollups/.
+
+Usage:
+    python scripts/benchmark_demand_rollups.py
+    python scripts/benchmark_demand_rollups.py --scales 1,10,30 --repeats 50
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Callable, Awaitable
+
+import numpy as np
+import psycopg2
+from sqlalchemy import text
+
+# Measure the queries, not the response cache
+os.environ['API_CACHE_ENABLED'] = 'false'
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.config.settings import get_settings
+from src.database.demand_rollup import rebuild_demand_rollups, COUNTS_TABLE, PROFILE_TABLE
+from database.async_operations import AsyncDatabase
+from api.routers.stats import get_general_stats, get_filtered_stats, get_stats_by_country
+from api.routers.skills import get_top_skills, search_skills, get_skills_by_type
+
+SCRATCH_TABLES = {
+    'raw_jobs': """
+        SELECT md5(r.job_id::text || k)::uuid AS job_id, r.portal, r.country, r.posted_date, r.scraped_at
+        FROM public.raw_jobs r CROSS JOIN generate_series(1, %(scale)s) k
+    """,
+    'cleaned_jobs': """
+        SELECT md5(c.job_id::text || k)::uuid AS job_id
+        FROM public.cleaned_jobs c CROSS JOIN generate_series(1, %(scale)s) k
+    """,
+    'extracted_skills': """
+        SELECT md5(s.job_id::text || k)::uuid AS job_id, s.skill_text, s.skill_type,
+               s.extraction_method, s.esco_uri, s.extracted_at
+        FROM public.extracted_skills s CROSS JOIN generate_series(1, %(scale)s) k
+    """,
+    'enhanced_skills': """
+        SELECT md5(s.job_id::text || k)::uuid AS job_id, s.normalized_skill, s.skill_type,
+               s.esco_concept_uri, s.llm_model
+        FROM public.enhanced_skills s CROSS JOIN generate_series(1, %(scale)s) k
+    """,
+    'gold_standard_annotations': """
+        SELECT md5(s.job_id::text || k)::uuid AS job_id, s.skill_text, s.skill_type, s.esco_concept_uri
+        FROM public.gold_standard_annotations s CROSS JOIN generate_series(1, %(scale)s) k
+    """,
+}
+
+# Same indexes as migrations 001/008/014 on the live tables
+SCRATCH_INDEXES = [
+    "ALTER TABLE raw_jobs ADD PRIMARY KEY (job_id)",
+    "CREATE INDEX ON raw_jobs (country)",
+    "ALTER TABLE cleaned_jobs ADD PRIMARY KEY (job_id)",
+    "CREATE INDEX ON extracted_skills (job_id)",
+    "CREATE INDEX ON extracted_skills (skill_type)",
+    "CREATE INDEX ON extracted_skills (extraction_method)",
+    "CREATE INDEX ON enhanced_skills (job_id)",
+    "CREATE INDEX ON gold_standard_annotations (job_id)",
+    "CREATE INDEX ON gold_standard_annotations (skill_text)",
+]
+
+# (name, endpoint, arguments) — every argument is passed (FastAPI Query defaults are not values)
+REQUESTS = [
+    ('stats', get_general_stats, {}),
+    ('stats/filtered', get_filtered_stats,
+     dict(country=None, job_status=None, extraction_method=None, mapping_status=None, skill_type=None)),
+    ('stats/filtered?country&method', get_filtered_stats,
+     dict(country='CO', job_status=None, extraction_method='pipeline_a', mapping_status='esco_mapped', skill_type=None)),
+    ('stats/filtered?job_status', get_filtered_stats,
+     dict(country='MX', job_status='cleaned', extraction_method='pipeline_b', mapping_status=None, skill_type='hard')),
+    ('stats/by-country', get_stats_by_country,
+     dict(extraction_method='ner', job_status=None, mapping_status=None, skill_type=None)),
+    ('skills/top', get_top_skills,
+     dict(country=None, skill_type=None, extraction_method=None, mapping_status=None, limit=20)),
+    ('skills/top?country&type', get_top_skills,
+     dict(country='CO', skill_type='hard', extraction_method='pipeline_a', mapping_status=None, limit=50)),
+    ('skills/search', search_skills,
+     dict(query='python', country=None, skill_type=None, extraction_method=None, mapping_status=None,
+          page=1, page_size=50, cursor=None, exact=False)),
+    ('skills/by-type', get_skills_by_type, dict(country='AR')),
+]
+
+# What the endpoints ran before the rollups (main statement of each)
+LEGACY_QUERIES = {
+    'skills/top?country&type': """
+        SELECT es.skill_text, es.skill_type, es.esco_uri, COUNT(es.skill_text) AS count
+        FROM extracted_skills es JOIN raw_jobs rj ON es.job_id = rj.job_id
+        WHERE rj.country = 'CO' AND es.skill_type = 'hard' AND es.extraction_method IN ('ner', 'regex')
+        GROUP BY es.skill_text, es.skill_type, es.esco_uri
+        ORDER BY count DESC LIMIT 50
+    """,
+    'skills/search': """
+        SELECT skill_text, skill_type, esco_uri, COUNT(skill_text) AS count
+        FROM extracted_skills WHERE skill_text ILIKE '%python%'
+        GROUP BY skill_text, skill_type, esco_uri ORDER BY count DESC LIMIT 50 OFFSET 0
+    """,
+    'stats/filtered?country&method': """
+        SELECT COUNT(*), COUNT(DISTINCT es.skill_text), COUNT(DISTINCT es.job_id)
+        FROM extracted_skills es JOIN raw_jobs rj ON es.job_id = rj.job_id
+        WHERE rj.country = 'CO' AND es.extraction_method IN ('ner', 'regex') AND es.esco_uri IS NOT NULL
+    """,
+    'stats/by-country': """
+        SELECT rj.country, COUNT(*), COUNT(DISTINCT es.skill_text)
+        FROM extracted_skills es JOIN raw_jobs rj ON es.job_id = rj.job_id
+        WHERE es.extraction_method = 'ner'
+        GROUP BY rj.country
+    """,
+}
+
+
+def latency_stats(latencies_ms: List[float]) -> Dict[str, float]:
+    arr = np.asarray(latencies_ms)
+    return {
+        'mean_ms': round(float(arr.mean()), 3),
+        'p50_ms': round(float(np.percentile(arr, 50)), 3),
+        'p95_ms': round(float(np.percentile(arr, 95)), 3),
+        'p99_ms': round(float(np.percentile(arr, 99)), 3)
+    }
+
+
+async def timed(call: Callable[[], Awaitable[Any]], repeats: int) -> Dict[str, float]:
+    await call()  # warm-up (plans, buffers)
+    latencies = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return latency_stats(latencies)
+
+
+async def benchmark_requests(schema: str, repeats: int) -> List[Dict[str, Any]]:
+    """Await the (async) endpoints against the scratch schema."""
+    db = AsyncDatabase(get_settings().database_url, pool_size=1, max_overflow=0,
+                       statement_timeout_ms=0, search_path=f"{schema},public")
+    requests = []
+    try:
+        async with db.session() as session:
+            for name, endpoint, kwargs in REQUESTS:
+                rollup = await timed(lambda: endpoint(**kwargs, db=session), repeats)
+                legacy = None
+                if name in LEGACY_QUERIES:
+                    sql = text(LEGACY_QUERIES[name])
+                    legacy = await timed(lambda: session.execute(sql), repeats)
+                requests.append({'request': name, 'rollup': rollup, 'legacy': legacy})
+                print(f"   {name:<32} p50={rollup['p50_ms']:>8}ms p95={rollup['p95_ms']:>8}ms"
+                      + (f"   (before: p95={legacy['p95_ms']}ms)" if legacy else ''))
+    finally:
+        await db.dispose()
+    return requests
+
+
+def build_scratch_schema(conn, schema: str, scale: int) -> Dict[str, Any]:
+    cursor = conn.cursor()
+    cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+    cursor.execute(f"CREATE SCHEMA {schema}")
+    cursor.execute(f"SET search_path TO {schema}, public")
+
+    row_counts = {}
+    copy_start = time.time()
+    for table, select in SCRATCH_TABLES.items():
+        cursor.execute(f"CREATE TABLE {schema}.{table} AS {select}", {'scale': scale})
+        row_counts[table] = cursor.rowcount
+    for statement in SCRATCH_INDEXES:
+        cursor.execute(statement)
+    for table in (COUNTS_TABLE, PROFILE_TABLE):
+        cursor.execute(f"CREATE TABLE {schema}.{table} (LIKE public.{table} INCLUDING ALL)")
+    conn.commit()
+    copy_seconds = time.time() - copy_start
+
+    summaries = rebuild_demand_rollups(conn)
+    for table in list(SCRATCH_TABLES) + [COUNTS_TABLE, PROFILE_TABLE]:
+        cursor.execute(f"ANALYZE {schema}.{table}")
+    conn.commit()
+
+    cursor.execute(f"SELECT COUNT(*) FROM {schema}.{COUNTS_TABLE}")
+    row_counts[COUNTS_TABLE] = cursor.fetchone()[0]
+    cursor.execute(f"SELECT COUNT(*) FROM {schema}.{PROFILE_TABLE}")
+    row_counts[PROFILE_TABLE] = cursor.fetchone()[0]
+    cursor.close()
+
+    return {
+        'rows': row_counts,
+        'copy_seconds': round(copy_seconds, 1),
+        'rebuild_seconds': round(sum(s['seconds'] for s in summaries), 1)
+    }
+
+
+def benchmark_scale(conn, scale: int, args) -> Dict[str, Any]:
+    schema = f"bench_demand_x{scale}"
+    print(f"\n{'=' * 80}")
+    print(f"SCALE: {scale}× ({schema})")
+    print('=' * 80)
+
+    build = build_scratch_schema(conn, schema, scale)
+    rows = build['rows']
+    print(f"   Skills: {rows['extracted_skills']:,} extracted, {rows['enhanced_skills']:,} enhanced, "
+          f"{rows['gold_standard_annotations']:,} gold; jobs: {rows['raw_jobs']:,}")
+    print(f"   Rollups: {rows[COUNTS_TABLE]:,} skill rows, {rows[PROFILE_TABLE]:,} job profile rows "
+          f"(rebuild {build['rebuild_seconds']}s)")
+
+    requests = asyncio.run(benchmark_requests(schema, args.repeats))
+
+    if not args.keep_schema:
+        cursor = conn.cursor()
+        cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+        conn.commit()
+        cursor.close()
+
+    return {'scale': scale, **build, 'requests': requests}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /api/skills and /api/stats on the demand rollups")
+    parser.add_argument('--scales', default='1,10', help='Comma-separated data multipliers')
+    parser.add_argument('--repeats', type=int, default=30, help='Timed calls per request type')
+    parser.add_argument('--keep-schema', action='store_true', help='Keep scratch schemas after the run')
+    parser.add_argument('--output-dir', default='outputs/benchmarks/demand_rollups')
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(',')]
+
+    print("=" * 80)
+    print("SKILL DEMAND ROLLUP BENCHMARK")
+    print("=" * 80)
+
+    conn = psycopg2.connect(get_settings().database_url)
+    results = [benchmark_scale(conn, scale, args) for scale in scales]
+    conn.close()
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'parameters': {'scales': scales, 'repeats': args.repeats},
+        'results': results
+    }
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"demand_rollups_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print()
+    print(f"{'Request':<32}" + ''.join(f"{f'p95 {s}x':>12}{f'before {s}x':>12}" for s in scales))
+    for i, (name, _, _) in enumerate(REQUESTS):
+        line = f"{name:<32}"
+        for r in results:
+            entry = r['requests'][i]
+            line += f"{entry['rollup']['p95_ms']:>12}{(entry['legacy'] or {}).get('p95_ms', '-'):>12}"
+        print(line)
+
+    print()
+    print("=" * 80)
+    print(f"✅ Report saved: {output_path}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/jobs?search= full-text search (migration 019) against the ILIKE path it replaced.
+
+Runs on the full live corpus (read-only). For each search term:
+    - full-text: get_jobs() as served (tsquery on cleaned_jobs.search_vector,
+      ranked, estimated total), first page and a cursor page
+    - ILIKE: the queries /jobs issued before (COUNT + ORDER BY scraped_at
+      OFFSET/LIMIT over raw_jobs title/description/company)
+and records p50/p95 latency plus how many jobs each path matches.
+
+Results are written to outputs/benchmarks/job_search/.
+
+Usage:
+    python scripts/benchmark_job_search.py
+    python scripts/benchmark_job_search.py --terms "python,analista de datos,desarroll*" --repeats 50
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Callable, Awaitable
+
+import numpy as np
+from sqlalchemy import text
+
+# Measure the queries, not the response cache
+os.environ['API_CACHE_ENABLED'] = 'false'
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.config.settings import get_settings
+from api.routers.jobs import get_jobs
+from database.async_operations import AsyncDatabase
+
+DEFAULT_TERMS = [
+    'python',
+    'java',
+    'analista de datos',
+    'gestión de proyectos',
+    'ingeniero',
+    'desarroll*',
+    'react OR angular',
+]
+
+LEGACY_COUNT = """
+    SELECT COUNT(*) FROM raw_jobs
+    WHERE title ILIKE :pattern OR description ILIKE :pattern OR company ILIKE :pattern
+"""
+LEGACY_PAGE = """
+    SELECT * FROM raw_jobs
+    WHERE title ILIKE :pattern OR description ILIKE :pattern OR company ILIKE :pattern
+    ORDER BY scraped_at DESC
+    OFFSET :offset LIMIT 50
+"""
+
+
+def latency_stats(latencies_ms: List[float]) -> Dict[str, float]:
+    arr = np.asarray(latencies_ms)
+    return {
+        'mean_ms': round(float(arr.mean()), 3),
+        'p50_ms': round(float(np.percentile(arr, 50)), 3),
+        'p95_ms': round(float(np.percentile(arr, 95)), 3),
+        'p99_ms': round(float(np.percentile(arr, 99)), 3)
+    }
+
+
+async def timed(call: Callable[[], Awaitable[Any]], repeats: int) -> Dict[str, float]:
+    await call()  # warm-up (plans, buffers)
+    latencies = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return latency_stats(latencies)
+
+
+async def search_page(session, term: str, cursor=None, exact: bool = False):
+    return await get_jobs(
+        country=None, portal=None, job_status=None, limit=50, offset=0,
+        cursor=cursor, exact=exact, search=term, sort=None, db=session
+    )
+
+
+async def legacy_search(session, pattern: str):
+    total = (await session.execute(text(LEGACY_COUNT), {'pattern': pattern})).scalar()
+    await session.execute(text(LEGACY_PAGE), {'pattern': pattern, 'offset': 0})
+    return total
+
+
+async def benchmark_term(session, term: str, repeats: int) -> Dict[str, Any]:
+    first = await search_page(session, term, exact=True)
+    fulltext = await timed(lambda: search_page(session, term), repeats)
+    fulltext_next = None
+    if first.next_cursor:
+        fulltext_next = await timed(lambda: search_page(session, term, cursor=first.next_cursor), repeats)
+
+    # ILIKE has no prefix/phrase syntax: search the plain words
+    pattern = f"%{term.replace('*', '').replace(' OR ', ' ')}%"
+    legacy_total = await legacy_search(session, pattern)
+    legacy = await timed(lambda: legacy_search(session, pattern), repeats)
+
+    return {
+        'term': term,
+        'fulltext': fulltext,
+        'fulltext_next_page': fulltext_next,
+        'ilike': legacy,
+        'matches': {'fulltext': first.total, 'ilike': legacy_total},
+    }
+
+
+async def run(terms: List[str], repeats: int):
+    db = AsyncDatabase(get_settings().database_url, pool_size=1, max_overflow=0, statement_timeout_ms=0)
+    try:
+        async with db.session() as session:
+            corpus = {
+                'raw_jobs': (await session.execute(text("SELECT COUNT(*) FROM raw_jobs"))).scalar(),
+                'cleaned_jobs': (await session.execute(text("SELECT COUNT(*) FROM cleaned_jobs"))).scalar(),
+                'without_search_vector': (await session.execute(
+                    text("SELECT COUNT(*) FROM cleaned_jobs WHERE search_vector IS NULL")
+                )).scalar(),
+            }
+            print(f"   Jobs: {corpus['raw_jobs']:,} raw, {corpus['cleaned_jobs']:,} cleaned "
+                  f"({corpus['without_search_vector']:,} without search_vector)\n")
+
+            results = []
+            for term in terms:
+                result = await benchmark_term(session, term, repeats)
+                results.append(result)
+                print(f"   {term:<24} full-text p95={result['fulltext']['p95_ms']:>8}ms "
+                      f"({result['matches']['fulltext']:,} jobs)   "
+                      f"ILIKE p95={result['ilike']['p95_ms']:>8}ms ({result['matches']['ilike']:,} jobs)")
+    finally:
+        await db.dispose()
+    return corpus, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /api/jobs full-text search against ILIKE")
+    parser.add_argument('--terms', default=','.join(DEFAULT_TERMS), help='Comma-separated search terms')
+    parser.add_argument('--repeats', type=int, default=30, help='Timed calls per term and path')
+    parser.add_argument('--output-dir', default='outputs/benchmarks/job_search')
+    args = parser.parse_args()
+
+    terms = [t.strip() for t in args.terms.split(',') if t.strip()]
+
+    print("=" * 80)
+    print("JOB SEARCH BENCHMARK (full-text vs ILIKE)")
+    print("=" * 80)
+
+    corpus, results = asyncio.run(run(terms, args.repeats))
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'parameters': {'terms': terms, 'repeats': args.repeats},
+        'corpus': corpus,
+        'results': results
+    }
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"job_search_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print()
+    print("=" * 80)
+    print(f"✅ Report saved: {output_path}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Benchmark micro-cluster mode (MicroClusterer) at million scale.
+
+For each corpus size (default 100k, 1M and 5M skills, 768D):
+    1. Write a scratch .npy matrix in chunks: perturbed copies of real skill
+       embeddings from an embedding snapshot, or (--synthetic) a random
+       Gaussian mixture. Occurrence counts follow a Zipf law, like real
+       skill demand. --storage int8 writes codes + scales, like an int8
+       snapshot (4x smaller file).
+    2. Run MicroClusterer.fit_predict on the memory-mapped matrix in a fresh
+       process and record wall time per stage, peak RSS and peak
+       numpy/Python allocations (tracemalloc). Mapped file pages are not
+       allocations, so the traced peak is what the method itself holds.
+    3. With --synthetic, report ARI against the generating mixture component.
+
+Results are written to outputs/benchmarks/microclustering/.
+
+Usage:
+    python scripts/benchmark_microclustering.py
+    python scripts/benchmark_microclustering.py --sizes 100000,1000000 --synthetic
+    python scripts/benchmark_microclustering.py --sizes 5000000 --storage int8 --method birch
+"""
+
+import sys
+import json
+import time
+import shutil
+import argparse
+import resource
+import tracemalloc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.embedder.compression import l2_normalize, quantize_int8
+from src.embedder.snapshot import load_snapshot
+
+GENERATE_CHUNK_SIZE = 50_000
+N_SYNTHETIC_CENTERS = 40
+
+
+def write_corpus(n: int, dim: int, seeds: Optional[np.ndarray], storage: str,
+                 work_dir: Path, rng: np.random.Generator) -> Dict[str, Path]:
+    """Write embeddings (+ scales), frequencies and generating component to work_dir."""
+    if seeds is None:
+        centers = l2_normalize(rng.standard_normal((N_SYNTHETIC_CENTERS, dim)).astype(np.float32))
+        noise = 0.5
+    else:
+        centers = seeds
+        noise = 0.05
+
+    paths = {
+        'embeddings': work_dir / 'embeddings.npy',
+        'scales': work_dir / 'scales.npy',
+        'frequencies': work_dir / 'frequencies.npy',
+        'components': work_dir / 'components.npy'
+    }
+    dtype = np.int8 if storage == 'int8' else np.float32
+    matrix = np.lib.format.open_memmap(paths['embeddings'], mode='w+', dtype=dtype, shape=(n, dim))
+    scales = np.empty(n, dtype=np.float32) if storage == 'int8' else None
+    components = np.empty(n, dtype=np.int32)
+
+    for start in range(0, n, GENERATE_CHUNK_SIZE):
+        size = min(GENERATE_CHUNK_SIZE, n - start)
+        picks = rng.integers(0, len(centers), size)
+        chunk = l2_normalize(
+            centers[picks] + noise * rng.standard_normal((size, dim)).astype(np.float32) / np.sqrt(dim)
+        )
+        if scales is not None:
+            matrix[start:start + size], scales[start:start + size] = quantize_int8(chunk)
+        else:
+            matrix[start:start + size] = chunk
+        components[start:start + size] = picks
+        print(f"   Written {start + size:,}/{n:,}", end='\r')
+    print()
+
+    matrix.flush()
+    del matrix
+    if scales is not None:
+        np.save(paths['scales'], scales)
+    else:
+        paths.pop('scales')
+    np.save(paths['frequencies'], np.minimum(rng.zipf(1.6, n), 100_000).astype(np.int64))
+    np.save(paths['components'], components)
+    return paths
+
+
+def run_fit(paths: Dict[str, str], params: Dict[str, Any], synthetic: bool) -> Dict[str, Any]:
+    """Child process: fit on the mapped matrix, report timings and memory."""
+    from sklearn.metrics import adjusted_rand_score
+    from src.analyzer.microclustering import MicroClusterer
+
+    embeddings = np.load(paths['embeddings'], mmap_mode='r')
+    scales = np.load(paths['scales'], mmap_mode='r') if 'scales' in paths else None
+    frequencies = np.load(paths['frequencies'])
+
+    tracemalloc.start()
+    micro = MicroClusterer(**params)
+    labels = micro.fit_predict(embeddings, frequencies, scales=scales)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        'timing': micro.timing_,
+        'n_micro_clusters': int(len(micro.micro_centroids_)),
+        'n_clusters': int(labels.max()) + 1 if (labels >= 0).any() else 0,
+        'noise_ratio': round(float(np.mean(labels == -1)), 4),
+        'noise_occurrence_ratio': round(float(frequencies[labels == -1].sum() / frequencies.sum()), 4),
+        'pca_explained_variance': micro.compressor.explained_variance_ratio_,
+        'peak_traced_mb': round(traced_peak / 1e6, 1),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    }
+    if synthetic:
+        components = np.load(paths['components']).astype(np.int64)
+        result['ari_vs_components'] = round(float(adjusted_rand_score(components, labels)), 4)
+        # Share of skills in the majority component of their micro-cluster
+        # (what stage 2 preserves, independent of the macro step)
+        n_components = int(components.max()) + 1
+        joint = np.bincount(micro.micro_labels_.astype(np.int64) * n_components + components)
+        joint = np.pad(joint, (0, -len(joint) % n_components)).reshape(-1, n_components)
+        result['micro_purity'] = round(float(joint.max(axis=1).sum() / len(components)), 4)
+    return result
+
+
+def benchmark_size(n: int, args, seeds: Optional[np.ndarray]) -> Dict[str, Any]:
+    print(f"\n{'=' * 80}")
+    print(f"CORPUS: {n:,} skills × {args.dim}D ({args.storage})")
+    print('=' * 80)
+
+    work_dir = Path(args.work_dir) / f"corpus_{n}"
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    write_start = time.time()
+    paths = write_corpus(n, args.dim, seeds, args.storage, work_dir, np.random.default_rng(42))
+    write_seconds = time.time() - write_start
+    file_mb = paths['embeddings'].stat().st_size / 1e6
+    print(f"   Matrix: {file_mb:,.0f} MB written in {write_seconds:.1f}s")
+
+    params = {
+        'method': args.method,
+        'n_micro_clusters': args.micro_clusters or None,
+        'n_components': args.n_components,
+        'batch_size': args.batch_size,
+        'min_cluster_size': args.min_cluster_size,
+        'birch_threshold': args.birch_threshold
+    }
+
+    # Fresh process per size: peak RSS is not polluted by earlier (larger) runs
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        result = pool.submit(
+            run_fit, {k: str(v) for k, v in paths.items()}, params, seeds is None
+        ).result()
+
+    if not args.keep_files:
+        shutil.rmtree(work_dir)
+
+    timing = result['timing']
+    print(f"   Fit: {timing['total_seconds']}s "
+          f"(pca {timing['reduction_seconds']}s, micro {timing['micro_fit_seconds']}s, "
+          f"assign {timing['micro_assign_seconds']}s, macro {timing['macro_seconds']}s)")
+    print(f"   Memory: peak RSS {result['peak_rss_mb']:,} MB, traced {result['peak_traced_mb']:,} MB "
+          f"(matrix file {file_mb:,.0f} MB)")
+    print(f"   {result['n_micro_clusters']:,} micro-clusters → {result['n_clusters']} clusters, "
+          f"noise {result['noise_ratio']:.1%}"
+          + (f", ARI vs components {result['ari_vs_components']:.3f}, micro purity {result['micro_purity']:.3f}"
+             if 'ari_vs_components' in result else ''))
+
+    return {
+        'n_skills': n,
+        'matrix_mb': round(file_mb, 1),
+        'write_seconds': round(write_seconds, 1),
+        **result
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark micro-cluster mode at 100k/1M/5M skills")
+    parser.add_argument('--sizes', default='100000,1000000,5000000', help='Comma-separated corpus sizes')
+    parser.add_argument('--dim', type=int, default=768)
+    parser.add_argument('--storage', choices=['float32', 'int8'], default='float32')
+    parser.add_argument('--method', choices=['minibatch_kmeans', 'birch'], default='minibatch_kmeans')
+    parser.add_argument('--micro-clusters', type=int, default=0, help='k-means centroids (0 = auto)')
+    parser.add_argument('--n-components', type=int, default=50, help='PCA dimension')
+    parser.add_argument('--batch-size', type=int, default=65_536)
+    parser.add_argument('--min-cluster-size', type=int, default=10, help='HDBSCAN min_cluster_size (micro-clusters)')
+    parser.add_argument('--birch-threshold', type=float, default=0.3)
+    parser.add_argument('--snapshot', default='latest', help='Embedding snapshot used to seed realistic vectors')
+    parser.add_argument('--synthetic', action='store_true', help='Use a random Gaussian mixture instead of a snapshot')
+    parser.add_argument('--work-dir', default='outputs/benchmarks/microclustering/tmp', help='Scratch matrices')
+    parser.add_argument('--keep-files', action='store_true', help='Keep scratch matrices after the run')
+    parser.add_argument('--output-dir', default='outputs/benchmarks/microclustering')
+    args = parser.parse_args()
+
+    sizes = [int(n) for n in args.sizes.split(',')]
+
+    print("=" * 80)
+    print("MICRO-CLUSTERING BENCHMARK")
+    print("=" * 80)
+
+    seeds = None
+    seed_source = 'synthetic'
+    if not args.synthetic:
+        snapshot = load_snapshot(args.snapshot)
+        seeds = l2_normalize(snapshot.as_float32())
+        args.dim = seeds.shape[1]
+        seed_source = f"snapshot:{snapshot.version}"
+        print(f"   Seeding from snapshot {snapshot.version} ({len(seeds):,} real embeddings)")
+
+    results = [benchmark_size(n, args, seeds) for n in sizes]
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'seed_source': seed_source,
+        'parameters': {
+            'dim': args.dim,
+            'storage': args.storage,
+            'method': args.method,
+            'micro_clusters': args.micro_clusters or 'auto',
+            'n_components': args.n_components,
+            'batch_size': args.batch_size,
+            'min_cluster_size': args.min_cluster_size,
+            'birch_threshold': args.birch_threshold if args.method == 'birch' else None
+        },
+        'results': results
+    }
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"microclustering_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print()
+    print(f"{'Skills':>10} {'Matrix MB':>10} {'Fit s':>8} {'Peak RSS MB':>12} {'Traced MB':>10} {'Micro':>7} {'Clusters':>9}")
+    for r in results:
+        print(f"{r['n_skills']:>10,} {r['matrix_mb']:>10,.0f} {r['timing']['total_seconds']:>8} "
+              f"{r['peak_rss_mb']:>12,} {r['peak_traced_mb']:>10,} {r['n_micro_clusters']:>7,} {r['n_clusters']:>9}")
+
+    print()
+    print("=" * 80)
+    print(f"✅ Report saved: {output_path}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
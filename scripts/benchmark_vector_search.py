@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Benchmark pgvector HNSW against the flat FAISS baseline.
+
+For each corpus size (default 100k and 1M vectors, 768D):
+    1. Generate L2-normalized vectors. By default these are perturbed copies of
+       real skill embeddings from an embedding snapshot (clustered like our
+       data); with --synthetic, a random Gaussian mixture is used instead.
+    2. FAISS IndexFlatIP (what phase0_build_faiss_index.py builds): exact
+       top-k, single-query latency. Its results are the recall ground truth.
+    3. pgvector: load into a scratch table with COPY, build the HNSW cosine
+       index (same parameters as migration 011), then measure single-query
+       latency and recall@k for each ef_search value.
+
+Results are written to outputs/benchmarks/vector_search/.
+
+Usage:
+    python scripts/benchmark_vector_search.py
+    python scripts/benchmark_vector_search.py --sizes 100000 --ef-search 20,40,100 --queries 500
+    python scripts/benchmark_vector_search.py --synthetic --sizes 1000000
+"""
+
+import io
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import psycopg2
+import faiss
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.config.settings import get_settings
+from src.embedder.compression import l2_normalize
+from src.embedder.snapshot import load_snapshot
+
+GENERATE_CHUNK_SIZE = 50_000
+
+
+def generate_chunks(n: int, dim: int, seeds: Optional[np.ndarray], rng: np.random.Generator,
+                    noise: float = 0.05):
+    """Yield normalized float32 chunks totalling n vectors."""
+    if seeds is None:
+        centers = l2_normalize(rng.standard_normal((1000, dim)).astype(np.float32))
+        noise = 0.5
+    else:
+        centers = seeds
+
+    for start in range(0, n, GENERATE_CHUNK_SIZE):
+        size = min(GENERATE_CHUNK_SIZE, n - start)
+        picks = centers[rng.integers(0, len(centers), size)]
+        chunk = picks + noise * rng.standard_normal((size, dim)).astype(np.float32) / np.sqrt(dim)
+        yield l2_normalize(chunk)
+
+
+def latency_stats(latencies_ms: List[float]) -> Dict[str, float]:
+    arr = np.asarray(latencies_ms)
+    return {
+        'mean_ms': round(float(arr.mean()), 3),
+        'p50_ms': round(float(np.percentile(arr, 50)), 3),
+        'p95_ms': round(float(np.percentile(arr, 95)), 3),
+        'p99_ms': round(float(np.percentile(arr, 99)), 3)
+    }
+
+
+def to_pgvector(vector: np.ndarray) -> str:
+    return '[' + ','.join(f'{x:.7g}' for x in vector) + ']'
+
+
+def benchmark_size(conn, n: int, args, seeds: Optional[np.ndarray]) -> Dict[str, Any]:
+    rng = np.random.default_rng(42)
+    table = f"bench_skill_vectors_{n}"
+    cursor = conn.cursor()
+
+    print(f"\n{'=' * 80}")
+    print(f"CORPUS: {n:,} vectors × {args.dim}D")
+    print('=' * 80)
+
+    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+    cursor.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, embedding vector({args.dim}))")
+    conn.commit()
+
+    index = faiss.IndexFlatIP(args.dim)
+    load_start = time.time()
+    offset = 0
+
+    for chunk in generate_chunks(n, args.dim, seeds, rng):
+        index.add(chunk)
+
+        buffer = io.StringIO()
+        for i, vector in enumerate(chunk):
+            buffer.write(f"{offset + i}\t{to_pgvector(vector)}\n")
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {table} (id, embedding) FROM STDIN", buffer)
+        conn.commit()
+
+        offset += len(chunk)
+        print(f"   Loaded {offset:,}/{n:,}", end='\r')
+
+    load_seconds = time.time() - load_start
+    print(f"\n   Load time: {load_seconds:.1f}s")
+
+    # Queries: fresh perturbed vectors (not in the corpus)
+    queries = next(generate_chunks(args.queries, args.dim, seeds, np.random.default_rng(7)))
+
+    # FAISS flat baseline (single-query latency, like the API)
+    faiss_latencies = []
+    ground_truth = []
+    for q in queries:
+        t0 = time.perf_counter()
+        _, idx = index.search(q.reshape(1, -1), args.k)
+        faiss_latencies.append((time.perf_counter() - t0) * 1000)
+        ground_truth.append(set(idx[0].tolist()))
+
+    faiss_result = {'index': 'faiss.IndexFlatIP', **latency_stats(faiss_latencies), 'recall_at_k': 1.0}
+    print(f"   FAISS flat: p50={faiss_result['p50_ms']}ms p95={faiss_result['p95_ms']}ms")
+    del index
+
+    # HNSW build
+    cursor.execute(f"SET maintenance_work_mem = '{args.maintenance_work_mem}'")
+    build_start = time.time()
+    cursor.execute(
+        f"CREATE INDEX ON {table} USING hnsw (embedding vector_cosine_ops) "
+        f"WITH (m = {args.m}, ef_construction = {args.ef_construction})"
+    )
+    conn.commit()
+    build_seconds = time.time() - build_start
+
+    cursor.execute(f"SELECT pg_size_pretty(pg_indexes_size('{table}'))")
+    index_size = cursor.fetchone()[0]
+    print(f"   HNSW build: {build_seconds:.1f}s, size {index_size}")
+
+    hnsw_results = []
+    for ef in args.ef_search:
+        cursor.execute(f"SET hnsw.ef_search = {ef}")
+        latencies = []
+        recalls = []
+        for q, truth in zip(queries, ground_truth):
+            literal = to_pgvector(q)
+            t0 = time.perf_counter()
+            cursor.execute(
+                f"SELECT id FROM {table} ORDER BY embedding <=> %s::vector LIMIT %s",
+                (literal, args.k)
+            )
+            ids = {row[0] for row in cursor.fetchall()}
+            latencies.append((time.perf_counter() - t0) * 1000)
+            recalls.append(len(ids & truth) / len(truth))
+
+        result = {
+            'index': 'pgvector.hnsw',
+            'ef_search': ef,
+            **latency_stats(latencies),
+            'recall_at_k': round(float(np.mean(recalls)), 4)
+        }
+        hnsw_results.append(result)
+        print(f"   HNSW ef_search={ef:<4} p50={result['p50_ms']}ms p95={result['p95_ms']}ms "
+              f"recall@{args.k}={result['recall_at_k']:.3f}")
+
+    if not args.keep_tables:
+        cursor.execute(f"DROP TABLE {table}")
+        conn.commit()
+    cursor.close()
+
+    return {
+        'n_vectors': n,
+        'load_seconds': round(load_seconds, 1),
+        'hnsw_build_seconds': round(build_seconds, 1),
+        'hnsw_index_size': index_size,
+        'faiss_flat': faiss_result,
+        'hnsw': hnsw_results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pgvector HNSW vs FAISS IndexFlatIP")
+    parser.add_argument('--sizes', default='100000,1000000', help='Comma-separated corpus sizes')
+    parser.add_argument('--dim', type=int, default=768)
+    parser.add_argument('--queries', type=int, default=200, help='Queries per configuration')
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--ef-search', default='20,40,100,200', help='Comma-separated ef_search values')
+    parser.add_argument('--m', type=int, default=16)
+    parser.add_argument('--ef-construction', type=int, default=64)
+    parser.add_argument('--maintenance-work-mem', default='2GB')
+    parser.add_argument('--snapshot', default='latest', help='Embedding snapshot used to seed realistic vectors')
+    parser.add_argument('--synthetic', action='store_true', help='Use a random Gaussian mixture instead of a snapshot')
+    parser.add_argument('--keep-tables', action='store_true', help='Keep scratch tables after the run')
+    parser.add_argument('--output-dir', default='outputs/benchmarks/vector_search')
+    args = parser.parse_args()
+
+    args.ef_search = [int(ef) for ef in args.ef_search.split(',')]
+    sizes = [int(n) for n in args.sizes.split(',')]
+
+    print("=" * 80)
+    print("VECTOR SEARCH BENCHMARK: pgvector HNSW vs FAISS IndexFlatIP")
+    print("=" * 80)
+
+    seeds = None
+    seed_source = 'synthetic'
+    if not args.synthetic:
+        snapshot = load_snapshot(args.snapshot)
+        seeds = l2_normalize(snapshot.as_float32())
+        args.dim = seeds.shape[1]
+        seed_source = f"snapshot:{snapshot.version}"
+        print(f"   Seeding from snapshot {snapshot.version} ({len(seeds):,} real embeddings)")
+
+    conn = psycopg2.connect(get_settings().database_url)
+    results = [benchmark_size(conn, n, args, seeds) for n in sizes]
+    conn.close()
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'seed_source': seed_source,
+        'parameters': {
+            'dim': args.dim,
+            'k': args.k,
+            'queries': args.queries,
+            'm': args.m,
+            'ef_construction': args.ef_construction,
+            'ef_search': args.ef_search
+        },
+        'results': results
+    }
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"vector_search_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print()
+    print("=" * 80)
+    print(f"✅ Report saved: {output_path}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -64,9 +64,13 @@ for job_id, title, description, requirements in jobs:
     cursor.execute("""
         INSERT INTO cleaned_jobs (
             job_id, title_cleaned, description_cleaned,
-            requirements_cleaned, combined_text, combined_word_count
-        ) VALUES (%s, %s, %s, %s, %s, %s)
-    """, (job_id, title_cleaned, desc_cleaned, req_cleaned, combined, word_count))
+            requirements_cleaned, combined_text, combined_word_count, search_vector
+        ) VALUES (
+            %s, %s, %s, %s, %s, %s,
+            job_search_vector(%s, (SELECT company FROM raw_jobs WHERE job_id = %s), %s)
+        )
+    """, (job_id, title_cleaned, desc_cleaned, req_cleaned, combined, word_count,
+          title_cleaned, job_id, combined))
 
     # Note: raw_jobs doesn't have cleaning_status column
 
@@ -252,7 +252,11 @@ def insert_cleaned_job(cursor, job_id: str, title_cleaned: str,
                       description_cleaned: str, requirements_cleaned: str,
                       combined_text: str, combined_word_count: int,
                       combined_char_count: int):
-    """Insert cleaned job into cleaned_jobs table."""
+    """
+    Insert cleaned job into cleaned_jobs table.
+
+    search_vector (migration 019) backs full-text search in /api/jobs?search=.
+    """
     cursor.execute("""
         INSERT INTO cleaned_jobs (
             job_id,
@@ -263,8 +267,12 @@ def insert_cleaned_job(cursor, job_id: str, title_cleaned: str,
             cleaning_method,
             cleaned_at,
             combined_word_count,
-            combined_char_count
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            combined_char_count,
+            search_vector
+        ) VALUES (
+            %s, %s, %s, %s, %s, %s, %s, %s, %s,
+            job_search_vector(%s, (SELECT company FROM raw_jobs WHERE job_id = %s), %s)
+        )
         ON CONFLICT (job_id) DO UPDATE SET
             title_cleaned = EXCLUDED.title_cleaned,
             description_cleaned = EXCLUDED.description_cleaned,
@@ -273,7 +281,8 @@ def insert_cleaned_job(cursor, job_id: str, title_cleaned: str,
             cleaning_method = EXCLUDED.cleaning_method,
             cleaned_at = EXCLUDED.cleaned_at,
             combined_word_count = EXCLUDED.combined_word_count,
-            combined_char_count = EXCLUDED.combined_char_count
+            combined_char_count = EXCLUDED.combined_char_count,
+            search_vector = EXCLUDED.search_vector
     """, (
         job_id,
         title_cleaned,
@@ -283,7 +292,10 @@ def insert_cleaned_job(cursor, job_id: str, title_cleaned: str,
         'html_strip',
         datetime.now(),
         combined_word_count,
-        combined_char_count
+        combined_char_count,
+        title_cleaned,
+        job_id,
+        combined_text
     ))
 
 
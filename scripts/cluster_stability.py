@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Bootstrap / subsample stability of a persisted clustering model.
+
+Refits HDBSCAN on K replicates of the model's 2D UMAP embedding in a process
+pool (see src/analyzer/stability.py) and stores per-cluster Jaccard
+stability plus the replicate ARI matrix in analysis_results
+(analysis_type='clustering_stability').
+
+The embedding is the .npy artifact written by run_clustering_task
+(<cluster_artifact_dir>/<pipeline>/<version>/embedding_2d.npy); it is
+created from the model's training coordinates if missing. Workers open it
+memory-mapped.
+
+Usage:
+    python scripts/cluster_stability.py pipeline_a_30k_pre
+    python scripts/cluster_stability.py pipeline_a_30k_post --replicates 20 --workers 8
+    python scripts/cluster_stability.py pipeline_a_30k_pre --method bootstrap --no-db
+"""
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+import psycopg2
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.config.settings import get_settings
+from src.analyzer.artifacts import save_array_artifact
+from src.analyzer.model_store import ClusteringModelStore
+from src.analyzer.stability import STABILITY_METHODS, cluster_stability
+
+
+def coordinates_file(model, pipeline: str, artifact_dir: str) -> Path:
+    """Path of the run's embedding_2d.npy, written from the model if missing."""
+    relative_path = f"{pipeline}/{model.version}/embedding_2d.npy"
+    path = Path(artifact_dir) / relative_path
+    if not path.exists():
+        save_array_artifact(model.coordinates, relative_path, base_dir=artifact_dir)
+    return path
+
+
+def main():
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(description="HDBSCAN cluster stability over bootstrap/subsample replicates")
+    parser.add_argument('pipeline', help='Pipeline name in the clustering model store')
+    parser.add_argument('--version', default='latest', help='Model version')
+    parser.add_argument('--replicates', type=int, default=settings.cluster_stability_replicates)
+    parser.add_argument('--method', choices=STABILITY_METHODS, default='subsample')
+    parser.add_argument('--fraction', type=float, default=0.8, help='Share of points per subsample')
+    parser.add_argument('--workers', type=int, default=settings.cluster_stability_workers,
+                        help='Worker processes (0 = all CPU cores)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-db', action='store_true', help='Only write the JSON report')
+    parser.add_argument('--output-dir', default='outputs/clustering/stability')
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count() or 1
+
+    print("=" * 80)
+    print(f"CLUSTER STABILITY: {args.pipeline}")
+    print("=" * 80)
+
+    model = ClusteringModelStore().load(args.pipeline, args.version)
+    path = coordinates_file(model, args.pipeline, settings.cluster_artifact_dir)
+    print(f"   Model {model.version}: {len(model.labels):,} skills, "
+          f"{model.manifest['n_clusters']} clusters")
+    print(f"   {args.replicates} {args.method} replicates on {workers} workers")
+
+    result = cluster_stability(
+        str(path),
+        model.labels,
+        model.manifest['clusterer_params'],
+        n_replicates=args.replicates,
+        method=args.method,
+        sample_fraction=args.fraction,
+        n_workers=workers,
+        random_state=args.seed
+    )
+
+    parameters = {
+        'pipeline': args.pipeline,
+        'model_version': model.version,
+        'model_input_hash': model.input_hash,
+        'method': args.method,
+        'sample_fraction': args.fraction if args.method == 'subsample' else None,
+        'n_replicates': args.replicates,
+        'seed': args.seed,
+        'hdbscan_params': model.manifest['clusterer_params'],
+        'embedding_2d': str(path)
+    }
+
+    summary = result['summary']
+    timing = result['timing']
+    print(f"\n   Stable clusters (Jaccard >= 0.75): {summary['n_stable_clusters']}/{summary['n_reference_clusters']}")
+    print(f"   Dissolved clusters (Jaccard <= 0.5): {summary['n_dissolved_clusters']}")
+    ari = {key: 'n/a' if summary[key] is None else f"{summary[key]:.3f}"
+           for key in ('mean_pairwise_ari', 'mean_ari_vs_reference')}
+    print(f"   Mean pairwise ARI: {ari['mean_pairwise_ari']} | vs reference: {ari['mean_ari_vs_reference']}")
+    print(f"   Fits: {timing['fit_wall_seconds']:.1f}s wall, {timing['fit_cpu_seconds']:.1f}s total "
+          f"({timing['speedup']}x, efficiency {timing['parallel_efficiency']})")
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"{args.pipeline}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'parameters': parameters, **result}, f, indent=2)
+    print(f"\n   ✅ Report saved: {output_path}")
+
+    if not args.no_db:
+        conn = psycopg2.connect(settings.database_url)
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO analysis_results
+            (analysis_type, parameters, results, created_at)
+            VALUES (%s, %s, %s, %s)
+            RETURNING analysis_id
+        """, ('clustering_stability', json.dumps(parameters), json.dumps(result), datetime.now()))
+        analysis_id = cursor.fetchone()[0]
+        conn.commit()
+        cursor.close()
+        conn.close()
+        print(f"   ✅ Stored in analysis_results: {analysis_id}")
+
+
+if __name__ == '__main__':
+    main()
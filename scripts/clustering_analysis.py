@@ -341,6 +341,8 @@ def save_results(df: pd.DataFrame, embedding_2d: np.ndarray, clusters: List[Dict
         'metrics': metrics,
         'clusters': clusters,
         'skills': df['skill_text'].tolist(),
+        'labels': df['cluster'].astype(int).tolist(),
+        'frequencies': df['frequency'].astype(int).tolist(),
         'embedding_2d': embedding_2d.tolist()
     }
 
@@ -17,12 +17,14 @@ Parameters (from experimentation - Fase 7):
 
 Usage:
     python scripts/clustering_esco_30k_final.py
+    python scripts/clustering_esco_30k_final.py --snapshot latest
 """
 
 import sys
 import json
+import argparse
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 from datetime import datetime
 from collections import defaultdict
 
@@ -37,6 +39,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.config.settings import get_settings
 from src.analyzer.dimension_reducer import DimensionReducer
 from src.analyzer.clustering import SkillClusterer
+from src.embedder.snapshot import EmbeddingSnapshot, load_snapshot
+from src.analyzer.scatter_tiles import render_scatter
+from src.database.temporal_cube import period_counts_query, refresh_skill_period_counts
 
 
 def extract_esco_skills() -> Tuple[List[str], List[int]]:
@@ -89,10 +94,19 @@ def extract_esco_skills() -> Tuple[List[str], List[int]]:
     return skill_texts, frequencies
 
 
-def fetch_embeddings_batch(skill_texts: List[str]) -> Tuple[np.ndarray, List[str], List[int]]:
+def fetch_embeddings_batch(
+    skill_texts: List[str],
+    snapshot: Optional[EmbeddingSnapshot] = None
+) -> Tuple[np.ndarray, List[str], List[int]]:
     """
     Fetch embeddings for all skills.
 
+    Args:
+        skill_texts: Skills to look up
+        snapshot: Optional embedding snapshot (see export_embedding_snapshot.py).
+            When given, vectors are read from the memory-mapped matrix
+            instead of querying skill_embeddings once per skill.
+
     Returns:
         (embeddings, found_skills, found_indices)
     """
@@ -101,6 +115,13 @@ def fetch_embeddings_batch(skill_texts: List[str]) -> Tuple[np.ndarray, List[str
     print("="*80)
     print(f"Requesting embeddings for {len(skill_texts)} skills...")
 
+    if snapshot is not None:
+        print(f"   Source: snapshot {snapshot.version} ({snapshot.path})")
+        embeddings_array, found_skills, found_indices = snapshot.select(skill_texts)
+        print(f"   ✅ Found embeddings: {len(found_skills)}/{len(skill_texts)}")
+        print(f"   Coverage: {len(found_skills)/len(skill_texts)*100:.1f}%")
+        return embeddings_array, found_skills, found_indices
+
     settings = get_settings()
     db_url = settings.database_url
     if db_url.startswith('postgresql://'):
@@ -223,25 +244,21 @@ def extract_temporal_frequencies(skill_texts: List[str]) -> pd.DataFrame:
 
     conn = psycopg2.connect(db_url)
 
-    # Query to get frequencies by quarter
+    # Frequencies by quarter from the skill_period_counts cube (migration 014)
     # Filter: Only NER + REGEX methods (exclude pipeline-a1-tfidf-np)
-    query = """
-        SELECT
-            DATE_TRUNC('quarter', j.posted_date) as quarter,
-            es.skill_text,
-            COUNT(*) as frequency
-        FROM extracted_skills es
-        JOIN raw_jobs j ON es.job_id = j.job_id
-        WHERE es.skill_type = 'hard'
-          AND es.esco_uri IS NOT NULL
-          AND es.extraction_method IN ('ner', 'regex')
-          AND j.posted_date IS NOT NULL
-        GROUP BY DATE_TRUNC('quarter', j.posted_date), es.skill_text
-        ORDER BY quarter, frequency DESC
-    """
+    refresh_skill_period_counts(conn, sources=['extracted'])
+    query, params = period_counts_query(
+        source='extracted',
+        period='quarter',
+        skill_types=['hard'],
+        extraction_methods=['ner', 'regex'],
+        has_esco=True
+    )
 
-    df = pd.read_sql_query(query, conn)
+    df = pd.read_sql_query(query, conn, params=params)
     conn.close()
+    df = df.rename(columns={'period_start': 'quarter'})
+    df['quarter'] = pd.to_datetime(df['quarter'])
 
     # Convert quarter to period string
     df['quarter_str'] = df['quarter'].dt.to_period('Q').astype(str)
@@ -423,57 +440,35 @@ def visualize_umap_scatter(
     skill_frequencies: List[int],
     output_path: str
 ):
-    """Generate UMAP scatter plot with frequency-based sizing."""
+    """
+    Generate UMAP scatter as density tiles + outliers/top skills sized by frequency.
+
+    Also writes <output>.tiles.json; skipped if the clustering result is unchanged.
+    """
 
     print("\n" + "="*80)
     print("GENERATING UMAP SCATTER PLOT")
     print("="*80)
 
-    fig, ax = plt.subplots(figsize=(16, 12))
-
-    # Normalize sizes
-    sizes = np.array(skill_frequencies)
-    sizes_norm = (sizes - sizes.min()) / (sizes.max() - sizes.min())
-    sizes_scaled = 10 + sizes_norm * 200  # 10-210 point size
-
-    # Get unique clusters
-    unique_labels = set(labels)
-    n_clusters = len(unique_labels - {-1})
-
-    # Color palette
-    palette = sns.color_palette('tab20', n_colors=n_clusters)
-    colors = []
-    for label in labels:
-        if label == -1:
-            colors.append('lightgray')
-        else:
-            colors.append(palette[label % len(palette)])
-
-    # Plot points
-    scatter = ax.scatter(
-        coordinates[:, 0],
-        coordinates[:, 1],
-        c=colors,
-        s=sizes_scaled,
-        alpha=0.6,
-        edgecolors='black',
-        linewidth=0.5
-    )
-
-    ax.set_title(
-        f'ESCO 30k: UMAP Projection (nn15_mcs15)\n'
-        f'{n_clusters} clusters, {len(skill_texts)} skills, Size = Frequency',
-        fontsize=16,
-        pad=20
+    n_clusters = len(set(labels) - {-1})
+    summary = render_scatter(
+        coordinates,
+        labels,
+        output_path,
+        frequencies=np.asarray(skill_frequencies),
+        skill_texts=skill_texts,
+        title=(
+            f'ESCO 30k: UMAP Projection (nn15_mcs15)\n'
+            f'{n_clusters} clusters, {len(skill_texts)} skills, Size = Frequency'
+        )
     )
-    ax.set_xlabel('UMAP 1', fontsize=12)
-    ax.set_ylabel('UMAP 2', fontsize=12)
-    ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f"   ✅ Saved: {output_path}")
-    plt.close()
+    if summary['cache_hit']:
+        print(f"   ⏭  Unchanged clustering, kept: {output_path}")
+    else:
+        print(f"   {summary['n_points']:,} points → {summary['n_cells']:,} cells + "
+              f"{summary['n_kept_points']:,} individual points ({summary['seconds']:.1f}s)")
+        print(f"   ✅ Saved: {output_path}")
 
 
 def save_results(
@@ -544,6 +539,11 @@ def save_results(
 
 def main():
     """Main execution."""
+    parser = argparse.ArgumentParser(description="ESCO 30k final clustering analysis")
+    parser.add_argument('--snapshot', default=None,
+                        help="Embedding snapshot path/version ('latest' for the most recent); "
+                             "default: query skill_embeddings")
+    args = parser.parse_args()
 
     print("\n" + "="*80)
     print("ESCO 30K - FINAL CLUSTERING ANALYSIS")
@@ -561,7 +561,8 @@ def main():
     skill_texts, skill_frequencies = extract_esco_skills()
 
     # Step 2: Fetch embeddings
-    embeddings, found_skills, found_indices = fetch_embeddings_batch(skill_texts)
+    snapshot = load_snapshot(args.snapshot) if args.snapshot else None
+    embeddings, found_skills, found_indices = fetch_embeddings_batch(skill_texts, snapshot)
 
     # Filter skills to those with embeddings
     skill_texts_filtered = [skill_texts[i] for i in found_indices]
@@ -17,7 +17,9 @@ The config file specifies:
 - sql_query: Query to extract skills with frequencies
 - temporal_sql_query: Query for temporal data (skills × quarters)
 - output_dir: Where to save results
-- clustering_params: UMAP + HDBSCAN parameters
+- clustering_params: UMAP + HDBSCAN parameters (optional 'silhouette_method':
+  auto/exact/chunked/sampled/none, 'silhouette_sample_size')
+- snapshot (optional): embedding snapshot version to read vectors from
 """
 
 import sys
@@ -26,20 +28,22 @@ import logging
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
 import numpy as np
 import pandas as pd
 import psycopg2
 from sentence_transformers import SentenceTransformer
 import umap
 import hdbscan
-from sklearn.metrics import silhouette_score, davies_bouldin_score
+from sklearn.metrics import davies_bouldin_score
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Add src to path
 sys.path.append('.')
 from src.config import get_settings
+from src.embedder.snapshot import EmbeddingSnapshot, load_snapshot
+from src.analyzer.metrics import SILHOUETTE_METHODS, compute_silhouette
 
 # Setup logging
 logging.basicConfig(
@@ -84,8 +88,21 @@ def extract_skills(query: str) -> pd.DataFrame:
 
     return df
 
-def get_embeddings(skills: List[str]) -> np.ndarray:
-    """Fetch embeddings from database."""
+def get_embeddings(skills: List[str], snapshot: Optional[EmbeddingSnapshot] = None) -> np.ndarray:
+    """Fetch embeddings from database, or from a memory-mapped snapshot if given."""
+    if snapshot is not None:
+        logger.info(f"Reading embeddings for {len(skills)} skills from snapshot {snapshot.version}...")
+        embeddings, found_skills, _ = snapshot.select(skills)
+        found = set(found_skills)
+        missing = [skill for skill in skills if skill not in found]
+
+        logger.info(f"   ✅ Found embeddings: {len(embeddings)}/{len(skills)}")
+        logger.info(f"   Coverage: {100*len(embeddings)/len(skills):.1f}%")
+        if missing:
+            logger.warning(f"   ⚠️  Missing embeddings for {len(missing)} skills")
+
+        return embeddings, missing
+
     conn = get_db_connection()
     cur = conn.cursor()
 
@@ -190,8 +207,9 @@ def analyze_clusters(df: pd.DataFrame, labels: np.ndarray) -> List[Dict]:
 
     return clusters
 
-def calculate_metrics(embedding_2d: np.ndarray, labels: np.ndarray) -> Dict:
-    """Calculate clustering quality metrics."""
+def calculate_metrics(embedding_2d: np.ndarray, labels: np.ndarray,
+                      silhouette_method: str = 'auto', silhouette_sample_size: int = 10000) -> Dict:
+    """Calculate clustering quality metrics (silhouette method selectable, see analyzer.metrics)."""
     # Filter out noise points
     mask = labels != -1
     if mask.sum() < 2:
@@ -200,13 +218,18 @@ def calculate_metrics(embedding_2d: np.ndarray, labels: np.ndarray) -> Dict:
             'davies_bouldin_score': None
         }
 
-    silhouette = silhouette_score(embedding_2d[mask], labels[mask])
-    davies_bouldin = davies_bouldin_score(embedding_2d[mask], labels[mask])
+    metrics = compute_silhouette(
+        embedding_2d[mask], labels[mask],
+        method=silhouette_method,
+        sample_size=silhouette_sample_size
+    )
+    metrics.setdefault('silhouette_score', 0.0)
+
+    start = datetime.now()
+    metrics['davies_bouldin_score'] = float(davies_bouldin_score(embedding_2d[mask], labels[mask]))
+    metrics['davies_bouldin_seconds'] = round((datetime.now() - start).total_seconds(), 3)
 
-    return {
-        'silhouette_score': float(silhouette),
-        'davies_bouldin_score': float(davies_bouldin)
-    }
+    return metrics
 
 def extract_temporal_data(query: str, skills_list: List[str]) -> pd.DataFrame:
     """Extract temporal frequency data."""
@@ -365,6 +388,12 @@ def save_results(
 def main():
     parser = argparse.ArgumentParser(description='Generic clustering analysis')
     parser.add_argument('--config', required=True, help='Path to config JSON file')
+    parser.add_argument('--snapshot', default=None,
+                        help="Embedding snapshot path/version ('latest' for the most recent); "
+                             "overrides the config's 'snapshot' key")
+    parser.add_argument('--silhouette-method', choices=SILHOUETTE_METHODS, default=None,
+                        help="Silhouette computation; overrides clustering_params.silhouette_method "
+                             "(default: auto)")
     args = parser.parse_args()
 
     # Load config
@@ -390,7 +419,9 @@ def main():
     logger.info("\n" + "=" * 80)
     logger.info("FETCHING EMBEDDINGS")
     logger.info("=" * 80)
-    embeddings, missing = get_embeddings(df['skill_text'].tolist())
+    snapshot_ref = args.snapshot or config.get('snapshot')
+    snapshot = load_snapshot(snapshot_ref) if snapshot_ref else None
+    embeddings, missing = get_embeddings(df['skill_text'].tolist(), snapshot)
 
     # Filter out skills without embeddings
     if missing:
@@ -415,8 +446,13 @@ def main():
 
     # Calculate metrics
     logger.info("\n📏 Calculating metrics...")
-    metrics = calculate_metrics(embedding_2d, labels)
-    logger.info(f"   Silhouette score: {metrics['silhouette_score']:.3f}")
+    metrics = calculate_metrics(
+        embedding_2d, labels,
+        silhouette_method=args.silhouette_method or config['clustering_params'].get('silhouette_method', 'auto'),
+        silhouette_sample_size=config['clustering_params'].get('silhouette_sample_size', 10000)
+    )
+    logger.info(f"   Silhouette score: {metrics['silhouette_score']:.3f} "
+                f"({metrics['silhouette_method']}, {metrics['silhouette_seconds']:.2f}s)")
     logger.info(f"   Davies-Bouldin: {metrics['davies_bouldin_score']:.3f}")
 
     # Extract temporal data
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Populate skill_embeddings.embedding_compact (halfvec) from the full 768D vectors.
+
+Fits a PCA projection (or Matryoshka-style truncation) on all embeddings,
+saves it to EMBEDDING_PROJECTION_PATH so query vectors can be projected the
+same way, and writes the reduced, half-precision vectors back to PostgreSQL.
+
+Requires migration 010 (pgvector >= 0.7.0).
+
+Usage:
+    python scripts/compact_skill_embeddings.py
+    python scripts/compact_skill_embeddings.py --method truncate --dim 384
+    python scripts/compact_skill_embeddings.py --snapshot latest   # read vectors from a snapshot
+"""
+
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+
+import numpy as np
+import psycopg2
+from psycopg2.extras import execute_values
+from pgvector import HalfVector
+from pgvector.psycopg2 import register_vector
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.config.settings import get_settings
+from src.embedder.compression import EmbeddingCompressor
+from src.embedder.snapshot import load_snapshot
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+UPDATE_BATCH_SIZE = 1000
+
+
+def load_full_embeddings(conn, snapshot: str = None):
+    """Load (skill_texts, embeddings) from a snapshot or from skill_embeddings."""
+    if snapshot:
+        emb_snapshot = load_snapshot(snapshot)
+        if emb_snapshot.manifest.get('compression'):
+            raise SystemExit(f"Snapshot {emb_snapshot.version} is already compressed; use a full-precision snapshot")
+        return emb_snapshot.skill_texts, emb_snapshot.as_float32()
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT skill_text, embedding FROM skill_embeddings ORDER BY skill_text")
+    rows = cursor.fetchall()
+    cursor.close()
+
+    return [row[0] for row in rows], np.vstack([row[1] for row in rows]).astype(np.float32)
+
+
+def write_compact_embeddings(conn, skill_texts, compact: np.ndarray, compressor: EmbeddingCompressor):
+    """Batch-update embedding_compact / compact_method / compact_dim."""
+    cursor = conn.cursor()
+
+    for start in range(0, len(skill_texts), UPDATE_BATCH_SIZE):
+        values = [
+            (skill_text, HalfVector(vector), compressor.method, compressor.dim)
+            for skill_text, vector in zip(
+                skill_texts[start:start + UPDATE_BATCH_SIZE],
+                compact[start:start + UPDATE_BATCH_SIZE]
+            )
+        ]
+        execute_values(
+            cursor,
+            """
+            UPDATE skill_embeddings se
+            SET embedding_compact = v.embedding,
+                compact_method = v.method,
+                compact_dim = v.dim
+            FROM (VALUES %s) AS v(skill_text, embedding, method, dim)
+            WHERE se.skill_text = v.skill_text
+            """,
+            values,
+            template="(%s, %s::halfvec, %s, %s)"
+        )
+        conn.commit()
+        logger.info(f"   Updated {min(start + UPDATE_BATCH_SIZE, len(skill_texts)):,}/{len(skill_texts):,}")
+
+    cursor.close()
+
+
+def main():
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(description="Populate compact halfvec skill embeddings")
+    parser.add_argument('--method', choices=['pca', 'truncate'], default=settings.embedding_compact_method,
+                        help='Dimension reduction method')
+    parser.add_argument('--dim', type=int, default=settings.embedding_compact_dim, help='Compact dimension')
+    parser.add_argument('--projection', default=settings.embedding_projection_path,
+                        help='Where to save the fitted projection (.npz)')
+    parser.add_argument('--snapshot', default=None, help='Read full vectors from this embedding snapshot')
+    args = parser.parse_args()
+
+    logger.info("=" * 80)
+    logger.info(f"COMPACT SKILL EMBEDDINGS ({args.method.upper()} → {args.dim}D, halfvec)")
+    logger.info("=" * 80)
+
+    start = time.time()
+    conn = psycopg2.connect(settings.database_url)
+    register_vector(conn)
+
+    skill_texts, embeddings = load_full_embeddings(conn, args.snapshot)
+    logger.info(f"Loaded {len(skill_texts):,} embeddings {embeddings.shape}")
+
+    compressor = EmbeddingCompressor(method=args.method, dim=args.dim)
+    compact = compressor.fit_transform(embeddings)
+    compressor.save(args.projection)
+
+    write_compact_embeddings(conn, skill_texts, compact, compressor)
+    conn.close()
+
+    full_mb = embeddings.shape[0] * embeddings.shape[1] * 4 / 1024 / 1024
+    compact_mb = compact.shape[0] * compact.shape[1] * 2 / 1024 / 1024
+
+    logger.info("")
+    logger.info("=" * 80)
+    logger.info(f"✅ {len(skill_texts):,} compact embeddings written in {time.time() - start:.1f}s")
+    logger.info(f"   Vector payload: {full_mb:.1f} MB → {compact_mb:.1f} MB")
+    logger.info(f"   Projection: {args.projection}")
+    logger.info("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Evaluate compact embeddings against full-precision 768D float32.
+
+For each (dimension, storage dtype) configuration this script measures:
+
+    1. ESCO semantic match agreement
+       For every skill without an ESCO mapping, the nearest ESCO-mapped skill
+       (cosine) is computed with full and compact vectors.
+       - top1_agreement: same nearest ESCO skill
+       - recall_at_k:    overlap of the top-k ESCO neighbours
+       - score_mae:      mean absolute error of the top-1 cosine score
+
+    2. HDBSCAN cluster stability
+       UMAP + HDBSCAN (same parameters as clustering_esco_30k_final.py) on the
+       N most frequent skills, full vs compact:
+       - ARI / NMI between cluster assignments
+       - number of clusters and noise share
+
+Input vectors come from a full-precision embedding snapshot, so no database
+access is needed (run scripts/export_embedding_snapshot.py first).
+
+Usage:
+    python scripts/evaluate_embedding_compression.py
+    python scripts/evaluate_embedding_compression.py --snapshot latest --dims 128,256,384 --storages float16,int8
+    python scripts/evaluate_embedding_compression.py --skip-clustering
+"""
+
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+import numpy as np
+from sklearn.metrics import adjusted_rand_score, normalized_mutual_info_score
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.embedder.snapshot import load_snapshot
+from src.embedder.compression import EmbeddingCompressor, apply_storage_dtype, l2_normalize
+
+QUERY_CHUNK_SIZE = 2048
+
+
+def top_k_neighbors(queries: np.ndarray, targets: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact cosine top-k (vectors are L2-normalized), chunked over queries.
+
+    Returns:
+        (indices, scores) each of shape (n_queries, k), sorted by score desc
+    """
+    k = min(k, targets.shape[0])
+    all_indices = np.empty((queries.shape[0], k), dtype=np.int64)
+    all_scores = np.empty((queries.shape[0], k), dtype=np.float32)
+
+    for start in range(0, queries.shape[0], QUERY_CHUNK_SIZE):
+        sims = queries[start:start + QUERY_CHUNK_SIZE] @ targets.T
+        idx = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        part = np.take_along_axis(sims, idx, axis=1)
+        order = np.argsort(-part, axis=1)
+        all_indices[start:start + QUERY_CHUNK_SIZE] = np.take_along_axis(idx, order, axis=1)
+        all_scores[start:start + QUERY_CHUNK_SIZE] = np.take_along_axis(part, order, axis=1)
+
+    return all_indices, all_scores
+
+
+def esco_match_agreement(full_q: np.ndarray, full_t: np.ndarray,
+                         comp_q: np.ndarray, comp_t: np.ndarray, k: int) -> Dict[str, float]:
+    """Compare nearest ESCO neighbours under full vs compact vectors."""
+    full_idx, full_scores = top_k_neighbors(full_q, full_t, k)
+    comp_idx, comp_scores = top_k_neighbors(comp_q, comp_t, k)
+
+    top1_agreement = float(np.mean(full_idx[:, 0] == comp_idx[:, 0]))
+    recall_at_k = float(np.mean([
+        len(set(f).intersection(c)) / len(f) for f, c in zip(full_idx, comp_idx)
+    ]))
+    score_mae = float(np.mean(np.abs(full_scores[:, 0] - comp_scores[:, 0])))
+
+    return {
+        'top1_agreement': round(top1_agreement, 4),
+        f'recall_at_{k}': round(recall_at_k, 4),
+        'score_mae': round(score_mae, 4)
+    }
+
+
+def cluster_labels(embeddings: np.ndarray, args) -> np.ndarray:
+    """UMAP 2D + HDBSCAN with the production parameters."""
+    from src.analyzer.dimension_reducer import DimensionReducer
+    from src.analyzer.clustering import SkillClusterer
+
+    reducer = DimensionReducer(
+        n_components=2,
+        n_neighbors=args.umap_neighbors,
+        min_dist=0.1,
+        metric='cosine',
+        random_state=42
+    )
+    coordinates = reducer.fit_transform(embeddings)
+
+    clusterer = SkillClusterer(min_cluster_size=args.min_cluster_size, min_samples=args.min_samples)
+    return clusterer.fit_predict(coordinates)
+
+
+def cluster_summary(labels: np.ndarray) -> Dict[str, Any]:
+    return {
+        'n_clusters': int(len(set(labels)) - (1 if -1 in labels else 0)),
+        'noise_pct': round(float(np.mean(labels == -1)) * 100, 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate reduced-precision / reduced-dimension embeddings")
+    parser.add_argument('--snapshot', default='latest', help='Full-precision embedding snapshot')
+    parser.add_argument('--method', choices=['pca', 'truncate'], default='pca', help='Dimension reduction method')
+    parser.add_argument('--dims', default='128,256,384,768', help='Comma-separated compact dimensions')
+    parser.add_argument('--storages', default='float32,float16,int8', help='Comma-separated storage dtypes')
+    parser.add_argument('--k', type=int, default=10, help='Neighbours for recall@k')
+    parser.add_argument('--max-skills', type=int, default=5000,
+                        help='Most frequent skills used for the clustering comparison')
+    parser.add_argument('--umap-neighbors', type=int, default=15)
+    parser.add_argument('--min-cluster-size', type=int, default=15)
+    parser.add_argument('--min-samples', type=int, default=5)
+    parser.add_argument('--skip-clustering', action='store_true', help='Only run the ESCO agreement check')
+    parser.add_argument('--output-dir', default='outputs/evaluation/embedding_compression')
+    args = parser.parse_args()
+
+    dims = [int(d) for d in args.dims.split(',')]
+    storages = [s.strip() for s in args.storages.split(',')]
+
+    print("=" * 80)
+    print("EMBEDDING COMPRESSION EVALUATION")
+    print("=" * 80)
+
+    snapshot = load_snapshot(args.snapshot)
+    if snapshot.manifest.get('compression') or snapshot.scales is not None:
+        raise SystemExit("Evaluation needs a full-precision snapshot as reference")
+
+    full = l2_normalize(snapshot.as_float32())
+    has_esco = np.array([uri is not None for uri in snapshot.esco_uris])
+    print(f"   Snapshot: {snapshot.version} ({len(snapshot):,} skills, {has_esco.sum():,} ESCO-mapped)")
+
+    if has_esco.sum() == 0 or has_esco.all():
+        raise SystemExit("Snapshot needs both ESCO-mapped and unmapped skills for the agreement check")
+
+    # Clustering subset: most frequent skills (same selection as the 30k scripts)
+    cluster_rows = np.argsort(-snapshot.frequencies, kind='stable')[:args.max_skills]
+
+    full_labels = None
+    if not args.skip_clustering:
+        print(f"\n🔬 Reference clustering on {len(cluster_rows):,} skills (768D float32)...")
+        full_labels = cluster_labels(full[cluster_rows], args)
+        print(f"   {cluster_summary(full_labels)}")
+
+    results: List[Dict[str, Any]] = []
+
+    for dim in dims:
+        if dim >= full.shape[1]:
+            projected = full
+            compression = {'method': 'none', 'dim': full.shape[1]}
+        else:
+            compressor = EmbeddingCompressor(method=args.method, dim=dim)
+            projected = compressor.fit_transform(full)
+            compression = compressor.to_dict()
+
+        for storage in storages:
+            if projected is full and storage == 'float32':
+                continue  # Reference configuration
+
+            start = time.time()
+            compact = l2_normalize(apply_storage_dtype(projected, storage))
+            out_dim = projected.shape[1]
+            bytes_per_vector = out_dim * {'float32': 4, 'float16': 2, 'int8': 1}[storage] + (4 if storage == 'int8' else 0)
+
+            row = {
+                'dim': out_dim,
+                'storage': storage,
+                'compression': compression,
+                'bytes_per_vector': bytes_per_vector,
+                'size_ratio': round(bytes_per_vector / (full.shape[1] * 4), 4),
+                'esco_agreement': esco_match_agreement(
+                    full[~has_esco], full[has_esco],
+                    compact[~has_esco], compact[has_esco],
+                    args.k
+                )
+            }
+
+            if full_labels is not None:
+                labels = cluster_labels(compact[cluster_rows], args)
+                row['cluster_stability'] = {
+                    'ari': round(float(adjusted_rand_score(full_labels, labels)), 4),
+                    'nmi': round(float(normalized_mutual_info_score(full_labels, labels)), 4),
+                    **cluster_summary(labels)
+                }
+
+            row['elapsed_seconds'] = round(time.time() - start, 1)
+            results.append(row)
+
+            stability = row.get('cluster_stability', {})
+            print(
+                f"   {row['dim']:>4}D {storage:<8} size={row['size_ratio']:.3f}  "
+                f"top1={row['esco_agreement']['top1_agreement']:.3f}  "
+                f"R@{args.k}={row['esco_agreement'][f'recall_at_{args.k}']:.3f}"
+                + (f"  ARI={stability['ari']:.3f}  NMI={stability['nmi']:.3f}" if stability else "")
+            )
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'snapshot': {'version': snapshot.version, 'content_hash': snapshot.content_hash},
+        'reference': {
+            'dim': full.shape[1],
+            'storage': 'float32',
+            'cluster_summary': cluster_summary(full_labels) if full_labels is not None else None
+        },
+        'parameters': {
+            'method': args.method,
+            'k': args.k,
+            'max_skills': args.max_skills,
+            'umap_neighbors': args.umap_neighbors,
+            'min_cluster_size': args.min_cluster_size,
+            'min_samples': args.min_samples
+        },
+        'results': results
+    }
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"compression_eval_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print()
+    print("=" * 80)
+    print(f"✅ Report saved: {output_path}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
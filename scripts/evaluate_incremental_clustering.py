@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Evaluate incremental cluster assignment against a full UMAP + HDBSCAN refit.
+
+Simulates the nightly flow of assign_new_skills_task on an embedding snapshot:
+
+    1. Hold out a share of skills as "new" (random, or the least frequent ones)
+    2. Fit UMAP + HDBSCAN (prediction_data=True) on the remaining skills
+    3. Place the held-out skills with reducer.transform + approximate_predict
+    4. Refit from scratch on all skills
+    5. Compare both assignments (ARI / NMI / noise agreement) on the new
+       skills and on all skills, and report wall time of each path
+
+Usage:
+    python scripts/evaluate_incremental_clustering.py
+    python scripts/evaluate_incremental_clustering.py --snapshot latest --new-fractions 0.02,0.05,0.1
+    python scripts/evaluate_incremental_clustering.py --holdout rare --limit 20000
+"""
+
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.analyzer.dimension_reducer import DimensionReducer
+from src.analyzer.clustering import SkillClusterer
+from src.analyzer.model_store import assignment_agreement
+from src.embedder.snapshot import load_snapshot
+
+
+def fit_models(embeddings: np.ndarray, args):
+    reducer = DimensionReducer(
+        n_components=2,
+        n_neighbors=args.n_neighbors,
+        min_dist=0.1,
+        metric='cosine',
+        random_state=42
+    )
+    coordinates = reducer.fit_transform(embeddings)
+    clusterer = SkillClusterer(
+        min_cluster_size=args.min_cluster_size,
+        min_samples=args.min_samples,
+        metric='euclidean',
+        cluster_selection_method='eom',
+        prediction_data=True
+    )
+    labels = clusterer.fit_predict(coordinates)
+    return reducer, clusterer, labels
+
+
+def evaluate_fraction(embeddings: np.ndarray, frequencies: np.ndarray,
+                      new_fraction: float, args) -> Dict[str, Any]:
+    n = len(embeddings)
+    n_new = max(1, int(round(n * new_fraction)))
+
+    if args.holdout == 'rare':
+        # Newly seen skills tend to be rare ones
+        order = np.argsort(frequencies, kind='stable')
+        new_idx = np.sort(order[:n_new])
+    else:
+        new_idx = np.sort(np.random.default_rng(42).choice(n, n_new, replace=False))
+    old_mask = np.ones(n, dtype=bool)
+    old_mask[new_idx] = False
+
+    print(f"\n{'=' * 80}")
+    print(f"NEW FRACTION {new_fraction:.1%}: {n_new:,} new / {old_mask.sum():,} fitted")
+    print('=' * 80)
+
+    # Incremental path: fit on old skills, then place new ones
+    start = time.time()
+    reducer, clusterer, old_labels = fit_models(embeddings[old_mask], args)
+    fit_seconds = time.time() - start
+
+    start = time.time()
+    new_coords = reducer.transform(embeddings[new_idx])
+    new_labels, _ = clusterer.approximate_predict(new_coords)
+    assign_seconds = time.time() - start
+
+    incremental = np.empty(n, dtype=np.int64)
+    incremental[old_mask] = old_labels
+    incremental[new_idx] = new_labels
+
+    # Full refit on everything
+    start = time.time()
+    _, _, full_labels = fit_models(embeddings, args)
+    refit_seconds = time.time() - start
+
+    result = {
+        'new_fraction': new_fraction,
+        'n_new': int(n_new),
+        'n_fitted': int(old_mask.sum()),
+        'wall_seconds': {
+            'initial_fit': round(fit_seconds, 2),
+            'incremental_assign': round(assign_seconds, 3),
+            'full_refit': round(refit_seconds, 2)
+        },
+        'noise_ratio_new_incremental': float(np.mean(new_labels == -1)),
+        'noise_ratio_new_refit': float(np.mean(full_labels[new_idx] == -1)),
+        'agreement_new_skills': assignment_agreement(new_labels, full_labels[new_idx]),
+        'agreement_all_skills': assignment_agreement(incremental, full_labels)
+    }
+
+    print(f"   Assign: {assign_seconds:.3f}s | Full refit: {refit_seconds:.1f}s "
+          f"({refit_seconds / max(assign_seconds, 1e-6):.0f}x)")
+    print(f"   ARI new skills: {result['agreement_new_skills']['adjusted_rand_index']:.3f} | "
+          f"ARI all skills: {result['agreement_all_skills']['adjusted_rand_index']:.3f}")
+    print(f"   Noise among new: incremental {result['noise_ratio_new_incremental']:.1%} "
+          f"vs refit {result['noise_ratio_new_refit']:.1%}")
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental assignment vs full clustering refit")
+    parser.add_argument('--snapshot', default='latest', help='Embedding snapshot version/path')
+    parser.add_argument('--new-fractions', default='0.02,0.05,0.1', help='Comma-separated shares held out as new')
+    parser.add_argument('--holdout', choices=['random', 'rare'], default='random')
+    parser.add_argument('--limit', type=int, default=None, help='Use only the N most frequent skills')
+    parser.add_argument('--n-neighbors', type=int, default=15)
+    parser.add_argument('--min-cluster-size', type=int, default=15)
+    parser.add_argument('--min-samples', type=int, default=5)
+    parser.add_argument('--output-dir', default='outputs/clustering/incremental')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("INCREMENTAL CLUSTER ASSIGNMENT vs FULL REFIT")
+    print("=" * 80)
+
+    snapshot = load_snapshot(args.snapshot)
+    frequencies = snapshot.frequencies
+    embeddings = snapshot.as_float32()
+    if args.limit:
+        top = np.sort(np.argsort(-frequencies, kind='stable')[:args.limit])
+        embeddings = embeddings[top]
+        frequencies = frequencies[top]
+    print(f"   Snapshot {snapshot.version}: {embeddings.shape}")
+
+    results = [
+        evaluate_fraction(embeddings, frequencies, float(f), args)
+        for f in args.new_fractions.split(',')
+    ]
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'snapshot': {'version': snapshot.version, 'content_hash': snapshot.content_hash},
+        'parameters': {
+            'holdout': args.holdout,
+            'limit': args.limit,
+            'n_neighbors': args.n_neighbors,
+            'min_cluster_size': args.min_cluster_size,
+            'min_samples': args.min_samples
+        },
+        'results': results
+    }
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"incremental_vs_refit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print()
+    print("=" * 80)
+    print(f"✅ Report saved: {output_path}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
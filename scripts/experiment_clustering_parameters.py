@@ -10,9 +10,15 @@ Experiments:
 2. Varying UMAP n_neighbors (10, 15, 20, 30)
 3. Combinations of best parameters
 
+UMAP's nearest-neighbour graph is built once (NN-descent at the largest
+n_neighbors of the grid, cached under KNN_CACHE_DIR) and sliced for every
+experiment; experiments run across --workers processes sharing the embedding
+matrix through shared memory.
+
 Usage:
     python scripts/experiment_clustering_parameters.py
     python scripts/experiment_clustering_parameters.py --quick  # Only test min_cluster_size
+    python scripts/experiment_clustering_parameters.py --workers 4
 """
 
 import sys
@@ -35,6 +41,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.config.settings import get_settings
 from src.analyzer.dimension_reducer import DimensionReducer
 from src.analyzer.clustering import SkillClusterer
+from src.analyzer.knn_graph import build_knn_graph, load_or_build_knn_graph
+from src.analyzer.parameter_sweep import run_parameter_sweep
 
 
 def load_subset(subset_path: str) -> Tuple[List[str], List[int]]:
@@ -79,6 +87,7 @@ def fetch_embeddings(skill_texts: List[str]) -> np.ndarray:
 
 def run_experiment(
     embeddings: np.ndarray,
+    precomputed_knn,
     skill_texts: List[str],
     skill_frequencies: List[int],
     umap_params: Dict[str, Any],
@@ -89,8 +98,8 @@ def run_experiment(
 
     start_time = time.time()
 
-    # UMAP reduction
-    reducer = DimensionReducer(**umap_params)
+    # UMAP reduction (neighbour graph shared across the sweep)
+    reducer = DimensionReducer(**umap_params, precomputed_knn=precomputed_knn)
     coordinates = reducer.fit_transform(embeddings)
 
     # HDBSCAN clustering
@@ -338,6 +347,17 @@ def main():
         default='outputs/clustering/experiments',
         help="Output directory for experiment results"
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help="Worker processes for the grid (embeddings shared via shared memory)"
+    )
+    parser.add_argument(
+        '--no-knn-cache',
+        action='store_true',
+        help="Rebuild the shared kNN graph instead of reusing a cached one"
+    )
 
     args = parser.parse_args()
 
@@ -393,26 +413,42 @@ def main():
                 'hdbscan': {'min_cluster_size': mcs, 'min_samples': mcs, 'metric': 'euclidean'}
             })
 
-    print(f"\n🧪 Running {len(experiments)} experiments...\n")
-
-    # Run all experiments
-    all_results = []
-    for i, exp_config in enumerate(experiments, 1):
-        print(f"[{i}/{len(experiments)}] Running: {exp_config['name']}...", end=' ')
-
-        result = run_experiment(
-            embeddings,
-            skill_texts,
-            skill_frequencies,
-            exp_config['umap'],
-            exp_config['hdbscan'],
-            exp_config['name']
-        )
-
-        all_results.append(result)
-        print(f"✅ ({result['duration_seconds']:.1f}s)")
+    # Shared kNN graph at the largest n_neighbors of the grid
+    max_neighbors = max(exp['umap']['n_neighbors'] for exp in experiments)
+    print(f"\n🔗 Building shared kNN graph (k={max_neighbors})...")
+    if args.no_knn_cache:
+        knn_graph = build_knn_graph(embeddings, max_neighbors, metric='cosine')
+    else:
+        knn_graph = load_or_build_knn_graph(embeddings, max_neighbors, metric='cosine')
+    print(f"   ✅ Graph ready ({knn_graph.build_seconds:.1f}s to build)")
+
+    print(f"\n🧪 Running {len(experiments)} experiments on {args.workers} worker(s)...\n")
+
+    def report(i: int, result: Dict[str, Any]):
+        print(f"[{i + 1}/{len(experiments)}] {result['experiment_name']} "
+              f"✅ ({result['duration_seconds']:.1f}s)")
+
+    sweep_start = time.time()
+    all_results = run_parameter_sweep(
+        run_experiment,
+        [
+            (exp_config['umap']['n_neighbors'], {
+                'umap_params': exp_config['umap'],
+                'hdbscan_params': exp_config['hdbscan'],
+                'experiment_name': exp_config['name']
+            })
+            for exp_config in experiments
+        ],
+        embeddings,
+        knn_graph=knn_graph,
+        n_workers=args.workers,
+        shared={'skill_texts': skill_texts, 'skill_frequencies': skill_frequencies},
+        on_result=report
+    )
+    print(f"\n   Sweep wall time: {time.time() - sweep_start:.1f}s")
 
-        # Generate visualization
+    # Generate visualizations
+    for exp_config, result in zip(experiments, all_results):
         viz_path = f"{args.output}/viz_{exp_config['name']}.png"
         visualize_experiment(
             np.array(result['coordinates']),
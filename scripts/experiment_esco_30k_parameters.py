@@ -9,10 +9,17 @@ Experiments:
 - n_neighbors: [10, 15, 20, 30]
 - Total: 20 configurations
 
-Runtime: ~15-20 minutes
+Runtime: ~15-20 minutes (serial, first run). The UMAP kNN graph is built once at
+max(n_neighbors) and cached under KNN_CACHE_DIR; --workers N runs grid points in
+parallel over a shared-memory copy of the embeddings.
+
+Usage:
+    python scripts/experiment_esco_30k_parameters.py
+    python scripts/experiment_esco_30k_parameters.py --workers 4
 """
 
 import sys
+import argparse
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -26,6 +33,8 @@ from collections import Counter
 from config.settings import get_settings
 from analyzer.dimension_reducer import DimensionReducer
 from analyzer.clustering import SkillClusterer
+from analyzer.knn_graph import load_or_build_knn_graph
+from analyzer.parameter_sweep import run_parameter_sweep
 
 
 def get_esco_skills_with_embeddings() -> Tuple[List[str], List[int], np.ndarray]:
@@ -94,6 +103,7 @@ def get_esco_skills_with_embeddings() -> Tuple[List[str], List[int], np.ndarray]
 
 def run_experiment(
     embeddings: np.ndarray,
+    precomputed_knn,
     skill_texts: List[str],
     skill_frequencies: List[int],
     n_neighbors: int,
@@ -101,13 +111,15 @@ def run_experiment(
     exp_name: str
 ) -> Dict:
     """Run single clustering experiment."""
+    exp_start = time.time()
 
-    # UMAP
+    # UMAP (neighbour graph shared across the sweep)
     reducer = DimensionReducer(
         n_components=2,
         n_neighbors=n_neighbors,
         min_dist=0.1,
-        metric='cosine'
+        metric='cosine',
+        precomputed_knn=precomputed_knn
     )
 
     coordinates = reducer.fit_transform(embeddings)
@@ -141,12 +153,17 @@ def run_experiment(
         'davies_bouldin': metrics.get('davies_bouldin_score', 0),
         'labels': labels,
         'coordinates': coordinates,
-        'cluster_analysis': cluster_analysis
+        'cluster_analysis': cluster_analysis,
+        'duration_seconds': time.time() - exp_start
     }
 
 
 def main():
     """Main execution."""
+    parser = argparse.ArgumentParser(description="ESCO 30k UMAP + HDBSCAN parameter sweep")
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for the grid (embeddings shared via shared memory)')
+    args = parser.parse_args()
 
     print("="*80)
     print("ESCO 30K - PARAMETER EXPERIMENTATION")
@@ -171,25 +188,30 @@ def main():
     print(f"   min_cluster_size: {min_cluster_size_vals}")
     print()
 
+    # Shared kNN graph at the largest n_neighbors
+    knn_graph = load_or_build_knn_graph(embeddings, max(n_neighbors_vals), metric='cosine')
+    print(f"🔗 Shared kNN graph k={knn_graph.n_neighbors} ({knn_graph.build_seconds:.1f}s to build)")
+    print()
+
     # Run experiments
-    results = []
     start_time = time.time()
 
-    for i, (nn, mcs, name) in enumerate(experiments, 1):
-        exp_start = time.time()
-
-        print(f"[{i}/{len(experiments)}] {name}...", end=" ", flush=True)
-
-        result = run_experiment(
-            embeddings, skill_texts, skill_frequencies,
-            nn, mcs, name
-        )
-
-        exp_time = time.time() - exp_start
-        print(f"✓ ({exp_time:.1f}s) - {result['n_clusters']} clusters, "
-              f"sil={result['silhouette']:.3f}")
-
-        results.append(result)
+    def report(i: int, result: Dict):
+        print(f"[{i + 1}/{len(experiments)}] {result['exp_name']} ✓ ({result['duration_seconds']:.1f}s) - "
+              f"{result['n_clusters']} clusters, sil={result['silhouette']:.3f}")
+
+    results = run_parameter_sweep(
+        run_experiment,
+        [
+            (nn, {'n_neighbors': nn, 'min_cluster_size': mcs, 'exp_name': name})
+            for nn, mcs, name in experiments
+        ],
+        embeddings,
+        knn_graph=knn_graph,
+        n_workers=args.workers,
+        shared={'skill_texts': skill_texts, 'skill_frequencies': skill_frequencies},
+        on_result=report
+    )
 
     total_time = time.time() - start_time
 
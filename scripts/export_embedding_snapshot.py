@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Export skill embeddings to a versioned, memory-mapped snapshot.
+
+Streams skill_embeddings from PostgreSQL through a server-side cursor and writes:
+    data/snapshots/embeddings/<version>/embeddings.npy     (n_skills × 768, float32)
+    data/snapshots/embeddings/<version>/metadata.parquet   (skill_text, frequency, skill_type, esco_uri)
+    data/snapshots/embeddings/<version>/manifest.json
+
+Analysis scripts (clustering_esco_30k_final.py, temporal_clustering_analysis.py,
+clustering_generic.py) and run_clustering_task can then open the snapshot with
+src.embedder.snapshot.load_snapshot() instead of querying vectors row by row.
+
+Usage:
+    python scripts/export_embedding_snapshot.py
+    python scripts/export_embedding_snapshot.py --esco-only --skill-type hard --version esco_hard_v1
+
+    # Compact snapshot: project with a fitted projection and store int8 + per-vector scales
+    python scripts/export_embedding_snapshot.py --projection data/embeddings/compact_projection.npz --dtype int8
+"""
+
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+
+import numpy as np
+import psycopg2
+from pgvector.psycopg2 import register_vector
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.config.settings import get_settings
+from src.embedder.snapshot import SnapshotWriter, SNAPSHOT_DTYPES
+from src.embedder.compression import EmbeddingCompressor
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+FETCH_SIZE = 5000
+
+
+def build_query(esco_only: bool, skill_type: str = None) -> tuple:
+    """
+    Build the export query.
+
+    Frequencies, skill type and ESCO URI come from extracted_skills
+    (NER + Regex, same filter as the clustering scripts), aggregated over all
+    raw variants that share an embedding (skill_canonical_map). Skills without
+    any extraction keep frequency 0 unless a filter excludes them.
+    """
+    conditions = ["es.extraction_method IN ('ner', 'regex')"]
+    params = []
+
+    if skill_type:
+        conditions.append("es.skill_type = %s")
+        params.append(skill_type)
+    if esco_only:
+        conditions.append("es.esco_uri IS NOT NULL")
+
+    join_type = "JOIN" if (esco_only or skill_type) else "LEFT JOIN"
+
+    query = f"""
+        SELECT
+            se.skill_text,
+            se.embedding,
+            COALESCE(stats.frequency, 0) AS frequency,
+            stats.skill_type,
+            stats.esco_uri
+        FROM skill_embeddings se
+        {join_type} (
+            SELECT
+                LOWER(TRIM(COALESCE(m.embedding_key, es.skill_text))) AS skill_key,
+                COUNT(*) AS frequency,
+                MODE() WITHIN GROUP (ORDER BY es.skill_type) AS skill_type,
+                MAX(es.esco_uri) AS esco_uri
+            FROM extracted_skills es
+            LEFT JOIN skill_canonical_map m ON m.skill_text = es.skill_text
+            WHERE {' AND '.join(conditions)}
+            GROUP BY LOWER(TRIM(COALESCE(m.embedding_key, es.skill_text)))
+        ) stats ON stats.skill_key = LOWER(TRIM(se.skill_text))
+        ORDER BY frequency DESC, se.skill_text
+    """
+    return query, params
+
+
+def export_snapshot(args) -> Path:
+    """Stream the query result into a SnapshotWriter."""
+    settings = get_settings()
+    conn = psycopg2.connect(settings.database_url)
+    register_vector(conn)
+
+    compressor = EmbeddingCompressor.load(args.projection) if args.projection else None
+
+    query, params = build_query(args.esco_only, args.skill_type)
+
+    # Count first: the .npy file is preallocated
+    count_cursor = conn.cursor()
+    count_cursor.execute(f"SELECT COUNT(*) FROM ({query}) q", params)
+    n_rows = count_cursor.fetchone()[0]
+    count_cursor.close()
+
+    if n_rows == 0:
+        conn.close()
+        raise SystemExit("No embeddings matched the export filters")
+
+    logger.info(f"Exporting {n_rows:,} embeddings...")
+
+    writer = SnapshotWriter(
+        base_dir=args.output_dir or settings.embedding_snapshot_dir,
+        n_rows=n_rows,
+        dim=compressor.dim if compressor else args.dim,
+        version=args.version,
+        dtype=args.dtype,
+        model_name=settings.embedding_model,
+        source={
+            'table': 'skill_embeddings',
+            'frequency_source': 'extracted_skills (ner, regex)',
+            'esco_only': args.esco_only,
+            'skill_type': args.skill_type
+        },
+        compression=compressor.to_dict() if compressor else None
+    )
+
+    # Named cursor = server-side cursor, rows arrive in FETCH_SIZE chunks
+    cursor = conn.cursor(name='embedding_snapshot_export')
+    cursor.itersize = FETCH_SIZE
+    cursor.execute(query, params)
+
+    while True:
+        rows = cursor.fetchmany(FETCH_SIZE)
+        if not rows:
+            break
+        embeddings = np.vstack([row[1] for row in rows])
+        if compressor:
+            embeddings = compressor.transform(embeddings)
+        writer.write_batch(
+            skill_texts=[row[0] for row in rows],
+            embeddings=embeddings,
+            frequencies=[row[2] for row in rows],
+            skill_types=[row[3] for row in rows],
+            esco_uris=[row[4] for row in rows]
+        )
+
+    cursor.close()
+    conn.close()
+
+    return writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export skill embeddings to a memory-mapped snapshot")
+    parser.add_argument('--version', default=None, help='Snapshot version name (default: timestamp)')
+    parser.add_argument('--output-dir', default=None, help='Snapshot root (default: EMBEDDING_SNAPSHOT_DIR)')
+    parser.add_argument('--esco-only', action='store_true', help='Only skills with an ESCO mapping')
+    parser.add_argument('--skill-type', default=None, help='Only skills of this type (hard, soft)')
+    parser.add_argument('--dim', type=int, default=768, help='Embedding dimension')
+    parser.add_argument('--dtype', choices=SNAPSHOT_DTYPES, default='float32',
+                        help='Storage dtype (int8 adds per-vector scales)')
+    parser.add_argument('--projection', default=None,
+                        help='Apply a fitted projection (.npz from compact_skill_embeddings.py)')
+    args = parser.parse_args()
+
+    logger.info("=" * 80)
+    logger.info("EMBEDDING SNAPSHOT EXPORT")
+    logger.info("=" * 80)
+
+    start = time.time()
+    path = export_snapshot(args)
+    elapsed = time.time() - start
+
+    logger.info("")
+    logger.info("=" * 80)
+    logger.info(f"✅ Snapshot written to {path} in {elapsed:.1f}s")
+    logger.info("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,20 +4,37 @@ Generate embeddings for ALL skills in extracted_skills table.
 
 This script generates embeddings for all unique skill_text values in extracted_skills
 that don't already have embeddings in skill_embeddings table.
+
+Raw texts are first canonicalized (SkillNormalizer.canonical_key: case, accents,
+whitespace, punctuation, CANONICAL_NAMES aliases) and recorded in
+skill_canonical_map (migration 012). Only distinct canonical forms without a
+vector are encoded, so "Python", "python", "PYTHON " and "Pythón" share one
+embedding. Existing raw-keyed embeddings are reused for their canonical group.
+
+Usage:
+    python scripts/generate_all_extracted_skills_embeddings.py
+    python scripts/generate_all_extracted_skills_embeddings.py --report   # backlog shrink, no writes
 """
 
 import sys
 import os
+import json
 import logging
 import argparse
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
 import psycopg2
+from psycopg2.extras import execute_values
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from tqdm import tqdm
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from src.config import get_settings
+from src.evaluation.normalizer import get_canonical_key
 
 # Setup logging
 logging.basicConfig(
@@ -51,22 +68,115 @@ def get_db_connection():
     )
 
 
+def build_canonical_map(
+    raw_texts: List[str],
+    embedded_texts: Set[str],
+    existing: Optional[Dict[str, Tuple[str, str]]] = None
+) -> List[Tuple[str, str, str]]:
+    """
+    Compute (skill_text, canonical_text, embedding_key) rows for unmapped raw texts.
+
+    The embedding key of a canonical group is, in order of preference:
+        1. the key already used by the group in skill_canonical_map
+        2. the canonical text, if it already has an embedding
+        3. an existing raw-keyed embedding of any variant (legacy rows, reused)
+        4. the canonical text (to be encoded)
+
+    Args:
+        raw_texts: Distinct raw skill_text values
+        embedded_texts: skill_text values present in skill_embeddings
+        existing: Current map {skill_text: (canonical_text, embedding_key)}
+
+    Returns:
+        New map rows (raw texts already mapped are skipped)
+    """
+    existing = existing or {}
+
+    group_key = {canonical: key for canonical, key in existing.values()}
+    canonical_of = {}
+    embedded_variant = {}
+
+    for raw in raw_texts:
+        canonical = get_canonical_key(raw)
+        if not canonical:
+            continue
+        canonical_of[raw] = canonical
+        if raw in embedded_texts:
+            embedded_variant.setdefault(canonical, raw)
+
+    rows = []
+    for raw, canonical in canonical_of.items():
+        if raw in existing:
+            continue
+        key = group_key.get(canonical)
+        if key is None:
+            if canonical in embedded_texts:
+                key = canonical
+            else:
+                key = embedded_variant.get(canonical, canonical)
+            group_key[canonical] = key
+        rows.append((raw, canonical, key))
+
+    return rows
+
+
+def load_skill_state(cursor) -> Tuple[List[str], Set[str], Dict[str, Tuple[str, str]]]:
+    """Load distinct raw skills, embedded texts and the current canonical map."""
+    cursor.execute("SELECT DISTINCT skill_text FROM extracted_skills WHERE skill_text IS NOT NULL")
+    raw_texts = [row[0] for row in cursor.fetchall()]
+
+    cursor.execute("SELECT skill_text FROM skill_embeddings")
+    embedded_texts = {row[0] for row in cursor.fetchall()}
+
+    cursor.execute("SELECT skill_text, canonical_text, embedding_key FROM skill_canonical_map")
+    existing = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+    return raw_texts, embedded_texts, existing
+
+
+def sync_canonical_map():
+    """Insert skill_canonical_map rows for raw skills that are not mapped yet."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    raw_texts, embedded_texts, existing = load_skill_state(cursor)
+    rows = build_canonical_map(raw_texts, embedded_texts, existing)
+
+    if rows:
+        execute_values(
+            cursor,
+            """
+            INSERT INTO skill_canonical_map (skill_text, canonical_text, embedding_key)
+            VALUES %s
+            ON CONFLICT (skill_text) DO NOTHING
+            """,
+            rows,
+            page_size=5000
+        )
+        conn.commit()
+
+    cursor.close()
+    conn.close()
+
+    logger.info(f"Canonical map: {len(existing) + len(rows):,} raw skills ({len(rows):,} new)")
+
+
 def get_missing_skills():
-    """Get all skills from extracted_skills that don't have embeddings."""
+    """Get canonical embedding keys that don't have embeddings yet."""
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    logger.info("Fetching skills without embeddings from extracted_skills...")
+    logger.info("Fetching canonical skills without embeddings...")
 
     cursor.execute("""
-        SELECT DISTINCT skill_text
-        FROM extracted_skills es
+        SELECT DISTINCT m.embedding_key
+        FROM skill_canonical_map m
         WHERE NOT EXISTS (
             SELECT 1
             FROM skill_embeddings se
-            WHERE se.skill_text = es.skill_text
+            WHERE se.skill_text = m.embedding_key
         )
-        ORDER BY skill_text
+        ORDER BY m.embedding_key
     """)
 
     skills = [row[0] for row in cursor.fetchall()]
@@ -74,10 +184,70 @@ def get_missing_skills():
     cursor.close()
     conn.close()
 
-    logger.info(f"Found {len(skills):,} skills without embeddings")
+    logger.info(f"Found {len(skills):,} canonical skills without embeddings")
     return skills
 
 
+def backlog_report(output_dir: str = "outputs/embeddings") -> Dict:
+    """
+    Compare the embedding backlog keyed on raw text vs canonical form.
+
+    Read-only: nothing is written to the database.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    raw_texts, embedded_texts, _ = load_skill_state(cursor)
+    cursor.close()
+    conn.close()
+
+    # Report against an empty map: how the current data collapses from scratch
+    rows = build_canonical_map(raw_texts, embedded_texts)
+
+    groups = defaultdict(list)
+    for raw, canonical, _ in rows:
+        groups[canonical].append(raw)
+
+    raw_missing = [raw for raw in raw_texts if raw not in embedded_texts]
+    canonical_missing = {key for _, _, key in rows if key not in embedded_texts}
+    reduction = 1 - len(canonical_missing) / len(raw_missing) if raw_missing else 0.0
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'distinct_raw_skills': len(raw_texts),
+        'distinct_canonical_skills': len(groups),
+        'dropped_empty_after_cleaning': len(raw_texts) - len(rows),
+        'backlog_raw_keyed': len(raw_missing),
+        'backlog_canonical_keyed': len(canonical_missing),
+        'backlog_reduction_pct': round(reduction * 100, 2),
+        'vector_count_reduction_pct': round((1 - len(groups) / len(raw_texts)) * 100, 2) if raw_texts else 0.0,
+        'largest_groups': [
+            {'canonical_text': canonical, 'variants': len(variants), 'examples': sorted(variants)[:10]}
+            for canonical, variants in sorted(groups.items(), key=lambda item: -len(item[1]))[:25]
+        ]
+    }
+
+    logger.info("="*80)
+    logger.info("CANONICAL EMBEDDING BACKLOG REPORT")
+    logger.info("="*80)
+    logger.info(f"Distinct raw skills:        {report['distinct_raw_skills']:,}")
+    logger.info(f"Distinct canonical skills:  {report['distinct_canonical_skills']:,} "
+                f"(-{report['vector_count_reduction_pct']}% vectors)")
+    logger.info(f"Backlog keyed on raw text:  {report['backlog_raw_keyed']:,}")
+    logger.info(f"Backlog keyed on canonical: {report['backlog_canonical_keyed']:,} "
+                f"(-{report['backlog_reduction_pct']}%)")
+    logger.info("Largest groups:")
+    for group in report['largest_groups'][:10]:
+        logger.info(f"   {group['canonical_text']!r}: {group['variants']} variants, e.g. {group['examples'][:4]}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"canonical_backlog_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    logger.info(f"Report saved: {output_path}")
+
+    return report
+
+
 def generate_embeddings(skills, batch_size=256):
     """Generate embeddings for skills."""
     logger.info(f"Loading model: {MODEL_NAME}")
@@ -124,8 +294,14 @@ def save_embeddings(skills, embeddings):
 def main():
     parser = argparse.ArgumentParser(description="Generate embeddings for extracted_skills")
     parser.add_argument('--batch-size', type=int, default=256, help='Batch size for embedding generation')
+    parser.add_argument('--report', action='store_true',
+                        help='Only report how canonicalization shrinks the backlog (no writes)')
     args = parser.parse_args()
 
+    if args.report:
+        backlog_report()
+        return
+
     logger.info("="*80)
     logger.info("EXTRACTED SKILLS EMBEDDINGS GENERATOR")
     logger.info("="*80)
@@ -133,7 +309,8 @@ def main():
     logger.info(f"Batch size: {args.batch_size}")
     logger.info("")
 
-    # Get missing skills
+    # Map raw texts to canonical embedding keys, then get missing keys
+    sync_canonical_map()
     skills = get_missing_skills()
 
     if len(skills) == 0:
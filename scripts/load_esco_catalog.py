@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Bulk-load the ESCO taxonomy (+ O*NET Hot Technologies) with a staged swap.
+
+Replaces the row-by-row DELETE + INSERT of import_real_esco.py /
+import_onet_hot_tech_skills.py:
+
+    1. Parse all ESCO collections and O*NET Technology_Skills.txt
+    2. COPY into esco_skills_staging / esco_skill_groups_staging
+    3. Carry over manually curated rows (skill_uri 'manual:%') from the live table
+    4. Build indexes on staging, compute the catalog checksum
+    5. Swap staging in atomically and record an esco_catalog_versions row (migration 013)
+
+If the checksum equals the current catalog version the swap is skipped
+(use --force to reload anyway).
+
+Usage:
+    python scripts/load_esco_catalog.py
+    python scripts/load_esco_catalog.py --no-onet
+    python scripts/load_esco_catalog.py --force
+"""
+
+import sys
+import csv
+import time
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pandas as pd
+import psycopg2
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.config.settings import get_settings
+from src.database.esco_catalog import (
+    StagedTableLoader,
+    get_current_catalog_version,
+    record_catalog_version,
+    table_checksum,
+    unique_by_key
+)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+ESCO_DIR = DATA_DIR / "esco"
+ONET_FILE = DATA_DIR / "onet" / "Technology_Skills.txt"
+
+# Same collections and order as import_real_esco.py (first occurrence of a URI wins)
+ESCO_COLLECTIONS = [
+    ("Main Skills", "skills_es.csv", "General Skills"),
+    ("Digital Skills", "digitalSkillsCollection_es.csv", "Digital Skills"),
+    ("Transversal Skills", "transversalSkillsCollection_es.csv", "Soft Skills"),
+    ("Digital Competence", "digCompSkillsCollection_es.csv", "Digital Competence"),
+    ("Green Skills", "greenSkillsCollection_es.csv", "Sustainability"),
+    ("Language Skills", "languageSkillsCollection_es.csv", "Languages"),
+    ("Research Skills", "researchSkillsCollection_es.csv", "Research & Academic"),
+]
+SKILL_GROUPS_FILE = "skillGroups_es.csv"
+
+SKILL_COLUMNS = (
+    'skill_uri', 'skill_id', 'preferred_label_es', 'preferred_label_en',
+    'description_es', 'description_en', 'skill_type', 'skill_group', 'skill_family',
+    'is_active'
+)
+GROUP_COLUMNS = ('group_id', 'group_name_es', 'group_name_en', 'description_es', 'description_en')
+
+# Same generic-term filter as import_onet_hot_tech_skills.py
+ONET_SKIP_PATTERNS = ['software', 'Software', 'system', 'System', 'tool', 'Tool',
+                      'application', 'Application']
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_esco_skills(source_files: Dict[str, str]) -> List[Tuple]:
+    """ESCO collections → esco_skills rows (same field mapping as import_real_esco.py)."""
+    rows = []
+    for collection_name, filename, skill_group in ESCO_COLLECTIONS:
+        csv_file = ESCO_DIR / filename
+        if not csv_file.exists():
+            print(f"   ⚠️  {collection_name}: file not found ({csv_file})")
+            continue
+
+        source_files[filename] = file_sha256(csv_file)
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                skill_uri = row.get('conceptUri', '')
+                preferred_label_es = row.get('preferredLabel', '')
+                if not (skill_uri and preferred_label_es):
+                    continue
+                rows.append((
+                    skill_uri,
+                    skill_uri.split('/')[-1],
+                    preferred_label_es,
+                    '',
+                    row.get('description', ''),
+                    '',
+                    row.get('skillType', 'knowledge'),
+                    skill_group or row.get('skillGroup', ''),
+                    row.get('conceptType', 'knowledge'),
+                    True
+                ))
+
+    return unique_by_key(rows)
+
+
+def read_onet_skills(source_files: Dict[str, str]) -> List[Tuple]:
+    """O*NET Hot Technologies for IT occupations → esco_skills rows."""
+    if not ONET_FILE.exists():
+        print(f"   ⚠️  O*NET: file not found ({ONET_FILE})")
+        return []
+
+    source_files[ONET_FILE.name] = file_sha256(ONET_FILE)
+    df = pd.read_csv(ONET_FILE, delimiter='\t', encoding='utf-8')
+    hot_tech_df = df[(df['O*NET-SOC Code'].str.startswith('15-')) & (df['Hot Technology'] == 'Y')]
+    unique_techs = hot_tech_df[['Example', 'Commodity Title', 'In Demand']].drop_duplicates(subset=['Example'])
+    unique_techs = unique_techs.sort_values('Example')
+
+    rows = []
+    for _, row in unique_techs.iterrows():
+        tech_name = row['Example'].strip()
+        tech_category = row['Commodity Title'].strip()
+
+        words = tech_name.split()
+        if len(words) > 2 and any(pattern in tech_name for pattern in ONET_SKIP_PATTERNS):
+            continue
+
+        n = len(rows)
+        rows.append((
+            f"onet:hot:{n:04d}",
+            f"hot:{n:04d}",
+            tech_name,
+            tech_name,  # No traducir nombres técnicos
+            f"Tecnología: {tech_category}",
+            f"Technology: {tech_category}",
+            'onet_in_demand' if row['In Demand'] == 'Y' else 'onet_hot_tech',
+            tech_category,
+            'IT & Software Development',
+            True
+        ))
+
+    return rows
+
+
+def read_skill_groups(source_files: Dict[str, str]) -> List[Tuple]:
+    groups_file = ESCO_DIR / SKILL_GROUPS_FILE
+    if not groups_file.exists():
+        print(f"   ⚠️  Skill groups: file not found ({groups_file})")
+        return []
+
+    source_files[SKILL_GROUPS_FILE] = file_sha256(groups_file)
+    rows = []
+    with open(groups_file, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            group_id = row.get('code', '')
+            group_name_es = row.get('preferredLabel', '')
+            if group_id and group_name_es:
+                rows.append((group_id, group_name_es, '', row.get('description', ''), ''))
+    return unique_by_key(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Staged bulk load of ESCO + O*NET taxonomy")
+    parser.add_argument('--no-onet', action='store_true', help='Skip O*NET Hot Technologies')
+    parser.add_argument('--force', action='store_true', help='Swap even if the checksum is unchanged')
+    args = parser.parse_args()
+
+    settings = get_settings()
+    timings = {}
+    source_files = {}
+    total_start = time.time()
+
+    print("=" * 70)
+    print("ESCO CATALOG LOAD (staged COPY + atomic swap)")
+    print("=" * 70)
+
+    # 1. Parse sources
+    start = time.time()
+    esco_rows = read_esco_skills(source_files)
+    onet_rows = [] if args.no_onet else read_onet_skills(source_files)
+    group_rows = read_skill_groups(source_files)
+    timings['parse'] = time.time() - start
+    print(f"   ESCO skills: {len(esco_rows):,} | O*NET: {len(onet_rows):,} | Groups: {len(group_rows):,}")
+
+    if not esco_rows:
+        print("❌ No ESCO rows parsed, aborting (live catalog untouched)")
+        sys.exit(1)
+
+    conn = psycopg2.connect(settings.database_url)
+    skills_loader = StagedTableLoader(conn, 'esco_skills', SKILL_COLUMNS)
+    groups_loader = StagedTableLoader(conn, 'esco_skill_groups', GROUP_COLUMNS)
+
+    try:
+        # 2-3. COPY into staging
+        start = time.time()
+        skills_loader.create_staging()
+        groups_loader.create_staging()
+        skills_loader.copy_rows(esco_rows)
+        skills_loader.copy_rows(onet_rows)
+        manual_count = skills_loader.copy_from_live(
+            f"skill_uri LIKE 'manual:%' AND skill_uri NOT IN "
+            f"(SELECT skill_uri FROM {skills_loader.staging})"
+        )
+        groups_loader.copy_rows(group_rows)
+        timings['copy'] = time.time() - start
+        print(f"   Carried over curated rows: {manual_count:,}")
+
+        # 4. Indexes + checksum
+        start = time.time()
+        n_indexes = skills_loader.build_indexes() + groups_loader.build_indexes()
+        timings['index'] = time.time() - start
+
+        cursor = conn.cursor()
+        checksum = table_checksum(cursor, skills_loader.staging)
+        current = get_current_catalog_version(cursor)
+        cursor.close()
+        conn.commit()
+
+        if current and current['checksum'] == checksum and not args.force:
+            skills_loader.discard()
+            groups_loader.discard()
+            print(f"✅ Catalog unchanged (version {current['version_id']}, checksum {checksum[:12]}), swap skipped")
+            return
+
+        # 5. Atomic swap + version row
+        start = time.time()
+        skills_loader.swap()
+        groups_loader.swap()
+        timings['swap'] = time.time() - start
+
+        load_seconds = time.time() - total_start
+        cursor = conn.cursor()
+        version_id = record_catalog_version(
+            cursor,
+            checksum,
+            row_counts={
+                'esco': len(esco_rows),
+                'onet': len(onet_rows),
+                'manual': manual_count,
+                'skill_groups': len(group_rows)
+            },
+            source_files=source_files,
+            load_seconds=round(load_seconds, 2)
+        )
+        conn.commit()
+        cursor.close()
+
+    except Exception:
+        skills_loader.discard()
+        groups_loader.discard()
+        raise
+    finally:
+        conn.close()
+
+    print()
+    print("=" * 70)
+    print(f"✅ CATALOG VERSION {version_id} LIVE (checksum {checksum[:12]})")
+    print("=" * 70)
+    print(f"   Rows:     {skills_loader.rows_loaded:,} skills, {groups_loader.rows_loaded:,} groups")
+    print(f"   Indexes:  {n_indexes} rebuilt on staging")
+    for phase, seconds in timings.items():
+        print(f"   {phase:<8}  {seconds:6.2f}s")
+    print(f"   total     {load_seconds:6.2f}s")
+
+
+if __name__ == '__main__':
+    main()
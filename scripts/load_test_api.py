@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Load test the dashboard endpoints of a running API under concurrent traffic.
+
+Each virtual user loops over a weighted mix of the requests the dashboard
+issues (stats, filtered stats, per-country stats, top/search skills, job
+listings, temporal) for --duration seconds. Every concurrency level reports
+throughput, p50/p95/p99 latency and errors (HTTP >= 400, timeouts).
+
+Compare the async routers with the previous sync ones by running the same
+test against both (disable the response cache on the server so the database
+path is measured):
+
+    git checkout <sync commit> && API_CACHE_ENABLED=false uvicorn src.api.main:app --workers 1
+    python scripts/load_test_api.py --label sync
+
+    git checkout <async commit> && API_CACHE_ENABLED=false uvicorn src.api.main:app --workers 1
+    python scripts/load_test_api.py --label async
+
+    python scripts/load_test_api.py --compare outputs/benchmarks/load_test/sync_*.json \\
+        outputs/benchmarks/load_test/async_*.json
+
+Results are written to outputs/benchmarks/load_test/.
+
+Usage:
+    python scripts/load_test_api.py --base-url http://localhost:8000 --concurrency 10,50,100 --duration 30
+"""
+
+import json
+import time
+import random
+import asyncio
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+import httpx
+import numpy as np
+
+# (name, path, params, weight) — roughly what one dashboard session requests
+TRAFFIC_MIX: List[Tuple[str, str, Dict[str, Any], int]] = [
+    ('stats', '/api/stats', {}, 10),
+    ('stats/filtered', '/api/stats/filtered', {'country': 'CO', 'extraction_method': 'pipeline_a'}, 15),
+    ('stats/filtered?job_status', '/api/stats/filtered', {'country': 'MX', 'job_status': 'cleaned'}, 10),
+    ('stats/by-country', '/api/stats/by-country', {}, 10),
+    ('skills/top', '/api/skills/top', {'limit': 20}, 15),
+    ('skills/top?country&type', '/api/skills/top', {'country': 'CO', 'skill_type': 'hard', 'limit': 50}, 10),
+    ('skills/search', '/api/skills/search', {'query': 'python', 'page_size': 50}, 10),
+    ('jobs', '/api/jobs', {'limit': 50}, 10),
+    ('jobs?country', '/api/jobs', {'country': 'AR', 'job_status': 'cleaned', 'limit': 50}, 5),
+    ('temporal/skills', '/api/temporal/skills', {}, 5),
+]
+
+
+def latency_stats(latencies_ms: List[float]) -> Dict[str, float]:
+    if not latencies_ms:
+        return {'mean_ms': None, 'p50_ms': None, 'p95_ms': None, 'p99_ms': None}
+    arr = np.asarray(latencies_ms)
+    return {
+        'mean_ms': round(float(arr.mean()), 3),
+        'p50_ms': round(float(np.percentile(arr, 50)), 3),
+        'p95_ms': round(float(np.percentile(arr, 95)), 3),
+        'p99_ms': round(float(np.percentile(arr, 99)), 3)
+    }
+
+
+async def virtual_user(client: httpx.AsyncClient, deadline: float, rng: random.Random,
+                       samples: Dict[str, List[float]], errors: Dict[str, int]):
+    weights = [weight for *_, weight in TRAFFIC_MIX]
+    while time.perf_counter() < deadline:
+        name, path, params, _ = rng.choices(TRAFFIC_MIX, weights=weights)[0]
+        t0 = time.perf_counter()
+        try:
+            response = await client.get(path, params=params)
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        elapsed = (time.perf_counter() - t0) * 1000
+        if failed:
+            errors[name] = errors.get(name, 0) + 1
+        else:
+            samples.setdefault(name, []).append(elapsed)
+
+
+async def run_level(base_url: str, concurrency: int, duration: float, timeout: float, seed: int) -> Dict[str, Any]:
+    samples: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            virtual_user(client, deadline, random.Random(seed + i), samples, errors)
+            for i in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    all_latencies = [ms for values in samples.values() for ms in values]
+    total_errors = sum(errors.values())
+    return {
+        'concurrency': concurrency,
+        'seconds': round(elapsed, 1),
+        'requests': len(all_latencies) + total_errors,
+        'errors': total_errors,
+        'throughput_rps': round(len(all_latencies) / elapsed, 1),
+        'latency': latency_stats(all_latencies),
+        'by_request': {
+            name: {**latency_stats(samples.get(name, [])), 'count': len(samples.get(name, [])),
+                   'errors': errors.get(name, 0)}
+            for name, *_ in TRAFFIC_MIX
+        }
+    }
+
+
+def print_level(result: Dict[str, Any]):
+    latency = result['latency']
+    print(f"   c={result['concurrency']:<5} {result['throughput_rps']:>8} req/s   "
+          f"p50={latency['p50_ms']}ms p95={latency['p95_ms']}ms p99={latency['p99_ms']}ms   "
+          f"errors={result['errors']}/{result['requests']}")
+
+
+def compare(paths: List[str]):
+    reports = [json.loads(Path(p).read_text(encoding='utf-8')) for p in paths]
+    base, other = reports
+    print(f"{'concurrency':<12}{'metric':<16}{base['label']:>14}{other['label']:>14}{'change':>10}")
+    for a in base['results']:
+        b = next((r for r in other['results'] if r['concurrency'] == a['concurrency']), None)
+        if b is None:
+            continue
+        rows = [('req/s', a['throughput_rps'], b['throughput_rps'])]
+        rows += [(f"{p} ms", a['latency'][f'{p}_ms'], b['latency'][f'{p}_ms']) for p in ('p50', 'p95', 'p99')]
+        rows.append(('errors', a['errors'], b['errors']))
+        for metric, x, y in rows:
+            change = f"{(y - x) / x * 100:+.0f}%" if x and y is not None else '-'
+            print(f"{a['concurrency']:<12}{metric:<16}{x!s:>14}{y!s:>14}{change:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the dashboard API endpoints")
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--concurrency', default='10,50,100', help='Comma-separated concurrent users')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds per concurrency level')
+    parser.add_argument('--timeout', type=float, default=30, help='Per-request timeout (counted as error)')
+    parser.add_argument('--label', default='run', help='Name of this setup (e.g. sync, async)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output-dir', default='outputs/benchmarks/load_test')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'OTHER'), help='Compare two saved reports')
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.compare)
+        return
+
+    levels = [int(c) for c in args.concurrency.split(',')]
+
+    print("=" * 80)
+    print(f"API LOAD TEST ({args.label}) → {args.base_url}")
+    print("=" * 80)
+
+    results = []
+    for concurrency in levels:
+        result = asyncio.run(run_level(args.base_url, concurrency, args.duration, args.timeout, args.seed))
+        results.append(result)
+        print_level(result)
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'label': args.label,
+        'parameters': {'base_url': args.base_url, 'concurrency': levels, 'duration': args.duration,
+                       'timeout': args.timeout, 'seed': args.seed},
+        'traffic_mix': [{'request': name, 'path': path, 'params': params, 'weight': weight}
+                        for name, path, params, weight in TRAFFIC_MIX],
+        'results': results
+    }
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"{args.label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print()
+    print("=" * 80)
+    print(f"✅ Report saved: {output_path}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,12 +9,19 @@ This script:
 4. Saves skill_text to index mapping to data/embeddings/esco_mapping.pkl
 
 FAISS provides 25x faster semantic search than PostgreSQL pgvector.
+
+Optional compact index (--compact-dim / --storage):
+    - PCA or truncation to a smaller dimension; the fitted projection is saved
+      to data/embeddings/esco_projection.npz and applied to queries by
+      ESCOMatcher3Layers
+    - float16 or int8 scalar-quantized storage (IndexScalarQuantizer)
 """
 
 import sys
 import pickle
+import argparse
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 
 import psycopg2
 import numpy as np
@@ -24,6 +31,16 @@ import faiss
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config.settings import get_settings
+from src.embedder.compression import EmbeddingCompressor
+
+PROJECTION_FILE = "esco_projection.npz"
+
+# Storage option → FAISS scalar quantizer (None = exact float32 IndexFlatIP)
+STORAGE_QUANTIZERS = {
+    'float32': None,
+    'float16': faiss.ScalarQuantizer.QT_fp16,
+    'int8': faiss.ScalarQuantizer.QT_8bit,
+}
 
 
 def load_embeddings_from_db() -> Tuple[List[str], np.ndarray]:
@@ -79,7 +96,7 @@ def load_embeddings_from_db() -> Tuple[List[str], np.ndarray]:
     return skill_texts, embeddings
 
 
-def build_faiss_index(embeddings: np.ndarray) -> faiss.Index:
+def build_faiss_index(embeddings: np.ndarray, storage: str = 'float32') -> faiss.Index:
     """
     Build FAISS IndexFlatIP index for cosine similarity search.
 
@@ -87,7 +104,8 @@ def build_faiss_index(embeddings: np.ndarray) -> faiss.Index:
     when embeddings are L2-normalized (which ours are).
 
     Args:
-        embeddings: Numpy array of shape (N, 768)
+        embeddings: Numpy array of shape (N, 768) or (N, compact_dim)
+        storage: 'float32' (exact), 'float16' or 'int8' (scalar quantized)
 
     Returns:
         FAISS index
@@ -98,14 +116,22 @@ def build_faiss_index(embeddings: np.ndarray) -> faiss.Index:
 
     dimension = embeddings.shape[1]
     print(f"   Dimension: {dimension}")
-    print(f"   Index type: IndexFlatIP (cosine similarity)")
+    quantizer_type = STORAGE_QUANTIZERS[storage]
+    if quantizer_type is None:
+        print(f"   Index type: IndexFlatIP (cosine similarity)")
+    else:
+        print(f"   Index type: IndexScalarQuantizer {storage} (cosine similarity)")
     print(f"   Total vectors: {len(embeddings):,}")
     print()
 
     # Create index
     # IndexFlatIP = exact search using inner product
     # For L2-normalized vectors, inner product = cosine similarity
-    index = faiss.IndexFlatIP(dimension)
+    if quantizer_type is None:
+        index = faiss.IndexFlatIP(dimension)
+    else:
+        index = faiss.IndexScalarQuantizer(dimension, quantizer_type, faiss.METRIC_INNER_PRODUCT)
+        index.train(embeddings)
 
     # Add embeddings to index
     print("🚀 Adding vectors to index...")
@@ -121,7 +147,8 @@ def build_faiss_index(embeddings: np.ndarray) -> faiss.Index:
 def save_index_and_mapping(
     index: faiss.Index,
     skill_texts: List[str],
-    output_dir: Path
+    output_dir: Path,
+    compressor: Optional[EmbeddingCompressor] = None
 ) -> None:
     """
     Save FAISS index and skill_text mapping to disk.
@@ -130,6 +157,7 @@ def save_index_and_mapping(
         index: FAISS index
         skill_texts: List of skill text labels
         output_dir: Directory to save files
+        compressor: Projection used to build a compact index (saved alongside)
     """
     print("=" * 70)
     print("SAVING INDEX AND MAPPING")
@@ -151,6 +179,15 @@ def save_index_and_mapping(
         pickle.dump(skill_texts, f)
     print(f"✅ Mapping saved: {mapping_path}")
     print(f"   File size: {mapping_path.stat().st_size / 1024:.2f} KB")
+
+    # Save (or clear) the query projection for compact indexes
+    projection_path = output_dir / PROJECTION_FILE
+    if compressor is not None:
+        compressor.save(str(projection_path))
+        print(f"✅ Projection saved: {projection_path}")
+    elif projection_path.exists():
+        projection_path.unlink()
+        print(f"🧹 Removed stale projection: {projection_path}")
     print()
 
 
@@ -201,6 +238,14 @@ def test_index(
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Build FAISS index from skill embeddings")
+    parser.add_argument('--compact-dim', type=int, default=0,
+                        help='Reduce vectors to this dimension before indexing (0 = full 768D)')
+    parser.add_argument('--compact-method', choices=['pca', 'truncate'], default='pca',
+                        help='Dimension reduction method for --compact-dim')
+    parser.add_argument('--storage', choices=list(STORAGE_QUANTIZERS), default='float32',
+                        help='Vector storage precision in the index')
+    args = parser.parse_args()
 
     print("=" * 70)
     print("PHASE 0 - STEP 0.2: BUILD FAISS INDEX")
@@ -210,12 +255,20 @@ def main():
     # Step 1: Load embeddings from database
     skill_texts, embeddings = load_embeddings_from_db()
 
+    # Step 1b (optional): Reduce dimension
+    compressor = None
+    if args.compact_dim:
+        compressor = EmbeddingCompressor(method=args.compact_method, dim=args.compact_dim)
+        embeddings = compressor.fit_transform(embeddings)
+        print(f"✅ Embeddings compacted ({args.compact_method}): {embeddings.shape}")
+        print()
+
     # Step 2: Build FAISS index
-    index = build_faiss_index(embeddings)
+    index = build_faiss_index(embeddings, storage=args.storage)
 
     # Step 3: Save index and mapping
     output_dir = Path(__file__).parent.parent / "data" / "embeddings"
-    save_index_and_mapping(index, skill_texts, output_dir)
+    save_index_and_mapping(index, skill_texts, output_dir, compressor)
 
     # Step 4: Test index
     test_index(index, skill_texts, embeddings, k=5)
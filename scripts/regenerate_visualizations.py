@@ -2,11 +2,22 @@
 """
 Regenera visualizaciones mejoradas para exp8/exp14.
 Usa los datos de exp8 (mejor calidad) pero con estrategias de visualización mejoradas.
+
+Los scatter UMAP se renderizan como tiles de densidad (src/analyzer/scatter_tiles.py)
+en paralelo con backend Agg, y se omiten si el resultado de clustering no cambió.
+
+Uso:
+    python scripts/regenerate_visualizations.py
+    python scripts/regenerate_visualizations.py --workers 4 outputs/clustering/experiments/<dataset>/<exp>
 """
 
+import sys
 import json
+import argparse
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
@@ -14,6 +25,11 @@ from adjustText import adjust_text
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.analyzer.scatter_tiles import render_scatter_jobs
+
 # Configuración
 sns.set_style("whitegrid")
 plt.rcParams['figure.dpi'] = 150
@@ -30,6 +46,51 @@ def load_experiment_data(exp_path):
     # Por ahora, asumimos que tenemos que recalcularlo
     return results
 
+def load_scatter_inputs(results):
+    """
+    Coordenadas 2D, labels, frecuencias y textos del resultado, o None si no están guardados.
+
+    Soporta el formato de clustering_analysis.py ('embedding_2d' + 'labels') y el de
+    clustering_esco_30k_final.py / temporal_clustering_analysis.py ('skills' con umap_x/umap_y).
+    """
+    if 'embedding_2d' in results and 'labels' in results:
+        coordinates = np.asarray(results['embedding_2d'], dtype=np.float32)
+        labels = np.asarray(results['labels'], dtype=np.int64)
+        frequencies = np.asarray(results.get('frequencies') or np.ones(len(labels)))
+        return coordinates, labels, frequencies, results.get('skills')
+
+    skills = results.get('skills')
+    if skills and isinstance(skills[0], dict) and 'umap_x' in skills[0]:
+        coordinates = np.array([[s['umap_x'], s['umap_y']] for s in skills], dtype=np.float32)
+        labels = np.array([s['cluster_id'] for s in skills], dtype=np.int64)
+        frequencies = np.array([s.get('frequency', 1) for s in skills])
+        return coordinates, labels, frequencies, [s['skill_text'] for s in skills]
+
+    return None
+
+
+def umap_scatter_job(results, output_path, top_n=50):
+    """Trabajo de render_scatter para el scatter UMAP (None si faltan coordenadas)."""
+    inputs = load_scatter_inputs(results)
+    if inputs is None:
+        return None
+
+    coordinates, labels, frequencies, skill_texts = inputs
+    n_clusters = results['metrics']['n_clusters']
+    centroid_labels = {c['cluster_id']: c['label'] for c in results['clusters'] if c.get('label')}
+
+    return {
+        'coordinates': coordinates,
+        'labels': labels,
+        'output_path': str(output_path),
+        'frequencies': frequencies,
+        'skill_texts': skill_texts,
+        'centroid_labels': centroid_labels,
+        'label_top_n': top_n,
+        'title': f'UMAP Projection - Top {top_n} Clusters (de {n_clusters} total)'
+    }
+
+
 def improved_umap_scatter(results, output_path):
     """
     Visualización mejorada del scatter UMAP.
@@ -181,7 +242,37 @@ def improved_fine_by_meta(results_exp14, output_path):
     print(f"   ✅ Guardado: {output_path}")
 
 
+def render_umap_scatters(experiments, workers):
+    """
+    Renderiza en paralelo los scatter UMAP de varios experimentos.
+
+    Los experimentos sin coordenadas guardadas usan la versión conceptual
+    (improved_umap_scatter).
+    """
+    jobs = []
+    for results, output_path in experiments:
+        job = umap_scatter_job(results, output_path)
+        if job is None:
+            improved_umap_scatter(results, output_path)
+        else:
+            jobs.append(job)
+
+    if not jobs:
+        return
+
+    print(f"\n🎨 Renderizando {len(jobs)} scatter UMAP (tiles de densidad, {workers} workers)...")
+    for summary in render_scatter_jobs(jobs, n_workers=workers):
+        status = 'sin cambios' if summary['cache_hit'] else f"{summary['seconds']:.1f}s"
+        print(f"   ✅ {summary['png']} ({summary['n_points']:,} puntos → "
+              f"{summary['n_cells']:,} celdas + {summary['n_kept_points']:,} puntos, {status})")
+
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Regenera visualizaciones de experimentos de clustering")
+    parser.add_argument('experiments', nargs='*', help='Directorios de experimentos adicionales (solo scatter UMAP)')
+    parser.add_argument('--workers', type=int, default=2, help='Procesos para renderizar scatters')
+    args = parser.parse_args()
+
     print("=" * 80)
     print("REGENERACIÓN DE VISUALIZACIONES MEJORADAS")
     print("=" * 80)
@@ -199,8 +290,11 @@ if __name__ == '__main__':
     # Generar visualizaciones
     output_dir = exp8_path
 
-    # 1. UMAP scatter mejorado
-    improved_umap_scatter(results_exp8, output_dir / 'umap_scatter_v2.png')
+    # 1. UMAP scatter mejorado (exp8 + experimentos adicionales, en paralelo)
+    scatter_experiments = [(results_exp8, output_dir / 'umap_scatter_v2.png')]
+    for exp_path in map(Path, args.experiments):
+        scatter_experiments.append((load_experiment_data(exp_path), exp_path / 'umap_scatter_v2.png'))
+    render_umap_scatters(scatter_experiments, args.workers)
 
     # 2. Macro centroids mejorado
     improved_macro_centroids(results_exp8, output_dir / 'umap_macro_centroids_v2.png')
@@ -16,8 +16,9 @@ Usage:
 
 import sys
 import json
+import argparse
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 from datetime import datetime
 from collections import defaultdict
 
@@ -32,6 +33,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.config.settings import get_settings
 from src.analyzer.dimension_reducer import DimensionReducer
 from src.analyzer.clustering import SkillClusterer
+from src.embedder.snapshot import EmbeddingSnapshot, load_snapshot
+from src.analyzer.scatter_tiles import render_scatter
+from src.database.temporal_cube import period_counts_query, refresh_skill_period_counts
 
 
 def extract_all_gold_standard_skills() -> Tuple[List[str], List[int]]:
@@ -81,10 +85,19 @@ def extract_all_gold_standard_skills() -> Tuple[List[str], List[int]]:
     return skill_texts, frequencies
 
 
-def fetch_embeddings_batch(skill_texts: List[str]) -> Tuple[np.ndarray, List[str], List[int]]:
+def fetch_embeddings_batch(
+    skill_texts: List[str],
+    snapshot: Optional[EmbeddingSnapshot] = None
+) -> Tuple[np.ndarray, List[str], List[int]]:
     """
     Fetch embeddings for all skills with embeddings.
 
+    Args:
+        skill_texts: Skills to look up
+        snapshot: Optional embedding snapshot (see export_embedding_snapshot.py).
+            When given, vectors are read from the memory-mapped matrix
+            instead of querying skill_embeddings once per skill.
+
     Returns:
         (embeddings, found_skills, found_indices)
     """
@@ -93,6 +106,13 @@ def fetch_embeddings_batch(skill_texts: List[str]) -> Tuple[np.ndarray, List[str
     print("="*80)
     print(f"Requesting embeddings for {len(skill_texts)} skills...")
 
+    if snapshot is not None:
+        print(f"   Source: snapshot {snapshot.version} ({snapshot.path})")
+        embeddings_array, found_skills, found_indices = snapshot.select(skill_texts)
+        print(f"   ✅ Found embeddings: {len(found_skills)}/{len(skill_texts)}")
+        print(f"   Coverage: {len(found_skills)/len(skill_texts)*100:.1f}%")
+        return embeddings_array, found_skills, found_indices
+
     settings = get_settings()
     db_url = settings.database_url
     if db_url.startswith('postgresql://'):
@@ -204,22 +224,18 @@ def extract_temporal_frequencies(skill_texts: List[str]) -> pd.DataFrame:
 
     conn = psycopg2.connect(db_url)
 
-    # Query to get frequencies by quarter
-    query = """
-        SELECT
-            DATE_TRUNC('quarter', j.posted_date) as quarter,
-            gsa.skill_text,
-            COUNT(*) as frequency
-        FROM gold_standard_annotations gsa
-        JOIN raw_jobs j ON gsa.job_id = j.job_id
-        WHERE gsa.skill_type = 'hard'
-          AND j.posted_date IS NOT NULL
-        GROUP BY DATE_TRUNC('quarter', j.posted_date), gsa.skill_text
-        ORDER BY quarter, frequency DESC
-    """
+    # Frequencies by quarter from the skill_period_counts cube (migration 014)
+    refresh_skill_period_counts(conn, sources=['gold_standard'])
+    query, params = period_counts_query(
+        source='gold_standard',
+        period='quarter',
+        skill_types=['hard']
+    )
 
-    df = pd.read_sql_query(query, conn)
+    df = pd.read_sql_query(query, conn, params=params)
     conn.close()
+    df = df.rename(columns={'period_start': 'quarter'})
+    df['quarter'] = pd.to_datetime(df['quarter'])
 
     # Convert quarter to period string
     df['quarter_str'] = df['quarter'].dt.to_period('Q').astype(str)
@@ -439,119 +455,44 @@ def visualize_umap_with_frequency(
     cluster_analysis: List[Dict[str, Any]],
     output_path: str
 ):
-    """Generate UMAP scatter with point size proportional to frequency."""
+    """
+    Generate UMAP scatter with point size proportional to frequency.
+
+    Points are binned into density tiles; outliers and the most frequent skills
+    are drawn individually and the 5 largest clusters labelled at their
+    centroid. Also writes <output>.tiles.json; skipped if the clustering result
+    is unchanged.
+    """
 
     print("\n" + "="*80)
     print("GENERATING UMAP SCATTER WITH FREQUENCY")
     print("="*80)
 
-    plt.style.use('seaborn-v0_8-whitegrid')
-
-    fig, ax = plt.subplots(figsize=(16, 12))
-
-    unique_labels = set(labels)
-    n_clusters = len(unique_labels) - (1 if -1 in unique_labels else 0)
-    colors = sns.color_palette("husl", n_clusters)
-
-    # Normalize frequencies to reasonable sizes (20-500 pixels)
-    freq_array = np.array(skill_frequencies)
-    min_size, max_size = 20, 500
-    sizes = min_size + (freq_array - freq_array.min()) / (freq_array.max() - freq_array.min()) * (max_size - min_size)
-
-    # Plot each cluster
-    for label in sorted(unique_labels):
-        if label == -1:
-            color = 'lightgray'
-            marker = 'x'
-            alpha = 0.3
-            zorder = 1
-        else:
-            color = colors[label % len(colors)]
-            marker = 'o'
-            alpha = 0.6
-            zorder = 2
-
-        mask = labels == label
-
-        ax.scatter(
-            coordinates[mask, 0],
-            coordinates[mask, 1],
-            s=sizes[mask],  # Size by frequency
-            c=[color],
-            marker=marker,
-            alpha=alpha,
-            edgecolors='black',
-            linewidth=0.5,
-            label=f"Cluster {label}" if label != -1 else "Noise",
-            zorder=zorder
-        )
-
-    # Add cluster labels for top 5 largest clusters
-    cluster_sizes = [(c['cluster_id'], c['size']) for c in cluster_analysis if c['cluster_id'] != -1]
-    cluster_sizes.sort(key=lambda x: x[1], reverse=True)
-    top_clusters = [c_id for c_id, _ in cluster_sizes[:5]]
-
-    for cluster_info in cluster_analysis:
-        cluster_id = cluster_info['cluster_id']
-        if cluster_id == -1 or cluster_id not in top_clusters:
-            continue
-
-        mask = labels == cluster_id
-        centroid_x = coordinates[mask, 0].mean()
-        centroid_y = coordinates[mask, 1].mean()
-
-        label_text = f"C{cluster_id}: {cluster_info['auto_label'][:30]}"
-
-        ax.text(
-            centroid_x, centroid_y,
-            label_text,
-            fontsize=9,
-            weight='bold',
-            ha='center',
-            va='center',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.85, edgecolor='black', linewidth=1.5)
-        )
+    n_clusters = len(set(labels) - {-1})
+    centroid_labels = {
+        c['cluster_id']: c['auto_label'] for c in cluster_analysis if c['cluster_id'] != -1
+    }
 
-    # Add size legend
-    legend_sizes = [
-        (freq_array.min(), min_size),
-        (np.percentile(freq_array, 50), min_size + (max_size - min_size) * 0.5),
-        (freq_array.max(), max_size)
-    ]
-
-    legend_elements = []
-    for freq, size in legend_sizes:
-        legend_elements.append(
-            plt.scatter([], [], s=size, c='gray', alpha=0.6, edgecolors='black',
-                       label=f'{int(freq)} occurrences')
+    summary = render_scatter(
+        coordinates,
+        labels,
+        str(output_path),
+        frequencies=np.asarray(skill_frequencies),
+        skill_texts=skill_texts,
+        centroid_labels=centroid_labels,
+        label_top_n=5,
+        title=(
+            f'Skill Clustering with Demand Frequency\n'
+            f'{n_clusters} clusters | Point size = frequency'
         )
-
-    # Create two legends: one for clusters, one for sizes
-    legend1 = ax.legend(loc='upper right', fontsize=8, ncol=2, title='Clusters')
-    ax.add_artist(legend1)
-
-    ax.legend(handles=legend_elements, loc='lower right', fontsize=9, title='Frequency', framealpha=0.95)
-
-    # Labels and title
-    ax.set_xlabel('UMAP Dimension 1', fontsize=12, weight='bold')
-    ax.set_ylabel('UMAP Dimension 2', fontsize=12, weight='bold')
-    ax.set_title(
-        f'Skill Clustering with Demand Frequency\n'
-        f'{n_clusters} clusters | Point size = frequency',
-        fontsize=14,
-        weight='bold',
-        pad=15
     )
 
-    ax.grid(True, alpha=0.3)
-    plt.tight_layout()
-
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
-
-    print(f"   ✅ UMAP with frequency saved: {output_file}")
+    if summary['cache_hit']:
+        print(f"   ⏭  Unchanged clustering, kept: {output_path}")
+    else:
+        print(f"   {summary['n_points']:,} points → {summary['n_cells']:,} cells + "
+              f"{summary['n_kept_points']:,} individual points ({summary['seconds']:.1f}s)")
+        print(f"   ✅ UMAP with frequency saved: {output_path}")
 
 
 def save_results(
@@ -619,6 +560,12 @@ def save_results(
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Temporal clustering analysis")
+    parser.add_argument('--snapshot', default=None,
+                        help="Embedding snapshot path/version ('latest' for the most recent); "
+                             "default: query skill_embeddings")
+    args = parser.parse_args()
+
     print("="*80)
     print("TEMPORAL CLUSTERING ANALYSIS - FULL PIPELINE")
     print("="*80)
@@ -631,7 +578,8 @@ def main():
     all_skills, all_frequencies = extract_all_gold_standard_skills()
 
     # Step 2: Fetch embeddings
-    embeddings, found_skills, found_indices = fetch_embeddings_batch(all_skills)
+    snapshot = load_snapshot(args.snapshot) if args.snapshot else None
+    embeddings, found_skills, found_indices = fetch_embeddings_batch(all_skills, snapshot)
 
     # Get frequencies for skills with embeddings
     found_frequencies = [all_frequencies[i] for i in found_indices]
@@ -1,8 +1,17 @@
 from .clustering import SkillClusterer
 from .dimension_reducer import DimensionReducer
+from .model_store import ClusteringModelStore, ClusteringModel
+from .knn_graph import KNNGraph, load_or_build_knn_graph
+from .microclustering import MicroClusterer
+from .parameter_sweep import run_parameter_sweep
 from .report_generator import ReportGenerator
+from .scatter_tiles import render_scatter, render_scatter_jobs
+from .stability import cluster_stability
 from .visualizations import VisualizationGenerator
 
 __all__ = [
-    'SkillClusterer', 'DimensionReducer', 'ReportGenerator', 'VisualizationGenerator'
+    'SkillClusterer', 'DimensionReducer', 'ReportGenerator', 'VisualizationGenerator',
+    'ClusteringModelStore', 'ClusteringModel',
+    'KNNGraph', 'load_or_build_knn_graph', 'run_parameter_sweep',
+    'render_scatter', 'render_scatter_jobs', 'cluster_stability', 'MicroClusterer'
 ]
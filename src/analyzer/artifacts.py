@@ -0,0 +1,68 @@
+"""
+Binary artifacts for clustering runs.
+
+Per-skill arrays (2D UMAP coordinates, labels) used to be stored inline in
+analysis_results.results as JSON lists, which made every row several MB and
+every read parse the whole thing. They are now written as .npy files under
+settings.cluster_artifact_dir and analysis_results only keeps a reference:
+
+    {"path": "pipeline_a_30k_pre/20260101_020000/embedding_2d.npy",
+     "shape": [30000, 2], "dtype": "float32", "sha256": "..."}
+
+Paths in references are relative to the artifact directory.
+"""
+
+from typing import Any, Dict, Optional
+from pathlib import Path
+import hashlib
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _artifact_dir(base_dir: Optional[str]) -> Path:
+    if base_dir is None:
+        from config.settings import get_settings
+        base_dir = get_settings().cluster_artifact_dir
+    return Path(base_dir)
+
+
+def save_array_artifact(array: np.ndarray, relative_path: str,
+                        dtype: str = 'float32', base_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Write an array as .npy and return the reference stored in analysis_results.
+
+    Args:
+        array: Array to store
+        relative_path: Path under the artifact directory (e.g. '<pipeline>/<run>/embedding_2d.npy')
+        dtype: Storage dtype (float32 halves the size of UMAP's float64 output)
+        base_dir: Artifact directory (defaults to settings.cluster_artifact_dir)
+    """
+    path = _artifact_dir(base_dir) / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = np.ascontiguousarray(array, dtype=dtype)
+    np.save(path, data)
+
+    reference = {
+        'path': relative_path,
+        'shape': list(data.shape),
+        'dtype': data.dtype.name,
+        'sha256': hashlib.sha256(data.tobytes()).hexdigest()
+    }
+    logger.info(f"Saved artifact {relative_path} {data.shape} ({path.stat().st_size / 1024:.0f} KB)")
+    return reference
+
+
+def load_array_artifact(reference: Dict[str, Any], base_dir: Optional[str] = None,
+                        mmap: bool = True) -> np.ndarray:
+    """Open an artifact from its analysis_results reference (memory-mapped by default)."""
+    path = _artifact_dir(base_dir) / reference['path']
+    array = np.load(path, mmap_mode='r' if mmap else None)
+    if list(array.shape) != list(reference['shape']):
+        raise ValueError(
+            f"Artifact {path} has shape {array.shape}, reference says {reference['shape']}"
+        )
+    return array
@@ -9,12 +9,44 @@ from typing import Dict, Any, List, Optional, Tuple
 from collections import Counter
 import logging
 import numpy as np
+import time
 import hdbscan
-from sklearn.metrics import silhouette_score, davies_bouldin_score
+from sklearn.metrics import davies_bouldin_score
+
+from .metrics import compute_silhouette, relative_validity, sampled_dbcv
 
 logger = logging.getLogger(__name__)
 
 
+def group_by_label(labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Group sample indices by label with one stable argsort.
+
+    Returns:
+        (cluster_ids, order, starts, counts): the members of cluster_ids[j] are
+        order[starts[j]:starts[j] + counts[j]], in their original order
+    """
+    labels = np.asarray(labels)
+    order = np.argsort(labels, kind='stable')
+    cluster_ids, starts, counts = np.unique(labels[order], return_index=True, return_counts=True)
+    return cluster_ids, order, starts, counts
+
+
+def top_k_by_frequency(members: np.ndarray, frequencies: np.ndarray, k: int) -> np.ndarray:
+    """
+    The k most frequent members, highest first.
+
+    argpartition finds the k-th largest frequency; only members at or above it
+    are sorted. Ties keep the original order (same result as a stable sort).
+    """
+    if len(members) > k:
+        member_freqs = frequencies[members]
+        kth_value = member_freqs[np.argpartition(member_freqs, -k)[-k]]
+        members = members[member_freqs >= kth_value]
+    ranked = members[np.lexsort((members, -frequencies[members]))]
+    return ranked[:k]
+
+
 class SkillClusterer:
     """
     Cluster skills using HDBSCAN in UMAP-reduced space.
@@ -39,7 +71,9 @@ class SkillClusterer:
         min_samples: Optional[int] = None,
         metric: str = 'euclidean',
         cluster_selection_method: str = 'eom',
-        allow_single_cluster: bool = False
+        allow_single_cluster: bool = False,
+        prediction_data: bool = False,
+        gen_min_span_tree: bool = False
     ):
         """
         Initialize HDBSCAN clusterer.
@@ -57,12 +91,18 @@ class SkillClusterer:
                 - 'leaf': More clusters, more granular
             allow_single_cluster: Allow all points in one cluster
                 - Usually False (we want multiple clusters)
+            prediction_data: Keep the data HDBSCAN needs to place new points
+                (required for approximate_predict)
+            gen_min_span_tree: Keep the minimum spanning tree
+                (required for the relative validity metric)
         """
         self.min_cluster_size = min_cluster_size
         self.min_samples = min_samples if min_samples is not None else min_cluster_size
         self.metric = metric
         self.cluster_selection_method = cluster_selection_method
         self.allow_single_cluster = allow_single_cluster
+        self.prediction_data = prediction_data
+        self.gen_min_span_tree = gen_min_span_tree
 
         # Initialize HDBSCAN
         self.clusterer = hdbscan.HDBSCAN(
@@ -70,7 +110,9 @@ class SkillClusterer:
             min_samples=self.min_samples,
             metric=metric,
             cluster_selection_method=cluster_selection_method,
-            allow_single_cluster=allow_single_cluster
+            allow_single_cluster=allow_single_cluster,
+            prediction_data=prediction_data,
+            gen_min_span_tree=gen_min_span_tree
         )
 
         self.labels_ = None
@@ -137,21 +179,60 @@ class SkillClusterer:
 
         return self.labels_
 
+    def approximate_predict(self, coordinates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Assign new points to the existing clusters without refitting.
+
+        Args:
+            coordinates: UMAP coordinates of the new samples (same space as fit)
+
+        Returns:
+            (labels, strengths): cluster label (-1 = noise) and membership
+            strength in [0, 1] for each sample
+
+        Raises:
+            RuntimeError: If the clusterer was not fitted with prediction_data=True
+        """
+        if not self.is_fitted or not self.prediction_data:
+            raise RuntimeError(
+                "SkillClusterer must be fitted with prediction_data=True "
+                "before approximate_predict()"
+            )
+
+        if not isinstance(coordinates, np.ndarray):
+            coordinates = np.array(coordinates)
+
+        labels, strengths = hdbscan.approximate_predict(self.clusterer, coordinates)
+
+        n_noise = int((labels == -1).sum())
+        logger.info(f"Assigned {len(labels)} new samples ({n_noise} noise)")
+
+        return labels, strengths
+
     def analyze_clusters(
         self,
         labels: np.ndarray,
         skill_texts: List[str],
-        skill_frequencies: Optional[List[int]] = None
+        skill_frequencies: Optional[List[int]] = None,
+        top_k: int = 5,
+        include_all_skills: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Analyze cluster composition and generate automatic labels.
 
+        Members are grouped with a single stable argsort over the labels and
+        the top skills per cluster are picked with argpartition, so the cost
+        is O(n log n) regardless of the number of clusters.
+
         Args:
             labels: Cluster labels from fit_predict
             skill_texts: List of skill names
             skill_frequencies: Optional skill frequencies for weighting
                 - If provided, top skills are selected by frequency
                 - If None, all skills weighted equally
+            top_k: Number of top skills per cluster
+            include_all_skills: Include the full member list per cluster
+                (needed by the clusters API; skip it for DB summaries)
 
         Returns:
             List of cluster info dicts:
@@ -163,74 +244,81 @@ class SkillClusterer:
                     'total_frequency': int
                 }
         """
-        if skill_frequencies is None:
-            skill_frequencies = [1] * len(skill_texts)
+        labels = np.asarray(labels)
 
         if len(labels) != len(skill_texts):
             raise ValueError(
                 f"Labels length ({len(labels)}) != skill_texts length ({len(skill_texts)})"
             )
 
-        cluster_info = []
-        unique_labels = sorted(set(labels) - {-1})  # Exclude noise
-
-        logger.info(f"Analyzing {len(unique_labels)} clusters...")
+        frequencies = (
+            np.ones(len(labels), dtype=np.int64) if skill_frequencies is None
+            else np.asarray(skill_frequencies)
+        )
+        texts = np.asarray(skill_texts, dtype=object)
 
-        for cluster_id in unique_labels:
-            mask = labels == cluster_id
+        cluster_ids, order, starts, counts = group_by_label(labels)
+        # Per-label frequency sums in one pass (labels shifted so noise=-1 → bin 0)
+        totals = np.bincount(labels + 1, weights=frequencies)
 
-            # Get skills in this cluster
-            cluster_skills = [skill_texts[i] for i in range(len(skill_texts)) if mask[i]]
-            cluster_freqs = [skill_frequencies[i] for i in range(len(skill_texts)) if mask[i]]
+        logger.info(f"Analyzing {int((cluster_ids != -1).sum())} clusters...")
 
-            # Sort by frequency
-            skill_freq_pairs = list(zip(cluster_skills, cluster_freqs))
-            skill_freq_pairs.sort(key=lambda x: x[1], reverse=True)
+        cluster_info = []
+        noise_info = None
+
+        for cluster_id, start, count in zip(cluster_ids.tolist(), starts.tolist(), counts.tolist()):
+            members = order[start:start + count]
+
+            if cluster_id == -1:
+                noise_info = {
+                    'cluster_id': -1,
+                    'size': int(count),
+                    'auto_label': 'Noise (unclustered)',
+                    'top_skills': texts[members[:top_k]].tolist(),
+                    'total_frequency': 0,
+                    'mean_frequency': 0.0
+                }
+                if include_all_skills:
+                    noise_info['all_skills'] = texts[members].tolist()
+                logger.info(f"Noise cluster: {count} skills (outliers)")
+                continue
 
-            # Top 5 skills
-            top_skills = [s for s, f in skill_freq_pairs[:5]]
+            top_skills = texts[top_k_by_frequency(members, frequencies, top_k)].tolist()
 
             # Auto-label: top 3 skills
             auto_label = ", ".join(top_skills[:3])
+            total_frequency = totals[cluster_id + 1]
 
-            cluster_info.append({
+            info = {
                 'cluster_id': int(cluster_id),
-                'size': int(mask.sum()),
+                'size': int(count),
                 'auto_label': auto_label,
                 'top_skills': top_skills,
-                'total_frequency': int(sum(cluster_freqs)),
-                'mean_frequency': float(np.mean(cluster_freqs)),
-                'all_skills': cluster_skills  # Include all for reference
-            })
+                'total_frequency': int(total_frequency),
+                'mean_frequency': float(total_frequency / count)
+            }
+            if include_all_skills:
+                info['all_skills'] = texts[members].tolist()  # Include all for reference
+            cluster_info.append(info)
 
             logger.info(
-                f"Cluster {cluster_id}: {mask.sum()} skills, "
+                f"Cluster {cluster_id}: {count} skills, "
                 f"label='{auto_label[:50]}...'"
             )
 
-        # Add noise cluster if exists
-        if -1 in labels:
-            mask = labels == -1
-            noise_skills = [skill_texts[i] for i in range(len(skill_texts)) if mask[i]]
-
-            cluster_info.append({
-                'cluster_id': -1,
-                'size': int(mask.sum()),
-                'auto_label': 'Noise (unclustered)',
-                'top_skills': noise_skills[:5] if noise_skills else [],
-                'total_frequency': 0,
-                'mean_frequency': 0.0,
-                'all_skills': noise_skills
-            })
-
-            logger.info(f"Noise cluster: {mask.sum()} skills (outliers)")
+        # Noise cluster goes last
+        if noise_info is not None:
+            cluster_info.append(noise_info)
 
         return cluster_info
 
     def calculate_metrics(
         self,
         coordinates: np.ndarray,
-        labels: np.ndarray
+        labels: np.ndarray,
+        silhouette_method: str = 'auto',
+        silhouette_sample_size: int = 10000,
+        validity: Optional[str] = None
     ) -> Dict[str, float]:
         """
         Calculate clustering quality metrics.
@@ -238,6 +326,16 @@ class SkillClusterer:
         Args:
             coordinates: UMAP coordinates
             labels: Cluster labels
+            silhouette_method: How to compute the silhouette (see analyzer.metrics)
+                - 'auto': exact up to 20k points, stratified sample above
+                - 'exact': sklearn silhouette_score (O(n²) memory)
+                - 'chunked': exact, memory-bounded
+                - 'sampled': stratified sample with 95% CI
+                - 'none': skip
+            silhouette_sample_size: Sample size for 'sampled'
+            validity: Optional density-based validity metric
+                - 'relative': HDBSCAN relative_validity_ (needs gen_min_span_tree=True)
+                - 'dbcv': DBCV on a stratified sample
 
         Returns:
             Dictionary with metrics:
@@ -247,6 +345,7 @@ class SkillClusterer:
                 - noise_percentage: % of noise points
                 - largest_cluster_size: Size of largest cluster
                 - smallest_cluster_size: Size of smallest cluster (excluding noise)
+                - *_seconds: Compute time of each quality metric
 
         Note:
             Metrics are only calculated for non-noise points
@@ -287,8 +386,13 @@ class SkillClusterer:
         # >0.25: Weak structure
         # <0.25: No substantial structure
         try:
-            silhouette = silhouette_score(filtered_coords, filtered_labels)
-            metrics['silhouette_score'] = float(silhouette)
+            metrics.update(compute_silhouette(
+                filtered_coords,
+                filtered_labels,
+                method=silhouette_method,
+                sample_size=silhouette_sample_size
+            ))
+            metrics.setdefault('silhouette_score', 0.0)
         except Exception as e:
             logger.warning(f"Could not calculate silhouette score: {e}")
             metrics['silhouette_score'] = 0.0
@@ -298,12 +402,23 @@ class SkillClusterer:
         # 1.0-2.0: Moderate separation
         # >2.0: Poor separation
         try:
+            start = time.time()
             davies_bouldin = davies_bouldin_score(filtered_coords, filtered_labels)
             metrics['davies_bouldin_score'] = float(davies_bouldin)
+            metrics['davies_bouldin_seconds'] = round(time.time() - start, 3)
         except Exception as e:
             logger.warning(f"Could not calculate Davies-Bouldin score: {e}")
             metrics['davies_bouldin_score'] = 0.0
 
+        # Density-based validity (cheap alternative to silhouette for HDBSCAN)
+        try:
+            if validity == 'relative':
+                metrics.update(relative_validity(self.clusterer))
+            elif validity == 'dbcv':
+                metrics.update(sampled_dbcv(filtered_coords, filtered_labels))
+        except Exception as e:
+            logger.warning(f"Could not calculate {validity} validity: {e}")
+
         # Cluster size stats
         if metrics['n_clusters'] > 0:
             cluster_sizes = Counter(filtered_labels)
@@ -316,7 +431,10 @@ class SkillClusterer:
             metrics['mean_cluster_size'] = 0.0
 
         logger.info(f"Quality metrics calculated:")
-        logger.info(f"  Silhouette: {metrics['silhouette_score']:.3f}")
+        logger.info(
+            f"  Silhouette: {metrics['silhouette_score']:.3f} "
+            f"({metrics.get('silhouette_method', 'n/a')}, {metrics.get('silhouette_seconds', 0):.2f}s)"
+        )
         logger.info(f"  Davies-Bouldin: {metrics['davies_bouldin_score']:.3f}")
 
         return metrics
@@ -334,6 +452,8 @@ class SkillClusterer:
             'metric': self.metric,
             'cluster_selection_method': self.cluster_selection_method,
             'allow_single_cluster': self.allow_single_cluster,
+            'prediction_data': self.prediction_data,
+            'gen_min_span_tree': self.gen_min_span_tree,
             'is_fitted': self.is_fitted
         }
 
@@ -5,7 +5,7 @@ This module provides UMAP-based dimensionality reduction for skill embeddings,
 reducing high-dimensional vectors (768D) to 2D/3D for visualization and clustering.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
 import numpy as np
 import umap
@@ -36,7 +36,8 @@ class DimensionReducer:
         min_dist: float = 0.1,
         metric: str = 'cosine',
         random_state: int = 42,
-        verbose: bool = False
+        verbose: bool = False,
+        precomputed_knn: Optional[Tuple] = None
     ):
         """
         Initialize UMAP dimension reducer.
@@ -56,6 +57,9 @@ class DimensionReducer:
                 - 'euclidean': For non-normalized vectors
             random_state: Random seed for reproducibility
             verbose: Print detailed UMAP progress
+            precomputed_knn: (knn_indices, knn_dists, search_index) built on the
+                same embeddings with the same metric and n_neighbors columns
+                (see analyzer.knn_graph). Skips UMAP's own neighbour search.
         """
         self.n_components = n_components
         self.n_neighbors = n_neighbors
@@ -63,9 +67,14 @@ class DimensionReducer:
         self.metric = metric
         self.random_state = random_state
         self.verbose = verbose
+        self.uses_precomputed_knn = precomputed_knn is not None
 
         self.settings = get_settings()
 
+        umap_kwargs = {}
+        if precomputed_knn is not None:
+            umap_kwargs['precomputed_knn'] = precomputed_knn
+
         # Initialize UMAP reducer
         self.reducer = umap.UMAP(
             n_components=n_components,
@@ -73,7 +82,8 @@ class DimensionReducer:
             min_dist=min_dist,
             metric=metric,
             random_state=random_state,
-            verbose=verbose
+            verbose=verbose,
+            **umap_kwargs
         )
 
         self.is_fitted = False
@@ -193,6 +203,7 @@ class DimensionReducer:
             'min_dist': self.min_dist,
             'metric': self.metric,
             'random_state': self.random_state,
+            'precomputed_knn': self.uses_precomputed_knn,
             'is_fitted': self.is_fitted
         }
 
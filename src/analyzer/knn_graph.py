@@ -0,0 +1,177 @@
+"""
+Precomputed nearest-neighbour graphs for UMAP parameter sweeps.
+
+UMAP spends most of its time building the kNN graph of the input. In a sweep
+over ``n_neighbors`` × ``min_cluster_size`` every grid point used to rebuild
+that graph from the same embedding matrix. Here it is built once with
+NN-descent at the largest ``n_neighbors`` of the sweep, cached on disk keyed by
+the input hash, and sliced down for smaller values (neighbour lists are sorted
+by distance, so the first k columns are the k-NN graph).
+
+DimensionReducer accepts the slice through ``precomputed_knn``.
+"""
+
+from typing import Optional, Tuple
+from pathlib import Path
+import logging
+import re
+import time
+
+import numpy as np
+
+from .model_store import input_hash
+
+logger = logging.getLogger(__name__)
+
+ANGULAR_METRICS = ('cosine', 'correlation', 'dice', 'jaccard', 'hellinger')
+
+
+class KNNGraph:
+    """
+    Approximate kNN graph of an embedding matrix.
+
+    ``indices`` / ``distances`` have shape (n_samples, n_neighbors); row i
+    lists the neighbours of sample i (itself first) by increasing distance.
+    """
+
+    def __init__(self, indices: np.ndarray, distances: np.ndarray, metric: str,
+                 input_hash: str, build_seconds: float = 0.0):
+        self.indices = indices
+        self.distances = distances
+        self.metric = metric
+        self.input_hash = input_hash
+        self.build_seconds = build_seconds
+
+    @property
+    def n_neighbors(self) -> int:
+        return self.indices.shape[1]
+
+    def __len__(self) -> int:
+        return self.indices.shape[0]
+
+    def precomputed_knn(self, n_neighbors: int) -> Tuple[np.ndarray, np.ndarray, None]:
+        """
+        Graph sliced to ``n_neighbors`` in UMAP's precomputed_knn format.
+
+        No search index is included, so the resulting UMAP model cannot
+        transform() new points (fine for sweeps; production fits build their own).
+        """
+        if n_neighbors > self.n_neighbors:
+            raise ValueError(
+                f"Graph was built with n_neighbors={self.n_neighbors}, cannot slice to {n_neighbors}"
+            )
+        return (
+            np.ascontiguousarray(self.indices[:, :n_neighbors]),
+            np.ascontiguousarray(self.distances[:, :n_neighbors]),
+            None
+        )
+
+    def save(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            indices=self.indices,
+            distances=self.distances,
+            metric=np.array(self.metric),
+            input_hash=np.array(self.input_hash),
+            build_seconds=np.array(self.build_seconds)
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> 'KNNGraph':
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                indices=data['indices'],
+                distances=data['distances'],
+                metric=str(data['metric']),
+                input_hash=str(data['input_hash']),
+                build_seconds=float(data['build_seconds'])
+            )
+
+
+def build_knn_graph(
+    embeddings: np.ndarray,
+    n_neighbors: int,
+    metric: str = 'cosine',
+    random_state: int = 42,
+    graph_input_hash: Optional[str] = None
+) -> KNNGraph:
+    """
+    Build the approximate kNN graph with NN-descent (same routine UMAP uses).
+
+    Args:
+        embeddings: Input matrix (n_samples, n_features)
+        n_neighbors: Largest n_neighbors the graph will be sliced to
+        metric: Distance metric (must match the UMAP metric)
+        random_state: Seed for NN-descent
+        graph_input_hash: Precomputed input hash (computed if None)
+    """
+    from umap.umap_ import nearest_neighbors
+
+    start = time.time()
+    indices, distances, _ = nearest_neighbors(
+        embeddings,
+        n_neighbors=n_neighbors,
+        metric=metric,
+        metric_kwds={},
+        angular=metric in ANGULAR_METRICS,
+        random_state=np.random.RandomState(random_state),
+        low_memory=True
+    )
+    build_seconds = time.time() - start
+
+    logger.info(
+        f"kNN graph built: {embeddings.shape[0]} samples, k={n_neighbors}, "
+        f"metric={metric} ({build_seconds:.1f}s)"
+    )
+
+    return KNNGraph(
+        indices=indices.astype(np.int32),
+        distances=distances.astype(np.float32),
+        metric=metric,
+        input_hash=graph_input_hash or input_hash([], embeddings),
+        build_seconds=build_seconds
+    )
+
+
+def load_or_build_knn_graph(
+    embeddings: np.ndarray,
+    n_neighbors: int,
+    metric: str = 'cosine',
+    cache_dir: Optional[str] = None,
+    random_state: int = 42
+) -> KNNGraph:
+    """
+    Return a cached graph with at least ``n_neighbors`` for this input, or build and cache one.
+
+    Cache files are named knn_<input hash>_<metric>_k<n_neighbors>.npz, so any
+    graph built for the same matrix with a larger k is reused.
+    """
+    if cache_dir is None:
+        from config.settings import get_settings
+        cache_dir = get_settings().knn_cache_dir
+    cache = Path(cache_dir)
+
+    graph_hash = input_hash([], embeddings)
+    prefix = f"knn_{graph_hash[:16]}_{metric}_k"
+
+    candidates = []
+    if cache.is_dir():
+        for path in cache.glob(f"{prefix}*.npz"):
+            match = re.search(r"_k(\d+)\.npz$", path.name)
+            if match and int(match.group(1)) >= n_neighbors:
+                candidates.append((int(match.group(1)), path))
+
+    if candidates:
+        k, path = min(candidates)
+        graph = KNNGraph.load(path)
+        if graph.input_hash == graph_hash and len(graph) == embeddings.shape[0]:
+            logger.info(f"Reusing cached kNN graph {path.name} (k={k})")
+            return graph
+
+    graph = build_knn_graph(embeddings, n_neighbors, metric, random_state, graph_hash)
+    path = graph.save(cache / f"{prefix}{n_neighbors}.npz")
+    logger.info(f"kNN graph cached: {path}")
+    return graph
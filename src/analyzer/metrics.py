@@ -0,0 +1,217 @@
+"""
+Scalable clustering quality metrics.
+
+sklearn's silhouette_score materializes the full n×n distance matrix, which is
+the bottleneck of a clustering run from ~30k skills on and runs out of memory
+at a few hundred thousand. This module offers three alternatives, each
+reporting its own compute time:
+
+    chunked   exact silhouette; distances are computed for a block of rows at
+              a time and reduced to per-cluster sums, so memory is bounded by
+              ``max_memory_mb`` instead of n²
+    sampled   silhouette of a stratified sample (per-cluster, proportional)
+              measured against the full data set, with a 95% confidence
+              interval from the stratified variance
+    validity  HDBSCAN relative validity (DBCV approximation computed from the
+              minimum spanning tree of the fit; needs gen_min_span_tree=True)
+              or DBCV on a stratified sample
+
+All functions expect noise points (-1) to be removed beforehand, as
+SkillClusterer.calculate_metrics does.
+"""
+
+from typing import Any, Dict
+import logging
+import time
+
+import numpy as np
+from scipy import sparse
+from sklearn.metrics import pairwise_distances, silhouette_score
+
+logger = logging.getLogger(__name__)
+
+SILHOUETTE_METHODS = ('auto', 'exact', 'chunked', 'sampled', 'none')
+
+# 'auto' switches from exact to sampled above this many non-noise points
+AUTO_EXACT_MAX_SAMPLES = 20000
+
+
+def stratified_sample(labels: np.ndarray, sample_size: int,
+                      random_state: int = 42) -> np.ndarray:
+    """
+    Indices of a proportional stratified sample (at least 2 per cluster when possible).
+
+    Returns sorted indices; all indices if sample_size >= len(labels).
+    """
+    labels = np.asarray(labels)
+    n = len(labels)
+    if sample_size >= n:
+        return np.arange(n)
+
+    rng = np.random.default_rng(random_state)
+    cluster_ids, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    quotas = np.maximum(np.round(counts * sample_size / n).astype(np.int64), np.minimum(counts, 2))
+
+    order = np.argsort(inverse, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    picked = [
+        rng.choice(order[start:start + count], size=quota, replace=False)
+        for start, count, quota in zip(starts, counts, quotas)
+    ]
+    return np.sort(np.concatenate(picked))
+
+
+def _silhouette_rows(X: np.ndarray, labels: np.ndarray, rows: np.ndarray,
+                     metric: str, max_memory_mb: int) -> np.ndarray:
+    """
+    Silhouette value of each sample in ``rows`` against all of X.
+
+    Processes rows in blocks sized so the (block × n) distance matrix stays
+    under max_memory_mb, reducing each block to per-cluster distance sums with
+    a sparse one-hot product.
+    """
+    n = X.shape[0]
+    cluster_ids, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    onehot = sparse.csr_matrix(
+        (np.ones(n, dtype=np.float64), (np.arange(n), inverse)),
+        shape=(n, len(cluster_ids))
+    )
+
+    block_size = max(1, int(max_memory_mb * 1024 * 1024 // (8 * n)))
+    values = np.empty(len(rows), dtype=np.float64)
+
+    for start in range(0, len(rows), block_size):
+        block = rows[start:start + block_size]
+        distances = pairwise_distances(X[block], X, metric=metric)
+        cluster_sums = np.asarray(onehot.T.dot(distances.T).T)  # (block, n_clusters)
+
+        own = inverse[block]
+        own_sizes = counts[own]
+        a = cluster_sums[np.arange(len(block)), own] / np.maximum(own_sizes - 1, 1)
+
+        mean_other = cluster_sums / counts
+        mean_other[np.arange(len(block)), own] = np.inf
+        b = mean_other.min(axis=1)
+
+        s = (b - a) / np.maximum(a, b)
+        s[own_sizes == 1] = 0.0  # sklearn convention for singleton clusters
+        values[start:start + len(block)] = np.nan_to_num(s)
+
+    return values
+
+
+def chunked_silhouette(X: np.ndarray, labels: np.ndarray, metric: str = 'euclidean',
+                       max_memory_mb: int = 256) -> Dict[str, Any]:
+    """Exact mean silhouette with memory bounded by max_memory_mb."""
+    start = time.time()
+    labels = np.asarray(labels)
+    values = _silhouette_rows(X, labels, np.arange(len(labels)), metric, max_memory_mb)
+    return {
+        'silhouette_score': float(values.mean()),
+        'silhouette_method': 'chunked',
+        'silhouette_seconds': round(time.time() - start, 3)
+    }
+
+
+def sampled_silhouette(X: np.ndarray, labels: np.ndarray, sample_size: int = 10000,
+                       metric: str = 'euclidean', random_state: int = 42,
+                       max_memory_mb: int = 256) -> Dict[str, Any]:
+    """
+    Stratified-sample estimate of the mean silhouette with a 95% CI.
+
+    Each sampled point's silhouette is computed against the full data set, so
+    the only error is sampling error. The estimate weights each cluster by its
+    share of points; the CI uses the stratified-sampling variance
+    sum_h W_h² s_h² / n_h.
+    """
+    start = time.time()
+    labels = np.asarray(labels)
+    rows = stratified_sample(labels, sample_size, random_state)
+    values = _silhouette_rows(X, labels, rows, metric, max_memory_mb)
+
+    sample_labels = labels[rows]
+    cluster_ids, inverse, n_h = np.unique(sample_labels, return_inverse=True, return_counts=True)
+    _, N_h = np.unique(labels, return_counts=True)
+    W_h = N_h / N_h.sum()
+
+    means = np.bincount(inverse, weights=values) / n_h
+    squares = np.bincount(inverse, weights=values ** 2)
+    variances = np.where(n_h > 1, (squares - n_h * means ** 2) / np.maximum(n_h - 1, 1), 0.0)
+
+    # Finite population correction: exact when a cluster is fully sampled
+    fpc = 1.0 - n_h / N_h
+    estimate = float(np.sum(W_h * means))
+    std_error = float(np.sqrt(np.sum(W_h ** 2 * variances * fpc / n_h)))
+
+    return {
+        'silhouette_score': estimate,
+        'silhouette_method': 'sampled',
+        'silhouette_sample_size': int(len(rows)),
+        'silhouette_std_error': std_error,
+        'silhouette_ci95': [estimate - 1.96 * std_error, estimate + 1.96 * std_error],
+        'silhouette_seconds': round(time.time() - start, 3)
+    }
+
+
+def exact_silhouette(X: np.ndarray, labels: np.ndarray, metric: str = 'euclidean') -> Dict[str, Any]:
+    """sklearn silhouette_score on the full set (O(n²) memory)."""
+    start = time.time()
+    return {
+        'silhouette_score': float(silhouette_score(X, labels, metric=metric)),
+        'silhouette_method': 'exact',
+        'silhouette_seconds': round(time.time() - start, 3)
+    }
+
+
+def compute_silhouette(X: np.ndarray, labels: np.ndarray, method: str = 'auto',
+                       sample_size: int = 10000, metric: str = 'euclidean',
+                       max_memory_mb: int = 256, random_state: int = 42) -> Dict[str, Any]:
+    """
+    Dispatch to the selected silhouette method.
+
+    'auto' uses exact sklearn up to AUTO_EXACT_MAX_SAMPLES points and the
+    stratified sample above; 'none' skips the metric.
+    """
+    if method not in SILHOUETTE_METHODS:
+        raise ValueError(f"Unknown silhouette method '{method}'. Use one of {SILHOUETTE_METHODS}")
+
+    if method == 'auto':
+        method = 'exact' if len(labels) <= AUTO_EXACT_MAX_SAMPLES else 'sampled'
+
+    if method == 'none':
+        return {'silhouette_method': 'none', 'silhouette_seconds': 0.0}
+    if method == 'exact':
+        return exact_silhouette(X, labels, metric)
+    if method == 'chunked':
+        return chunked_silhouette(X, labels, metric, max_memory_mb)
+    return sampled_silhouette(X, labels, sample_size, metric, random_state, max_memory_mb)
+
+
+def relative_validity(hdbscan_model) -> Dict[str, Any]:
+    """
+    HDBSCAN relative validity (fast DBCV approximation from the fit's MST).
+
+    Requires the model to be fitted with gen_min_span_tree=True.
+    """
+    start = time.time()
+    value = hdbscan_model.relative_validity_
+    return {
+        'relative_validity': float(value),
+        'relative_validity_seconds': round(time.time() - start, 3)
+    }
+
+
+def sampled_dbcv(X: np.ndarray, labels: np.ndarray, sample_size: int = 5000,
+                 metric: str = 'euclidean', random_state: int = 42) -> Dict[str, Any]:
+    """Full DBCV (hdbscan.validity.validity_index) on a stratified sample."""
+    from hdbscan.validity import validity_index
+
+    start = time.time()
+    rows = stratified_sample(np.asarray(labels), sample_size, random_state)
+    value = validity_index(np.asarray(X[rows], dtype=np.float64), np.asarray(labels)[rows], metric=metric)
+    return {
+        'dbcv': float(value),
+        'dbcv_sample_size': int(len(rows)),
+        'dbcv_seconds': round(time.time() - start, 3)
+    }
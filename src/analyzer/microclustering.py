@@ -0,0 +1,321 @@
+"""
+Two-stage (micro → macro) clustering for million-scale skill sets.
+
+UMAP + HDBSCAN on every skill needs the whole matrix and a kNN graph in
+memory. This mode only ever holds one batch of raw embeddings:
+
+    1. Reduction   PCA fitted on a random sample of rows, applied per batch
+                   (vectors re-normalized, so euclidean ~ cosine)
+    2. Micro       MiniBatchKMeans (occurrence-weighted) or BIRCH, fitted with
+                   partial_fit over batches streamed from the (memory-mapped)
+                   matrix; a second pass assigns every skill to its
+                   micro-cluster and accumulates its mass (occurrences)
+    3. Macro       UMAP (2D) + HDBSCAN on the micro-cluster centroids; macro
+                   clusters lighter than ``min_cluster_mass`` become noise
+    4. Labels      each skill takes the macro label of its micro-cluster
+
+HDBSCAN has no sample weights, so mass enters through stage 2: weighted
+k-means places centroids in proportion to occurrences, so heavily demanded
+regions are denser in centroid space, and through the macro mass filter.
+
+Labels, ``embedding_2d_`` (the 2D position of each skill's micro-cluster) and
+``clusterer`` (the SkillClusterer fitted on the centroids) plug into the same
+analyze_clusters()/calculate_metrics() calls as the exact pipeline.
+"""
+
+from typing import Any, Dict, Iterator, Optional, Tuple
+import logging
+import time
+
+import numpy as np
+from sklearn.cluster import Birch, MiniBatchKMeans
+
+from embedder.compression import EmbeddingCompressor, dequantize_int8, l2_normalize
+
+from .clustering import SkillClusterer
+from .dimension_reducer import DimensionReducer
+
+logger = logging.getLogger(__name__)
+
+MICRO_METHODS = ('minibatch_kmeans', 'birch')
+
+
+def default_n_micro_clusters(n: int) -> int:
+    """~50 skills per micro-cluster, between 100 and 10k centroids."""
+    return int(min(10_000, max(100, n // 50)))
+
+
+class MicroClusterer:
+    """
+    Cluster skills through micro-clusters streamed from a memory-mapped matrix.
+
+    Usage:
+        micro = MicroClusterer(min_cluster_size=20)
+        labels = micro.fit_predict(snapshot.embeddings, snapshot.frequencies,
+                                   scales=snapshot.scales)
+        summaries = micro.clusterer.analyze_clusters(labels, snapshot.skill_texts,
+                                                     snapshot.frequencies)
+    """
+
+    def __init__(
+        self,
+        method: str = 'minibatch_kmeans',
+        n_micro_clusters: Optional[int] = None,
+        n_components: int = 50,
+        batch_size: int = 65_536,
+        pca_sample_size: int = 20_000,
+        n_epochs: int = 1,
+        birch_threshold: float = 0.3,
+        min_cluster_size: int = 10,
+        min_samples: int = 5,
+        min_cluster_mass: int = 0,
+        n_neighbors: int = 15,
+        random_state: int = 42
+    ):
+        """
+        Initialize micro-clusterer.
+
+        Args:
+            method: 'minibatch_kmeans' (occurrence-weighted) or 'birch'
+            n_micro_clusters: k-means centroids (default: default_n_micro_clusters(n));
+                BIRCH finds its own number from birch_threshold
+            n_components: PCA dimension of stage 1
+            batch_size: Rows read from the matrix per step
+            pca_sample_size: Rows sampled to fit the PCA
+            n_epochs: Passes of partial_fit over the data (k-means)
+            birch_threshold: BIRCH subcluster radius in PCA space
+            min_cluster_size: HDBSCAN min_cluster_size, in micro-clusters
+            min_samples: HDBSCAN min_samples, in micro-clusters
+            min_cluster_mass: Macro clusters with fewer occurrences become noise
+            n_neighbors: UMAP neighbors on the centroids
+            random_state: Seed for sampling, k-means and UMAP
+        """
+        if method not in MICRO_METHODS:
+            raise ValueError(f"Unknown micro-clustering method '{method}'. Use one of {MICRO_METHODS}")
+
+        self.method = method
+        self.n_micro_clusters = n_micro_clusters
+        self.n_components = n_components
+        self.batch_size = batch_size
+        self.pca_sample_size = pca_sample_size
+        self.n_epochs = n_epochs
+        self.birch_threshold = birch_threshold
+        self.min_cluster_size = min_cluster_size
+        self.min_samples = min_samples
+        self.min_cluster_mass = min_cluster_mass
+        self.n_neighbors = n_neighbors
+        self.random_state = random_state
+
+        self.compressor: Optional[EmbeddingCompressor] = None
+        self.reducer: Optional[DimensionReducer] = None
+        self.clusterer: Optional[SkillClusterer] = None
+        self.micro_labels_: Optional[np.ndarray] = None
+        self.micro_centroids_: Optional[np.ndarray] = None
+        self.micro_mass_: Optional[np.ndarray] = None
+        self.micro_counts_: Optional[np.ndarray] = None
+        self.micro_coordinates_: Optional[np.ndarray] = None
+        self.macro_labels_: Optional[np.ndarray] = None
+        self.labels_: Optional[np.ndarray] = None
+        self.timing_: Dict[str, float] = {}
+
+    # --- streaming ---
+
+    def _read(self, embeddings: np.ndarray, scales: Optional[np.ndarray], rows) -> np.ndarray:
+        if scales is not None:
+            return dequantize_int8(embeddings[rows], scales[rows])
+        return np.asarray(embeddings[rows], dtype=np.float32)
+
+    def _batches(self, embeddings: np.ndarray, scales: Optional[np.ndarray],
+                 weights: np.ndarray) -> Iterator[Tuple[slice, np.ndarray, np.ndarray]]:
+        """Yield (rows, reduced batch, weights) in file order."""
+        n = embeddings.shape[0]
+        for start in range(0, n, self.batch_size):
+            rows = slice(start, min(start + self.batch_size, n))
+            yield rows, self.compressor.transform(self._read(embeddings, scales, rows)), weights[rows]
+
+    # --- stages ---
+
+    def _fit_reduction(self, embeddings: np.ndarray, scales: Optional[np.ndarray]):
+        n, dim = embeddings.shape
+        rng = np.random.default_rng(self.random_state)
+        sample = np.sort(rng.choice(n, size=min(n, self.pca_sample_size), replace=False))
+        self.compressor = EmbeddingCompressor(method='pca', dim=min(self.n_components, dim))
+        self.compressor.fit(l2_normalize(self._read(embeddings, scales, sample)))
+
+    def _fit_micro(self, embeddings: np.ndarray, scales: Optional[np.ndarray], weights: np.ndarray):
+        n = embeddings.shape[0]
+        if self.method == 'minibatch_kmeans':
+            k = min(self.n_micro_clusters or default_n_micro_clusters(n), n)
+            model = MiniBatchKMeans(
+                n_clusters=k,
+                batch_size=self.batch_size,
+                init='random',  # k-means++ over a whole batch costs more than the fit itself
+                n_init=1,
+                random_state=self.random_state
+            )
+            # partial_fit initializes the centroids from its first call, which
+            # needs at least k rows: reduced batches are buffered until then
+            # (batch_size may be smaller than k); later batches of any size
+            # only move the centroids
+            pending, pending_weights = [], []
+            for _ in range(self.n_epochs):
+                for _, batch, batch_weights in self._batches(embeddings, scales, weights):
+                    if hasattr(model, 'cluster_centers_'):
+                        model.partial_fit(batch, sample_weight=batch_weights)
+                        continue
+                    pending.append(batch)
+                    pending_weights.append(batch_weights)
+                    if sum(len(b) for b in pending) >= k:
+                        model.partial_fit(np.vstack(pending), sample_weight=np.concatenate(pending_weights))
+                        pending, pending_weights = [], []
+            if not hasattr(model, 'cluster_centers_'):
+                raise ValueError(f"MiniBatchKMeans needs at least {k} rows to initialize, got {n}")
+        else:
+            model = Birch(threshold=self.birch_threshold, n_clusters=None)
+            for _, batch, _ in self._batches(embeddings, scales, weights):
+                model.partial_fit(batch)
+        return model
+
+    def _assign_micro(self, model, embeddings: np.ndarray, scales: Optional[np.ndarray], weights: np.ndarray):
+        """Second pass: micro label, mass and weighted centroid of every micro-cluster."""
+        n = embeddings.shape[0]
+        centers = model.cluster_centers_ if self.method == 'minibatch_kmeans' else model.subcluster_centers_
+        k = len(centers)
+
+        micro_labels = np.empty(n, dtype=np.int32)
+        mass = np.zeros(k, dtype=np.float64)
+        counts = np.zeros(k, dtype=np.int64)
+        sums = np.zeros((k, centers.shape[1]), dtype=np.float64)
+
+        for rows, batch, batch_weights in self._batches(embeddings, scales, weights):
+            # Birch with n_clusters=None predicts the nearest subcluster index
+            batch_labels = model.predict(batch)
+            micro_labels[rows] = batch_labels
+            mass += np.bincount(batch_labels, weights=batch_weights, minlength=k)
+            counts += np.bincount(batch_labels, minlength=k)
+            weighted = batch * batch_weights[:, None]
+            for d in range(sums.shape[1]):
+                sums[:, d] += np.bincount(batch_labels, weights=weighted[:, d], minlength=k)
+
+        # Drop empty micro-clusters and renumber
+        used = counts > 0
+        remap = np.cumsum(used) - 1
+        self.micro_labels_ = remap[micro_labels].astype(np.int32)
+        self.micro_mass_ = mass[used]
+        self.micro_counts_ = counts[used]
+        self.micro_centroids_ = l2_normalize(sums[used] / np.maximum(mass[used], 1e-12)[:, None])
+
+    def _fit_macro(self):
+        m = len(self.micro_centroids_)
+        self.reducer = DimensionReducer(
+            n_components=2,
+            n_neighbors=min(self.n_neighbors, m - 1),
+            min_dist=0.1,
+            metric='cosine',
+            random_state=self.random_state
+        )
+        self.micro_coordinates_ = self.reducer.fit_transform(self.micro_centroids_).astype(np.float32)
+
+        self.clusterer = SkillClusterer(
+            min_cluster_size=self.min_cluster_size,
+            min_samples=self.min_samples,
+            metric='euclidean',
+            cluster_selection_method='eom',
+            allow_single_cluster=False,
+            prediction_data=False,
+            gen_min_span_tree=True
+        )
+        macro = self.clusterer.fit_predict(self.micro_coordinates_)
+
+        # Macro clusters below the mass floor become noise; renumber the rest
+        if self.min_cluster_mass and (macro >= 0).any():
+            cluster_mass = np.bincount(macro[macro >= 0], weights=self.micro_mass_[macro >= 0])
+            light = np.flatnonzero(cluster_mass < self.min_cluster_mass)
+            macro = np.where(np.isin(macro, light), -1, macro)
+        kept = np.unique(macro[macro >= 0])
+        remap = np.full(int(macro.max()) + 2 if len(macro) else 1, -1, dtype=np.int64)
+        remap[kept] = np.arange(len(kept))
+        self.macro_labels_ = np.where(macro >= 0, remap[macro], -1)
+
+    # --- public API ---
+
+    def fit_predict(
+        self,
+        embeddings: np.ndarray,
+        frequencies: Optional[np.ndarray] = None,
+        scales: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Cluster every row of ``embeddings``.
+
+        Args:
+            embeddings: (n, dim) matrix, typically EmbeddingSnapshot.embeddings
+                (memory-mapped; only batch_size rows are materialized at a time)
+            frequencies: Occurrences per row (mass); default 1
+            scales: Per-row scales for int8 snapshots
+
+        Returns:
+            labels: Macro cluster per row (-1 = noise)
+        """
+        n = embeddings.shape[0]
+        weights = (
+            np.asarray(frequencies, dtype=np.float64) if frequencies is not None
+            else np.ones(n, dtype=np.float64)
+        )
+        start = time.time()
+
+        self._fit_reduction(embeddings, scales)
+        self.timing_['reduction_seconds'] = round(time.time() - start, 2)
+
+        stage = time.time()
+        model = self._fit_micro(embeddings, scales, weights)
+        self.timing_['micro_fit_seconds'] = round(time.time() - stage, 2)
+
+        stage = time.time()
+        self._assign_micro(model, embeddings, scales, weights)
+        del model
+        self.timing_['micro_assign_seconds'] = round(time.time() - stage, 2)
+
+        stage = time.time()
+        self._fit_macro()
+        self.timing_['macro_seconds'] = round(time.time() - stage, 2)
+
+        self.labels_ = self.macro_labels_[self.micro_labels_]
+        self.timing_['total_seconds'] = round(time.time() - start, 2)
+
+        n_clusters = int(self.macro_labels_.max()) + 1 if (self.macro_labels_ >= 0).any() else 0
+        logger.info(
+            f"Micro-clustering ({self.method}): {n} skills → {len(self.micro_centroids_)} micro-clusters "
+            f"→ {n_clusters} clusters, noise {np.mean(self.labels_ == -1):.1%} "
+            f"({self.timing_['total_seconds']}s)"
+        )
+        return self.labels_
+
+    @property
+    def embedding_2d_(self) -> np.ndarray:
+        """2D position of each row (its micro-cluster's centroid in the UMAP map)."""
+        if self.micro_labels_ is None:
+            raise RuntimeError("MicroClusterer must be fitted first")
+        return self.micro_coordinates_[self.micro_labels_]
+
+    def get_parameters(self) -> Dict[str, Any]:
+        """Parameters for documentation (same role as SkillClusterer.get_parameters)."""
+        return {
+            'mode': 'microcluster',
+            'method': self.method,
+            'n_micro_clusters': (
+                len(self.micro_centroids_) if self.micro_centroids_ is not None else self.n_micro_clusters
+            ),
+            'n_components': self.n_components,
+            'batch_size': self.batch_size,
+            'pca_sample_size': self.pca_sample_size,
+            'n_epochs': self.n_epochs,
+            'birch_threshold': self.birch_threshold if self.method == 'birch' else None,
+            'min_cluster_size': self.min_cluster_size,
+            'min_samples': self.min_samples,
+            'min_cluster_mass': self.min_cluster_mass,
+            'n_neighbors': self.n_neighbors,
+            'pca_explained_variance': (
+                self.compressor.explained_variance_ratio_ if self.compressor is not None else None
+            )
+        }
@@ -0,0 +1,300 @@
+"""
+Versioned store for fitted clustering models (UMAP reducer + HDBSCAN).
+
+Each full clustering run saves its fitted models so that new skills can be
+placed in the existing map without refitting:
+
+    <cluster_model_dir>/<pipeline>/<version>/
+        reducer.joblib     fitted DimensionReducer (UMAP)
+        clusterer.joblib   fitted SkillClusterer (HDBSCAN, prediction_data=True)
+        training.npz       labels, 2D coordinates and mean embedding of the fit
+        skill_texts.json   skills the models were fitted on (row i ↔ label i)
+        skill_keys.json    embedding keys of the fit population (LOWER(TRIM()))
+        manifest.json      version, input hash, parameters, fit statistics
+
+    <cluster_model_dir>/<pipeline>/LATEST
+
+New skills go through ``reducer.transform`` + ``approximate_predict``; a full
+refit is only needed when the new data drifts away from the fit (see
+assess_drift()).
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime
+from pathlib import Path
+import hashlib
+import json
+import logging
+
+import joblib
+import numpy as np
+from sklearn.metrics import adjusted_rand_score, normalized_mutual_info_score
+
+logger = logging.getLogger(__name__)
+
+REDUCER_FILE = "reducer.joblib"
+CLUSTERER_FILE = "clusterer.joblib"
+TRAINING_FILE = "training.npz"
+SKILL_TEXTS_FILE = "skill_texts.json"
+SKILL_KEYS_FILE = "skill_keys.json"
+MANIFEST_FILE = "manifest.json"
+LATEST_FILE = "LATEST"
+
+
+def input_hash(skill_texts: List[str], embeddings: np.ndarray) -> str:
+    """Content hash of a clustering input (same role as a snapshot content_hash)."""
+    hasher = hashlib.sha256()
+    hasher.update('\n'.join(skill_texts).encode('utf-8'))
+    hasher.update(np.ascontiguousarray(embeddings, dtype=np.float32).tobytes())
+    return hasher.hexdigest()
+
+
+def assignment_agreement(labels_a: np.ndarray, labels_b: np.ndarray) -> Dict[str, float]:
+    """
+    Agreement between two label assignments of the same skills.
+
+    Cluster ids are arbitrary across fits, so agreement is measured with
+    permutation-invariant scores (ARI, NMI) plus the share of skills whose
+    noise/non-noise status matches.
+    """
+    labels_a = np.asarray(labels_a)
+    labels_b = np.asarray(labels_b)
+    return {
+        'n_skills': int(len(labels_a)),
+        'adjusted_rand_index': float(adjusted_rand_score(labels_a, labels_b)),
+        'normalized_mutual_info': float(normalized_mutual_info_score(labels_a, labels_b)),
+        'noise_agreement': float(np.mean((labels_a == -1) == (labels_b == -1))) if len(labels_a) else 1.0
+    }
+
+
+class ClusteringModel:
+    """Fitted reducer + clusterer loaded from the store."""
+
+    def __init__(self, path: Path, reducer, clusterer, manifest: Dict[str, Any],
+                 skill_texts: List[str], labels: np.ndarray, coordinates: np.ndarray,
+                 embedding_mean: np.ndarray, skill_keys: Optional[List[str]] = None):
+        self.path = Path(path)
+        self.reducer = reducer
+        self.clusterer = clusterer
+        self.manifest = manifest
+        self.skill_texts = skill_texts
+        self.labels = labels
+        self.coordinates = coordinates
+        self.embedding_mean = embedding_mean
+        # Models saved without keys: the fit's texts, normalized
+        self.skill_keys = skill_keys if skill_keys is not None else [
+            text.strip().lower() for text in skill_texts
+        ]
+
+    @property
+    def version(self) -> str:
+        return self.manifest['version']
+
+    @property
+    def input_hash(self) -> str:
+        return self.manifest['input_hash']
+
+    def assign(self, embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Place new skills in the fitted map.
+
+        Returns:
+            (labels, strengths, coordinates) for each embedding
+        """
+        coordinates = self.reducer.transform(embeddings)
+        labels, strengths = self.clusterer.approximate_predict(coordinates)
+        return labels, strengths, coordinates
+
+
+class ClusteringModelStore:
+    """
+    Save and load versioned clustering models per pipeline.
+
+    Usage:
+        store = ClusteringModelStore()
+        store.save('pipeline_a_post_esco', reducer, clusterer, skill_texts,
+                   embeddings, coordinates, labels, input_hash=snapshot.content_hash)
+        model = store.load('pipeline_a_post_esco')       # LATEST
+        labels, strengths, coords = model.assign(new_embeddings)
+    """
+
+    def __init__(self, base_dir: Optional[str] = None):
+        if base_dir is None:
+            from config.settings import get_settings
+            base_dir = get_settings().cluster_model_dir
+        self.base_dir = Path(base_dir)
+
+    def _pipeline_dir(self, pipeline: str) -> Path:
+        return self.base_dir / pipeline
+
+    def has_model(self, pipeline: str) -> bool:
+        return (self._pipeline_dir(pipeline) / LATEST_FILE).exists()
+
+    def save(
+        self,
+        pipeline: str,
+        reducer,
+        clusterer,
+        skill_texts: List[str],
+        embeddings: np.ndarray,
+        coordinates: np.ndarray,
+        labels: np.ndarray,
+        input_hash: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        version: Optional[str] = None,
+        skill_keys: Optional[List[str]] = None
+    ) -> Path:
+        """
+        Persist a fitted reducer/clusterer pair and point LATEST at it.
+
+        Args:
+            pipeline: Pipeline name (one model lineage per pipeline)
+            reducer: Fitted DimensionReducer
+            clusterer: Fitted SkillClusterer (prediction_data=True)
+            skill_texts: Skills the models were fitted on
+            embeddings: Input matrix of the fit (only its mean is stored)
+            coordinates: UMAP output of the fit
+            labels: HDBSCAN labels of the fit
+            input_hash: Snapshot content_hash or input_hash() of the matrix
+            metadata: Extra manifest fields (parameters, metrics, timings)
+            version: Version name (defaults to a timestamp)
+            skill_keys: Embedding keys of the fit population, used to tell
+                new skills apart (defaults to the normalized skill_texts)
+
+        Returns:
+            Path to the model version directory
+        """
+        version = version or datetime.now().strftime('%Y%m%d_%H%M%S')
+        path = self._pipeline_dir(pipeline) / version
+        if path.exists():
+            raise FileExistsError(f"Model version already exists: {path}")
+        path.mkdir(parents=True)
+
+        labels = np.asarray(labels)
+        joblib.dump(reducer, path / REDUCER_FILE)
+        joblib.dump(clusterer, path / CLUSTERER_FILE)
+        np.savez(
+            path / TRAINING_FILE,
+            labels=labels,
+            coordinates=np.asarray(coordinates, dtype=np.float32),
+            embedding_mean=np.asarray(embeddings, dtype=np.float32).mean(axis=0)
+        )
+        with open(path / SKILL_TEXTS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(list(skill_texts), f, ensure_ascii=False)
+        if skill_keys is not None:
+            with open(path / SKILL_KEYS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(list(skill_keys), f, ensure_ascii=False)
+
+        n_noise = int((labels == -1).sum())
+        manifest = {
+            'version': version,
+            'pipeline': pipeline,
+            'created_at': datetime.now().isoformat(),
+            'input_hash': input_hash,
+            'n_skills': int(len(labels)),
+            'dim': int(embeddings.shape[1]),
+            'n_clusters': int(len(set(labels.tolist()) - {-1})),
+            'noise_ratio': n_noise / len(labels) if len(labels) else 0.0,
+            'reducer_params': reducer.get_parameters(),
+            'clusterer_params': clusterer.get_parameters(),
+            **(metadata or {})
+        }
+        with open(path / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False, default=str)
+
+        (self._pipeline_dir(pipeline) / LATEST_FILE).write_text(version, encoding='utf-8')
+
+        logger.info(
+            f"Saved clustering model {pipeline}/{version} "
+            f"({manifest['n_skills']} skills, input={input_hash[:12]})"
+        )
+        return path
+
+    def load(self, pipeline: str, version: Optional[str] = None) -> ClusteringModel:
+        """Load a model version (None/'latest' → LATEST)."""
+        pipeline_dir = self._pipeline_dir(pipeline)
+        if not version or version == 'latest':
+            latest_file = pipeline_dir / LATEST_FILE
+            if not latest_file.exists():
+                raise FileNotFoundError(f"No clustering model for pipeline '{pipeline}' in {self.base_dir}")
+            version = latest_file.read_text(encoding='utf-8').strip()
+
+        path = pipeline_dir / version
+        if not path.is_dir():
+            raise FileNotFoundError(f"Clustering model not found: {path}")
+
+        with open(path / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        with open(path / SKILL_TEXTS_FILE, 'r', encoding='utf-8') as f:
+            skill_texts = json.load(f)
+        skill_keys = None
+        if (path / SKILL_KEYS_FILE).exists():
+            with open(path / SKILL_KEYS_FILE, 'r', encoding='utf-8') as f:
+                skill_keys = json.load(f)
+        with np.load(path / TRAINING_FILE) as training:
+            labels = training['labels']
+            coordinates = training['coordinates']
+            embedding_mean = training['embedding_mean']
+
+        reducer = joblib.load(path / REDUCER_FILE)
+        clusterer = joblib.load(path / CLUSTERER_FILE)
+
+        logger.info(f"Loaded clustering model {pipeline}/{version} ({len(skill_texts)} skills)")
+
+        return ClusteringModel(path, reducer, clusterer, manifest, skill_texts,
+                               labels, coordinates, embedding_mean, skill_keys=skill_keys)
+
+
+def assess_drift(
+    model: ClusteringModel,
+    new_embeddings: np.ndarray,
+    new_labels: np.ndarray,
+    noise_threshold: float,
+    drift_threshold: float,
+    new_fraction_threshold: float
+) -> Dict[str, Any]:
+    """
+    Decide whether incremental assignment is still good enough.
+
+    Signals:
+        noise_ratio     share of new skills approximate_predict left as noise
+        centroid_drift  cosine distance between the fit's mean embedding and
+                        the mean of the new embeddings
+        new_fraction    new skills relative to the size of the fit
+
+    Returns:
+        Dict with the signals, thresholds, 'needs_refit' and 'reasons'
+    """
+    n_new = len(new_labels)
+    noise_ratio = float(np.mean(np.asarray(new_labels) == -1)) if n_new else 0.0
+
+    centroid_drift = 0.0
+    if n_new:
+        new_mean = np.asarray(new_embeddings, dtype=np.float32).mean(axis=0)
+        denom = float(np.linalg.norm(new_mean) * np.linalg.norm(model.embedding_mean))
+        if denom > 0:
+            centroid_drift = 1.0 - float(np.dot(new_mean, model.embedding_mean)) / denom
+
+    new_fraction = n_new / max(len(model.skill_texts), 1)
+
+    reasons = []
+    if noise_ratio > noise_threshold:
+        reasons.append(f"noise_ratio {noise_ratio:.3f} > {noise_threshold}")
+    if centroid_drift > drift_threshold:
+        reasons.append(f"centroid_drift {centroid_drift:.4f} > {drift_threshold}")
+    if new_fraction > new_fraction_threshold:
+        reasons.append(f"new_fraction {new_fraction:.3f} > {new_fraction_threshold}")
+
+    return {
+        'n_new': n_new,
+        'noise_ratio': noise_ratio,
+        'centroid_drift': centroid_drift,
+        'new_fraction': new_fraction,
+        'thresholds': {
+            'noise_ratio': noise_threshold,
+            'centroid_drift': drift_threshold,
+            'new_fraction': new_fraction_threshold
+        },
+        'needs_refit': bool(reasons),
+        'reasons': reasons
+    }
@@ -0,0 +1,138 @@
+"""
+Process-pool runner for clustering parameter sweeps.
+
+Grid points are independent UMAP + HDBSCAN fits on the same embedding matrix.
+They run across a process pool; the matrix and the precomputed kNN graph are
+placed once in shared memory and every worker maps them as read-only numpy
+views instead of receiving a pickled copy per task.
+
+The experiment function is called as
+
+    run_fn(embeddings, precomputed_knn, **shared, **point_kwargs)
+
+where ``precomputed_knn`` is the graph sliced to the grid point's n_neighbors
+(or None when no graph is given). ``run_fn`` must be a module-level function.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import logging
+
+import numpy as np
+
+from .knn_graph import KNNGraph
+
+logger = logging.getLogger(__name__)
+
+# Worker-side state, set once per process by _init_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def _to_shared(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, Tuple[str, tuple, str]]:
+    """Copy an array into a new shared memory block; return the block and its descriptor."""
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _attach(descriptor: Tuple[str, tuple, str]) -> np.ndarray:
+    name, shape, dtype = descriptor
+    block = shared_memory.SharedMemory(name=name)
+    _worker_state.setdefault('blocks', []).append(block)  # keep the mapping alive
+    view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    view.flags.writeable = False
+    return view
+
+
+def _init_worker(embeddings_desc, knn_desc, knn_metric, run_fn, shared):
+    _worker_state['embeddings'] = _attach(embeddings_desc)
+    _worker_state['knn'] = None
+    if knn_desc is not None:
+        indices = _attach(knn_desc[0])
+        distances = _attach(knn_desc[1])
+        _worker_state['knn'] = KNNGraph(indices, distances, knn_metric, input_hash='')
+    _worker_state['run_fn'] = run_fn
+    _worker_state['shared'] = shared
+
+
+def _run_point(n_neighbors: int, kwargs: Dict[str, Any]) -> Any:
+    knn = _worker_state['knn']
+    precomputed_knn = knn.precomputed_knn(n_neighbors) if knn is not None else None
+    return _worker_state['run_fn'](
+        _worker_state['embeddings'], precomputed_knn, **_worker_state['shared'], **kwargs
+    )
+
+
+def run_parameter_sweep(
+    run_fn: Callable[..., Any],
+    grid: List[Tuple[int, Dict[str, Any]]],
+    embeddings: np.ndarray,
+    knn_graph: Optional[KNNGraph] = None,
+    n_workers: int = 1,
+    shared: Optional[Dict[str, Any]] = None,
+    on_result: Optional[Callable[[int, Any], None]] = None
+) -> List[Any]:
+    """
+    Run every grid point and return the results in grid order.
+
+    Args:
+        run_fn: Module-level experiment function (see module docstring)
+        grid: (n_neighbors, kwargs) per grid point
+        embeddings: Input matrix shared by all grid points
+        knn_graph: Graph built at max(n_neighbors) of the grid (optional)
+        n_workers: Worker processes (1 = run in this process)
+        shared: Extra kwargs identical for all points (e.g. skill_texts),
+            sent once per worker
+        on_result: Called as on_result(grid_index, result) when a point finishes
+    """
+    shared = shared or {}
+    results: List[Any] = [None] * len(grid)
+
+    if n_workers <= 1:
+        for i, (n_neighbors, kwargs) in enumerate(grid):
+            precomputed_knn = knn_graph.precomputed_knn(n_neighbors) if knn_graph is not None else None
+            results[i] = run_fn(embeddings, precomputed_knn, **shared, **kwargs)
+            if on_result:
+                on_result(i, results[i])
+        return results
+
+    blocks = []
+    try:
+        block, embeddings_desc = _to_shared(np.asarray(embeddings, dtype=np.float32))
+        blocks.append(block)
+
+        knn_desc = None
+        if knn_graph is not None:
+            idx_block, idx_desc = _to_shared(knn_graph.indices)
+            dist_block, dist_desc = _to_shared(knn_graph.distances)
+            blocks.extend([idx_block, dist_block])
+            knn_desc = (idx_desc, dist_desc)
+
+        logger.info(
+            f"Sweep: {len(grid)} grid points on {n_workers} workers "
+            f"(shared matrix {embeddings.shape}, kNN graph={'yes' if knn_graph is not None else 'no'})"
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(embeddings_desc, knn_desc, knn_graph.metric if knn_graph is not None else None,
+                      run_fn, shared)
+        ) as pool:
+            futures = {
+                pool.submit(_run_point, n_neighbors, kwargs): i
+                for i, (n_neighbors, kwargs) in enumerate(grid)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                if on_result:
+                    on_result(i, results[i])
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return results
@@ -0,0 +1,347 @@
+"""
+Density-tile rendering for large UMAP scatter plots.
+
+Drawing every skill of a 30k+ clustering as its own marker makes matplotlib
+slow and the PNGs served from /api/static several MB. Here points are binned
+into a ``grid_size`` × ``grid_size`` grid instead; each non-empty cell keeps its
+count, dominant cluster and summed frequency. Only what a density view would
+hide is kept as individual points:
+
+    outliers    points in cells with at most ``outlier_max_count`` points
+    top points  the ``top_points`` most frequent skills (drawn sized by frequency)
+
+plus one centroid per cluster, the ``label_top_n`` largest ones labelled.
+
+render_scatter() writes ``<name>.png`` and ``<name>.tiles.json`` (cells, kept
+points, centroids). The JSON carries a cache key hashed from the coordinates,
+labels, frequencies and render parameters; an unchanged configuration is not
+re-rendered. render_scatter_jobs() runs several renders in a process pool
+under the Agg backend.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import hashlib
+import json
+import logging
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NOISE_COLOR = (0.83, 0.83, 0.83)
+
+
+def scatter_cache_key(coordinates: np.ndarray, labels: np.ndarray,
+                      frequencies: Optional[np.ndarray], params: Dict[str, Any]) -> str:
+    """sha256 of the clustering result and render parameters."""
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(coordinates, dtype=np.float32).tobytes())
+    digest.update(np.ascontiguousarray(labels, dtype=np.int64).tobytes())
+    if frequencies is not None:
+        digest.update(np.ascontiguousarray(frequencies, dtype=np.float64).tobytes())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def density_tiles(
+    coordinates: np.ndarray,
+    labels: np.ndarray,
+    frequencies: Optional[np.ndarray] = None,
+    skill_texts: Optional[Sequence[str]] = None,
+    centroid_labels: Optional[Dict[int, str]] = None,
+    grid_size: int = 256,
+    top_points: int = 200,
+    outlier_max_count: int = 2,
+    max_points: int = 5000,
+    label_top_n: int = 10
+) -> Dict[str, Any]:
+    """
+    Bin a 2D scatter into density cells and pick the points kept individually.
+
+    Args:
+        coordinates: (n, 2) UMAP coordinates
+        labels: Cluster label per point (-1 = noise)
+        frequencies: Occurrences per point (defaults to 1)
+        skill_texts: Skill text per point (used for kept points and centroid labels)
+        centroid_labels: cluster_id → label text (defaults to the cluster's most frequent skill)
+        grid_size: Cells per axis
+        top_points: Most frequent points always kept
+        outlier_max_count: Points in cells with at most this many points are kept
+        max_points: Cap on kept points (most frequent first)
+        label_top_n: Largest clusters whose centroid gets a text label
+
+    Returns:
+        JSON-serializable dict with 'bounds', 'grid_size', 'cells'
+        ([ix, iy, count, dominant_label, frequency_sum]), 'points' and 'centroids'
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    labels = np.asarray(labels, dtype=np.int64)
+    n = len(labels)
+    frequencies = np.ones(n) if frequencies is None else np.asarray(frequencies, dtype=np.float64)
+
+    xmin, ymin = coordinates.min(axis=0)
+    xmax, ymax = coordinates.max(axis=0)
+    pad_x = max((xmax - xmin) * 0.01, 1e-9)
+    pad_y = max((ymax - ymin) * 0.01, 1e-9)
+    xmin, xmax, ymin, ymax = xmin - pad_x, xmax + pad_x, ymin - pad_y, ymax + pad_y
+
+    ix = np.clip(((coordinates[:, 0] - xmin) / (xmax - xmin) * grid_size).astype(np.int64), 0, grid_size - 1)
+    iy = np.clip(((coordinates[:, 1] - ymin) / (ymax - ymin) * grid_size).astype(np.int64), 0, grid_size - 1)
+    cell = iy * grid_size + ix
+
+    counts = np.bincount(cell, minlength=grid_size * grid_size)
+    freq_sums = np.bincount(cell, weights=frequencies, minlength=grid_size * grid_size)
+
+    # Dominant label per cell: most points, ties to the lower label
+    n_codes = int(labels.max()) + 2
+    pair_codes, pair_counts = np.unique(cell * n_codes + (labels + 1), return_counts=True)
+    pair_cells = pair_codes // n_codes
+    pair_labels = pair_codes % n_codes - 1
+    order = np.lexsort((pair_labels, -pair_counts, pair_cells))
+    first = np.r_[True, pair_cells[order][1:] != pair_cells[order][:-1]]
+    dominant = np.full(grid_size * grid_size, -1, dtype=np.int64)
+    dominant[pair_cells[order][first]] = pair_labels[order][first]
+
+    occupied = np.flatnonzero(counts)
+    cells = np.column_stack([
+        occupied % grid_size,
+        occupied // grid_size,
+        counts[occupied],
+        dominant[occupied],
+        np.round(freq_sums[occupied]).astype(np.int64)
+    ]).tolist()
+
+    # Individually kept points: sparse-cell outliers + most frequent skills
+    keep = counts[cell] <= outlier_max_count
+    if top_points > 0:
+        keep[np.argsort(-frequencies, kind='stable')[:top_points]] = True
+    kept = np.flatnonzero(keep)
+    if len(kept) > max_points:
+        kept = np.sort(kept[np.argsort(-frequencies[kept], kind='stable')[:max_points]])
+
+    points = [
+        {
+            'x': round(float(coordinates[i, 0]), 4),
+            'y': round(float(coordinates[i, 1]), 4),
+            'cluster_id': int(labels[i]),
+            'frequency': int(frequencies[i]),
+            **({'skill': skill_texts[i]} if skill_texts is not None else {})
+        }
+        for i in kept
+    ]
+
+    # Centroids (vectorized over clusters)
+    clustered = labels >= 0
+    centroids = []
+    if clustered.any():
+        sizes = np.bincount(labels[clustered])
+        cluster_ids = np.flatnonzero(sizes)
+        cx = np.bincount(labels[clustered], weights=coordinates[clustered, 0])[cluster_ids] / sizes[cluster_ids]
+        cy = np.bincount(labels[clustered], weights=coordinates[clustered, 1])[cluster_ids] / sizes[cluster_ids]
+
+        # Most frequent member per cluster (fallback label)
+        members = np.flatnonzero(clustered)
+        member_order = members[np.lexsort((-frequencies[members], labels[members]))]
+        member_labels = labels[member_order]
+        top_member = dict(zip(
+            member_labels[np.r_[True, member_labels[1:] != member_labels[:-1]]].tolist(),
+            member_order[np.r_[True, member_labels[1:] != member_labels[:-1]]].tolist()
+        ))
+
+        labelled = set(cluster_ids[np.argsort(-sizes[cluster_ids], kind='stable')[:label_top_n]].tolist())
+        for cluster_id, x, y in zip(cluster_ids.tolist(), cx, cy):
+            text = None
+            if cluster_id in labelled:
+                if centroid_labels and cluster_id in centroid_labels:
+                    text = centroid_labels[cluster_id]
+                elif skill_texts is not None:
+                    text = skill_texts[top_member[cluster_id]]
+            centroids.append({
+                'cluster_id': cluster_id,
+                'x': round(float(x), 4),
+                'y': round(float(y), 4),
+                'size': int(sizes[cluster_id]),
+                'label': text
+            })
+
+    return {
+        'n_points': int(n),
+        'grid_size': grid_size,
+        'bounds': [float(xmin), float(xmax), float(ymin), float(ymax)],
+        'cells': cells,
+        'points': points,
+        'centroids': centroids
+    }
+
+
+def _cluster_color(cluster_id: int, cmap) -> tuple:
+    if cluster_id < 0:
+        return NOISE_COLOR
+    return tuple(cmap(cluster_id % cmap.N)[:3])
+
+
+def draw_tiles(tiles: Dict[str, Any], output_path: Path, title: str = '', dpi: int = 150) -> None:
+    """Draw density cells as an image, kept points on top and labelled centroids."""
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    cmap = matplotlib.colormaps['tab20']
+    grid_size = tiles['grid_size']
+    xmin, xmax, ymin, ymax = tiles['bounds']
+
+    cells = np.asarray(tiles['cells'], dtype=np.float64).reshape(-1, 5)
+    image = np.zeros((grid_size, grid_size, 4))
+    if len(cells):
+        log_counts = np.log1p(cells[:, 2])
+        alphas = 0.25 + 0.75 * log_counts / max(log_counts.max(), 1e-9)
+        colors = np.array([_cluster_color(int(label), cmap) for label in cells[:, 3]])
+        iy, ix = cells[:, 1].astype(int), cells[:, 0].astype(int)
+        image[iy, ix, :3] = colors
+        image[iy, ix, 3] = alphas
+
+    fig, ax = plt.subplots(figsize=(16, 12))
+    ax.imshow(image, origin='lower', extent=(xmin, xmax, ymin, ymax),
+              interpolation='nearest', aspect='auto', zorder=1)
+
+    points = tiles['points']
+    if points:
+        freqs = np.array([p['frequency'] for p in points], dtype=np.float64)
+        span = max(freqs.max() - freqs.min(), 1e-9)
+        ax.scatter(
+            [p['x'] for p in points],
+            [p['y'] for p in points],
+            c=[_cluster_color(p['cluster_id'], cmap) for p in points],
+            s=10 + (freqs - freqs.min()) / span * 200,
+            alpha=0.8,
+            edgecolors='black',
+            linewidth=0.4,
+            zorder=2
+        )
+
+    for centroid in tiles['centroids']:
+        if not centroid['label']:
+            continue
+        ax.text(
+            centroid['x'], centroid['y'],
+            f"C{centroid['cluster_id']}: {centroid['label'][:30]}",
+            fontsize=8,
+            weight='bold',
+            ha='center',
+            va='center',
+            zorder=3,
+            bbox=dict(boxstyle='round,pad=0.4', facecolor='white', alpha=0.85, edgecolor='black', linewidth=1)
+        )
+
+    ax.set_xlim(xmin, xmax)
+    ax.set_ylim(ymin, ymax)
+    ax.set_title(title, fontsize=14, weight='bold', pad=15)
+    ax.set_xlabel('UMAP 1', fontsize=12)
+    ax.set_ylabel('UMAP 2', fontsize=12)
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
+
+def render_scatter(
+    coordinates: np.ndarray,
+    labels: np.ndarray,
+    output_path: str,
+    frequencies: Optional[np.ndarray] = None,
+    skill_texts: Optional[Sequence[str]] = None,
+    centroid_labels: Optional[Dict[int, str]] = None,
+    title: str = '',
+    grid_size: int = 256,
+    top_points: int = 200,
+    outlier_max_count: int = 2,
+    max_points: int = 5000,
+    label_top_n: int = 10,
+    dpi: int = 150,
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """
+    Write ``output_path`` (PNG) and its ``.tiles.json``, unless both are up to date.
+
+    Returns a summary: {'png', 'tiles', 'cache_key', 'cache_hit', 'n_points',
+    'n_cells', 'n_kept_points', 'seconds'}.
+    """
+    start = time.time()
+    png_path = Path(output_path)
+    tiles_path = png_path.with_suffix('.tiles.json')
+
+    params = {
+        'grid_size': grid_size, 'top_points': top_points, 'outlier_max_count': outlier_max_count,
+        'max_points': max_points, 'label_top_n': label_top_n, 'dpi': dpi, 'title': title,
+        'centroid_labels': centroid_labels or {}
+    }
+    cache_key = scatter_cache_key(coordinates, labels, frequencies, params)
+
+    if use_cache and png_path.exists() and tiles_path.exists():
+        with open(tiles_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('cache_key') == cache_key:
+            logger.info(f"Scatter up to date, skipping render: {png_path}")
+            return {
+                'png': str(png_path),
+                'tiles': str(tiles_path),
+                'cache_key': cache_key,
+                'cache_hit': True,
+                'n_points': cached['n_points'],
+                'n_cells': len(cached['cells']),
+                'n_kept_points': len(cached['points']),
+                'seconds': round(time.time() - start, 3)
+            }
+
+    tiles = density_tiles(
+        coordinates, labels, frequencies, skill_texts, centroid_labels,
+        grid_size=grid_size, top_points=top_points, outlier_max_count=outlier_max_count,
+        max_points=max_points, label_top_n=label_top_n
+    )
+    tiles['cache_key'] = cache_key
+
+    png_path.parent.mkdir(parents=True, exist_ok=True)
+    draw_tiles(tiles, png_path, title=title, dpi=dpi)
+    with open(tiles_path, 'w', encoding='utf-8') as f:
+        json.dump(tiles, f, ensure_ascii=False)
+
+    seconds = time.time() - start
+    logger.info(
+        f"Rendered {png_path}: {tiles['n_points']} points → {len(tiles['cells'])} cells + "
+        f"{len(tiles['points'])} kept points ({seconds:.1f}s)"
+    )
+    return {
+        'png': str(png_path),
+        'tiles': str(tiles_path),
+        'cache_key': cache_key,
+        'cache_hit': False,
+        'n_points': tiles['n_points'],
+        'n_cells': len(tiles['cells']),
+        'n_kept_points': len(tiles['points']),
+        'seconds': round(seconds, 3)
+    }
+
+
+def _init_agg_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _render_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    return render_scatter(**job)
+
+
+def render_scatter_jobs(jobs: List[Dict[str, Any]], n_workers: int = 1) -> List[Dict[str, Any]]:
+    """
+    Run render_scatter(**job) for every job; returns summaries in job order.
+
+    With n_workers > 1 jobs run in a process pool whose workers use the Agg backend.
+    """
+    if n_workers <= 1 or len(jobs) <= 1:
+        return [render_scatter(**job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(jobs)), initializer=_init_agg_worker) as pool:
+        return list(pool.map(_render_job, jobs))
@@ -0,0 +1,274 @@
+"""
+Bootstrap / subsample stability of HDBSCAN clusters.
+
+HDBSCAN is refitted on K replicates of the 2D UMAP embedding of a clustering
+run (UMAP itself is not refitted: the question is whether the density
+clusters found in that map are robust to resampling):
+
+    subsample   a random ``sample_fraction`` of the points, without replacement
+    bootstrap   n points drawn with replacement (duplicates kept in the fit,
+                each point scored once)
+
+Replicates run in a process pool. The embedding is read from a .npy file that
+every worker opens memory-mapped, so it is never pickled or copied per task,
+and each fit is single-threaded so throughput scales with the number of
+workers.
+
+Scores (Hennig, 2007):
+
+    per-cluster Jaccard   for each reference cluster C, the best
+                          |C ∩ D| / |C ∪ D| over replicate clusters D, on the
+                          points present in the replicate; averaged over
+                          replicates. >= 0.75 stable, <= 0.5 dissolved
+    ARI matrix            adjusted Rand index between every pair of replicates
+                          on the points they share, and of each replicate
+                          against the reference labels
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import logging
+import time
+
+import numpy as np
+from sklearn.metrics import adjusted_rand_score
+
+logger = logging.getLogger(__name__)
+
+STABILITY_METHODS = ('subsample', 'bootstrap')
+
+# Hennig's thresholds for the mean Jaccard of a cluster
+STABLE_JACCARD = 0.75
+DISSOLVED_JACCARD = 0.5
+
+HDBSCAN_PARAMS = ('min_cluster_size', 'min_samples', 'metric',
+                  'cluster_selection_method', 'allow_single_cluster')
+
+# Worker-side state, set once per process by _init_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def replicate_indices(n: int, method: str, sample_fraction: float,
+                      rng: np.random.Generator) -> np.ndarray:
+    """Row indices of one replicate (sorted; may repeat for bootstrap)."""
+    if method == 'bootstrap':
+        return np.sort(rng.integers(0, n, size=n))
+    size = max(2, int(round(n * sample_fraction)))
+    return np.sort(rng.choice(n, size=size, replace=False))
+
+
+def _init_worker(coordinates_path: str, hdbscan_params: Dict[str, Any],
+                 method: str, sample_fraction: float):
+    _worker_state['coordinates'] = np.load(coordinates_path, mmap_mode='r')
+    _worker_state['hdbscan_params'] = hdbscan_params
+    _worker_state['method'] = method
+    _worker_state['sample_fraction'] = sample_fraction
+
+
+def _fit_replicate(seed: int) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Fit HDBSCAN on one replicate; return (unique indices, their labels, fit seconds)."""
+    import hdbscan
+
+    coordinates = _worker_state['coordinates']
+    rng = np.random.default_rng(seed)
+    idx = replicate_indices(len(coordinates), _worker_state['method'],
+                            _worker_state['sample_fraction'], rng)
+
+    start = time.time()
+    labels = hdbscan.HDBSCAN(core_dist_n_jobs=1, **_worker_state['hdbscan_params']).fit_predict(
+        np.asarray(coordinates[idx], dtype=np.float64)
+    )
+    fit_seconds = time.time() - start
+
+    # Bootstrap duplicates get the same label; score each point once
+    unique_idx, first = np.unique(idx, return_index=True)
+    return unique_idx, labels[first].astype(np.int64), fit_seconds
+
+
+def jaccard_per_cluster(reference_labels: np.ndarray, idx: np.ndarray,
+                        replicate_labels: np.ndarray, n_reference_clusters: int) -> np.ndarray:
+    """
+    Best Jaccard of each reference cluster against the replicate's clusters.
+
+    NaN for reference clusters with no point in the replicate.
+    """
+    ref = reference_labels[idx]
+    a = np.bincount(ref[ref >= 0], minlength=n_reference_clusters).astype(np.float64)
+
+    rep_mask = replicate_labels >= 0
+    if not rep_mask.any():
+        return np.where(a > 0, 0.0, np.nan)
+
+    n_rep = int(replicate_labels.max()) + 1
+    b = np.bincount(replicate_labels[rep_mask], minlength=n_rep).astype(np.float64)
+
+    both = (ref >= 0) & rep_mask
+    joint = np.bincount(
+        ref[both] * n_rep + replicate_labels[both],
+        minlength=n_reference_clusters * n_rep
+    ).reshape(n_reference_clusters, n_rep).astype(np.float64)
+
+    union = a[:, None] + b[None, :] - joint
+    with np.errstate(invalid='ignore', divide='ignore'):
+        jaccard = np.where(union > 0, joint / union, 0.0)
+    best = jaccard.max(axis=1)
+    best[a == 0] = np.nan
+    return best
+
+
+def _finite(value: float) -> Optional[float]:
+    """float, or None for NaN (PostgreSQL rejects NaN in json/jsonb)."""
+    return None if np.isnan(value) else float(value)
+
+
+def _nan_stat(values: np.ndarray, stat) -> Optional[float]:
+    """stat (np.mean, np.std) of the non-NaN values; None if there are none."""
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    return float(stat(values)) if len(values) else None
+
+
+def ari_matrix(replicates: List[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+    """Symmetric K×K ARI between replicates on their shared points (diagonal = 1)."""
+    k = len(replicates)
+    matrix = np.eye(k)
+    for i in range(k):
+        idx_i, labels_i = replicates[i]
+        for j in range(i + 1, k):
+            idx_j, labels_j = replicates[j]
+            _, pos_i, pos_j = np.intersect1d(idx_i, idx_j, assume_unique=True, return_indices=True)
+            value = adjusted_rand_score(labels_i[pos_i], labels_j[pos_j]) if len(pos_i) else np.nan
+            matrix[i, j] = matrix[j, i] = value
+    return matrix
+
+
+def cluster_stability(
+    coordinates_path: str,
+    reference_labels: np.ndarray,
+    hdbscan_params: Dict[str, Any],
+    n_replicates: int = 20,
+    method: str = 'subsample',
+    sample_fraction: float = 0.8,
+    n_workers: int = 1,
+    random_state: int = 42
+) -> Dict[str, Any]:
+    """
+    Refit HDBSCAN on ``n_replicates`` replicates and score cluster stability.
+
+    Args:
+        coordinates_path: .npy with the 2D UMAP embedding (opened memory-mapped)
+        reference_labels: Labels of the clustering run being assessed
+        hdbscan_params: SkillClusterer parameters of that run (extra keys ignored)
+        n_replicates: Number of replicates (K)
+        method: 'subsample' or 'bootstrap'
+        sample_fraction: Share of points per subsample replicate
+        n_workers: Worker processes (1 = run in this process)
+        random_state: Seed of the replicate draws
+
+    Returns:
+        JSON-serializable dict with 'summary', 'clusters', 'ari_matrix',
+        'ari_vs_reference' and 'timing'
+    """
+    if method not in STABILITY_METHODS:
+        raise ValueError(f"Unknown stability method '{method}'. Use one of {STABILITY_METHODS}")
+
+    coordinates_path = str(Path(coordinates_path))
+    reference_labels = np.asarray(reference_labels, dtype=np.int64)
+    params = {key: hdbscan_params[key] for key in HDBSCAN_PARAMS if key in hdbscan_params}
+    seeds = np.random.SeedSequence(random_state).generate_state(n_replicates).tolist()
+
+    start = time.time()
+    if n_workers <= 1:
+        _init_worker(coordinates_path, params, method, sample_fraction)
+        fits = [_fit_replicate(seed) for seed in seeds]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(coordinates_path, params, method, sample_fraction)
+        ) as pool:
+            fits = list(pool.map(_fit_replicate, seeds))
+    fit_wall_seconds = time.time() - start
+
+    replicates = [(idx, labels) for idx, labels, _ in fits]
+    fit_seconds = [seconds for _, _, seconds in fits]
+
+    # Per-cluster Jaccard across replicates
+    n_reference_clusters = int(reference_labels.max()) + 1 if (reference_labels >= 0).any() else 0
+    jaccards = np.vstack([
+        jaccard_per_cluster(reference_labels, idx, labels, n_reference_clusters)
+        for idx, labels in replicates
+    ]) if n_reference_clusters else np.empty((n_replicates, 0))
+
+    sizes = np.bincount(reference_labels[reference_labels >= 0], minlength=n_reference_clusters)
+    with np.errstate(invalid='ignore'):
+        mean_jaccard = np.nanmean(jaccards, axis=0)
+        std_jaccard = np.nanstd(jaccards, axis=0)
+        observed = np.sum(~np.isnan(jaccards), axis=0)
+        stable_rate = np.sum(jaccards >= STABLE_JACCARD, axis=0) / np.maximum(observed, 1)
+        dissolved_rate = np.sum(jaccards <= DISSOLVED_JACCARD, axis=0) / np.maximum(observed, 1)
+
+    clusters = [
+        {
+            'cluster_id': cluster_id,
+            'size': int(sizes[cluster_id]),
+            'mean_jaccard': _finite(mean_jaccard[cluster_id]),
+            'std_jaccard': _finite(std_jaccard[cluster_id]),
+            'stable_rate': float(stable_rate[cluster_id]),
+            'dissolved_rate': float(dissolved_rate[cluster_id]),
+            'replicates_observed': int(observed[cluster_id])
+        }
+        for cluster_id in np.flatnonzero(sizes).tolist()
+    ]
+
+    # ARI between replicates and against the reference
+    matrix = ari_matrix(replicates)
+    pairwise = matrix[np.triu_indices(n_replicates, k=1)]
+    vs_reference = np.array([
+        adjusted_rand_score(reference_labels[idx], labels) for idx, labels in replicates
+    ], dtype=np.float64)
+
+    valid = ~np.isnan(mean_jaccard) & (sizes > 0)
+    cpu_seconds = float(np.sum(fit_seconds))
+    summary = {
+        'n_reference_clusters': int(np.count_nonzero(sizes)),
+        'n_stable_clusters': int(np.sum(mean_jaccard[valid] >= STABLE_JACCARD)),
+        'n_dissolved_clusters': int(np.sum(mean_jaccard[valid] <= DISSOLVED_JACCARD)),
+        'mean_jaccard': float(np.mean(mean_jaccard[valid])) if valid.any() else None,
+        'size_weighted_jaccard': (
+            float(np.average(mean_jaccard[valid], weights=sizes[valid])) if valid.any() else None
+        ),
+        'mean_pairwise_ari': _nan_stat(pairwise, np.mean),
+        'std_pairwise_ari': _nan_stat(pairwise, np.std),
+        'mean_ari_vs_reference': _nan_stat(vs_reference, np.mean),
+        'mean_replicate_noise_ratio': float(np.mean([np.mean(labels == -1) for _, labels in replicates])),
+        'mean_replicate_clusters': float(np.mean([len(set(labels.tolist()) - {-1}) for _, labels in replicates]))
+    }
+
+    timing = {
+        'fit_wall_seconds': round(fit_wall_seconds, 2),
+        'fit_cpu_seconds': round(cpu_seconds, 2),
+        'replicate_fit_seconds': [round(s, 2) for s in fit_seconds],
+        'n_workers': n_workers,
+        'speedup': round(cpu_seconds / fit_wall_seconds, 2) if fit_wall_seconds > 0 else None,
+        'parallel_efficiency': (
+            round(cpu_seconds / fit_wall_seconds / max(n_workers, 1), 3) if fit_wall_seconds > 0 else None
+        ),
+        'total_seconds': round(time.time() - start, 2)
+    }
+
+    logger.info(
+        f"Stability ({method}, K={n_replicates}, {n_workers} workers): "
+        f"{summary['n_stable_clusters']}/{summary['n_reference_clusters']} stable clusters, "
+        f"mean pairwise ARI={summary['mean_pairwise_ari']}, "
+        f"speedup {timing['speedup']}x in {timing['fit_wall_seconds']}s"
+    )
+
+    return {
+        'summary': summary,
+        'clusters': clusters,
+        'ari_matrix': [[_finite(v) for v in row] for row in np.round(matrix, 4)],
+        'ari_vs_reference': [_finite(v) for v in np.round(vs_reference, 4)],
+        'timing': timing
+    }
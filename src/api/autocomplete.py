@@ -0,0 +1,221 @@
+"""
+In-memory skill prefix index for /api/skills/autocomplete.
+
+Type-ahead requests are too frequent (and too latency-sensitive) for a
+database round trip per keystroke, so distinct skills and their mention
+counts are loaded once from skill_demand_counts (migration 015) into one
+sorted array per source and searched with bisect:
+
+    - keys are the casefolded skill text plus every later word start
+      ("machine learning" is found by "mach" and by "lea")
+    - the keys starting with a prefix form one contiguous slice; the most
+      mentioned skills of that slice are returned
+    - prefixes whose slice holds more than PRECOMPUTED_SLICE_SIZE keys
+      ("a", "de", "ana"...) are answered from top lists precomputed at
+      build time, so no request ranks more than that many keys
+
+The index is rebuilt in a background thread, while the previous one keeps
+answering, after a skills_extracted / skills_enhanced event or once it is
+SKILL_AUTOCOMPLETE_MAX_AGE_SECONDS old (gold standard edits, missed events).
+"""
+
+from bisect import bisect_left
+from threading import Lock, Thread
+from typing import Any, Dict, List, Optional, Tuple
+import heapq
+import logging
+import time
+
+from sqlalchemy import text
+
+from config.settings import get_settings
+from api.cache import SKILL_EVENTS
+
+logger = logging.getLogger(__name__)
+
+MAX_SUGGESTIONS = 50
+PRECOMPUTED_SLICE_SIZE = 2000
+
+
+def normalize_prefix(value: str) -> str:
+    """Case/whitespace-insensitive form used for keys and queries."""
+    return ' '.join(value.casefold().split())
+
+
+class SkillPrefixIndex:
+    """Sorted (key, skill) array for one source, searched with bisect."""
+
+    def __init__(self, skills: List[Tuple[str, int]]):
+        """
+        Args:
+            skills: (skill_text, mention_count) pairs, one per distinct skill
+        """
+        self.skills = [skill for skill, _ in skills]
+        self.counts = [int(count) for _, count in skills]
+
+        entries = []
+        for position, skill in enumerate(self.skills):
+            key = normalize_prefix(skill)
+            entries.append((key, position))
+            # Word starts after the first one ("learning" in "machine learning")
+            for offset, char in enumerate(key):
+                if char == ' ' and offset + 1 < len(key):
+                    entries.append((key[offset + 1:], position))
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.positions = [position for _, position in entries]
+
+        # Short prefixes match thousands of keys: keep their answers ready.
+        # Slices are contiguous runs of the sorted keys; only large runs are split further.
+        self.large_prefix_top: Dict[str, List[int]] = {}
+        ranges = [(0, len(self.keys))]
+        length = 1
+        while ranges:
+            large = []
+            for start, end in ranges:
+                i = start
+                while i < end:
+                    if len(self.keys[i]) < length:
+                        i += 1
+                        continue
+                    prefix = self.keys[i][:length]
+                    j = bisect_left(self.keys, prefix + '\U0010ffff', i, end)
+                    if j - i > PRECOMPUTED_SLICE_SIZE:
+                        self.large_prefix_top[prefix] = self._top(set(self.positions[i:j]), MAX_SUGGESTIONS)
+                        large.append((i, j))
+                    i = j
+            ranges = large
+            length += 1
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def _top(self, positions, limit: int) -> List[int]:
+        return heapq.nsmallest(limit, positions, key=lambda p: (-self.counts[p], self.skills[p]))
+
+    def search(self, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Most mentioned skills with a word starting with ``prefix``, as (skill_text, count)."""
+        prefix = normalize_prefix(prefix)
+        if not prefix:
+            return []
+
+        if prefix in self.large_prefix_top:
+            top = self.large_prefix_top[prefix][:limit]
+        else:
+            start = bisect_left(self.keys, prefix)
+            end = bisect_left(self.keys, prefix + '\U0010ffff', start)
+            top = self._top(set(self.positions[start:end]), limit)
+
+        return [(self.skills[p], self.counts[p]) for p in top]
+
+
+class SkillAutocomplete:
+    """Per-source prefix indexes with background rebuilds (see module docstring)."""
+
+    def __init__(self, max_age_seconds: int = 3600):
+        self.max_age_seconds = max_age_seconds
+        self._indexes: Dict[str, SkillPrefixIndex] = {}
+        self._built_at = 0.0
+        self._stale_since: Optional[float] = None
+        self._lock = Lock()
+        self._rebuilding = False
+
+    def mark_stale(self):
+        """Rebuild on the next request (the current index is still served)."""
+        with self._lock:
+            self._stale_since = self._stale_since or time.time()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'built_at': self._built_at or None,
+            'stale': self._stale_since is not None,
+            'skills': {source: len(index) for source, index in self._indexes.items()},
+        }
+
+    def build(self, session) -> Dict[str, SkillPrefixIndex]:
+        """Load distinct skills per source and swap in new indexes."""
+        started_at = time.time()
+        rows = session.execute(text("""
+            SELECT source, skill_text, SUM(mention_count) AS count
+            FROM skill_demand_counts
+            GROUP BY source, skill_text
+        """)).fetchall()
+
+        by_source: Dict[str, List[Tuple[str, int]]] = {}
+        for row in rows:
+            by_source.setdefault(row.source, []).append((row.skill_text, row.count))
+        indexes = {source: SkillPrefixIndex(skills) for source, skills in by_source.items()}
+
+        with self._lock:
+            self._indexes = indexes
+            self._built_at = started_at
+            if self._stale_since is not None and self._stale_since <= started_at:
+                self._stale_since = None
+
+        logger.info(
+            f"Skill autocomplete index built: {sum(len(i) for i in indexes.values())} skills "
+            f"in {time.time() - started_at:.1f}s"
+        )
+        return indexes
+
+    def _rebuild_in_background(self):
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+
+        def run():
+            from api.dependencies import db_ops
+            session = db_ops.get_session()
+            try:
+                self.build(session)
+            except Exception as e:
+                logger.warning(f"Skill autocomplete rebuild failed ({e})")
+            finally:
+                session.close()
+                with self._lock:
+                    self._rebuilding = False
+
+        Thread(target=run, daemon=True, name='SkillAutocompleteRebuild').start()
+
+    def get_index(self, source: str, session) -> Optional[SkillPrefixIndex]:
+        """Index for ``source``; built in the request the first time only."""
+        if not self._built_at:
+            self.build(session)
+        elif self._stale_since is not None or time.time() - self._built_at > self.max_age_seconds:
+            self._rebuild_in_background()
+        return self._indexes.get(source)
+
+
+_autocomplete: Optional[SkillAutocomplete] = None
+
+
+def get_skill_autocomplete() -> SkillAutocomplete:
+    """Process-wide SkillAutocomplete configured from settings."""
+    global _autocomplete
+    if _autocomplete is None:
+        _autocomplete = SkillAutocomplete(max_age_seconds=get_settings().skill_autocomplete_max_age_seconds)
+    return _autocomplete
+
+
+def start_autocomplete_refresh_listener() -> Thread:
+    """
+    Mark the autocomplete index stale on extraction events (daemon thread).
+
+    Without Redis the index is still rebuilt by age.
+    """
+    def on_event(event_payload: Dict[str, Any]):
+        if event_payload.get('event') in SKILL_EVENTS:
+            get_skill_autocomplete().mark_stale()
+
+    def listen():
+        try:
+            from events.event_bus import EventBus
+            EventBus().subscribe_pattern('labor_observatory:*', on_event)
+        except Exception as e:
+            logger.warning(f"Skill autocomplete: event listener stopped, falling back to age-based rebuilds ({e})")
+
+    thread = Thread(target=listen, daemon=True, name='SkillAutocompleteRefresh')
+    thread.start()
+    logger.info("🎧 Skill autocomplete refresh listener started")
+    return thread
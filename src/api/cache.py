@@ -0,0 +1,397 @@
+"""
+Response cache for read-only dashboard endpoints (stats, skills, temporal).
+
+Responses are keyed on route + normalized query parameters and kept in an
+in-process LRU, optionally backed by Redis (shared across API workers, DB 3).
+The data behind these endpoints only changes when a pipeline stage finishes,
+so entries are invalidated by the event bus rather than by a short TTL:
+
+    - each endpoint declares the events that make it stale
+      (jobs_scraped, jobs_cleaned, skills_extracted, skills_enhanced,
+      clustering_completed)
+    - a listener thread records when each event was last seen; an entry
+      created before that is stale
+    - entries older than API_CACHE_TTL_SECONDS are stale too (missed events)
+    - stale entries are still served, while one background refresh
+      recomputes them (stale-while-revalidate), until they are
+      API_CACHE_TTL_SECONDS + API_CACHE_MAX_STALE_SECONDS old; older ones
+      are recomputed in the request
+
+The same event times (publisher timestamps, equal across workers) are the
+data version behind the ETags of these endpoints (api/http_cache.py).
+
+Usage:
+    @router.get("/stats", response_model=StatsResponse)
+    @cached_response("stats", invalidate_on=DATA_EVENTS)
+    async def get_general_stats(db: AsyncSession = Depends(get_async_db)): ...
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from threading import Lock, Thread
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+import asyncio
+import inspect
+import json
+import logging
+import os
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from config.settings import get_settings
+from api.http_cache import mark_uncacheable, set_data_version
+
+logger = logging.getLogger(__name__)
+
+# Events that change what the dashboard endpoints count
+DATA_EVENTS = ('jobs_scraped', 'jobs_cleaned', 'skills_extracted', 'skills_enhanced', 'clustering_completed')
+# Job listings: cleaned_jobs backs job_status=cleaned and full-text search
+JOB_EVENTS = ('jobs_scraped', 'jobs_cleaned')
+SKILL_EVENTS = ('skills_extracted', 'skills_enhanced')
+# /api/temporal/* reads skill_period_counts, which changes when it is refreshed
+TEMPORAL_EVENTS = SKILL_EVENTS + ('skill_period_counts_refreshed',)
+
+REDIS_DB = 3  # 0/1 Celery, 2 event bus
+REDIS_PREFIX = 'labor_observatory:api_cache:'
+
+_MISS = object()
+
+
+def normalize_params(params: Dict[str, Any]) -> str:
+    """Stable cache-key fragment: None/'' dropped, strings trimmed, keys sorted."""
+    normalized = {}
+    for name, value in params.items():
+        if isinstance(value, str):
+            value = value.strip()
+        if value is None or value == '':
+            continue
+        normalized[name] = value
+    return json.dumps(normalized, sort_keys=True, default=str, ensure_ascii=False)
+
+
+class ResponseCache:
+    """
+    Two-tier response cache with event-based invalidation.
+
+    The in-process tier is a thread-safe LRU (FastAPI runs sync endpoints in a
+    thread pool). The Redis tier is optional and best effort: any Redis error
+    is logged and the request falls through to the database.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: int = 600,
+                 max_stale_seconds: int = 3600, redis_url: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+        self._invalidated_at: Dict[str, float] = {}
+        self._versions: Dict[str, str] = {}  # event -> publisher timestamp of its last occurrence
+        self._refreshing: set = set()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='api-cache-refresh')
+        self._tasks: set = set()  # Async refreshes (keep a reference until done)
+        self.stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0, 'invalidations': 0}
+
+        self._redis = None
+        if redis_url:
+            try:
+                import redis
+                self._redis = redis.Redis.from_url(f"{redis_url}/{REDIS_DB}", socket_timeout=0.5)
+                self._redis.ping()
+            except Exception as e:
+                logger.warning(f"API cache: Redis tier disabled ({e})")
+                self._redis = None
+
+    # --- invalidation ---
+
+    def invalidate(self, event_name: str, at: Optional[float] = None, version: Optional[str] = None):
+        """
+        Mark every entry depending on ``event_name`` and created before ``at`` as stale.
+
+        ``version`` identifies the event occurrence (its publisher timestamp).
+        """
+        with self._lock:
+            self._invalidated_at[event_name] = at or time.time()
+            self._versions[event_name] = version or str(self._invalidated_at[event_name])
+            self.stats['invalidations'] += 1
+
+    def data_version(self, events: Iterable[str]) -> str:
+        """Token that changes with each of ``events`` and every API_CACHE_TTL_SECONDS (missed events)."""
+        period = int(time.time() // self.ttl_seconds)
+        return f"{period}:" + ','.join(self._versions.get(event, '') for event in events)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, 'entries': len(self._data), 'redis': self._redis is not None}
+
+    def _is_fresh(self, created_at: float, events: Tuple[str, ...], now: float) -> bool:
+        if now - created_at > self.ttl_seconds:
+            return False
+        return all(created_at > self._invalidated_at.get(event, 0.0) for event in events)
+
+    # --- storage tiers ---
+
+    def _get_local(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def _get_remote(self, key: str) -> Optional[Tuple[float, Any]]:
+        if self._redis is None:
+            return None
+        try:
+            raw = self._redis.get(REDIS_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"API cache: Redis read failed ({e})")
+            return None
+        if not raw:
+            return None
+        stored = json.loads(raw)
+        return stored['created_at'], stored['payload']
+
+    def _put_local(self, key: str, created_at: float, payload: Any):
+        with self._lock:
+            self._data[key] = (created_at, payload)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def _put(self, key: str, created_at: float, payload: Any):
+        self._put_local(key, created_at, payload)
+        if self._redis is not None:
+            try:
+                self._redis.set(
+                    REDIS_PREFIX + key,
+                    json.dumps({'created_at': created_at, 'payload': payload}),
+                    ex=self.ttl_seconds + self.max_stale_seconds
+                )
+            except Exception as e:
+                logger.warning(f"API cache: Redis write failed ({e})")
+
+    # --- lookup ---
+
+    def _compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        created_at = time.time()  # before the queries: events during them leave it stale
+        payload = jsonable_encoder(compute())
+        self._put(key, created_at, payload)
+        return payload
+
+    def _refresh_in_background(self, key: str, compute: Callable[[], Any]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self.stats['refreshes'] += 1
+
+        def run():
+            try:
+                self._compute(key, compute)
+            except Exception as e:
+                logger.warning(f"API cache: background refresh of {key} failed ({e})")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(run)
+
+    def _refresh_in_background_async(self, key: str, compute: Callable[[], Awaitable[Any]]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self.stats['refreshes'] += 1
+
+        async def run():
+            try:
+                created_at = time.time()
+                self._put(key, created_at, jsonable_encoder(await compute()))
+            except Exception as e:
+                logger.warning(f"API cache: background refresh of {key} failed ({e})")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _lookup(self, key: str, events: Tuple[str, ...], serve_stale: bool) -> Tuple[Any, bool]:
+        """(payload or _MISS, whether a stale payload is served and needs a background refresh)."""
+        now = time.time()
+        entry = self._get_local(key)
+        if entry is None or not self._is_fresh(entry[0], events, now):
+            # Another API worker may already have recomputed it
+            remote = self._get_remote(key)
+            if remote is not None and (entry is None or remote[0] > entry[0]):
+                entry = remote
+                self._put_local(key, *remote)
+
+        if entry is not None:
+            created_at, payload = entry
+            if self._is_fresh(created_at, events, now):
+                self.stats['hits'] += 1
+                return payload, False
+            if serve_stale and now - created_at <= self.ttl_seconds + self.max_stale_seconds:
+                self.stats['stale_hits'] += 1
+                return payload, True
+
+        self.stats['misses'] += 1
+        return _MISS, False
+
+    def get_or_compute(self, key: str, events: Iterable[str], compute: Callable[[], Any],
+                       background_compute: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Cached JSON-compatible payload for ``key``.
+
+        Args:
+            key: Route + normalized parameters
+            events: Events that invalidate this entry
+            compute: Produces the response in the current request
+            background_compute: Same, but safe to run after the request ended
+                (own DB session); stale entries are only served if given
+        """
+        payload, refresh = self._lookup(key, tuple(events), background_compute is not None)
+        if refresh:
+            self._refresh_in_background(key, background_compute)
+            mark_uncacheable()
+        if payload is not _MISS:
+            return payload
+        return self._compute(key, compute)
+
+    async def get_or_compute_async(self, key: str, events: Iterable[str], compute: Callable[[], Awaitable[Any]],
+                                   background_compute: Optional[Callable[[], Awaitable[Any]]] = None) -> Any:
+        """get_or_compute() for coroutine functions (refreshes run as event loop tasks)."""
+        payload, refresh = self._lookup(key, tuple(events), background_compute is not None)
+        if refresh:
+            self._refresh_in_background_async(key, background_compute)
+            mark_uncacheable()
+        if payload is not _MISS:
+            return payload
+        created_at = time.time()  # before the queries: events during them leave it stale
+        payload = jsonable_encoder(await compute())
+        self._put(key, created_at, payload)
+        return payload
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide ResponseCache configured from settings."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = ResponseCache(
+            max_entries=settings.api_cache_max_entries,
+            ttl_seconds=settings.api_cache_ttl_seconds,
+            max_stale_seconds=settings.api_cache_max_stale_seconds,
+            redis_url=os.getenv("REDIS_URL", "redis://localhost:6379") if settings.api_cache_redis else None
+        )
+    return _cache
+
+
+def cached_response(route: str, invalidate_on: Iterable[str] = DATA_EVENTS):
+    """
+    Cache a sync or async endpoint's response (see module docstring).
+
+    The endpoint's ``db`` session is not part of the key. Background refreshes
+    call the endpoint again with a session of their own (a threadpool thread
+    for sync endpoints, an event loop task for async ones). HTTPExceptions are
+    never cached. Responses carry the events' data version (ETag).
+    """
+    events = tuple(invalidate_on)
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def cache_key(bound) -> str:
+            params = {name: value for name, value in bound.arguments.items() if name != 'db'}
+            return f"{route}?{normalize_params(params)}"
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not get_settings().api_cache_enabled:
+                    return await func(*args, **kwargs)
+
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+
+                async def background():
+                    from api.dependencies import async_db
+                    async with async_db.session() as session:
+                        return await func(**{**bound.arguments, 'db': session})
+
+                # Read before the lookup: a payload is never newer than its version
+                set_data_version(get_response_cache().data_version(events))
+                return await get_response_cache().get_or_compute_async(
+                    cache_key(bound),
+                    events,
+                    lambda: func(*args, **kwargs),
+                    background if 'db' in bound.arguments else None
+                )
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not get_settings().api_cache_enabled:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+
+            def background():
+                from api.dependencies import db_ops
+                session = db_ops.get_session()
+                try:
+                    return func(**{**bound.arguments, 'db': session})
+                finally:
+                    session.close()
+
+            set_data_version(get_response_cache().data_version(events))
+            return get_response_cache().get_or_compute(
+                cache_key(bound),
+                events,
+                lambda: func(*args, **kwargs),
+                background if 'db' in bound.arguments else None
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def start_cache_invalidation_listener() -> Optional[Thread]:
+    """
+    Invalidate cached responses on pipeline events (daemon thread).
+
+    Without Redis the cache still works, with TTL-only expiry.
+    """
+    if not get_settings().api_cache_enabled:
+        return None
+
+    def on_event(event_payload: Dict[str, Any]):
+        event_name = event_payload.get('event')
+        if event_name:
+            get_response_cache().invalidate(event_name, version=event_payload.get('timestamp'))
+
+    def listen():
+        try:
+            from events.event_bus import EventBus
+            EventBus().subscribe_pattern('labor_observatory:*', on_event)
+        except Exception as e:
+            logger.warning(f"API cache: event listener stopped, falling back to TTL expiry ({e})")
+
+    thread = Thread(target=listen, daemon=True, name='ApiCacheInvalidation')
+    thread.start()
+    logger.info("🎧 API cache invalidation listener started")
+    return thread
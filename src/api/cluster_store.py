@@ -0,0 +1,167 @@
+"""
+In-memory store of clustering result files for /api/clusters.
+
+Result files (outputs/clustering/...) hold every cluster's member skills,
+the skill list and the 2D embedding of every skill, but the endpoints only
+serve metadata, metrics and per-cluster summaries. Each config is parsed
+once into:
+
+    - slim ClusterInfo models (no member list), in file order
+    - an index cluster_id -> position
+    - member lists per cluster_id, only copied into a response on request
+
+skills / embedding_2d are not kept. A config is re-read when its file's
+mtime or size changes (new clustering run), checked with one stat() per
+request.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+
+from api.schemas.cluster import ClusterInfo, ClusterMetrics, ClusterMetadata
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("⚠️ orjson not available, clustering results are parsed with json. Install with: pip install orjson")
+
+CLUSTERING_DIR = Path(__file__).parent.parent.parent / "outputs" / "clustering"
+
+
+def resolve_results_path(config: str) -> Path:
+    """
+    Results file of a config: final/<config>/<config>_final_results.json,
+    then the legacy <config>.json, then clustering_results.json.
+    """
+    candidates = [
+        CLUSTERING_DIR / "final" / config / f"{config}_final_results.json",
+        CLUSTERING_DIR / f"{config}.json",
+        CLUSTERING_DIR / "clustering_results.json",
+    ]
+    for path in candidates:
+        if path.exists():
+            return path
+    raise FileNotFoundError(f"Clustering results not found for config: {config}")
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+@dataclass(frozen=True)
+class ClusterResults:
+    """Parsed results of one clustering config."""
+    path: Path
+    signature: Tuple[int, int]  # (st_mtime_ns, st_size) when parsed
+    metadata: ClusterMetadata
+    metrics: ClusterMetrics
+    clusters: Tuple[ClusterInfo, ...]
+    positions: Dict[int, int]
+    members: Dict[int, Tuple[str, ...]]
+
+    @classmethod
+    def parse(cls, path: Path, signature: Tuple[int, int]) -> "ClusterResults":
+        data = _read_json(path)
+        clusters, positions, members = [], {}, {}
+        for c in data.get("clusters", []):
+            cluster_id = c["cluster_id"]
+            positions[cluster_id] = len(clusters)
+            if c.get("all_skills") is not None:
+                members[cluster_id] = tuple(c["all_skills"])
+            clusters.append(ClusterInfo(
+                cluster_id=cluster_id,
+                size=c["size"],
+                # Legacy files use auto_label, final/ files label
+                label=c.get("auto_label", c.get("label", "")),
+                top_skills=c.get("top_skills", []),
+                mean_frequency=c.get("mean_frequency", 0.0)
+            ))
+        return cls(
+            path=path,
+            signature=signature,
+            metadata=ClusterMetadata(**data.get("metadata", {})),
+            metrics=ClusterMetrics(**data.get("metrics", {})),
+            clusters=tuple(clusters),
+            positions=positions,
+            members=members
+        )
+
+    @property
+    def version(self) -> str:
+        """Data version of these results (ETag source)."""
+        return f"{self.path.name}:{self.signature[0]}:{self.signature[1]}"
+
+    def cluster(self, cluster_id: int, include_skills: bool = False) -> Optional[ClusterInfo]:
+        position = self.positions.get(cluster_id)
+        if position is None:
+            return None
+        cluster = self.clusters[position]
+        if not include_skills:
+            return cluster
+        return cluster.model_copy(update={"all_skills": list(self.members.get(cluster_id, ()))})
+
+    def all_clusters(self, include_skills: bool = False) -> List[ClusterInfo]:
+        if not include_skills:
+            return list(self.clusters)
+        return [self.cluster(c.cluster_id, include_skills=True) for c in self.clusters]
+
+
+class ClusterResultStore:
+    """Parsed ClusterResults per config, reloaded when the file changes."""
+
+    def __init__(self):
+        self._results: Dict[str, ClusterResults] = {}
+        self._lock = Lock()
+        self.loads = 0
+        self.hits = 0
+
+    def get(self, config: str) -> ClusterResults:
+        path = resolve_results_path(config)
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._results.get(config)
+        if cached is not None and cached.path == path and cached.signature == signature:
+            self.hits += 1
+            return cached
+
+        with self._lock:
+            # Another request may have parsed it while we waited
+            cached = self._results.get(config)
+            if cached is not None and cached.path == path and cached.signature == signature:
+                self.hits += 1
+                return cached
+            results = ClusterResults.parse(path, signature)
+            self._results[config] = results
+            self.loads += 1
+            logger.info(f"Loaded clustering results {config} from {path} ({len(results.clusters)} clusters)")
+            return results
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'configs': sorted(self._results),
+            'loads': self.loads,
+            'hits': self.hits,
+            'parser': 'orjson' if ORJSON_AVAILABLE else 'json'
+        }
+
+
+_cluster_store: Optional[ClusterResultStore] = None
+
+
+def get_cluster_store() -> ClusterResultStore:
+    """Process-wide ClusterResultStore."""
+    global _cluster_store
+    if _cluster_store is None:
+        _cluster_store = ClusterResultStore()
+    return _cluster_store
@@ -1,8 +1,9 @@
 """
 FastAPI dependencies for database sessions, configuration, etc.
 """
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from functools import lru_cache
 
 import sys
@@ -10,12 +11,23 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database.operations import DatabaseOperations
+from database.async_operations import AsyncDatabase
 from config.settings import get_settings, Settings
 
 
 # Database operations instance
 db_ops = DatabaseOperations()
 
+# Async engine for the dashboard routers (stats, skills, jobs, temporal)
+_settings = get_settings()
+async_db = AsyncDatabase(
+    _settings.database_url,
+    pool_size=_settings.database_async_pool_size,
+    max_overflow=_settings.database_async_max_overflow,
+    pool_timeout=_settings.database_pool_timeout,
+    statement_timeout_ms=_settings.database_statement_timeout_ms
+)
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -29,6 +41,15 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides an async database session.
+    Automatically closes session after request.
+    """
+    async with async_db.session() as session:
+        yield session
+
+
 @lru_cache()
 def get_settings_cached() -> Settings:
     """
@@ -0,0 +1,194 @@
+"""
+Conditional GET and response compression for the API.
+
+Strong ETags come from a data-version token, not from hashing the body:
+an endpoint records the version of the data it answered with
+(set_data_version()) and the middleware derives the ETag from it plus the
+request path, query and content encoding:
+
+    cached_response() endpoints   time of the last event they depend on
+                                  (publisher timestamp) + TTL period
+    /clusters                     mtime and size of the results file
+
+A request whose If-None-Match matches gets 304 Not Modified with no body.
+Stale payloads (served while a refresh runs) get no ETag, so clients never
+hold on to them. Responses without a version carry no validators.
+
+JSON/text bodies of at least API_COMPRESSION_MIN_BYTES are compressed with
+brotli (if installed) or gzip according to Accept-Encoding. Streaming
+responses (/api/export/*) are passed through; they encode themselves.
+"""
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Set
+from urllib.parse import parse_qsl, urlencode
+import gzip
+import hashlib
+import json
+import logging
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5  # 0-11; higher is much slower for little gain on JSON
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/')
+
+# Per-request holder: {'version': token} or {'uncacheable': True}
+_request_data = ContextVar('api_request_data', default=None)
+
+
+def set_data_version(token: str):
+    """Record the version of the data this request answers with (ETag source)."""
+    holder = _request_data.get()
+    if holder is not None and not holder.get('uncacheable'):
+        holder['version'] = token
+
+
+def mark_uncacheable():
+    """No validator for this response (e.g. a stale payload)."""
+    holder = _request_data.get()
+    if holder is not None:
+        holder['uncacheable'] = True
+        holder.pop('version', None)
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> Set[str]:
+    """Content codings of an Accept-Encoding header, without those refused with q=0."""
+    accepted = set()
+    for part in (accept_encoding or '').split(','):
+        coding, _, params = part.partition(';')
+        name, _, value = params.strip().partition('=')
+        try:
+            if name.strip() == 'q' and float(value) == 0:
+                continue
+        except ValueError:
+            pass
+        if coding.strip():
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (json fallback) for the large dashboard payloads."""
+
+    def render(self, content: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(content, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class ConditionalCompressionMiddleware:
+    """ASGI middleware: ETag / If-None-Match from data versions, then gzip/brotli."""
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    def _encoding(self, request_headers: Headers) -> Optional[str]:
+        accepted = accepted_encodings(request_headers.get('accept-encoding'))
+        if BROTLI_AVAILABLE and 'br' in accepted:
+            return 'br'
+        if 'gzip' in accepted or '*' in accepted:
+            return 'gzip'
+        return None
+
+    @staticmethod
+    def _etag(scope: Dict[str, Any], version: str, encoding: Optional[str]) -> str:
+        pairs = parse_qsl(scope.get('query_string', b'').decode('latin-1'), keep_blank_values=True)
+        query = urlencode(sorted(pairs))
+        digest = hashlib.sha1(f"{scope['path']}?{query}|{version}".encode('utf-8')).hexdigest()[:32]
+        return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+    @staticmethod
+    def _compress(body: bytes, encoding: str) -> bytes:
+        if encoding == 'br':
+            return brotli.compress(body, quality=BROTLI_QUALITY)
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] not in ('GET', 'HEAD'):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = self._encoding(request_headers)
+        holder: Dict[str, Any] = {}
+        token = _request_data.set(holder)
+        start: Optional[Dict[str, Any]] = None
+        parts = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+            elif message['type'] == 'http.response.start':
+                start = message
+            elif message['type'] == 'http.response.body':
+                parts.append(message.get('body', b''))
+                if message.get('more_body', False):
+                    # Streaming body: send it as it comes
+                    passthrough = True
+                    await send(start)
+                    await send({'type': 'http.response.body', 'body': b''.join(parts), 'more_body': True})
+                else:
+                    await self._finish(scope, request_headers, encoding, holder, start, b''.join(parts), send)
+            else:
+                await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_data.reset(token)
+
+    async def _finish(self, scope, request_headers: Headers, encoding: Optional[str],
+                      holder: Dict[str, Any], start: Dict[str, Any], body: bytes, send):
+        headers = MutableHeaders(raw=start['headers'])
+        compressible = (
+            encoding is not None
+            and scope['method'] == 'GET'
+            and start['status'] == 200
+            and 'content-encoding' not in headers
+            and headers.get('content-type', '').startswith(COMPRESSIBLE_TYPES)
+            and len(body) >= self.minimum_size
+        )
+        if compressible:
+            headers.add_vary_header('Accept-Encoding')
+
+        version = holder.get('version')
+        if version is not None and start['status'] == 200:
+            etag = self._etag(scope, version, encoding if compressible else None)
+            headers['ETag'] = etag
+            headers['Cache-Control'] = 'no-cache'  # revalidate every time (cheap 304)
+            if_none_match = request_headers.get('if-none-match')
+            if if_none_match and (if_none_match.strip() == '*' or etag in (t.strip() for t in if_none_match.split(','))):
+                # Same headers (CORS, Vary, ETag...) without those describing a body
+                for name in ('content-length', 'content-type', 'content-encoding'):
+                    del headers[name]
+                await send({'type': 'http.response.start', 'status': 304, 'headers': headers.raw})
+                await send({'type': 'http.response.body', 'body': b''})
+                return
+
+        if compressible:
+            body = self._compress(body, encoding)
+            headers['Content-Encoding'] = encoding
+            headers['Content-Length'] = str(len(body))
+
+        await send(start)
+        await send({'type': 'http.response.body', 'body': body})
@@ -14,7 +14,13 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import routers
-from api.routers import stats, jobs, skills, clusters, temporal, admin_celery, admin_llm
+from api.routers import stats, jobs, skills, clusters, temporal, export, admin_celery, admin_llm
+from api.cache import get_response_cache, start_cache_invalidation_listener
+from api.autocomplete import get_skill_autocomplete, start_autocomplete_refresh_listener
+from api.cluster_store import get_cluster_store
+from api.http_cache import ConditionalCompressionMiddleware
+from config.settings import get_settings
+from api.dependencies import async_db
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +48,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ETag / 304 from data versions, then gzip/brotli (api/http_cache.py)
+app.add_middleware(ConditionalCompressionMiddleware, minimum_size=get_settings().api_compression_min_bytes)
+
 # Mount static files (clustering outputs, visualizations)
 outputs_path = Path(__file__).parent.parent.parent / "outputs"
 if outputs_path.exists():
@@ -54,10 +63,29 @@ app.include_router(jobs.router, prefix="/api", tags=["Jobs"])
 app.include_router(skills.router, prefix="/api", tags=["Skills"])
 app.include_router(clusters.router, prefix="/api", tags=["Clustering"])
 app.include_router(temporal.router, prefix="/api", tags=["Temporal Analysis"])
+app.include_router(export.router, prefix="/api", tags=["Export"])
 app.include_router(admin_celery.router, prefix="/api/admin", tags=["Administration"])
 app.include_router(admin_llm.router, tags=["LLM Pipeline B"])
 
 
+@app.on_event("startup")
+def start_response_cache():
+    """Invalidate cached dashboard responses on pipeline events."""
+    start_cache_invalidation_listener()
+
+
+@app.on_event("startup")
+def start_skill_autocomplete():
+    """Rebuild the skill autocomplete index on extraction events."""
+    start_autocomplete_refresh_listener()
+
+
+@app.on_event("shutdown")
+async def close_async_db():
+    """Close the asyncpg connection pool."""
+    await async_db.dispose()
+
+
 @app.get("/")
 def read_root():
     """Root endpoint - API information."""
@@ -72,6 +100,7 @@ def read_root():
             "skills": "/api/skills",
             "clusters": "/api/clusters",
             "temporal": "/api/temporal",
+            "export": "/api/export",
             "admin": "/api/admin"
         }
     }
@@ -86,6 +115,16 @@ def health_check():
     }
 
 
+@app.get("/api/cache/stats")
+def cache_stats():
+    """Response cache counters (hits, stale hits, misses, refreshes, invalidations), autocomplete index and clustering result store state."""
+    return {
+        **get_response_cache().summary(),
+        'autocomplete': get_skill_autocomplete().summary(),
+        'clusters': get_cluster_store().summary()
+    }
+
+
 @app.get("/api/ping")
 def ping():
     """Simple ping endpoint for testing."""
@@ -0,0 +1,87 @@
+"""
+Keyset pagination cursors and cheap totals for list endpoints (/jobs, /skills/search).
+
+Cursors are opaque to clients: the sort key of the last row of a page,
+JSON-encoded and base64url'd. The next page is ``WHERE (sort key) < cursor``,
+which uses the sort index instead of reading and discarding OFFSET rows.
+
+Totals are the planner's row estimate (EXPLAIN, no rows read) unless the
+client asks for ``exact=true``; exact counts are kept in the response cache
+until an event changes the data behind them.
+"""
+
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Tuple, Union
+import base64
+import json
+
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from config.settings import get_settings
+from api.cache import get_response_cache, normalize_params
+
+
+def encode_cursor(values: Iterable[Any]) -> str:
+    """Opaque cursor for a sort key (datetimes and UUIDs as strings)."""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, default=str, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Sort key of a cursor; HTTP 400 if it was not produced by encode_cursor()."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+async def estimated_count(db, statement: Union[str, Any], params: Optional[dict] = None) -> int:
+    """
+    Planner row estimate of a query, without running it.
+
+    Args:
+        db: AsyncSession
+        statement: SQL text (``:name`` params) or a SQLAlchemy select
+        params: Parameters for SQL text
+    """
+    if not isinstance(statement, str):
+        # Render with :name placeholders so it can be wrapped in EXPLAIN as SQL text
+        compiled = statement.compile(
+            dialect=postgresql.dialect(paramstyle='named'),
+            compile_kwargs={"render_postcompile": True}
+        )
+        statement, params = str(compiled), compiled.params
+    plan = (await db.execute(text(f"EXPLAIN (FORMAT JSON) {statement}"), params or {})).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+async def query_total(
+    route: str,
+    filters: dict,
+    exact: bool,
+    exact_count: Callable[[], Awaitable[int]],
+    estimate: Callable[[], Awaitable[int]],
+    invalidate_on: Iterable[str]
+) -> Tuple[int, bool]:
+    """
+    Total for a paginated listing: (total, is_estimate).
+
+    Exact counts are cached per route + filters (shared by every page of a
+    listing) and dropped when one of ``invalidate_on`` fires.
+    """
+    if not exact:
+        return await estimate(), True
+
+    if not get_settings().api_cache_enabled:
+        return await exact_count(), False
+    key = f"{route}:count?{normalize_params(filters)}"
+    return await get_response_cache().get_or_compute_async(key, invalidate_on, exact_count), False
@@ -1,96 +1,51 @@
 """
 Clusters Router - Clustering results and analysis.
+
+Result files are parsed once and kept in memory until they change
+(api/cluster_store.py); cluster member lists are only returned on request.
 """
-from fastapi import APIRouter, HTTPException, Path as PathParam
+from fastapi import APIRouter, HTTPException, Query, Path as PathParam
 from fastapi.responses import FileResponse
-from typing import Optional, List, Dict, Any
+from typing import Optional
 import logging
-import json
 from pathlib import Path
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from api.schemas.cluster import ClusterInfo, ClusterMetrics, ClusterMetadata, ClusteringResponse
+from api.schemas.cluster import ClusterInfo, ClusteringResponse
+from api.cluster_store import get_cluster_store
+from api.http_cache import FastJSONResponse, set_data_version
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-def load_clustering_results(config: str = "clustering_results") -> Dict[str, Any]:
-    """
-    Load clustering results from JSON file.
-
-    Args:
-        config: Configuration name (e.g., "pipeline_b_300_post", "manual_300_pre")
-
-    Returns:
-        Dict with clustering results
-    """
-    project_root = Path(__file__).parent.parent.parent.parent
-
-    # Try loading from final/ directory first (new structure)
-    final_path = project_root / "outputs" / "clustering" / "final" / config / f"{config}_final_results.json"
-    if final_path.exists():
-        with open(final_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
-    # Fallback to legacy paths
-    results_path = project_root / "outputs" / "clustering" / f"{config}.json"
-    if results_path.exists():
-        with open(results_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
-    # Final fallback to main file
-    main_path = project_root / "outputs" / "clustering" / "clustering_results.json"
-    if main_path.exists():
-        with open(main_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
-    raise FileNotFoundError(f"Clustering results not found for config: {config}")
-
-
-@router.get("/clusters", response_model=ClusteringResponse)
+@router.get("/clusters", response_model=ClusteringResponse, response_class=FastJSONResponse)
 def get_clusters(
-    config: Optional[str] = "clustering_results"
+    config: Optional[str] = "clustering_results",
+    include_skills: bool = Query(False, description="Include each cluster's full member list (all_skills)")
 ) -> ClusteringResponse:
     """
     Get clustering results.
 
     Args:
         config: Configuration name (default: "clustering_results")
+        include_skills: Include all_skills per cluster (omitted by default)
 
     Returns:
         ClusteringResponse with clusters, metrics, and metadata
     """
     try:
-        data = load_clustering_results(config)
-
-        # Parse metadata
-        metadata = ClusterMetadata(**data.get("metadata", {}))
-
-        # Parse metrics
-        metrics = ClusterMetrics(**data.get("metrics", {}))
-
-        # Parse clusters
-        clusters = [
-            ClusterInfo(
-                cluster_id=c["cluster_id"],
-                size=c["size"],
-                label=c.get("auto_label", ""),
-                top_skills=c.get("top_skills", []),
-                mean_frequency=c.get("mean_frequency", 0.0),
-                all_skills=c.get("all_skills", None)
-            )
-            for c in data.get("clusters", [])
-        ]
+        results = get_cluster_store().get(config)
+        set_data_version(results.version)
 
         return ClusteringResponse(
             config=config,
-            metadata=metadata,
-            metrics=metrics,
-            clusters=clusters
+            metadata=results.metadata,
+            metrics=results.metrics,
+            clusters=results.all_clusters(include_skills)
         )
 
     except FileNotFoundError as e:
@@ -100,10 +55,11 @@ def get_clusters(
         raise HTTPException(status_code=500, detail=f"Error retrieving clustering results: {str(e)}")
 
 
-@router.get("/clusters/{cluster_id}", response_model=ClusterInfo)
+@router.get("/clusters/{cluster_id}", response_model=ClusterInfo, response_class=FastJSONResponse)
 def get_cluster_detail(
     cluster_id: int = PathParam(..., ge=0, description="Cluster ID"),
-    config: Optional[str] = "clustering_results"
+    config: Optional[str] = "clustering_results",
+    include_skills: bool = Query(True, description="Include the cluster's full member list (all_skills)")
 ) -> ClusterInfo:
     """
     Get detailed information about a specific cluster.
@@ -111,33 +67,25 @@ def get_cluster_detail(
     Args:
         cluster_id: ID of the cluster
         config: Configuration name
+        include_skills: Include all_skills (default true)
 
     Returns:
         ClusterInfo with all skills in the cluster
     """
     try:
-        data = load_clustering_results(config)
-
-        # Find cluster
-        cluster = next(
-            (c for c in data.get("clusters", []) if c["cluster_id"] == cluster_id),
-            None
-        )
+        results = get_cluster_store().get(config)
+        set_data_version(results.version)
+        cluster = results.cluster(cluster_id, include_skills)
 
         if not cluster:
             raise HTTPException(status_code=404, detail=f"Cluster {cluster_id} not found")
 
-        return ClusterInfo(
-            cluster_id=cluster["cluster_id"],
-            size=cluster["size"],
-            label=cluster.get("auto_label", ""),
-            top_skills=cluster.get("top_skills", []),
-            mean_frequency=cluster.get("mean_frequency", 0.0),
-            all_skills=cluster.get("all_skills", [])
-        )
+        return cluster
 
     except HTTPException:
         raise
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting cluster detail: {e}")
         raise HTTPException(status_code=500, detail=str(e))
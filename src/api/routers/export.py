@@ -0,0 +1,217 @@
+"""
+Export Router - Bulk downloads of skills and jobs.
+
+Responses are streamed from a server-side cursor (api/streaming.py) as
+NDJSON, CSV or Parquet, so exports of any size run in bounded memory.
+Filters are the same as /skills/search and /jobs. NDJSON and CSV are
+compressed per Accept-Encoding (zstd, gzip), e.g.:
+
+    curl -H 'Accept-Encoding: zstd' -o skills.csv.zst \\
+        'http://localhost:8000/api/export/skills?format=csv&extraction_method=pipeline_a&country=CO'
+"""
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import exists, select
+from datetime import datetime
+from typing import Optional
+import logging
+
+import pyarrow as pa
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from api.streaming import MEDIA_TYPES, negotiate_encoding, stream_rows
+from database.models import RawJob, CleanedJob, GoldStandardAnnotation
+from database.demand_rollup import SOURCES, demand_filter, resolve_extraction_method
+from database.job_search import search_tsquery, search_match
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+FORMAT_PATTERN = "^(ndjson|csv|parquet)$"
+
+MENTION_COLUMNS = [
+    ("job_id", pa.string()),
+    ("skill_text", pa.string()),
+    ("skill_type", pa.string()),
+    ("esco_uri", pa.string()),
+    ("source", pa.string()),
+    ("extraction_method", pa.string()),
+    ("country", pa.string()),
+    ("portal", pa.string()),
+    ("posted_date", pa.date32()),
+]
+
+SKILL_COLUMNS = [
+    ("skill_text", pa.string()),
+    ("skill_type", pa.string()),
+    ("esco_uri", pa.string()),
+    ("mention_count", pa.int64()),
+]
+
+JOB_COLUMNS = [
+    ("job_id", pa.string()),
+    ("portal", pa.string()),
+    ("country", pa.string()),
+    ("title", pa.string()),
+    ("company", pa.string()),
+    ("location", pa.string()),
+    ("url", pa.string()),
+    ("salary_raw", pa.string()),
+    ("contract_type", pa.string()),
+    ("remote_type", pa.string()),
+    ("posted_date", pa.date32()),
+    ("scraped_at", pa.timestamp("us")),
+]
+
+JOB_TEXT_COLUMNS = [
+    ("description", pa.string()),
+    ("requirements", pa.string()),
+]
+
+
+def _export_response(name: str, export_format: str, body, encoding: Optional[str]) -> StreamingResponse:
+    filename = f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Vary": "Accept-Encoding",
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return StreamingResponse(body, media_type=MEDIA_TYPES[export_format], headers=headers)
+
+
+def _mention_query(source: str, methods, query: str, country, skill_type, mapping_status, job_status):
+    """One row per skill mention of the source table, with the job's country/portal/date."""
+    columns = SOURCES[source]
+    skill_text, esco_uri, method = columns["skill_text"], columns["esco_uri"], columns["method"]
+    conditions = []
+    params = {}
+
+    if methods:
+        conditions.append(f"{method} = ANY(:methods)")
+        params["methods"] = list(methods)
+    if country:
+        conditions.append("r.country = :country")
+        params["country"] = country.upper()
+    if skill_type and skill_type.lower() in ["hard", "soft"]:
+        conditions.append("s.skill_type = :skill_type")
+        params["skill_type"] = skill_type.lower()
+    if mapping_status == "esco_mapped":
+        conditions.append(f"COALESCE({esco_uri}, '') <> ''")
+    elif mapping_status == "unmapped":
+        conditions.append(f"COALESCE({esco_uri}, '') = ''")
+    if query:  # Trigram indexes on the skill columns (migration 017)
+        conditions.append(f"{skill_text} ILIKE :search_pattern")
+        params["search_pattern"] = f"%{query}%"
+    if job_status == "cleaned":
+        conditions.append("EXISTS (SELECT 1 FROM cleaned_jobs cj WHERE cj.job_id = s.job_id)")
+    elif job_status == "golden":
+        conditions.append("EXISTS (SELECT 1 FROM gold_standard_annotations gsa WHERE gsa.job_id = s.job_id)")
+
+    sql = f"""
+        SELECT
+            s.job_id,
+            {skill_text} AS skill_text,
+            s.skill_type,
+            NULLIF({esco_uri}, '') AS esco_uri,
+            '{source}' AS source,
+            {method} AS extraction_method,
+            r.country,
+            r.portal,
+            r.posted_date
+        FROM {columns['table']} s
+        JOIN raw_jobs r ON r.job_id = s.job_id
+        {"WHERE " + " AND ".join(conditions) if conditions else ""}
+    """
+    return sql, params
+
+
+@router.get("/export/skills")
+def export_skills(
+    format: str = Query("ndjson", pattern=FORMAT_PATTERN, description="ndjson, csv or parquet"),
+    level: str = Query("mention", pattern="^(mention|skill)$", description="mention (one row per job skill) or skill (totals per skill)"),
+    query: str = Query("", description="Skill text contains (empty for all)"),
+    country: Optional[str] = Query(None, description="Filter by country code"),
+    skill_type: Optional[str] = Query(None, description="Filter by skill type (hard, soft)"),
+    extraction_method: Optional[str] = Query(None, description="Filter by extraction method (ner, regex, pipeline_a, pipeline_b, manual)"),
+    mapping_status: Optional[str] = Query(None, description="Filter by mapping status (esco_mapped, unmapped)"),
+    job_status: Optional[str] = Query(None, description="Filter by job status (cleaned, golden; level=mention only)"),
+    accept_encoding: Optional[str] = Header(None)
+) -> StreamingResponse:
+    """
+    Export skills with the /skills/search filters.
+
+    Levels:
+    - mention: every extracted skill with its job (job_id, country, portal, posted_date)
+    - skill: one row per skill × type × ESCO URI with its mention count (the
+      /skills/search result set, unpaged, most mentioned first)
+    """
+    source, methods = resolve_extraction_method(extraction_method)
+
+    if level == "skill":
+        if job_status:
+            raise HTTPException(status_code=400, detail="job_status is only available with level=mention")
+        where, params = demand_filter(
+            source, methods, country=country, skill_type=skill_type, mapping_status=mapping_status
+        )
+        if query:
+            where += " AND skill_text ILIKE :search_pattern"
+            params["search_pattern"] = f"%{query}%"
+        sql = f"""
+            SELECT
+                skill_text,
+                NULLIF(skill_type, '') AS skill_type,
+                NULLIF(esco_uri, '') AS esco_uri,
+                SUM(mention_count) AS mention_count
+            FROM skill_demand_counts {where}
+            GROUP BY skill_text, skill_demand_counts.skill_type, skill_demand_counts.esco_uri
+            ORDER BY mention_count DESC, skill_text
+        """
+        columns = SKILL_COLUMNS
+    else:
+        sql, params = _mention_query(source, methods, query, country, skill_type, mapping_status, job_status)
+        columns = MENTION_COLUMNS
+
+    encoding = negotiate_encoding(accept_encoding, format)
+    return _export_response(
+        f"skills_{level}", format, stream_rows(sql, params, columns, format, encoding), encoding
+    )
+
+
+@router.get("/export/jobs")
+def export_jobs(
+    format: str = Query("ndjson", pattern=FORMAT_PATTERN, description="ndjson, csv or parquet"),
+    country: Optional[str] = Query(None, description="Filter by country code (e.g., CO, MX, AR)"),
+    portal: Optional[str] = Query(None, description="Filter by job portal"),
+    job_status: Optional[str] = Query(None, description="Filter by job status (raw, cleaned, golden)"),
+    search: Optional[str] = Query(None, description="Full-text search in title, company and description"),
+    include_text: bool = Query(False, description="Include description and requirements"),
+    accept_encoding: Optional[str] = Header(None)
+) -> StreamingResponse:
+    """
+    Export job postings with the /jobs filters, most recently scraped first.
+    """
+    columns = JOB_COLUMNS + (JOB_TEXT_COLUMNS if include_text else [])
+    query = select(*(getattr(RawJob, name) for name, _ in columns))
+
+    if job_status == "cleaned":
+        query = query.where(exists().where(CleanedJob.job_id == RawJob.job_id).correlate(RawJob))
+    elif job_status == "golden":
+        query = query.where(exists().where(GoldStandardAnnotation.job_id == RawJob.job_id))
+    if country:
+        query = query.where(RawJob.country == country.upper())
+    if portal:
+        query = query.where(RawJob.portal == portal.lower())
+    tsquery = search_tsquery(search) if search else None
+    if tsquery is not None:
+        query = query.join(CleanedJob, CleanedJob.job_id == RawJob.job_id).where(search_match(tsquery))
+
+    # Index on (scraped_at DESC, job_id DESC) (migration 018): no sort step
+    query = query.order_by(RawJob.scraped_at.desc(), RawJob.job_id.desc())
+
+    encoding = negotiate_encoding(accept_encoding, format)
+    return _export_response("jobs", format, stream_rows(query, None, columns, format, encoding), encoding)
@@ -1,9 +1,15 @@
 """
 Jobs Router - CRUD operations for job postings.
+
+/jobs pages with keyset cursors on (scraped_at, job_id) (offset still
+accepted) and reports an estimated total unless exact=true (api/pagination.py).
+search= is full-text over cleaned jobs (database/job_search.py), ranked by
+relevance unless sort=recent. Endpoints are async (asyncpg).
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, tuple_
+from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 import logging
@@ -12,9 +18,12 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from api.dependencies import get_db
+from api.dependencies import get_async_db
+from api.cache import JOB_EVENTS
+from api.pagination import encode_cursor, decode_cursor, estimated_count, query_total
 from api.schemas.job import JobBase, JobDetail, JobListResponse, ExtractedSkillSchema
-from database.models import RawJob, ExtractedSkill, CleanedJob
+from database.models import RawJob, ExtractedSkill, CleanedJob, GoldStandardAnnotation
+from database.job_search import search_tsquery, search_match, search_rank
 from sqlalchemy import text, exists
 
 logger = logging.getLogger(__name__)
@@ -22,15 +31,22 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+async def _count(db: AsyncSession, query) -> int:
+    return (await db.execute(select(func.count()).select_from(query.subquery()))).scalar() or 0
+
+
 @router.get("/jobs", response_model=JobListResponse)
-def get_jobs(
+async def get_jobs(
     country: Optional[str] = Query(None, description="Filter by country code (e.g., CO, MX, AR)"),
     portal: Optional[str] = Query(None, description="Filter by job portal"),
     job_status: Optional[str] = Query(None, description="Filter by job status (raw, cleaned, golden)"),
     limit: int = Query(50, ge=1, le=100, description="Number of results to return"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
-    search: Optional[str] = Query(None, description="Search in title or description"),
-    db: Session = Depends(get_db)
+    offset: int = Query(0, ge=0, description="Number of results to skip (ignored with cursor)"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    exact: bool = Query(False, description="Exact total (COUNT) instead of the planner estimate"),
+    search: Optional[str] = Query(None, description="Full-text search in title, company and description"),
+    sort: Optional[str] = Query(None, pattern="^(relevance|recent)$", description="relevance (default with search) or recent"),
+    db: AsyncSession = Depends(get_async_db)
 ) -> JobListResponse:
     """
     Get a paginated list of job postings with optional filters.
@@ -39,51 +55,77 @@ def get_jobs(
     - country: Country code (CO, MX, AR, etc.)
     - portal: Job portal (computrabajo, bumeran, indeed, etc.)
     - job_status: Job processing status (raw, cleaned, golden)
-    - search: Search text in title or description
+    - search: Full-text search (websearch syntax: "exact phrase", OR, -exclude, prefix*),
+      accent-insensitive, over cleaned jobs only
+    - sort: relevance (ts_rank_cd, default when searching) or recent (scraped_at)
     - limit: Results per page (1-100, default 50)
     - offset: Pagination offset (default 0)
+    - cursor: Keyset pagination, constant cost at any depth (takes precedence over offset)
+    - exact: Exact total instead of an estimate
     """
     try:
         # Build base query
-        query = db.query(RawJob)
+        query = select(RawJob)
 
         # Apply job_status filter
         if job_status == "cleaned":
             # Only jobs that exist in cleaned_jobs
-            query = query.filter(
-                exists().where(CleanedJob.job_id == RawJob.job_id)
+            # correlate(RawJob): cleaned_jobs is also joined when searching
+            query = query.where(
+                exists().where(CleanedJob.job_id == RawJob.job_id).correlate(RawJob)
             )
         elif job_status == "golden":
             # Only jobs that have gold standard annotations
-            gold_job_ids_subquery = db.execute(
-                text("SELECT DISTINCT job_id FROM gold_standard_annotations")
-            ).fetchall()
-            gold_job_ids = [row[0] for row in gold_job_ids_subquery]
-            query = query.filter(RawJob.job_id.in_(gold_job_ids))
+            query = query.where(
+                exists().where(GoldStandardAnnotation.job_id == RawJob.job_id)
+            )
         # If job_status is None or "raw", no additional filter (all jobs)
 
         # Apply other filters
         if country:
-            query = query.filter(RawJob.country == country.upper())
+            query = query.where(RawJob.country == country.upper())
 
         if portal:
-            query = query.filter(RawJob.portal == portal.lower())
-
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    RawJob.title.ilike(search_pattern),
-                    RawJob.description.ilike(search_pattern),
-                    RawJob.company.ilike(search_pattern)
-                )
-            )
-
-        # Get total count
-        total = query.count()
+            query = query.where(RawJob.portal == portal.lower())
+
+        tsquery = search_tsquery(search) if search else None
+        if tsquery is not None:
+            # GIN index on cleaned_jobs.search_vector (migration 019)
+            query = query.join(CleanedJob, CleanedJob.job_id == RawJob.job_id).where(search_match(tsquery))
+        by_relevance = tsquery is not None and sort != "recent"
+
+        # Get total (estimated unless exact=true)
+        filtered = query.with_only_columns(RawJob.job_id)
+        total, total_is_estimate = await query_total(
+            "jobs",
+            {"country": country, "portal": portal, "job_status": job_status, "search": search},
+            exact,
+            exact_count=lambda: _count(db, filtered),
+            estimate=lambda: estimated_count(db, filtered),
+            invalidate_on=JOB_EVENTS
+        )
 
-        # Apply pagination and ordering
-        jobs = query.order_by(RawJob.scraped_at.desc()).offset(offset).limit(limit).all()
+        # Apply pagination and ordering (job_id breaks ties)
+        sort_key = search_rank(tsquery) if by_relevance else RawJob.scraped_at
+        query = query.add_columns(sort_key).order_by(sort_key.desc(), RawJob.job_id.desc())
+        if cursor:
+            after_key, job_id = decode_cursor(cursor, 2)
+            try:
+                after = (float(after_key) if by_relevance else datetime.fromisoformat(after_key), UUID(job_id))
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            query = query.where(tuple_(sort_key, RawJob.job_id) < after)
+            offset = 0
+        else:
+            query = query.offset(offset)
+
+        # One extra row tells whether there is a next page
+        rows = (await db.execute(query.limit(limit + 1))).all()
+        jobs = [job for job, _ in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last_job, last_key = rows[limit - 1]
+            next_cursor = encode_cursor([last_key, last_job.job_id])
 
         # Convert to response models
         jobs_response = [JobBase.model_validate(job) for job in jobs]
@@ -92,18 +134,22 @@ def get_jobs(
             total=total,
             limit=limit,
             offset=offset,
-            jobs=jobs_response
+            jobs=jobs_response,
+            next_cursor=next_cursor,
+            total_is_estimate=total_is_estimate
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting jobs: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving jobs: {str(e)}")
 
 
 @router.get("/jobs/{job_id}", response_model=JobDetail)
-def get_job_detail(
+async def get_job_detail(
     job_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> JobDetail:
     """
     Get detailed information about a specific job, including all types of extracted skills.
@@ -117,15 +163,15 @@ def get_job_detail(
     """
     try:
         # Query job
-        job = db.query(RawJob).filter(RawJob.job_id == job_id).first()
+        job = await db.get(RawJob, job_id)
 
         if not job:
             raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
         # Query extracted skills for this job (Pipeline A: NER + Regex)
-        skills = db.query(ExtractedSkill).filter(
-            ExtractedSkill.job_id == job_id
-        ).all()
+        skills = (await db.execute(
+            select(ExtractedSkill).where(ExtractedSkill.job_id == job_id)
+        )).scalars().all()
 
         # Query enhanced skills for this job (Pipeline B: LLM)
         enhanced_skills_query = text("""
@@ -133,7 +179,7 @@ def get_job_detail(
             FROM enhanced_skills
             WHERE job_id = :job_id
         """)
-        enhanced_skills_result = db.execute(enhanced_skills_query, {"job_id": str(job_id)}).fetchall()
+        enhanced_skills_result = (await db.execute(enhanced_skills_query, {"job_id": str(job_id)})).fetchall()
 
         # Query manual/gold standard annotations for this job
         manual_skills_query = text("""
@@ -141,7 +187,7 @@ def get_job_detail(
             FROM gold_standard_annotations
             WHERE job_id = :job_id
         """)
-        manual_skills_result = db.execute(manual_skills_query, {"job_id": str(job_id)}).fetchall()
+        manual_skills_result = (await db.execute(manual_skills_query, {"job_id": str(job_id)})).fetchall()
 
         # Convert to dict
         job_dict = {
@@ -202,10 +248,10 @@ def get_job_detail(
 
 
 @router.get("/jobs/country/{country_code}")
-def get_jobs_by_country(
+async def get_jobs_by_country(
     country_code: str,
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get jobs for a specific country.
@@ -213,9 +259,11 @@ def get_jobs_by_country(
     Quick endpoint for country-specific queries.
     """
     try:
-        jobs = db.query(RawJob).filter(
-            RawJob.country == country_code.upper()
-        ).order_by(RawJob.scraped_at.desc()).limit(limit).all()
+        jobs = (await db.execute(
+            select(RawJob).where(
+                RawJob.country == country_code.upper()
+            ).order_by(RawJob.scraped_at.desc()).limit(limit)
+        )).scalars().all()
 
         return {
             "country": country_code.upper(),
@@ -1,8 +1,16 @@
 """
 Skills Router - Skill analysis and aggregations.
+
+/skills/top, /skills/search and /skills/by-type read the skill_demand_counts
+rollup (migration 015) rather than grouping the skill tables per request,
+and are async (asyncpg); the other endpoints still use the sync session.
+Substring search is served by its trigram index (migration 017) and pages
+with keyset cursors; /skills/autocomplete by an in-memory prefix index
+(api/autocomplete.py).
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, distinct, text
 from typing import Optional
 import logging
@@ -11,9 +19,20 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from api.dependencies import get_db
-from api.schemas.skill import SkillCount, TopSkillsResponse
+from api.dependencies import get_db, get_async_db
+from api.cache import cached_response, SKILL_EVENTS
+from api.http_cache import FastJSONResponse
+from api.autocomplete import MAX_SUGGESTIONS, get_skill_autocomplete
+from api.pagination import encode_cursor, decode_cursor, estimated_count, query_total
+from api.schemas.skill import (
+    SkillCount, TopSkillsResponse, SimilarSkill, SimilarSkillsResponse,
+    SkillSuggestion, SkillAutocompleteResponse
+)
 from database.models import ExtractedSkill, RawJob
+from database.demand_rollup import demand_filter, resolve_extraction_method
+from config.settings import get_settings
+from embedder.query_cache import QueryEmbeddingCache, normalize_query
+from evaluation.normalizer import get_canonical_key
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +44,38 @@ except ImportError:
 
 router = APIRouter()
 
+# Query vectors for /skills/{skill}/similar (pgvector text literals)
+_query_embeddings = QueryEmbeddingCache(maxsize=get_settings().query_embedding_cache_size)
+_vectorizer = None
+
+
+async def _scalar(db: AsyncSession, sql: str, params: dict) -> int:
+    return (await db.execute(text(sql), params)).scalar() or 0
+
+
+def _encode_skill(skill: str) -> Optional[str]:
+    """Encode a skill that is not in skill_embeddings (lazy model load)."""
+    global _vectorizer
+    if _vectorizer is None:
+        try:
+            from embedder.vectorizer import Vectorizer
+            _vectorizer = Vectorizer(get_settings().embedding_model)
+        except ImportError as e:
+            logger.warning(f"Embedding model unavailable for similar-skill queries: {e}")
+            return None
+    vector = _vectorizer.embed_text(skill)
+    return '[' + ','.join(f'{x:.7g}' for x in vector) + ']'
+
 
-@router.get("/skills/top", response_model=TopSkillsResponse)
-def get_top_skills(
+@router.get("/skills/top", response_model=TopSkillsResponse, response_class=FastJSONResponse)
+@cached_response("skills/top", invalidate_on=SKILL_EVENTS)
+async def get_top_skills(
     country: Optional[str] = Query(None, description="Filter by country code"),
     skill_type: Optional[str] = Query(None, description="Filter by skill type (hard, soft)"),
     extraction_method: Optional[str] = Query(None, description="Filter by extraction method (ner, regex, pipeline_a, pipeline_b)"),
     mapping_status: Optional[str] = Query(None, description="Filter by mapping status (esco_mapped, unmapped)"),
     limit: int = Query(20, ge=1, le=100, description="Number of top skills to return"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> TopSkillsResponse:
     """
     Get the most demanded skills with frequency counts.
@@ -49,153 +91,29 @@ def get_top_skills(
         TopSkillsResponse with skill frequencies
     """
     try:
-        # Manual uses gold_standard_annotations table
-        if extraction_method == "manual":
-            # Query gold_standard_annotations table
-            query_str = """
-                SELECT
-                    skill_text,
-                    skill_type,
-                    esco_concept_uri as esco_uri,
-                    COUNT(*) as count
-                FROM gold_standard_annotations gsa
-            """
-
-            conditions = []
-            params = {}
-
-            # Join with jobs if filtering by country
-            if country:
-                query_str += " JOIN raw_jobs rj ON gsa.job_id = rj.job_id"
-                conditions.append("rj.country = :country")
-                params["country"] = country.upper()
-
-            # Filter by skill type
-            if skill_type and skill_type.lower() in ['hard', 'soft']:
-                conditions.append("gsa.skill_type = :skill_type")
-                params["skill_type"] = skill_type.lower()
-
-            # Filter by mapping status
-            if mapping_status:
-                if mapping_status == "esco_mapped":
-                    conditions.append("gsa.esco_concept_uri IS NOT NULL")
-                elif mapping_status == "unmapped":
-                    conditions.append("gsa.esco_concept_uri IS NULL")
-
-            # Add WHERE clause if there are conditions
-            if conditions:
-                query_str += " WHERE " + " AND ".join(conditions)
-
-            query_str += """
-                GROUP BY skill_text, skill_type, esco_concept_uri
-                ORDER BY count DESC
-                LIMIT :limit
-            """
-            params["limit"] = limit
-
-            results = db.execute(text(query_str), params).fetchall()
-
-            # Get total unique skills from gold_standard_annotations
-            total_unique_query = "SELECT COUNT(DISTINCT skill_text) FROM gold_standard_annotations"
-            total_unique = db.execute(text(total_unique_query)).scalar() or 0
-
-        # Pipeline B uses enhanced_skills table
-        elif extraction_method == "pipeline_b":
-            # Query enhanced_skills table
-            query_str = """
-                SELECT
-                    normalized_skill as skill_text,
-                    skill_type,
-                    esco_concept_uri as esco_uri,
-                    COUNT(*) as count
-                FROM enhanced_skills es
-            """
-
-            conditions = []
-            params = {}
-
-            # Join with jobs if filtering by country
-            if country:
-                query_str += " JOIN raw_jobs rj ON es.job_id = rj.job_id"
-                conditions.append("rj.country = :country")
-                params["country"] = country.upper()
-
-            # Filter by skill type
-            if skill_type and skill_type.lower() in ['hard', 'soft']:
-                conditions.append("es.skill_type = :skill_type")
-                params["skill_type"] = skill_type.lower()
-
-            # Filter by mapping status
-            if mapping_status:
-                if mapping_status == "esco_mapped":
-                    conditions.append("es.esco_concept_uri IS NOT NULL")
-                elif mapping_status == "unmapped":
-                    conditions.append("es.esco_concept_uri IS NULL")
-
-            # Add WHERE clause if there are conditions
-            if conditions:
-                query_str += " WHERE " + " AND ".join(conditions)
-
-            query_str += """
-                GROUP BY normalized_skill, skill_type, esco_concept_uri
-                ORDER BY count DESC
-                LIMIT :limit
-            """
-            params["limit"] = limit
-
-            results = db.execute(text(query_str), params).fetchall()
-
-            # Get total unique skills from enhanced_skills
-            total_unique_query = "SELECT COUNT(DISTINCT normalized_skill) FROM enhanced_skills"
-            total_unique = db.execute(text(total_unique_query)).scalar() or 0
-
-        else:
-            # Original logic for extracted_skills (Pipeline A, NER, Regex)
-            query = db.query(
-                ExtractedSkill.skill_text,
-                ExtractedSkill.skill_type,
-                ExtractedSkill.esco_uri,
-                func.count(ExtractedSkill.skill_text).label('count')
-            )
-
-            # Join with jobs if filtering by country
-            if country:
-                query = query.join(RawJob, ExtractedSkill.job_id == RawJob.job_id)
-                query = query.filter(RawJob.country == country.upper())
-
-            # Filter by skill type
-            if skill_type and skill_type.lower() in ['hard', 'soft']:
-                query = query.filter(ExtractedSkill.skill_type == skill_type.lower())
-
-            # Filter by extraction method
-            if extraction_method:
-                if extraction_method == "ner":
-                    query = query.filter(ExtractedSkill.extraction_method == 'ner')
-                elif extraction_method == "regex":
-                    query = query.filter(ExtractedSkill.extraction_method == 'regex')
-                elif extraction_method == "pipeline_a":
-                    # Pipeline A includes both ner and regex
-                    query = query.filter(ExtractedSkill.extraction_method.in_(['ner', 'regex']))
-
-            # Filter by mapping status
-            if mapping_status:
-                if mapping_status == "esco_mapped":
-                    query = query.filter(ExtractedSkill.esco_uri.isnot(None))
-                elif mapping_status == "unmapped":
-                    query = query.filter(ExtractedSkill.esco_uri.is_(None))
-
-            # Group by skill and order by count
-            query = query.group_by(
-                ExtractedSkill.skill_text,
-                ExtractedSkill.skill_type,
-                ExtractedSkill.esco_uri
-            ).order_by(func.count(ExtractedSkill.skill_text).desc())
-
-            # Get results
-            results = query.limit(limit).all()
-
-            # Calculate total unique skills
-            total_unique = db.query(func.count(distinct(ExtractedSkill.skill_text))).scalar() or 0
+        # Rollup rows for the table behind the method (gold standard, Pipeline B or Pipeline A)
+        source, methods = resolve_extraction_method(extraction_method)
+        where, params = demand_filter(
+            source, methods, country=country, skill_type=skill_type, mapping_status=mapping_status
+        )
+        params["limit"] = limit
+
+        results = (await db.execute(text(f"""
+            SELECT
+                skill_text,
+                NULLIF(skill_type, '') AS skill_type,
+                NULLIF(esco_uri, '') AS esco_uri,
+                SUM(mention_count) AS count
+            FROM skill_demand_counts {where}
+            GROUP BY skill_text, skill_type, esco_uri
+            ORDER BY count DESC, skill_text
+            LIMIT :limit
+        """), params)).fetchall()
+
+        # Total unique skills of the source table
+        total_unique = (await db.execute(text(
+            "SELECT COUNT(DISTINCT skill_text) FROM skill_demand_counts WHERE source = :source"
+        ), {"source": source})).scalar() or 0
 
         # Calculate total count for percentages
         total_count = sum(r.count for r in results) if results else 1
@@ -222,16 +140,19 @@ def get_top_skills(
         raise HTTPException(status_code=500, detail=f"Error retrieving skills: {str(e)}")
 
 
-@router.get("/skills/search", response_model=TopSkillsResponse)
-def search_skills(
+@router.get("/skills/search", response_model=TopSkillsResponse, response_class=FastJSONResponse)
+@cached_response("skills/search", invalidate_on=SKILL_EVENTS)
+async def search_skills(
     query: str = Query("", description="Search query for skill names (empty for all)"),
     country: Optional[str] = Query(None, description="Filter by country code"),
     skill_type: Optional[str] = Query(None, description="Filter by skill type (hard, soft)"),
     extraction_method: Optional[str] = Query(None, description="Filter by extraction method (ner, regex, pipeline_a, pipeline_b, manual)"),
     mapping_status: Optional[str] = Query(None, description="Filter by mapping status (esco_mapped, unmapped)"),
-    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    page: int = Query(1, ge=1, description="Page number (1-indexed, ignored with cursor)"),
     page_size: int = Query(50, ge=1, le=100, description="Results per page"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    exact: bool = Query(False, description="Exact total_unique instead of the planner estimate"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Search for skills by text with pagination and filters.
@@ -244,6 +165,8 @@ def search_skills(
         mapping_status: Filter by ESCO mapping status (esco_mapped, unmapped)
         page: Page number (1-indexed)
         page_size: Results per page (1-100)
+        cursor: Keyset pagination on (count, skill_text), constant cost at any depth
+        exact: Exact total_unique instead of an estimate
 
     Returns:
         TopSkillsResponse with matching skills and pagination info
@@ -252,165 +175,67 @@ def search_skills(
         search_pattern = f"%{query}%" if query else "%"
         offset = (page - 1) * page_size
 
-        # Manual uses gold_standard_annotations table
-        if extraction_method == "manual":
-            query_str = """
-                SELECT
-                    skill_text,
-                    skill_type,
-                    esco_concept_uri as esco_uri,
-                    COUNT(*) as count
-                FROM gold_standard_annotations gsa
-            """
-
-            conditions = []
-            if query:  # Only add LIKE condition if there's a search query
-                conditions.append("LOWER(skill_text) LIKE LOWER(:search_pattern)")
-            params = {"search_pattern": search_pattern, "limit": page_size, "offset": offset}
-
-            # Join with jobs if filtering by country
-            if country:
-                query_str += " JOIN raw_jobs rj ON gsa.job_id = rj.job_id"
-                conditions.append("rj.country = :country")
-                params["country"] = country.upper()
-
-            # Filter by skill type
-            if skill_type and skill_type.lower() in ['hard', 'soft']:
-                conditions.append("gsa.skill_type = :skill_type")
-                params["skill_type"] = skill_type.lower()
-
-            # Filter by mapping status
-            if mapping_status:
-                if mapping_status == "esco_mapped":
-                    conditions.append("gsa.esco_concept_uri IS NOT NULL")
-                elif mapping_status == "unmapped":
-                    conditions.append("gsa.esco_concept_uri IS NULL")
-
-            if conditions:
-                query_str += " WHERE " + " AND ".join(conditions)
-            query_str += """
-                GROUP BY skill_text, skill_type, esco_concept_uri
-                ORDER BY count DESC
-                LIMIT :limit OFFSET :offset
-            """
-
-            results = db.execute(text(query_str), params).fetchall()
-
-            # Get total count for pagination
-            count_query = f"""
-                SELECT COUNT(DISTINCT skill_text)
-                FROM gold_standard_annotations gsa
-                {' JOIN raw_jobs rj ON gsa.job_id = rj.job_id' if country else ''}
-                {' WHERE ' + ' AND '.join(conditions) if conditions else ''}
-            """
-            total_unique = db.execute(text(count_query), params).scalar() or 0
-
-        # Pipeline B uses enhanced_skills table
-        elif extraction_method == "pipeline_b":
-            query_str = """
-                SELECT
-                    normalized_skill as skill_text,
-                    skill_type,
-                    esco_concept_uri as esco_uri,
-                    COUNT(*) as count
-                FROM enhanced_skills es
-            """
-
-            conditions = []
-            if query:  # Only add LIKE condition if there's a search query
-                conditions.append("LOWER(normalized_skill) LIKE LOWER(:search_pattern)")
-            params = {"search_pattern": search_pattern, "limit": page_size, "offset": offset}
-
-            # Join with jobs if filtering by country
-            if country:
-                query_str += " JOIN raw_jobs rj ON es.job_id = rj.job_id"
-                conditions.append("rj.country = :country")
-                params["country"] = country.upper()
-
-            # Filter by skill type
-            if skill_type and skill_type.lower() in ['hard', 'soft']:
-                conditions.append("es.skill_type = :skill_type")
-                params["skill_type"] = skill_type.lower()
-
-            # Filter by mapping status
-            if mapping_status:
-                if mapping_status == "esco_mapped":
-                    conditions.append("es.esco_concept_uri IS NOT NULL")
-                elif mapping_status == "unmapped":
-                    conditions.append("es.esco_concept_uri IS NULL")
-
-            if conditions:
-                query_str += " WHERE " + " AND ".join(conditions)
-            query_str += """
-                GROUP BY normalized_skill, skill_type, esco_concept_uri
-                ORDER BY count DESC
-                LIMIT :limit OFFSET :offset
-            """
-
-            results = db.execute(text(query_str), params).fetchall()
-
-            # Get total count for pagination
-            count_query = f"""
-                SELECT COUNT(DISTINCT normalized_skill)
-                FROM enhanced_skills es
-                {' JOIN raw_jobs rj ON es.job_id = rj.job_id' if country else ''}
-                {' WHERE ' + ' AND '.join(conditions) if conditions else ''}
+        source, methods = resolve_extraction_method(extraction_method)
+        where, params = demand_filter(
+            source, methods, country=country, skill_type=skill_type, mapping_status=mapping_status
+        )
+        if query:  # Only add ILIKE condition if there's a search query (trigram index)
+            where += " AND skill_text ILIKE :search_pattern"
+            params["search_pattern"] = search_pattern
+
+        # Keyset on the full sort key; skill_type/esco_uri break (count, skill_text) ties
+        keyset = ""
+        if cursor:
+            after_count, after_skill, after_type, after_uri = decode_cursor(cursor, 4)
+            keyset = """
+                HAVING SUM(mention_count) < :after_count
+                    OR (SUM(mention_count) = :after_count
+                        AND (skill_text, skill_demand_counts.skill_type, skill_demand_counts.esco_uri)
+                            > (:after_skill, :after_type, :after_uri))
             """
-            total_unique = db.execute(text(count_query), params).scalar() or 0
-
-        else:
-            # Original logic for extracted_skills (Pipeline A, NER, Regex)
-            base_query = db.query(
-                ExtractedSkill.skill_text,
-                ExtractedSkill.skill_type,
-                ExtractedSkill.esco_uri,
-                func.count(ExtractedSkill.skill_text).label('count')
-            )
-
-            # Only filter by search pattern if query is provided
-            if query:
-                base_query = base_query.filter(ExtractedSkill.skill_text.ilike(search_pattern))
-
-            # Join with jobs if filtering by country
-            if country:
-                base_query = base_query.join(RawJob, ExtractedSkill.job_id == RawJob.job_id)
-                base_query = base_query.filter(RawJob.country == country.upper())
-
-            # Filter by skill type
-            if skill_type and skill_type.lower() in ['hard', 'soft']:
-                base_query = base_query.filter(ExtractedSkill.skill_type == skill_type.lower())
-
-            # Filter by extraction method
-            if extraction_method:
-                if extraction_method == "ner":
-                    base_query = base_query.filter(ExtractedSkill.extraction_method == 'ner')
-                elif extraction_method == "regex":
-                    base_query = base_query.filter(ExtractedSkill.extraction_method == 'regex')
-                elif extraction_method == "pipeline_a":
-                    base_query = base_query.filter(ExtractedSkill.extraction_method.in_(['ner', 'regex']))
-
-            # Filter by mapping status
-            if mapping_status:
-                if mapping_status == "esco_mapped":
-                    base_query = base_query.filter(ExtractedSkill.esco_uri.isnot(None))
-                elif mapping_status == "unmapped":
-                    base_query = base_query.filter(ExtractedSkill.esco_uri.is_(None))
-
-            # Group by skill and order by count
-            query_with_group = base_query.group_by(
-                ExtractedSkill.skill_text,
-                ExtractedSkill.skill_type,
-                ExtractedSkill.esco_uri
-            ).order_by(func.count(ExtractedSkill.skill_text).desc())
-
-            # Get results with pagination
-            results = query_with_group.limit(page_size).offset(offset).all()
-
-            # Calculate total unique skills matching search
-            count_query = db.query(func.count(distinct(ExtractedSkill.skill_text)))
-            if query:
-                count_query = count_query.filter(ExtractedSkill.skill_text.ilike(search_pattern))
-            total_unique = count_query.scalar() or 0
+            offset = 0
+
+        rows = (await db.execute(text(f"""
+            SELECT
+                skill_text,
+                NULLIF(skill_type, '') AS skill_type,
+                NULLIF(esco_uri, '') AS esco_uri,
+                skill_demand_counts.skill_type AS sort_type,
+                skill_demand_counts.esco_uri AS sort_uri,
+                SUM(mention_count) AS count
+            FROM skill_demand_counts {where}
+            GROUP BY skill_text, skill_demand_counts.skill_type, skill_demand_counts.esco_uri
+            {keyset}
+            ORDER BY count DESC, skill_text, sort_type, sort_uri
+            LIMIT :limit OFFSET :offset
+        """), {
+            **params,
+            "limit": page_size + 1,
+            "offset": offset,
+            **({
+                "after_count": after_count, "after_skill": after_skill,
+                "after_type": after_type, "after_uri": after_uri
+            } if cursor else {})
+        })).fetchall()
+
+        # One extra row tells whether there is a next page
+        results = rows[:page_size]
+        next_cursor = None
+        if len(rows) > page_size:
+            last = results[-1]
+            next_cursor = encode_cursor([int(last.count), last.skill_text, last.sort_type, last.sort_uri])
+
+        # Total for pagination (same filters), estimated unless exact=true
+        total_unique, total_is_estimate = await query_total(
+            "skills/search",
+            {"source": source, **params},
+            exact,
+            exact_count=lambda: _scalar(db, f"SELECT COUNT(DISTINCT skill_text) FROM skill_demand_counts {where}", params),
+            estimate=lambda: estimated_count(
+                db, f"SELECT skill_text FROM skill_demand_counts {where} GROUP BY skill_text", params
+            ),
+            invalidate_on=SKILL_EVENTS
+        )
 
         # Calculate total count for percentages
         total_count = sum(r.count for r in results) if results else 1
@@ -430,20 +255,62 @@ def search_skills(
         return TopSkillsResponse(
             total_unique=total_unique,
             skills=skills,
-            page=page,
+            page=page if not cursor else None,
             page_size=page_size,
-            total_pages=(total_unique + page_size - 1) // page_size if total_unique > 0 else 0
+            total_pages=(total_unique + page_size - 1) // page_size if total_unique > 0 else 0,
+            next_cursor=next_cursor,
+            total_is_estimate=total_is_estimate
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error searching skills: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/skills/autocomplete", response_model=SkillAutocompleteResponse)
+def autocomplete_skills(
+    q: str = Query(..., min_length=1, description="Prefix typed so far (matches any word start)"),
+    extraction_method: Optional[str] = Query(None, description="Skill source (ner, regex, pipeline_a, pipeline_b, manual)"),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS, description="Number of suggestions"),
+    db: Session = Depends(get_db)
+) -> SkillAutocompleteResponse:
+    """
+    Suggest skills for type-ahead, most mentioned first.
+
+    Answered from an in-memory prefix index, without a database query once
+    the index is built. ner/regex/pipeline_a all suggest Pipeline A skills.
+
+    Args:
+        q: Prefix (case-insensitive)
+        extraction_method: Which skill table to suggest from
+        limit: Number of suggestions (1-50)
+
+    Returns:
+        SkillAutocompleteResponse with (skill_text, count) suggestions
+    """
+    try:
+        source, _ = resolve_extraction_method(extraction_method)
+        index = get_skill_autocomplete().get_index(source, db)
+        suggestions = index.search(q, limit) if index is not None else []
+
+        return SkillAutocompleteResponse(
+            query=q,
+            source=source,
+            suggestions=[SkillSuggestion(skill_text=skill, count=count) for skill, count in suggestions]
+        )
+
+    except Exception as e:
+        logger.error(f"Error in skill autocomplete: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/skills/by-type")
-def get_skills_by_type(
+@cached_response("skills/by-type", invalidate_on=SKILL_EVENTS)
+async def get_skills_by_type(
     country: Optional[str] = Query(None, description="Filter by country"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get skill distribution by type (hard vs soft).
@@ -455,16 +322,12 @@ def get_skills_by_type(
         Counts by skill type
     """
     try:
-        query = db.query(
-            ExtractedSkill.skill_type,
-            func.count(ExtractedSkill.extraction_id).label('count')
-        )
-
-        if country:
-            query = query.join(RawJob, ExtractedSkill.job_id == RawJob.job_id)
-            query = query.filter(RawJob.country == country.upper())
-
-        results = query.group_by(ExtractedSkill.skill_type).all()
+        where, params = demand_filter('extracted', country=country)
+        results = (await db.execute(text(f"""
+            SELECT NULLIF(skill_type, '') AS skill_type, SUM(mention_count) AS count
+            FROM skill_demand_counts {where}
+            GROUP BY 1
+        """), params)).fetchall()
 
         total = sum(r.count for r in results)
 
@@ -486,6 +349,7 @@ def get_skills_by_type(
 
 
 @router.get("/skills/detail")
+@cached_response("skills/detail", invalidate_on=SKILL_EVENTS)
 def get_skill_detail(
     skill_text: str = Query(..., description="Exact skill text to get details for"),
     extraction_method: Optional[str] = Query(None, description="Filter by extraction method (ner, regex, pipeline_a, pipeline_b, manual)"),
@@ -726,3 +590,117 @@ def get_skill_detail(
     except Exception as e:
         logger.error(f"Error getting skill detail: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving skill details: {str(e)}")
+
+
+@router.get("/skills/{skill}/similar", response_model=SimilarSkillsResponse)
+def get_similar_skills(
+    skill: str,
+    k: int = Query(10, ge=1, le=100, description="Number of neighbours to return"),
+    ef_search: Optional[int] = Query(None, ge=1, le=1000, description="HNSW ef_search (default: HNSW_EF_SEARCH)"),
+    db: Session = Depends(get_db)
+) -> SimilarSkillsResponse:
+    """
+    Get the skills closest to a given skill in embedding space.
+
+    Uses the HNSW cosine index on skill_embeddings.embedding (migration 011).
+    The skill is resolved to its canonical key (SkillNormalizer.canonical_key,
+    then skill_canonical_map.embedding_key) like the stored embeddings. The
+    query vector is the stored embedding when it exists, or the canonical key
+    encoded with the embedding model otherwise; both are cached in memory.
+
+    Args:
+        skill: Skill text (case, accents and aliases are resolved)
+        k: Number of neighbours (1-100)
+        ef_search: HNSW candidate list size (higher = better recall, slower)
+
+    Returns:
+        SimilarSkillsResponse with neighbours sorted by cosine similarity
+    """
+    try:
+        settings = get_settings()
+        ef_search = ef_search or settings.hnsw_ef_search
+        key = get_canonical_key(skill)
+        if not key:
+            raise HTTPException(status_code=404, detail=f"Skill '{skill}' is empty after normalization")
+        # The skill's own rows: its canonical key and legacy raw-keyed variants
+        self_keys = sorted({key, normalize_query(skill)})
+
+        cached = _query_embeddings.get(key)
+        if cached is not None:
+            query_vector, source = cached
+        else:
+            # Prefer the mapped embedding key, then a legacy raw-keyed match
+            query_vector = db.execute(
+                text("""
+                    WITH target AS (
+                        SELECT COALESCE(
+                            (SELECT embedding_key
+                             FROM skill_canonical_map
+                             WHERE skill_text = :skill OR canonical_text = :key
+                             ORDER BY (skill_text = :skill) DESC
+                             LIMIT 1),
+                            :key
+                        ) AS embedding_key
+                    )
+                    SELECT se.embedding::text
+                    FROM skill_embeddings se, target
+                    WHERE se.skill_text = target.embedding_key
+                       OR LOWER(TRIM(se.skill_text)) = ANY(:self_keys)
+                    ORDER BY (se.skill_text = target.embedding_key) DESC
+                    LIMIT 1
+                """),
+                {"key": key, "skill": skill, "self_keys": self_keys}
+            ).scalar()
+            source = "stored"
+
+            if query_vector is None:
+                query_vector = _encode_skill(key)
+                source = "encoded"
+                if query_vector is None:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Skill '{skill}' has no embedding and the embedding model is not available"
+                    )
+
+            _query_embeddings.put(key, (query_vector, source))
+
+        # Session-local to this transaction only
+        db.execute(text("SELECT set_config('hnsw.ef_search', :ef, true)"), {"ef": str(ef_search)})
+
+        # The skill itself (canonical row, raw-keyed variants and texts mapped
+        # to the same canonical key) is filtered in SQL, so the HNSW scan
+        # still returns k neighbours
+        results = db.execute(
+            text("""
+                SELECT se.skill_text, 1 - (se.embedding <=> CAST(:query AS vector)) AS similarity
+                FROM skill_embeddings se
+                WHERE LOWER(TRIM(se.skill_text)) <> ALL(:self_keys)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM skill_canonical_map m
+                      WHERE m.canonical_text = :key
+                        AND se.skill_text IN (m.skill_text, m.embedding_key)
+                  )
+                ORDER BY se.embedding <=> CAST(:query AS vector)
+                LIMIT :k
+            """),
+            {"query": query_vector, "key": key, "self_keys": self_keys, "k": k}
+        ).fetchall()
+
+        neighbours = [
+            SimilarSkill(skill_text=r.skill_text, similarity=round(float(r.similarity), 4))
+            for r in results
+        ]
+
+        return SimilarSkillsResponse(
+            skill=skill,
+            source=source,
+            cached=cached is not None,
+            ef_search=ef_search,
+            results=neighbours
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting similar skills: {e}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving similar skills: {str(e)}")
@@ -1,27 +1,77 @@
 """
 Statistics Router - General system statistics and metrics.
+
+Skill and "jobs with skills" counts come from the demand rollups
+(skill_demand_counts / job_skill_profile, migration 015) instead of
+aggregating the skill tables on every request. Endpoints are async
+(asyncpg, api.dependencies.get_async_db).
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct, text, exists
-from typing import Dict, Any, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, distinct, select, text
+from typing import Dict, Any, Optional, Iterable, Tuple
 import logging
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from api.dependencies import get_db
+from api.dependencies import get_async_db
+from api.cache import cached_response, DATA_EVENTS
+from api.http_cache import FastJSONResponse
 from api.schemas.stats import StatsResponse, DateRange, ExtractionMethodsBreakdown
-from database.models import RawJob, ExtractedSkill, AnalysisResult, CleanedJob
+from database.models import RawJob, AnalysisResult, CleanedJob
+from database.demand_rollup import demand_filter, resolve_extraction_method
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-
-@router.get("/stats", response_model=StatsResponse)
-def get_general_stats(db: Session = Depends(get_db)) -> StatsResponse:
+COUNTRIES = ['AR', 'CO', 'MX']
+GEMMA_MODEL = 'gemma-3-4b-instruct'
+
+
+async def _skill_totals(db: AsyncSession, source: str, methods: Optional[Iterable[str]] = None, **filters) -> Tuple[int, int]:
+    """(mentions, unique skills) from skill_demand_counts."""
+    where, params = demand_filter(source, methods, **filters)
+    row = (await db.execute(text(f"""
+        SELECT COALESCE(SUM(mention_count), 0) AS total, COUNT(DISTINCT skill_text) AS unique_skills
+        FROM skill_demand_counts {where}
+    """), params)).fetchone()
+    return int(row.total), int(row.unique_skills)
+
+
+async def _profile_totals(db: AsyncSession, source: str, methods: Optional[Iterable[str]] = None, **filters) -> Dict[str, Any]:
+    """Mentions, distinct jobs and mentions per method from job_skill_profile."""
+    where, params = demand_filter(source, methods, profile=True, **filters)
+    by_method = {
+        row.extraction_method: int(row.mentions)
+        for row in (await db.execute(text(f"""
+            SELECT extraction_method, SUM(mention_count) AS mentions
+            FROM job_skill_profile {where}
+            GROUP BY extraction_method
+        """), params)).fetchall()
+    }
+    jobs = (await db.execute(text(f"SELECT COUNT(DISTINCT job_id) FROM job_skill_profile {where}"), params)).scalar() or 0
+    return {'mentions': sum(by_method.values()), 'jobs': int(jobs), 'by_method': by_method}
+
+
+def _raw_job_conditions(country: Optional[str], job_status: Optional[str]) -> Tuple[list, Dict[str, Any]]:
+    """Conditions on raw_jobs rj for the country and job_status filters."""
+    conditions, params = [], {}
+    if country:
+        conditions.append("rj.country = :country")
+        params["country"] = country.upper()
+    if job_status == "cleaned":
+        conditions.append("EXISTS (SELECT 1 FROM cleaned_jobs cj WHERE cj.job_id = rj.job_id)")
+    elif job_status == "golden":
+        conditions.append("EXISTS (SELECT 1 FROM gold_standard_annotations gsa WHERE gsa.job_id = rj.job_id)")
+    return conditions, params
+
+
+@router.get("/stats", response_model=StatsResponse, response_class=FastJSONResponse)
+@cached_response("stats", invalidate_on=DATA_EVENTS)
+async def get_general_stats(db: AsyncSession = Depends(get_async_db)) -> StatsResponse:
     """
     Get general statistics about the observatory.
 
@@ -29,76 +79,55 @@ def get_general_stats(db: Session = Depends(get_db)) -> StatsResponse:
     """
     try:
         # Funnel de datos
-        total_raw_jobs = db.query(func.count(RawJob.job_id)).scalar() or 0
-        total_cleaned_jobs = db.query(func.count(CleanedJob.job_id)).scalar() or 0
-        total_jobs_with_skills = db.query(func.count(distinct(ExtractedSkill.job_id))).scalar() or 0
-
-        # Total skills (all extractions)
-        total_skills = db.query(func.count(ExtractedSkill.extraction_id)).scalar() or 0
-
-        # Unique skills
-        total_unique_skills = db.query(func.count(distinct(ExtractedSkill.skill_text))).scalar() or 0
-
-        # Extraction methods breakdown - Pipeline A (NER + Regex combined)
-        ner_count = db.query(func.count(ExtractedSkill.extraction_id)).filter(
-            ExtractedSkill.extraction_method == 'ner'
-        ).scalar() or 0
-
-        regex_count = db.query(func.count(ExtractedSkill.extraction_id)).filter(
-            ExtractedSkill.extraction_method == 'regex'
-        ).scalar() or 0
-
+        total_raw_jobs = (await db.execute(select(func.count(RawJob.job_id)))).scalar() or 0
+        total_cleaned_jobs = (await db.execute(select(func.count(CleanedJob.job_id)))).scalar() or 0
+
+        # Pipeline A (all extractions): totals, unique skills, NER / Regex breakdown
+        total_skills, total_unique_skills = await _skill_totals(db, 'extracted')
+        pipeline_a = await _profile_totals(db, 'extracted')
+        total_jobs_with_skills = pipeline_a['jobs']
+        ner_count = pipeline_a['by_method'].get('ner', 0)
+        regex_count = pipeline_a['by_method'].get('regex', 0)
         pipeline_a_count = ner_count + regex_count
 
-        # Pipeline B (LLM enhanced skills) - using raw SQL since EnhancedSkill model might not be loaded
-        from sqlalchemy import text
-        enhanced_result = db.execute(text("""
-            SELECT
-                COUNT(*) as total,
-                COUNT(DISTINCT job_id) as unique_jobs,
-                COUNT(CASE WHEN llm_model = 'gemma-3-4b-instruct' THEN 1 END) as gemma_count
-            FROM enhanced_skills
-        """)).fetchone()
-
-        pipeline_b_count = enhanced_result.total if enhanced_result else 0
-        pipeline_b_jobs = enhanced_result.unique_jobs if enhanced_result else 0
-        gemma_count = enhanced_result.gemma_count if enhanced_result else 0
+        # Pipeline B (LLM enhanced skills)
+        pipeline_b = await _profile_totals(db, 'enhanced')
 
         extraction_methods = ExtractionMethodsBreakdown(
             ner=ner_count,
             regex=regex_count,
             pipeline_a1=pipeline_a_count,
-            pipeline_b_total=pipeline_b_count,
-            pipeline_b_gemma=gemma_count,
-            pipeline_b_jobs=pipeline_b_jobs
+            pipeline_b_total=pipeline_b['mentions'],
+            pipeline_b_gemma=pipeline_b['by_method'].get(GEMMA_MODEL, 0),
+            pipeline_b_jobs=pipeline_b['jobs']
         )
 
         # Number of clustering analyses
-        n_clusters_query = db.query(AnalysisResult).filter(
-            AnalysisResult.analysis_type == 'clustering'
-        ).first()
+        n_clusters_query = (await db.execute(
+            select(AnalysisResult).where(AnalysisResult.analysis_type == 'clustering').limit(1)
+        )).scalars().first()
         n_clusters = 0
         if n_clusters_query and n_clusters_query.results:
             n_clusters = n_clusters_query.results.get('metrics', {}).get('n_clusters', 0)
 
         # Countries with jobs
-        countries = db.query(distinct(RawJob.country)).filter(
-            RawJob.country.isnot(None)
-        ).all()
+        countries = (await db.execute(
+            select(distinct(RawJob.country)).where(RawJob.country.isnot(None))
+        )).all()
         countries_list = [c[0] for c in countries]
         n_countries = len(countries_list)
 
         # Portals with jobs
-        portals = db.query(distinct(RawJob.portal)).filter(
-            RawJob.portal.isnot(None)
-        ).all()
+        portals = (await db.execute(
+            select(distinct(RawJob.portal)).where(RawJob.portal.isnot(None))
+        )).all()
         portals_list = [p[0] for p in portals]
 
         # Date range of jobs
-        date_stats = db.query(
+        date_stats = (await db.execute(select(
             func.min(RawJob.posted_date).label('start'),
             func.max(RawJob.posted_date).label('end')
-        ).first()
+        ))).first()
 
         date_range = DateRange(
             start=date_stats.start if date_stats else None,
@@ -106,7 +135,7 @@ def get_general_stats(db: Session = Depends(get_db)) -> StatsResponse:
         )
 
         # Last scraping timestamp
-        last_scraping = db.query(func.max(RawJob.scraped_at)).scalar()
+        last_scraping = (await db.execute(select(func.max(RawJob.scraped_at)))).scalar()
 
         return StatsResponse(
             total_raw_jobs=total_raw_jobs,
@@ -129,13 +158,14 @@ def get_general_stats(db: Session = Depends(get_db)) -> StatsResponse:
 
 
 @router.get("/stats/summary")
-def get_stats_summary(db: Session = Depends(get_db)) -> Dict[str, Any]:
+@cached_response("stats/summary", invalidate_on=DATA_EVENTS)
+async def get_stats_summary(db: AsyncSession = Depends(get_async_db)) -> Dict[str, Any]:
     """
     Get a quick summary of key metrics (lighter version).
     """
     try:
-        total_jobs = db.query(func.count(RawJob.job_id)).scalar() or 0
-        total_skills = db.query(func.count(distinct(ExtractedSkill.skill_text))).scalar() or 0
+        total_jobs = (await db.execute(select(func.count(RawJob.job_id)))).scalar() or 0
+        _, total_skills = await _skill_totals(db, 'extracted')
 
         return {
             "total_jobs": total_jobs,
@@ -148,14 +178,15 @@ def get_stats_summary(db: Session = Depends(get_db)) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/stats/filtered")
-def get_filtered_stats(
+@router.get("/stats/filtered", response_class=FastJSONResponse)
+@cached_response("stats/filtered", invalidate_on=DATA_EVENTS)
+async def get_filtered_stats(
     country: Optional[str] = Query(None, description="Filter by country (CO, MX, AR)"),
     job_status: Optional[str] = Query(None, description="Filter by job status (raw, cleaned, golden)"),
     extraction_method: Optional[str] = Query(None, description="Filter skills by extraction method (ner, regex, pipeline_a, pipeline_b)"),
     mapping_status: Optional[str] = Query(None, description="Filter skills by mapping (esco_mapped, unmapped)"),
     skill_type: Optional[str] = Query(None, description="Filter by skill type (hard, soft)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Get statistics with comprehensive filters for Dashboard.
@@ -167,296 +198,54 @@ def get_filtered_stats(
     - mapping_status: ESCO mapping status (esco_mapped, unmapped)
     """
     try:
-        # Determine which table to use for skills based on extraction_method and job_status
-        use_gold_standard = (job_status == "golden")
-        use_enhanced_skills = (extraction_method == "pipeline_b")
-
-        # Build base jobs query
-        jobs_query = db.query(RawJob)
-
-        # Apply country filter to jobs
-        if country:
-            jobs_query = jobs_query.filter(RawJob.country == country.upper())
+        source, methods = resolve_extraction_method(extraction_method)
+        skill_filters = {'country': country, 'skill_type': skill_type, 'mapping_status': mapping_status}
 
-        # Apply job_status filter
-        if job_status == "cleaned":
-            jobs_query = jobs_query.filter(exists().where(CleanedJob.job_id == RawJob.job_id))
-        elif job_status == "golden":
-            gold_job_ids = db.execute(text("SELECT DISTINCT job_id FROM gold_standard_annotations")).fetchall()
-            gold_ids = [row[0] for row in gold_job_ids]
-            jobs_query = jobs_query.filter(RawJob.job_id.in_(gold_ids))
-
-        # Apply extraction_method filter to jobs (only jobs with skills from that method)
+        # Jobs: raw_jobs with the country / job_status filters, restricted to
+        # jobs with skills from the requested extraction method
+        job_conditions, job_params = _raw_job_conditions(country, job_status)
         if extraction_method:
-            if extraction_method == "manual":
-                job_ids_with_method = db.execute(text("SELECT DISTINCT job_id FROM gold_standard_annotations")).fetchall()
-            elif extraction_method == "pipeline_b":
-                job_ids_with_method = db.execute(text("SELECT DISTINCT job_id FROM enhanced_skills")).fetchall()
-            elif extraction_method == "ner":
-                job_ids_with_method = db.query(distinct(ExtractedSkill.job_id)).filter(ExtractedSkill.extraction_method == 'ner').all()
-            elif extraction_method == "regex":
-                job_ids_with_method = db.query(distinct(ExtractedSkill.job_id)).filter(ExtractedSkill.extraction_method == 'regex').all()
-            elif extraction_method == "pipeline_a":
-                job_ids_with_method = db.query(distinct(ExtractedSkill.job_id)).filter(ExtractedSkill.extraction_method.in_(['ner', 'regex'])).all()
-
-            method_job_ids = [row[0] for row in job_ids_with_method]
-            jobs_query = jobs_query.filter(RawJob.job_id.in_(method_job_ids))
-
-        # Count jobs with all filters applied
-        total_jobs = jobs_query.count()
-
-        # Get the filtered job IDs early so we can use them for extraction method counts
-        filtered_job_ids = [row.job_id for row in jobs_query.all()]
-
-        # Build skills query based on extraction method and job status
-        if use_gold_standard or extraction_method == "manual":
-            # Use gold_standard_annotations for golden jobs or manual method
-            skills_query = None  # We'll use raw SQL for gold standard
-        elif use_enhanced_skills:
-            # Use enhanced_skills for pipeline_b
-            skills_query = None  # We'll use raw SQL for enhanced skills
-        else:
-            # Use extracted_skills for pipeline_a, ner, regex
-            skills_query = db.query(ExtractedSkill)
-
-        # Calculate skills based on the appropriate table
-        if use_gold_standard or extraction_method == "manual":
-            # Query gold_standard_annotations
-            skill_conditions = []
-            skill_params = {}
-
-            if country:
-                skill_conditions.append("rj.country = :country")
-                skill_params["country"] = country.upper()
-            if skill_type and skill_type.lower() in ['hard', 'soft']:
-                skill_conditions.append("gsa.skill_type = :skill_type")
-                skill_params["skill_type"] = skill_type.lower()
-            if mapping_status:
-                if mapping_status == "esco_mapped":
-                    skill_conditions.append("gsa.esco_concept_uri IS NOT NULL")
-                elif mapping_status == "unmapped":
-                    skill_conditions.append("gsa.esco_concept_uri IS NULL")
-
-            skill_query_str = "SELECT COUNT(*) as total, COUNT(DISTINCT skill_text) as unique_skills, COUNT(DISTINCT gsa.job_id) as unique_jobs FROM gold_standard_annotations gsa"
-            if country:
-                skill_query_str += " JOIN raw_jobs rj ON gsa.job_id = rj.job_id"
-            if skill_conditions:
-                skill_query_str += " WHERE " + " AND ".join(skill_conditions)
-
-            skill_result = db.execute(text(skill_query_str), skill_params).fetchone()
-            total_skills = skill_result.total if skill_result else 0
-            unique_skills = skill_result.unique_skills if skill_result else 0
-            unique_jobs_with_skills = skill_result.unique_jobs if skill_result else 0
-
-        elif use_enhanced_skills:
-            # Query enhanced_skills
-            skill_conditions = []
-            skill_params = {}
-
-            if country:
-                skill_conditions.append("rj.country = :country")
-                skill_params["country"] = country.upper()
-            if skill_type and skill_type.lower() in ['hard', 'soft']:
-                skill_conditions.append("es.skill_type = :skill_type")
-                skill_params["skill_type"] = skill_type.lower()
-            if mapping_status:
-                if mapping_status == "esco_mapped":
-                    skill_conditions.append("es.esco_concept_uri IS NOT NULL")
-                elif mapping_status == "unmapped":
-                    skill_conditions.append("es.esco_concept_uri IS NULL")
-
-            skill_query_str = "SELECT COUNT(*) as total, COUNT(DISTINCT normalized_skill) as unique_skills, COUNT(DISTINCT es.job_id) as unique_jobs FROM enhanced_skills es"
-            if country:
-                skill_query_str += " JOIN raw_jobs rj ON es.job_id = rj.job_id"
-            if skill_conditions:
-                skill_query_str += " WHERE " + " AND ".join(skill_conditions)
-
-            skill_result = db.execute(text(skill_query_str), skill_params).fetchone()
-            total_skills = skill_result.total if skill_result else 0
-            unique_skills = skill_result.unique_skills if skill_result else 0
-            unique_jobs_with_skills = skill_result.unique_jobs if skill_result else 0
+            method_where, method_params = demand_filter(source, methods, profile=True)
+            job_conditions.append(f"rj.job_id IN (SELECT job_id FROM job_skill_profile {method_where})")
+            job_params.update(method_params)
 
-        else:
-            # Use extracted_skills for pipeline_a, ner, regex
-            # Join with jobs if needed for country filter
-            if country:
-                skills_query = skills_query.join(RawJob, ExtractedSkill.job_id == RawJob.job_id)
-                skills_query = skills_query.filter(RawJob.country == country.upper())
-
-            # Apply extraction_method filter
-            if extraction_method:
-                if extraction_method == "ner":
-                    skills_query = skills_query.filter(ExtractedSkill.extraction_method == 'ner')
-                elif extraction_method == "regex":
-                    skills_query = skills_query.filter(ExtractedSkill.extraction_method == 'regex')
-                elif extraction_method == "pipeline_a":
-                    skills_query = skills_query.filter(ExtractedSkill.extraction_method.in_(['ner', 'regex']))
-
-            # Apply mapping_status filter
-            if mapping_status:
-                if mapping_status == "esco_mapped":
-                    skills_query = skills_query.filter(ExtractedSkill.esco_uri.isnot(None))
-                elif mapping_status == "unmapped":
-                    skills_query = skills_query.filter(ExtractedSkill.esco_uri.is_(None))
-
-            # Apply skill_type filter
-            if skill_type and skill_type.lower() in ['hard', 'soft']:
-                skills_query = skills_query.filter(ExtractedSkill.skill_type == skill_type.lower())
-
-            # Count skills
-            total_skills = skills_query.count()
-
-            # For unique counts with extracted_skills, we need to use the same filtered query
-            unique_skills_query = db.query(func.count(distinct(ExtractedSkill.skill_text)))
-            unique_jobs_query = db.query(func.count(distinct(ExtractedSkill.job_id)))
-
-            # Apply same filters to unique counts
-            if country:
-                unique_skills_query = unique_skills_query.select_from(ExtractedSkill).join(RawJob, ExtractedSkill.job_id == RawJob.job_id).filter(RawJob.country == country.upper())
-                unique_jobs_query = unique_jobs_query.select_from(ExtractedSkill).join(RawJob, ExtractedSkill.job_id == RawJob.job_id).filter(RawJob.country == country.upper())
-            else:
-                unique_skills_query = unique_skills_query.select_from(ExtractedSkill)
-                unique_jobs_query = unique_jobs_query.select_from(ExtractedSkill)
-
-            if extraction_method:
-                if extraction_method == "ner":
-                    unique_skills_query = unique_skills_query.filter(ExtractedSkill.extraction_method == 'ner')
-                    unique_jobs_query = unique_jobs_query.filter(ExtractedSkill.extraction_method == 'ner')
-                elif extraction_method == "regex":
-                    unique_skills_query = unique_skills_query.filter(ExtractedSkill.extraction_method == 'regex')
-                    unique_jobs_query = unique_jobs_query.filter(ExtractedSkill.extraction_method == 'regex')
-                elif extraction_method == "pipeline_a":
-                    unique_skills_query = unique_skills_query.filter(ExtractedSkill.extraction_method.in_(['ner', 'regex']))
-                    unique_jobs_query = unique_jobs_query.filter(ExtractedSkill.extraction_method.in_(['ner', 'regex']))
-
-            if mapping_status:
-                if mapping_status == "esco_mapped":
-                    unique_skills_query = unique_skills_query.filter(ExtractedSkill.esco_uri.isnot(None))
-                    unique_jobs_query = unique_jobs_query.filter(ExtractedSkill.esco_uri.isnot(None))
-                elif mapping_status == "unmapped":
-                    unique_skills_query = unique_skills_query.filter(ExtractedSkill.esco_uri.is_(None))
-                    unique_jobs_query = unique_jobs_query.filter(ExtractedSkill.esco_uri.is_(None))
-
-            if skill_type and skill_type.lower() in ['hard', 'soft']:
-                unique_skills_query = unique_skills_query.filter(ExtractedSkill.skill_type == skill_type.lower())
-                unique_jobs_query = unique_jobs_query.filter(ExtractedSkill.skill_type == skill_type.lower())
-
-            unique_skills = unique_skills_query.scalar() or 0
-            unique_jobs_with_skills = unique_jobs_query.scalar() or 0
-
-        # Get breakdown by extraction method (always include for transparency)
-        ner_count_query = db.query(func.count(ExtractedSkill.extraction_id)).filter(
-            ExtractedSkill.extraction_method == 'ner'
-        )
-        regex_count_query = db.query(func.count(ExtractedSkill.extraction_id)).filter(
-            ExtractedSkill.extraction_method == 'regex'
-        )
-
-        # Apply country filter to extraction counts if set
-        if country:
-            ner_count_query = ner_count_query.join(RawJob, ExtractedSkill.job_id == RawJob.job_id).filter(RawJob.country == country.upper())
-            regex_count_query = regex_count_query.join(RawJob, ExtractedSkill.job_id == RawJob.job_id).filter(RawJob.country == country.upper())
-
-        # Apply job_status filter to extraction counts (filter by filtered job IDs)
-        if job_status and filtered_job_ids:
-            # Join with RawJob if not already joined
-            if not country:
-                ner_count_query = ner_count_query.join(RawJob, ExtractedSkill.job_id == RawJob.job_id)
-                regex_count_query = regex_count_query.join(RawJob, ExtractedSkill.job_id == RawJob.job_id)
-            ner_count_query = ner_count_query.filter(RawJob.job_id.in_(filtered_job_ids))
-            regex_count_query = regex_count_query.filter(RawJob.job_id.in_(filtered_job_ids))
-
-        # Apply skill_type filter to extraction counts
-        if skill_type and skill_type.lower() in ['hard', 'soft']:
-            ner_count_query = ner_count_query.filter(ExtractedSkill.skill_type == skill_type.lower())
-            regex_count_query = regex_count_query.filter(ExtractedSkill.skill_type == skill_type.lower())
-
-        # Apply mapping_status filter to extraction counts
-        if mapping_status:
-            if mapping_status == "esco_mapped":
-                ner_count_query = ner_count_query.filter(ExtractedSkill.esco_uri.isnot(None))
-                regex_count_query = regex_count_query.filter(ExtractedSkill.esco_uri.isnot(None))
-            elif mapping_status == "unmapped":
-                ner_count_query = ner_count_query.filter(ExtractedSkill.esco_uri.is_(None))
-                regex_count_query = regex_count_query.filter(ExtractedSkill.esco_uri.is_(None))
-
-        ner_count = ner_count_query.scalar() or 0
-        regex_count = regex_count_query.scalar() or 0
+        job_result = (await db.execute(text(f"""
+            SELECT
+                COUNT(*) AS total,
+                ARRAY_AGG(DISTINCT rj.country) FILTER (WHERE rj.country IS NOT NULL) AS countries,
+                ARRAY_AGG(DISTINCT rj.portal) FILTER (WHERE rj.portal IS NOT NULL) AS portals,
+                MIN(rj.posted_date) AS date_start,
+                MAX(rj.posted_date) AS date_end
+            FROM raw_jobs rj
+            {'WHERE ' + ' AND '.join(job_conditions) if job_conditions else ''}
+        """), job_params)).fetchone()
+        total_jobs = job_result.total
+        filtered_countries = job_result.countries or []
+        filtered_portals = job_result.portals or []
+
+        # Skills: golden jobs only have manual annotations
+        if job_status == "golden":
+            source, methods = resolve_extraction_method("manual")
+
+        total_skills, unique_skills = await _skill_totals(db, source, methods, **skill_filters)
+        unique_jobs_with_skills = (await _profile_totals(db, source, methods, **skill_filters))['jobs']
+
+        # Breakdown by extraction method (always include for transparency)
+        pipeline_a = await _profile_totals(db, 'extracted', job_status=job_status, **skill_filters)
+        ner_count = pipeline_a['by_method'].get('ner', 0)
+        regex_count = pipeline_a['by_method'].get('regex', 0)
 
         # Count cleaned jobs with filters
-        cleaned_jobs_query = db.query(func.count(CleanedJob.job_id))
+        cleaned_jobs_query = select(func.count(CleanedJob.job_id))
         if country:
-            cleaned_jobs_query = cleaned_jobs_query.join(RawJob, CleanedJob.job_id == RawJob.job_id).filter(RawJob.country == country.upper())
-        total_cleaned_jobs = cleaned_jobs_query.scalar() or 0
-
-        # Pipeline B counts (from enhanced_skills table) with filters
-        pipeline_b_conditions = []
-        pipeline_b_params = {}
-
-        # Always need to join with raw_jobs for job_status filter
-        needs_join = country or job_status
+            cleaned_jobs_query = cleaned_jobs_query.join(RawJob, CleanedJob.job_id == RawJob.job_id).where(RawJob.country == country.upper())
+        total_cleaned_jobs = (await db.execute(cleaned_jobs_query)).scalar() or 0
 
-        if country:
-            pipeline_b_conditions.append("rj.country = :country")
-            pipeline_b_params["country"] = country.upper()
-
-        # Apply job_status filter using filtered_job_ids
-        if job_status and filtered_job_ids:
-            # Create placeholders for SQL IN clause
-            job_id_placeholders = ','.join([f':job_id_{i}' for i in range(len(filtered_job_ids))])
-            pipeline_b_conditions.append(f"es.job_id IN ({job_id_placeholders})")
-            for i, job_id in enumerate(filtered_job_ids):
-                pipeline_b_params[f"job_id_{i}"] = job_id
-
-        if skill_type and skill_type.lower() in ['hard', 'soft']:
-            pipeline_b_conditions.append("es.skill_type = :skill_type")
-            pipeline_b_params["skill_type"] = skill_type.lower()
-
-        if mapping_status:
-            if mapping_status == "esco_mapped":
-                pipeline_b_conditions.append("es.esco_concept_uri IS NOT NULL")
-            elif mapping_status == "unmapped":
-                pipeline_b_conditions.append("es.esco_concept_uri IS NULL")
-
-        pipeline_b_query_str = """
-            SELECT COUNT(*) as total, COUNT(DISTINCT es.job_id) as unique_jobs,
-                   COUNT(CASE WHEN es.llm_model = 'gemma-3-4b-instruct' THEN 1 END) as gemma_count
-            FROM enhanced_skills es
-        """
-        if needs_join:
-            pipeline_b_query_str += " JOIN raw_jobs rj ON es.job_id = rj.job_id"
-        if pipeline_b_conditions:
-            pipeline_b_query_str += " WHERE " + " AND ".join(pipeline_b_conditions)
-
-        enhanced_result = db.execute(text(pipeline_b_query_str), pipeline_b_params).fetchone()
-
-        pipeline_b_total = enhanced_result.total if enhanced_result else 0
-        pipeline_b_jobs = enhanced_result.unique_jobs if enhanced_result else 0
-        pipeline_b_gemma = enhanced_result.gemma_count if enhanced_result else 0
-
-        if filtered_job_ids:
-            countries_query = db.query(distinct(RawJob.country)).filter(
-                RawJob.country.isnot(None),
-                RawJob.job_id.in_(filtered_job_ids)
-            )
-            filtered_countries = [c[0] for c in countries_query.all()]
-
-            portals_query = db.query(distinct(RawJob.portal)).filter(
-                RawJob.portal.isnot(None),
-                RawJob.job_id.in_(filtered_job_ids)
-            )
-            filtered_portals = [p[0] for p in portals_query.all()]
-
-            # Date range from filtered jobs
-            date_stats_query = db.query(
-                func.min(RawJob.posted_date).label('start'),
-                func.max(RawJob.posted_date).label('end')
-            ).filter(RawJob.job_id.in_(filtered_job_ids))
-            date_stats = date_stats_query.first()
-        else:
-            filtered_countries = []
-            filtered_portals = []
-            date_stats = None
+        # Pipeline B counts with filters
+        pipeline_b = await _profile_totals(db, 'enhanced', job_status=job_status, **skill_filters)
+        pipeline_b_total = pipeline_b['mentions']
+        pipeline_b_jobs = pipeline_b['jobs']
+        pipeline_b_gemma = pipeline_b['by_method'].get(GEMMA_MODEL, 0)
 
         return {
             "filters": {
@@ -486,8 +275,8 @@ def get_filtered_stats(
             "countries": sorted(filtered_countries),
             "portals": sorted(filtered_portals),
             "date_range": {
-                "start": date_stats.start if date_stats else None,
-                "end": date_stats.end if date_stats else None
+                "start": job_result.date_start,
+                "end": job_result.date_end
             }
         }
 
@@ -496,13 +285,14 @@ def get_filtered_stats(
         raise HTTPException(status_code=500, detail=f"Error retrieving filtered statistics: {str(e)}")
 
 
-@router.get("/stats/by-country")
-def get_stats_by_country(
+@router.get("/stats/by-country", response_class=FastJSONResponse)
+@cached_response("stats/by-country", invalidate_on=DATA_EVENTS)
+async def get_stats_by_country(
     extraction_method: Optional[str] = Query(None, description="Filter by extraction method"),
     job_status: Optional[str] = Query(None, description="Filter by job status"),
     mapping_status: Optional[str] = Query(None, description="Filter by mapping status"),
     skill_type: Optional[str] = Query(None, description="Filter by skill type (hard, soft)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Get statistics broken down by country with optional filters.
@@ -511,137 +301,45 @@ def get_stats_by_country(
         Dictionary with per-country stats
     """
     try:
-        countries = ['AR', 'CO', 'MX']
-        country_stats = {}
+        source, methods = resolve_extraction_method(extraction_method)
 
-        for country_code in countries:
-            # Build jobs query with filters
-            jobs_query = db.query(RawJob).filter(RawJob.country == country_code)
-
-            # Apply job_status filter
-            if job_status == "cleaned":
-                jobs_query = jobs_query.filter(exists().where(CleanedJob.job_id == RawJob.job_id))
-            elif job_status == "golden":
-                gold_job_ids = db.execute(text("SELECT DISTINCT job_id FROM gold_standard_annotations")).fetchall()
-                gold_ids = [row[0] for row in gold_job_ids]
-                jobs_query = jobs_query.filter(RawJob.job_id.in_(gold_ids))
-
-            # Apply extraction_method filter to jobs (only jobs with skills from that method)
-            if extraction_method:
-                if extraction_method == "manual":
-                    method_job_ids_query = db.execute(text("SELECT DISTINCT job_id FROM gold_standard_annotations WHERE job_id IN (SELECT job_id FROM raw_jobs WHERE country = :country)"), {"country": country_code})
-                    method_job_ids = [row[0] for row in method_job_ids_query.fetchall()]
-                    jobs_query = jobs_query.filter(RawJob.job_id.in_(method_job_ids)) if method_job_ids else jobs_query.filter(RawJob.job_id.in_([]))
-                elif extraction_method == "pipeline_b":
-                    method_job_ids_query = db.execute(text("SELECT DISTINCT job_id FROM enhanced_skills WHERE job_id IN (SELECT job_id FROM raw_jobs WHERE country = :country)"), {"country": country_code})
-                    method_job_ids = [row[0] for row in method_job_ids_query.fetchall()]
-                    jobs_query = jobs_query.filter(RawJob.job_id.in_(method_job_ids)) if method_job_ids else jobs_query.filter(RawJob.job_id.in_([]))
-                elif extraction_method in ["ner", "regex", "pipeline_a"]:
-                    if extraction_method == "ner":
-                        method_job_ids = db.query(distinct(ExtractedSkill.job_id)).join(RawJob, ExtractedSkill.job_id == RawJob.job_id).filter(RawJob.country == country_code, ExtractedSkill.extraction_method == 'ner').all()
-                    elif extraction_method == "regex":
-                        method_job_ids = db.query(distinct(ExtractedSkill.job_id)).join(RawJob, ExtractedSkill.job_id == RawJob.job_id).filter(RawJob.country == country_code, ExtractedSkill.extraction_method == 'regex').all()
-                    elif extraction_method == "pipeline_a":
-                        method_job_ids = db.query(distinct(ExtractedSkill.job_id)).join(RawJob, ExtractedSkill.job_id == RawJob.job_id).filter(RawJob.country == country_code, ExtractedSkill.extraction_method.in_(['ner', 'regex'])).all()
-                    method_ids = [row[0] for row in method_job_ids]
-                    jobs_query = jobs_query.filter(RawJob.job_id.in_(method_ids)) if method_ids else jobs_query.filter(RawJob.job_id.in_([]))
-
-            total_jobs = jobs_query.count()
-
-            # Query skills from the appropriate table based on extraction_method
-            if extraction_method == "manual":
-                # Use gold_standard_annotations
-                skill_conditions = ["rj.country = :country"]
-                skill_params = {"country": country_code}
-
-                if skill_type and skill_type.lower() in ['hard', 'soft']:
-                    skill_conditions.append("gsa.skill_type = :skill_type")
-                    skill_params["skill_type"] = skill_type.lower()
-
-                if mapping_status:
-                    if mapping_status == "esco_mapped":
-                        skill_conditions.append("gsa.esco_concept_uri IS NOT NULL")
-                    elif mapping_status == "unmapped":
-                        skill_conditions.append("gsa.esco_concept_uri IS NULL")
-
-                skill_query_str = f"SELECT COUNT(*) as total, COUNT(DISTINCT skill_text) as unique_skills FROM gold_standard_annotations gsa JOIN raw_jobs rj ON gsa.job_id = rj.job_id WHERE {' AND '.join(skill_conditions)}"
-                skill_result = db.execute(text(skill_query_str), skill_params).fetchone()
-                total_skills = skill_result.total if skill_result else 0
-                unique_skills_count = skill_result.unique_skills if skill_result else 0
-
-            elif extraction_method == "pipeline_b":
-                # Use enhanced_skills
-                skill_conditions = ["rj.country = :country"]
-                skill_params = {"country": country_code}
-
-                if skill_type and skill_type.lower() in ['hard', 'soft']:
-                    skill_conditions.append("es.skill_type = :skill_type")
-                    skill_params["skill_type"] = skill_type.lower()
-
-                if mapping_status:
-                    if mapping_status == "esco_mapped":
-                        skill_conditions.append("es.esco_concept_uri IS NOT NULL")
-                    elif mapping_status == "unmapped":
-                        skill_conditions.append("es.esco_concept_uri IS NULL")
-
-                skill_query_str = f"SELECT COUNT(*) as total, COUNT(DISTINCT normalized_skill) as unique_skills FROM enhanced_skills es JOIN raw_jobs rj ON es.job_id = rj.job_id WHERE {' AND '.join(skill_conditions)}"
-                skill_result = db.execute(text(skill_query_str), skill_params).fetchone()
-                total_skills = skill_result.total if skill_result else 0
-                unique_skills_count = skill_result.unique_skills if skill_result else 0
-
-            else:
-                # Use extracted_skills (default for pipeline_a, ner, regex, or no filter)
-                skills_query = db.query(ExtractedSkill).join(RawJob, ExtractedSkill.job_id == RawJob.job_id).filter(RawJob.country == country_code)
-
-                # Apply extraction_method filter
-                if extraction_method:
-                    if extraction_method == "ner":
-                        skills_query = skills_query.filter(ExtractedSkill.extraction_method == 'ner')
-                    elif extraction_method == "regex":
-                        skills_query = skills_query.filter(ExtractedSkill.extraction_method == 'regex')
-                    elif extraction_method == "pipeline_a":
-                        skills_query = skills_query.filter(ExtractedSkill.extraction_method.in_(['ner', 'regex']))
-
-                # Apply skill_type filter
-                if skill_type and skill_type.lower() in ['hard', 'soft']:
-                    skills_query = skills_query.filter(ExtractedSkill.skill_type == skill_type.lower())
-
-                # Apply mapping_status filter
-                if mapping_status:
-                    if mapping_status == "esco_mapped":
-                        skills_query = skills_query.filter(ExtractedSkill.esco_uri.isnot(None))
-                    elif mapping_status == "unmapped":
-                        skills_query = skills_query.filter(ExtractedSkill.esco_uri.is_(None))
-
-                total_skills = skills_query.count()
-
-                # Get unique skills count
-                unique_skills = db.query(func.count(distinct(ExtractedSkill.skill_text))).select_from(ExtractedSkill).join(RawJob, ExtractedSkill.job_id == RawJob.job_id).filter(RawJob.country == country_code)
-
-                if extraction_method:
-                    if extraction_method == "ner":
-                        unique_skills = unique_skills.filter(ExtractedSkill.extraction_method == 'ner')
-                    elif extraction_method == "regex":
-                        unique_skills = unique_skills.filter(ExtractedSkill.extraction_method == 'regex')
-                    elif extraction_method == "pipeline_a":
-                        unique_skills = unique_skills.filter(ExtractedSkill.extraction_method.in_(['ner', 'regex']))
-
-                if skill_type and skill_type.lower() in ['hard', 'soft']:
-                    unique_skills = unique_skills.filter(ExtractedSkill.skill_type == skill_type.lower())
-
-                if mapping_status:
-                    if mapping_status == "esco_mapped":
-                        unique_skills = unique_skills.filter(ExtractedSkill.esco_uri.isnot(None))
-                    elif mapping_status == "unmapped":
-                        unique_skills = unique_skills.filter(ExtractedSkill.esco_uri.is_(None))
-
-                unique_skills_count = unique_skills.scalar() or 0
+        # Jobs per country (only jobs with skills from the method, if given)
+        if extraction_method:
+            where, params = demand_filter(source, methods, job_status=job_status, profile=True)
+            job_rows = (await db.execute(text(f"""
+                SELECT country, COUNT(DISTINCT job_id) AS total
+                FROM job_skill_profile {where}
+                GROUP BY country
+            """), params)).fetchall()
+        else:
+            conditions, params = _raw_job_conditions(None, job_status)
+            job_rows = (await db.execute(text(f"""
+                SELECT rj.country, COUNT(*) AS total
+                FROM raw_jobs rj
+                {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+                GROUP BY rj.country
+            """), params)).fetchall()
+        jobs_by_country = {row.country: int(row.total) for row in job_rows}
+
+        # Skills per country
+        where, params = demand_filter(source, methods, skill_type=skill_type, mapping_status=mapping_status)
+        skills_by_country = {
+            row.country: row
+            for row in (await db.execute(text(f"""
+                SELECT country, SUM(mention_count) AS total, COUNT(DISTINCT skill_text) AS unique_skills
+                FROM skill_demand_counts {where}
+                GROUP BY country
+            """), params)).fetchall()
+        }
 
+        country_stats = {}
+        for country_code in COUNTRIES:
+            skills_row = skills_by_country.get(country_code)
             country_stats[country_code] = {
                 "country": country_code,
-                "total_jobs": total_jobs,
-                "total_skills": total_skills,
-                "unique_skills": unique_skills_count
+                "total_jobs": jobs_by_country.get(country_code, 0),
+                "total_skills": int(skills_row.total) if skills_row else 0,
+                "unique_skills": int(skills_row.unique_skills) if skills_row else 0
             }
 
         return {
@@ -1,9 +1,14 @@
 """
 Temporal Analysis Router - Skill demand evolution over time.
+
+Counts come from the skill_period_counts cube (migration 014, refreshed by
+refresh_skill_period_counts_task) instead of scanning extracted_skills JOIN raw_jobs.
+Quarter bucketing, per-quarter top-N and the heatmap are computed in SQL, so only
+the rows of the response leave the database. Endpoints are async (asyncpg).
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
 from typing import Optional
 from datetime import datetime
 import logging
@@ -12,14 +17,20 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from api.dependencies import get_db
+from api.dependencies import get_async_db
+from api.cache import cached_response, TEMPORAL_EVENTS
+from api.http_cache import FastJSONResponse
 from api.schemas.temporal import QuarterData, TemporalAnalysisResponse
-from database.models import ExtractedSkill, RawJob
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+HEATMAP_MAX_SKILLS = 20
+
+# "2024-Q1" labels, same as get_quarter()
+QUARTER_LABEL = """to_char(DATE_TRUNC('quarter', month_start), 'YYYY-"Q"Q')"""
+
 
 def get_quarter(date):
     """Get quarter from date (Q1, Q2, Q3, Q4)."""
@@ -29,12 +40,27 @@ def get_quarter(date):
     return f"{year}-Q{quarter}"
 
 
-@router.get("/temporal/skills", response_model=TemporalAnalysisResponse)
-def get_temporal_skills(
+def _cube_conditions(country: Optional[str] = None, year: Optional[int] = None):
+    """WHERE conditions + params over skill_period_counts (extracted skills)."""
+    conditions = ["source = 'extracted'"]
+    params = {}
+    if country:
+        conditions.append("country = :country")
+        params["country"] = country.upper()
+    if year:
+        # Range on month_start (indexable), not EXTRACT(year ...)
+        conditions.append("month_start >= make_date(:year, 1, 1) AND month_start < make_date(:year + 1, 1, 1)")
+        params["year"] = year
+    return conditions, params
+
+
+@router.get("/temporal/skills", response_model=TemporalAnalysisResponse, response_class=FastJSONResponse)
+@cached_response("temporal/skills", invalidate_on=TEMPORAL_EVENTS)
+async def get_temporal_skills(
     country: Optional[str] = Query(None, description="Filter by country"),
     year: Optional[int] = Query(None, description="Filter by year"),
     top_n: int = Query(10, ge=1, le=50, description="Top N skills per quarter"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> TemporalAnalysisResponse:
     """
     Get temporal evolution of skill demand by quarter.
@@ -48,86 +74,62 @@ def get_temporal_skills(
         Quarterly skill evolution data
     """
     try:
-        # Build query
-        query = db.query(
-            RawJob.posted_date,
-            ExtractedSkill.skill_text,
-            func.count(ExtractedSkill.skill_text).label('count')
-        ).join(
-            ExtractedSkill, RawJob.job_id == ExtractedSkill.job_id
-        ).filter(
-            RawJob.posted_date.isnot(None)
-        )
-
-        # Apply filters
-        if country:
-            query = query.filter(RawJob.country == country.upper())
-
-        if year:
-            query = query.filter(extract('year', RawJob.posted_date) == year)
-
-        # Group by date and skill
-        results = query.group_by(
-            RawJob.posted_date,
-            ExtractedSkill.skill_text
-        ).all()
-
-        # Process by quarter
-        quarterly_data = {}
-        skill_totals = {}  # For heatmap
-
-        for row in results:
-            quarter = get_quarter(row.posted_date)
-            skill = row.skill_text
-            count = row.count
-
-            # Group by quarter
-            if quarter not in quarterly_data:
-                quarterly_data[quarter] = {}
-
-            if skill not in quarterly_data[quarter]:
-                quarterly_data[quarter][skill] = 0
-
-            quarterly_data[quarter][skill] += count
-
-            # Track totals for heatmap
-            if skill not in skill_totals:
-                skill_totals[skill] = {}
-            if quarter not in skill_totals[skill]:
-                skill_totals[skill][quarter] = 0
-            skill_totals[skill][quarter] += count
-
-        # Build response
-        quarters = []
-        for quarter in sorted(quarterly_data.keys()):
-            # Get top N skills for this quarter
-            top_skills = sorted(
-                quarterly_data[quarter].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:top_n]
-
-            quarters.append(QuarterData(
-                quarter=quarter,
-                top_skills=[{"skill": s, "count": c} for s, c in top_skills]
-            ))
-
-        # Build heatmap data (skill x quarter matrix)
-        # Get top skills overall
-        overall_top_skills = set()
-        for quarter_skills in quarterly_data.values():
-            top_in_quarter = sorted(
-                quarter_skills.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:top_n]
-            overall_top_skills.update([s for s, _ in top_in_quarter])
-
+        conditions, params = _cube_conditions(country, year)
+        params.update({"top_n": top_n, "heatmap_skills": HEATMAP_MAX_SKILLS})
+
+        # One statement: quarterly totals → per-quarter ranks → top-N rows plus
+        # the heatmap cells of the (at most 20) skills that reach any top-N
+        rows = (await db.execute(text(f"""
+            WITH quarterly AS (
+                SELECT {QUARTER_LABEL} AS quarter, skill_text, SUM(mention_count)::bigint AS count
+                FROM skill_period_counts
+                WHERE {' AND '.join(conditions)}
+                GROUP BY 1, 2
+            ),
+            ranked AS (
+                SELECT quarter, skill_text, count,
+                       ROW_NUMBER() OVER (PARTITION BY quarter ORDER BY count DESC, skill_text) AS rank
+                FROM quarterly
+            ),
+            heatmap_skills AS (
+                SELECT skill_text, ROW_NUMBER() OVER (ORDER BY MIN(rank), SUM(count) DESC, skill_text) AS position
+                FROM ranked
+                WHERE rank <= :top_n
+                GROUP BY skill_text
+                ORDER BY position
+                LIMIT :heatmap_skills
+            )
+            SELECT 'top' AS kind, quarter, skill_text, count, rank AS position
+            FROM ranked
+            WHERE rank <= :top_n
+            UNION ALL
+            SELECT 'heatmap', q.quarter, q.skill_text, q.count, h.position
+            FROM quarterly q
+            JOIN heatmap_skills h USING (skill_text)
+            ORDER BY kind DESC, quarter, position
+        """), params)).fetchall()
+
+        # Build response (rows arrive sorted by quarter and rank)
+        quarterly_top = {}
+        heatmap = {}
+        for row in rows:
+            if row.kind == 'top':
+                quarterly_top.setdefault(row.quarter, []).append({"skill": row.skill_text, "count": int(row.count)})
+            else:
+                heatmap.setdefault((row.position, row.skill_text), {})[row.quarter] = int(row.count)
+
+        quarter_labels = list(quarterly_top)
+        quarters = [
+            QuarterData(quarter=quarter, top_skills=top_skills)
+            for quarter, top_skills in quarterly_top.items()
+        ]
+
+        # Heatmap data (skill x quarter matrix, 0 where the skill had no mentions)
         heatmap_data = []
-        for skill in list(overall_top_skills)[:20]:  # Limit to 20 skills for heatmap
+        for (_, skill), counts in sorted(heatmap.items()):
             row = {"skill": skill}
-            for quarter in sorted(quarterly_data.keys()):
-                row[quarter] = quarterly_data[quarter].get(skill, 0)
+            for quarter in quarter_labels:
+                row[quarter] = counts.get(quarter, 0)
             heatmap_data.append(row)
 
         return TemporalAnalysisResponse(
@@ -142,11 +144,13 @@ def get_temporal_skills(
         raise HTTPException(status_code=500, detail=f"Error analyzing temporal data: {str(e)}")
 
 
-@router.get("/temporal/trends")
-def get_skill_trends(
+@router.get("/temporal/trends", response_class=FastJSONResponse)
+@cached_response("temporal/trends", invalidate_on=TEMPORAL_EVENTS)
+async def get_skill_trends(
     skill: str = Query(..., min_length=2, description="Skill name to analyze"),
     country: Optional[str] = Query(None, description="Filter by country"),
-    db: Session = Depends(get_db)
+    match: str = Query("contains", pattern="^(contains|exact)$", description="contains (substring) or exact (case-insensitive)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get trend data for a specific skill over time.
@@ -154,40 +158,34 @@ def get_skill_trends(
     Args:
         skill: Skill name (e.g., "Python", "React")
         country: Optional country filter
+        match: Substring match (trigram index, migration 016) or exact name (LOWER(skill_text) index)
 
     Returns:
         Monthly/quarterly counts for the skill
     """
     try:
-        query = db.query(
-            RawJob.posted_date,
-            func.count(ExtractedSkill.skill_text).label('count')
-        ).join(
-            ExtractedSkill, RawJob.job_id == ExtractedSkill.job_id
-        ).filter(
-            ExtractedSkill.skill_text.ilike(f"%{skill}%"),
-            RawJob.posted_date.isnot(None)
-        )
-
-        if country:
-            query = query.filter(RawJob.country == country.upper())
-
-        results = query.group_by(RawJob.posted_date).all()
-
-        # Group by quarter
-        quarterly_counts = {}
-        for row in results:
-            quarter = get_quarter(row.posted_date)
-            if quarter not in quarterly_counts:
-                quarterly_counts[quarter] = 0
-            quarterly_counts[quarter] += row.count
+        conditions, params = _cube_conditions(country)
+        if match == "exact":
+            conditions.append("LOWER(skill_text) = LOWER(:skill)")
+            params["skill"] = skill
+        else:
+            conditions.append("skill_text ILIKE :pattern")
+            params["pattern"] = f"%{skill}%"
+
+        results = (await db.execute(text(f"""
+            SELECT {QUARTER_LABEL} AS quarter, SUM(mention_count)::bigint AS count
+            FROM skill_period_counts
+            WHERE {' AND '.join(conditions)}
+            GROUP BY 1
+            ORDER BY 1
+        """), params)).fetchall()
 
         return {
             "skill": skill,
             "country": country,
             "data": [
-                {"period": q, "count": c}
-                for q, c in sorted(quarterly_counts.items())
+                {"period": row.quarter, "count": int(row.count)}
+                for row in results
             ]
         }
 
@@ -41,6 +41,8 @@ class JobListResponse(BaseModel):
     limit: int
     offset: int
     jobs: List[JobBase]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page (None on the last page)
+    total_is_estimate: bool = False  # Planner estimate; request exact=true for COUNT(*)
 
 
 class ExtractedSkillSchema(BaseModel):
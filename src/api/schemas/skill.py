@@ -21,3 +21,33 @@ class TopSkillsResponse(BaseModel):
     page: Optional[int] = None
     page_size: Optional[int] = None
     total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # /skills/search: pass as ?cursor= for the next page
+    total_is_estimate: Optional[bool] = None  # /skills/search: planner estimate unless exact=true
+
+
+class SimilarSkill(BaseModel):
+    """Nearest neighbour of a skill in embedding space."""
+    skill_text: str
+    similarity: float
+
+
+class SimilarSkillsResponse(BaseModel):
+    """Response for similar skills endpoint."""
+    skill: str
+    source: str  # 'stored' (skill_embeddings) or 'encoded' (model, skill not in table)
+    cached: bool
+    ef_search: int
+    results: List[SimilarSkill]
+
+
+class SkillSuggestion(BaseModel):
+    """Autocomplete suggestion."""
+    skill_text: str
+    count: int
+
+
+class SkillAutocompleteResponse(BaseModel):
+    """Response for skill autocomplete endpoint."""
+    query: str
+    source: str  # extracted, enhanced or gold_standard (skill_demand_counts source)
+    suggestions: List[SkillSuggestion]
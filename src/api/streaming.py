@@ -0,0 +1,212 @@
+"""
+Streaming bulk exports (/api/export/*): NDJSON, CSV or Parquet straight from
+a server-side cursor.
+
+Rows are fetched EXPORT_BATCH_ROWS at a time (asyncpg cursor inside one
+transaction), encoded and sent before the next batch is read, so memory use
+depends on the batch size, not on the size of the export:
+
+    ndjson    one JSON object per line
+    csv       header + rows
+    parquet   one row group per batch (zstd-compressed columns)
+
+NDJSON and CSV are compressed on the fly when the client accepts it
+(Accept-Encoding: zstd, gzip); Parquet is already compressed.
+"""
+
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+import csv
+import io
+import json
+import logging
+import zlib
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import text
+from sqlalchemy.sql import Executable
+
+from config.settings import get_settings
+from api.http_cache import accepted_encodings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+# (column name, Arrow type) of an export, in output order
+Columns = Sequence[Tuple[str, pa.DataType]]
+
+
+def negotiate_encoding(accept_encoding: Optional[str], export_format: str) -> Optional[str]:
+    """Content-Encoding for a response: zstd, gzip or None (identity)."""
+    if export_format == 'parquet':
+        return None
+    accepted = accepted_encodings(accept_encoding)
+    if ZSTD_AVAILABLE and 'zstd' in accepted:
+        return 'zstd'
+    if 'gzip' in accepted or '*' in accepted:
+        return 'gzip'
+    return None
+
+
+def _compressor(encoding: Optional[str]):
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compressobj()
+    if encoding == 'gzip':
+        return zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    return None
+
+
+def _plain(value: Any) -> Any:
+    """JSON/CSV form of a database value."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out what was written since the last take()."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def take(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class RowEncoder:
+    """Encodes batches of rows in one export format."""
+
+    def __init__(self, export_format: str, columns: Columns):
+        self.format = export_format
+        self.columns = list(columns)
+        self.names = [name for name, _ in self.columns]
+        self._started = False
+        if export_format == 'parquet':
+            self._sink = _ChunkSink()
+            self._schema = pa.schema(self.columns)
+            self._writer = pq.ParquetWriter(self._sink, self._schema, compression='zstd')
+
+    def encode(self, rows: List[Sequence[Any]]) -> bytes:
+        if self.format == 'ndjson':
+            return self._ndjson(rows)
+        if self.format == 'csv':
+            return self._csv(rows)
+        return self._parquet(rows)
+
+    def finish(self) -> bytes:
+        """Trailing bytes (CSV header of an empty export, Parquet footer)."""
+        if self.format == 'parquet':
+            self._writer.close()
+            return self._sink.take()
+        if self.format == 'csv' and not self._started:
+            return self._csv([])
+        return b''
+
+    def _ndjson(self, rows) -> bytes:
+        if ORJSON_AVAILABLE:
+            return b''.join(
+                orjson.dumps(dict(zip(self.names, row)), default=str) + b'\n' for row in rows
+            )
+        return ''.join(
+            json.dumps({name: _plain(value) for name, value in zip(self.names, row)},
+                       ensure_ascii=False, default=str) + '\n'
+            for row in rows
+        ).encode('utf-8')
+
+    def _csv(self, rows) -> bytes:
+        out = io.StringIO()
+        writer = csv.writer(out)
+        if not self._started:
+            writer.writerow(self.names)
+            self._started = True
+        writer.writerows([_plain(value) for value in row] for row in rows)
+        return out.getvalue().encode('utf-8')
+
+    def _parquet(self, rows) -> bytes:
+        arrays = []
+        for i, (_, column_type) in enumerate(self.columns):
+            values = [row[i] for row in rows]
+            if pa.types.is_string(column_type):
+                values = [str(v) if isinstance(v, UUID) else v for v in values]
+            arrays.append(pa.array(values, type=column_type))
+        self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self._schema))
+        return self._sink.take()
+
+
+async def stream_rows(
+    statement: Union[str, Executable],
+    params: Optional[Dict[str, Any]],
+    columns: Columns,
+    export_format: str,
+    encoding: Optional[str] = None
+) -> AsyncIterator[bytes]:
+    """
+    Run ``statement`` (SQL text or a select) on a server-side cursor and
+    yield the encoded, optionally compressed, export.
+
+    Opens its own session: the response body is produced after the endpoint
+    (and its dependencies) has returned.
+    """
+    from api.dependencies import async_db
+
+    settings = get_settings()
+    encoder = RowEncoder(export_format, columns)
+    compressor = _compressor(encoding)
+    exported = 0
+
+    def out(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor and data else data
+
+    async with async_db.session() as session:
+        # One long statement: the API statement_timeout is meant for dashboard queries
+        await session.execute(text(f"SET LOCAL statement_timeout = {int(settings.export_statement_timeout_ms)}"))
+        if isinstance(statement, str):
+            statement = text(statement)
+        result = await session.stream(statement, params or {})
+        async for batch in result.partitions(settings.export_batch_rows):
+            exported += len(batch)
+            chunk = out(encoder.encode(batch))
+            if chunk:
+                yield chunk
+
+    tail = out(encoder.finish())
+    if compressor:
+        tail += compressor.flush()
+    if tail:
+        yield tail
+    logger.info(f"Exported {exported:,} rows as {export_format}" + (f" ({encoding})" if encoding else ""))
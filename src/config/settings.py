@@ -8,6 +8,11 @@ class Settings(BaseSettings):
     # Database
     database_url: str = Field(..., env='DATABASE_URL')
     database_pool_size: int = Field(20, env='DATABASE_POOL_SIZE')
+    # Async API path (asyncpg; stats/skills/jobs/temporal routers)
+    database_async_pool_size: int = Field(20, env='DATABASE_ASYNC_POOL_SIZE')
+    database_async_max_overflow: int = Field(10, env='DATABASE_ASYNC_MAX_OVERFLOW')
+    database_pool_timeout: float = Field(10.0, env='DATABASE_POOL_TIMEOUT')  # Seconds waiting for a free connection
+    database_statement_timeout_ms: int = Field(15000, env='DATABASE_STATEMENT_TIMEOUT_MS')  # Per API statement, 0 = none
     
     # Scraping
     scraper_user_agent: str = Field(..., env='SCRAPER_USER_AGENT')
@@ -54,12 +59,53 @@ class Settings(BaseSettings):
     embedding_model: str = Field('intfloat/multilingual-e5-base', env='EMBEDDING_MODEL')
     embedding_batch_size: int = Field(32, env='EMBEDDING_BATCH_SIZE')
     embedding_cache_dir: str = Field('./data/cache/embeddings', env='EMBEDDING_CACHE_DIR')
+    embedding_snapshot_dir: str = Field('./data/snapshots/embeddings', env='EMBEDDING_SNAPSHOT_DIR')
+    embedding_compact_method: str = Field('pca', env='EMBEDDING_COMPACT_METHOD')  # pca, truncate
+    embedding_compact_dim: int = Field(256, env='EMBEDDING_COMPACT_DIM')
+    embedding_projection_path: str = Field('./data/embeddings/compact_projection.npz', env='EMBEDDING_PROJECTION_PATH')
+
+    # Vector search (pgvector HNSW, migration 011)
+    hnsw_ef_search: int = Field(40, env='HNSW_EF_SEARCH')  # Higher = better recall, slower queries
+    query_embedding_cache_size: int = Field(2048, env='QUERY_EMBEDDING_CACHE_SIZE')
+
+    # API response cache (stats/skills/temporal endpoints, invalidated by pipeline events)
+    api_cache_enabled: bool = Field(True, env='API_CACHE_ENABLED')
+    api_cache_ttl_seconds: int = Field(600, env='API_CACHE_TTL_SECONDS')  # Fresh without an invalidating event
+    api_cache_max_stale_seconds: int = Field(3600, env='API_CACHE_MAX_STALE_SECONDS')  # Served stale while refreshing
+    api_cache_max_entries: int = Field(512, env='API_CACHE_MAX_ENTRIES')  # In-process LRU size
+    api_cache_redis: bool = Field(False, env='API_CACHE_REDIS')  # Share entries across API workers (Redis DB 3)
+    api_compression_min_bytes: int = Field(1024, env='API_COMPRESSION_MIN_BYTES')  # Smaller responses are sent as is
+    skill_autocomplete_max_age_seconds: int = Field(3600, env='SKILL_AUTOCOMPLETE_MAX_AGE_SECONDS')  # Prefix index rebuild without events
+    export_batch_rows: int = Field(5000, env='EXPORT_BATCH_ROWS')  # Rows per cursor fetch in /api/export/*
+    export_statement_timeout_ms: int = Field(0, env='EXPORT_STATEMENT_TIMEOUT_MS')  # Per export statement, 0 = none
+
+    # ESCO catalog (migration 013)
+    ner_cache_dir: str = Field('./data/cache/ner', env='NER_CACHE_DIR')  # EntityRuler skills, keyed by catalog checksum
     
     # Analysis
     cluster_min_size: int = Field(5, env='CLUSTER_MIN_SIZE')
     cluster_min_samples: int = Field(3, env='CLUSTER_MIN_SAMPLES')
     umap_n_neighbors: int = Field(15, env='UMAP_N_NEIGHBORS')
     umap_min_dist: float = Field(0.1, env='UMAP_MIN_DIST')
+    cluster_silhouette_method: str = Field('auto', env='CLUSTER_SILHOUETTE_METHOD')  # auto, exact, chunked, sampled, none
+    cluster_silhouette_sample_size: int = Field(10000, env='CLUSTER_SILHOUETTE_SAMPLE_SIZE')
+    cluster_mode: str = Field('exact', env='CLUSTER_MODE')  # exact (UMAP+HDBSCAN on every skill) or microcluster (needs a snapshot)
+    cluster_micro_method: str = Field('minibatch_kmeans', env='CLUSTER_MICRO_METHOD')  # minibatch_kmeans or birch
+    cluster_micro_clusters: int = Field(0, env='CLUSTER_MICRO_CLUSTERS')  # 0 = ~n/50, capped at 10k
+    cluster_micro_batch_size: int = Field(65536, env='CLUSTER_MICRO_BATCH_SIZE')  # Rows streamed from the snapshot per step
+    knn_cache_dir: str = Field('./data/cache/knn', env='KNN_CACHE_DIR')  # Shared kNN graphs for parameter sweeps
+    cluster_model_dir: str = Field('./data/models/clustering', env='CLUSTER_MODEL_DIR')
+    cluster_artifact_dir: str = Field('./outputs/clustering/artifacts', env='CLUSTER_ARTIFACT_DIR')  # npy coordinates per run
+    cluster_refit_noise_ratio: float = Field(0.35, env='CLUSTER_REFIT_NOISE_RATIO')  # Max noise share among new skills
+    cluster_refit_drift: float = Field(0.05, env='CLUSTER_REFIT_DRIFT')  # Max cosine distance between mean embeddings
+    cluster_refit_new_fraction: float = Field(0.25, env='CLUSTER_REFIT_NEW_FRACTION')  # Max new skills vs fit size
+    cluster_stability_replicates: int = Field(20, env='CLUSTER_STABILITY_REPLICATES')
+    cluster_stability_workers: int = Field(0, env='CLUSTER_STABILITY_WORKERS')  # 0 = all CPU cores
+    cluster_llm_labels: bool = Field(True, env='CLUSTER_LLM_LABELS')  # Falls back to top-skill labels if the LLM is unavailable
+    cluster_label_cache_path: str = Field('./data/cache/cluster_labels.json', env='CLUSTER_LABEL_CACHE_PATH')
+    cluster_label_top_k: int = Field(10, env='CLUSTER_LABEL_TOP_K')  # Top skills in the signature and prompt
+    cluster_label_batch_size: int = Field(20, env='CLUSTER_LABEL_BATCH_SIZE')  # Clusters per prompt
+    cluster_label_reuse_threshold: float = Field(0.6, env='CLUSTER_LABEL_REUSE_THRESHOLD')  # Signature Jaccard to reuse a label
     
     # Output
     output_dir: str = Field('./outputs', env='OUTPUT_DIR')
@@ -0,0 +1,75 @@
+"""
+Async database access for the FastAPI service (SQLAlchemy asyncio + asyncpg).
+
+The dashboard routers (stats, skills, jobs, temporal) await their queries on
+the event loop instead of holding a threadpool thread and a pooled
+connection each for the whole request. Unlike DatabaseOperations, the pool is
+bounded explicitly and every statement carries a server-side timeout, so one
+slow query cannot take the API down:
+
+    pool_size + max_overflow   connections this process may open
+    pool_timeout               seconds a request waits for one before failing
+    statement_timeout          PostgreSQL cancels statements running longer
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+import logging
+import os
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+logger = logging.getLogger(__name__)
+
+ASYNC_DRIVER = 'postgresql+asyncpg'
+
+
+def async_database_url(database_url: str) -> str:
+    """Same database, asyncpg driver (postgresql://, postgresql+psycopg2://, ...)."""
+    url = make_url(database_url)
+    # libpq-only options asyncpg does not understand
+    query = {k: v for k, v in url.query.items() if k not in ('sslmode', 'connect_timeout')}
+    return url.set(drivername=ASYNC_DRIVER, query=query).render_as_string(hide_password=False)
+
+
+class AsyncDatabase:
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        pool_size: int = 20,
+        max_overflow: int = 10,
+        pool_timeout: float = 10.0,
+        statement_timeout_ms: int = 15000,
+        application_name: str = 'labor_observatory_api',
+        search_path: Optional[str] = None
+    ):
+        self.database_url = async_database_url(database_url or os.getenv('DATABASE_URL'))
+        server_settings = {'application_name': application_name}
+        if statement_timeout_ms:
+            server_settings['statement_timeout'] = str(statement_timeout_ms)
+        if search_path:
+            server_settings['search_path'] = search_path
+
+        self.engine = create_async_engine(
+            self.database_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            connect_args={'server_settings': server_settings}
+        )
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Session that is closed (and its connection returned) on exit."""
+        async with self.SessionLocal() as session:
+            yield session
+
+    def pool_status(self) -> str:
+        return self.engine.pool.status()
+
+    async def dispose(self):
+        await self.engine.dispose()
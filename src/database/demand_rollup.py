@@ -0,0 +1,207 @@
+"""
+Skill demand rollups for the /api/skills/* and /api/stats/* endpoints.
+
+Two tables (migration 015), one row set per source:
+
+    skill_demand_counts   skill × skill_type × ESCO URI × country × portal × method
+                          with mention_count and job_count (distinct jobs)
+    job_skill_profile     job × method × skill_type × ESCO-mapped with mention_count,
+                          for "jobs with skills" (COUNT(DISTINCT job_id)) under filters
+
+Sources and what "method" holds:
+
+    extracted       extracted_skills (Pipeline A)        extraction_method (ner, regex)
+    enhanced        enhanced_skills (Pipeline B)         llm_model
+    gold_standard   gold_standard_annotations (manual)   ''
+
+Statement triggers on the three skill tables keep both tables current on every
+insert, update and delete, so nothing here runs on the write path.
+rebuild_demand_rollups() recomputes a source from scratch (backfill after the
+migration, or repair after raw_jobs country/portal edits, which the triggers
+do not follow).
+
+demand_filter() translates the API filters (extraction_method, country,
+skill_type, mapping_status, job_status) into a WHERE clause over either table.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+COUNTS_TABLE = 'skill_demand_counts'
+PROFILE_TABLE = 'job_skill_profile'
+
+SOURCES: Dict[str, Dict[str, str]] = {
+    'extracted': {
+        'table': 'extracted_skills',
+        'skill_text': 's.skill_text',
+        'esco_uri': 's.esco_uri',
+        'method': 's.extraction_method',
+    },
+    'enhanced': {
+        'table': 'enhanced_skills',
+        'skill_text': 's.normalized_skill',
+        'esco_uri': 's.esco_concept_uri',
+        'method': 's.llm_model',
+    },
+    'gold_standard': {
+        'table': 'gold_standard_annotations',
+        'skill_text': 's.skill_text',
+        'esco_uri': 's.esco_concept_uri',
+        'method': "NULL",
+    },
+}
+
+# API extraction_method → (source, methods within it)
+EXTRACTION_METHODS: Dict[Optional[str], Tuple[str, Optional[Tuple[str, ...]]]] = {
+    None: ('extracted', None),
+    'ner': ('extracted', ('ner',)),
+    'regex': ('extracted', ('regex',)),
+    'pipeline_a': ('extracted', ('ner', 'regex')),
+    'pipeline_b': ('enhanced', None),
+    'manual': ('gold_standard', None),
+}
+
+
+def rollups_available(cursor) -> bool:
+    """True if migration 015 is applied (safe to call before it is)."""
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (COUNTS_TABLE,))
+    return bool(cursor.fetchone()[0])
+
+
+def resolve_extraction_method(extraction_method: Optional[str]) -> Tuple[str, Optional[Tuple[str, ...]]]:
+    """Source and method list for an API extraction_method (unknown values: all extracted skills)."""
+    return EXTRACTION_METHODS.get(extraction_method, EXTRACTION_METHODS[None])
+
+
+def demand_filter(
+    source: str,
+    methods: Optional[Iterable[str]] = None,
+    country: Optional[str] = None,
+    skill_type: Optional[str] = None,
+    mapping_status: Optional[str] = None,
+    job_status: Optional[str] = None,
+    profile: bool = False
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    WHERE clause + params (SQLAlchemy ``:name`` style) over skill_demand_counts,
+    or over job_skill_profile with ``profile=True``.
+
+    job_status (cleaned, golden) is a per-job filter, only available on the profile.
+    """
+    table = PROFILE_TABLE if profile else COUNTS_TABLE
+    conditions = [f"{table}.source = :source"]
+    params: Dict[str, Any] = {'source': source}
+
+    if methods:
+        conditions.append(f"{table}.extraction_method = ANY(:methods)")
+        params['methods'] = list(methods)
+    if country:
+        conditions.append(f"{table}.country = :country")
+        params['country'] = country.upper()
+    if skill_type and skill_type.lower() in ['hard', 'soft']:
+        conditions.append(f"{table}.skill_type = :skill_type")
+        params['skill_type'] = skill_type.lower()
+    if mapping_status in ('esco_mapped', 'unmapped'):
+        mapped = f"{table}.has_esco" if profile else f"{table}.esco_uri <> ''"
+        conditions.append(mapped if mapping_status == 'esco_mapped' else f"NOT ({mapped})")
+    if job_status:
+        if not profile:
+            raise ValueError("job_status filters need the job_skill_profile table (profile=True)")
+        if job_status == 'cleaned':
+            conditions.append(f"EXISTS (SELECT 1 FROM cleaned_jobs cj WHERE cj.job_id = {table}.job_id)")
+        elif job_status == 'golden':
+            conditions.append(
+                f"EXISTS (SELECT 1 FROM gold_standard_annotations gsa WHERE gsa.job_id = {table}.job_id)"
+            )
+
+    return "WHERE " + " AND ".join(conditions), params
+
+
+def _rebuild_sql(source: str) -> Tuple[str, str]:
+    spec = SOURCES[source]
+    counts_sql = f"""
+        INSERT INTO {COUNTS_TABLE} (
+            source, skill_text, skill_type, esco_uri, country, portal, extraction_method,
+            mention_count, job_count
+        )
+        SELECT
+            '{source}',
+            {spec['skill_text']},
+            COALESCE(s.skill_type, ''),
+            COALESCE({spec['esco_uri']}, ''),
+            COALESCE(j.country, ''),
+            COALESCE(j.portal, ''),
+            COALESCE({spec['method']}, ''),
+            COUNT(*),
+            COUNT(DISTINCT s.job_id)
+        FROM {spec['table']} s
+        JOIN raw_jobs j ON s.job_id = j.job_id
+        GROUP BY 2, 3, 4, 5, 6, 7
+    """
+    profile_sql = f"""
+        INSERT INTO {PROFILE_TABLE} (
+            job_id, source, extraction_method, skill_type, has_esco, country, portal, mention_count
+        )
+        SELECT
+            s.job_id,
+            '{source}',
+            COALESCE({spec['method']}, ''),
+            COALESCE(s.skill_type, ''),
+            {spec['esco_uri']} IS NOT NULL,
+            COALESCE(j.country, ''),
+            COALESCE(j.portal, ''),
+            COUNT(*)
+        FROM {spec['table']} s
+        JOIN raw_jobs j ON s.job_id = j.job_id
+        GROUP BY 1, 3, 4, 5, 6, 7
+    """
+    return counts_sql, profile_sql
+
+
+def rebuild_source(conn, source: str) -> Dict[str, Any]:
+    """
+    Recompute one source of both rollups and commit.
+
+    Writers to the source table wait for the rebuild (SHARE lock), so no
+    trigger update is lost or counted twice.
+
+    Returns a summary: {'source', 'rows', 'profile_rows', 'seconds'}.
+    """
+    if source not in SOURCES:
+        raise ValueError(f"Unknown source '{source}'. Use one of {tuple(SOURCES)}")
+
+    start = time.time()
+    counts_sql, profile_sql = _rebuild_sql(source)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(f"LOCK TABLE {SOURCES[source]['table']} IN SHARE MODE")
+        cursor.execute(f"DELETE FROM {COUNTS_TABLE} WHERE source = %s", (source,))
+        cursor.execute(f"DELETE FROM {PROFILE_TABLE} WHERE source = %s", (source,))
+        cursor.execute(counts_sql)
+        rows = cursor.rowcount
+        cursor.execute(profile_sql)
+        profile_rows = cursor.rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    seconds = time.time() - start
+    logger.info(f"Demand rollup rebuild [{source}]: {rows} rows, {profile_rows} job profile rows ({seconds:.1f}s)")
+    return {
+        'source': source,
+        'rows': rows,
+        'profile_rows': profile_rows,
+        'seconds': round(seconds, 3)
+    }
+
+
+def rebuild_demand_rollups(conn, sources: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """Rebuild every source (or the given ones); see rebuild_source()."""
+    return [rebuild_source(conn, source) for source in (sources or SOURCES)]
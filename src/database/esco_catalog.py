@@ -0,0 +1,281 @@
+"""
+Staged bulk loading and versioning of the ESCO taxonomy tables.
+
+A load never touches the live table until the very end:
+
+    1. CREATE TABLE <table>_staging (LIKE <table>)      -- no indexes yet
+    2. COPY rows into the staging table                  -- one round trip per batch
+    3. Recreate the live table's constraints/indexes on staging
+    4. In one transaction: re-point foreign keys, rename live → _old,
+       staging → live, drop _old
+
+Readers see either the old or the new catalog, never an empty or half-loaded
+one. Each swap is recorded in esco_catalog_versions (migration 013) with a
+content checksum that consumers compare against their caches.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import csv
+import io
+import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSIONS_TABLE = 'esco_catalog_versions'
+
+# Columns hashed for the catalog checksum (what consumers actually read)
+CHECKSUM_COLUMNS = (
+    'skill_uri', 'preferred_label_es', 'preferred_label_en',
+    'skill_type', 'skill_group', 'is_active'
+)
+
+
+def get_current_catalog_version(cursor) -> Optional[Dict[str, Any]]:
+    """
+    Return the latest catalog version, or None if none was recorded.
+
+    Safe to call before migration 013 is applied (returns None).
+    """
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (CATALOG_VERSIONS_TABLE,))
+    if not cursor.fetchone()[0]:
+        return None
+
+    cursor.execute(f"""
+        SELECT version_id, checksum, loaded_at
+        FROM {CATALOG_VERSIONS_TABLE}
+        ORDER BY version_id DESC
+        LIMIT 1
+    """)
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return {'version_id': row[0], 'checksum': row[1], 'loaded_at': row[2]}
+
+
+def table_checksum(cursor, table: str = 'esco_skills') -> str:
+    """md5 over the consumer-visible columns of a taxonomy table, ordered by URI."""
+    row_expr = " || '|' || ".join(f"COALESCE({col}::text, '')" for col in CHECKSUM_COLUMNS)
+    cursor.execute(f"SELECT md5(COALESCE(string_agg({row_expr}, E'\\n' ORDER BY skill_uri), '')) FROM {table}")
+    return cursor.fetchone()[0]
+
+
+def record_catalog_version(cursor, checksum: str, row_counts: Dict[str, int],
+                           source_files: Dict[str, str], load_seconds: float) -> int:
+    """Insert a catalog version row and return its id."""
+    cursor.execute(f"""
+        INSERT INTO {CATALOG_VERSIONS_TABLE} (checksum, row_counts, source_files, load_seconds)
+        VALUES (%s, %s, %s, %s)
+        RETURNING version_id
+    """, (checksum, json.dumps(row_counts), json.dumps(source_files), load_seconds))
+    return cursor.fetchone()[0]
+
+
+class StagedTableLoader:
+    """
+    Load a table through a staging copy and swap it in atomically.
+
+    Usage:
+        loader = StagedTableLoader(conn, 'esco_skills', columns)
+        loader.create_staging()
+        loader.copy_rows(rows)
+        loader.build_indexes()
+        loader.swap()          # single transaction
+    """
+
+    def __init__(self, conn, table: str, columns: Sequence[str]):
+        self.conn = conn
+        self.table = table
+        self.staging = f"{table}_staging"
+        self.old = f"{table}_old"
+        self.columns = list(columns)
+        self.rows_loaded = 0
+
+    def create_staging(self) -> None:
+        """Create an empty, index-free copy of the live table."""
+        cursor = self.conn.cursor()
+        cursor.execute(f"DROP TABLE IF EXISTS {self.staging}")
+        cursor.execute(f"CREATE TABLE {self.staging} (LIKE {self.table} INCLUDING DEFAULTS)")
+        self.conn.commit()
+        cursor.close()
+
+    def copy_rows(self, rows: Iterable[Sequence[Any]]) -> int:
+        """COPY rows (tuples in ``columns`` order) into the staging table."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        count = 0
+        for row in rows:
+            writer.writerow(['\\N' if value is None else value for value in row])
+            count += 1
+        buffer.seek(0)
+
+        cursor = self.conn.cursor()
+        cursor.copy_expert(
+            f"COPY {self.staging} ({', '.join(self.columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer
+        )
+        self.conn.commit()
+        cursor.close()
+
+        self.rows_loaded += count
+        return count
+
+    def copy_from_live(self, where: str) -> int:
+        """Carry rows from the live table into staging (e.g. manually curated skills)."""
+        cursor = self.conn.cursor()
+        cursor.execute(f"INSERT INTO {self.staging} SELECT * FROM {self.table} WHERE {where}")
+        count = cursor.rowcount
+        self.conn.commit()
+        cursor.close()
+
+        self.rows_loaded += count
+        return count
+
+    def build_indexes(self) -> int:
+        """Recreate the live table's PK/UNIQUE constraints, indexes and self-references on staging."""
+        cursor = self.conn.cursor()
+
+        cursor.execute("""
+            SELECT conname, pg_get_constraintdef(oid), contype, confrelid = conrelid
+            FROM pg_constraint
+            WHERE conrelid = %s::regclass AND contype IN ('p', 'u', 'f')
+            ORDER BY contype DESC
+        """, (self.table,))
+        constraints = cursor.fetchall()
+        constraint_names = {name for name, _, _, _ in constraints}
+
+        for name, definition, contype, self_reference in constraints:
+            if contype == 'f':
+                if not self_reference:
+                    continue  # outgoing FKs to other tables are not used by the taxonomy tables
+                definition = re.sub(rf"REFERENCES {self.table}\(", f"REFERENCES {self.staging}(", definition)
+            cursor.execute(f"ALTER TABLE {self.staging} ADD CONSTRAINT {name}_staging {definition}")
+
+        cursor.execute("""
+            SELECT indexname, indexdef
+            FROM pg_indexes
+            WHERE schemaname = current_schema() AND tablename = %s
+        """, (self.table,))
+        indexes = [(name, d) for name, d in cursor.fetchall() if name not in constraint_names]
+
+        for name, definition in indexes:
+            definition = re.sub(rf"INDEX {re.escape(name)} ON ", f"INDEX {name}_staging ON ", definition)
+            definition = re.sub(rf" ON (\S+\.)?{self.table} ", f" ON {self.staging} ", definition)
+            cursor.execute(definition)
+
+        cursor.execute(f"ANALYZE {self.staging}")
+        self.conn.commit()
+        cursor.close()
+
+        return len(constraints) + len(indexes)
+
+    def swap(self) -> None:
+        """
+        Replace the live table with staging in a single transaction.
+
+        Foreign keys from other tables are dropped and recreated against the
+        new table; dependent rows that point at removed URIs follow the
+        constraint's ON DELETE rule (CASCADE → delete, SET NULL → null).
+        """
+        cursor = self.conn.cursor()
+
+        try:
+            cursor.execute(f"LOCK TABLE {self.table} IN ACCESS EXCLUSIVE MODE")
+
+            # Foreign keys in other tables referencing the live table
+            cursor.execute("""
+                SELECT c.conrelid::regclass::text, c.conname, pg_get_constraintdef(c.oid),
+                       c.confdeltype, a.attname
+                FROM pg_constraint c
+                JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = c.conkey[1]
+                WHERE c.confrelid = %s::regclass AND c.contype = 'f' AND c.conrelid <> c.confrelid
+            """, (self.table,))
+            dependents = cursor.fetchall()
+
+            for dep_table, name, _, _, _ in dependents:
+                cursor.execute(f"ALTER TABLE {dep_table} DROP CONSTRAINT {name}")
+
+            # Names of live constraints/indexes → free them for the staging objects
+            cursor.execute("""
+                SELECT indexname FROM pg_indexes
+                WHERE schemaname = current_schema() AND tablename = %s
+            """, (self.table,))
+            live_indexes = [row[0] for row in cursor.fetchall()]
+            cursor.execute("""
+                SELECT conname FROM pg_constraint
+                WHERE conrelid = %s::regclass AND contype = 'f'
+            """, (self.table,))
+            live_fks = [row[0] for row in cursor.fetchall()]
+
+            for name in live_indexes:
+                cursor.execute(f"ALTER INDEX {name} RENAME TO {name}_old")
+            for name in live_fks:
+                cursor.execute(f"ALTER TABLE {self.table} RENAME CONSTRAINT {name} TO {name}_old")
+
+            cursor.execute(f"ALTER TABLE {self.table} RENAME TO {self.old}")
+            cursor.execute(f"ALTER TABLE {self.staging} RENAME TO {self.table}")
+
+            cursor.execute("""
+                SELECT indexname FROM pg_indexes
+                WHERE schemaname = current_schema() AND tablename = %s
+            """, (self.table,))
+            for (name,) in cursor.fetchall():
+                if name.endswith('_staging'):
+                    cursor.execute(f"ALTER INDEX {name} RENAME TO {name[:-len('_staging')]}")
+            cursor.execute("""
+                SELECT conname FROM pg_constraint
+                WHERE conrelid = %s::regclass AND contype = 'f'
+            """, (self.table,))
+            for (name,) in cursor.fetchall():
+                if name.endswith('_staging'):
+                    cursor.execute(
+                        f"ALTER TABLE {self.table} RENAME CONSTRAINT {name} TO {name[:-len('_staging')]}"
+                    )
+
+            # Re-point dependents, applying their ON DELETE rule to orphans first
+            for dep_table, name, definition, delete_rule, column in dependents:
+                pk_column = re.search(r"REFERENCES \S+?\((\w+)\)", definition).group(1)
+                orphan_filter = (
+                    f"{column} IS NOT NULL AND NOT EXISTS "
+                    f"(SELECT 1 FROM {self.table} t WHERE t.{pk_column} = {dep_table}.{column})"
+                )
+                if delete_rule == 'c':
+                    cursor.execute(f"DELETE FROM {dep_table} WHERE {orphan_filter}")
+                elif delete_rule == 'n':
+                    cursor.execute(f"UPDATE {dep_table} SET {column} = NULL WHERE {orphan_filter}")
+
+                definition = re.sub(r"REFERENCES \S+?\(", f"REFERENCES {self.table}(", definition)
+                not_valid = '' if delete_rule in ('c', 'n') else ' NOT VALID'
+                cursor.execute(f"ALTER TABLE {dep_table} ADD CONSTRAINT {name} {definition}{not_valid}")
+
+            cursor.execute(f"DROP TABLE {self.old}")
+            self.conn.commit()
+
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        logger.info(f"Swapped {self.staging} → {self.table} ({self.rows_loaded:,} rows)")
+
+    def discard(self) -> None:
+        """Drop the staging table (e.g. after a failed load)."""
+        self.conn.rollback()
+        cursor = self.conn.cursor()
+        cursor.execute(f"DROP TABLE IF EXISTS {self.staging}")
+        self.conn.commit()
+        cursor.close()
+
+
+def unique_by_key(rows: Iterable[Sequence[Any]], key_index: int = 0) -> List[Sequence[Any]]:
+    """Keep the first row per key (same semantics as INSERT ... ON CONFLICT DO NOTHING)."""
+    seen = set()
+    unique = []
+    for row in rows:
+        if row[key_index] in seen:
+            continue
+        seen.add(row[key_index])
+        unique.append(row)
+    return unique
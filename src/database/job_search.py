@@ -0,0 +1,66 @@
+"""
+Full-text job search over cleaned_jobs.search_vector (migration 019).
+
+The document is job_search_vector(title, company, combined_text): unaccented
+Spanish stems plus unaccented exact words, weighted A title, B company,
+C/D body. Queries use websearch_to_tsquery syntax in both configurations:
+
+    python django            both words
+    "analista de datos"      phrase
+    python OR java           either
+    python -junior           exclude
+    desarroll*               prefix (words ending in *)
+
+Results are ranked with ts_rank_cd (title matches first).
+"""
+
+import re
+
+from sqlalchemy import cast, func, literal_column
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, TSQUERY
+
+from database.models import CleanedJob
+
+STEMMED_CONFIG = 'public.spanish_unaccent'
+EXACT_CONFIG = 'public.simple_unaccent'
+
+PREFIX_TERM = re.compile(r'(\w+)\*')
+
+
+def _config(name: str):
+    return literal_column(f"'{name}'::regconfig")
+
+
+def search_tsquery(search: str):
+    """
+    tsquery for a user search string, or None if nothing searchable is left.
+
+    Words ending in * become prefix matches on exact words; everything else
+    goes through websearch_to_tsquery (stemmed OR exact).
+    """
+    parts = []
+    rest = PREFIX_TERM.sub(' ', search).strip()
+    if rest:
+        parts.append(
+            func.websearch_to_tsquery(_config(STEMMED_CONFIG), rest, type_=TSQUERY)
+            .op('||')(func.websearch_to_tsquery(_config(EXACT_CONFIG), rest, type_=TSQUERY))
+        )
+    for term in PREFIX_TERM.findall(search):
+        parts.append(func.to_tsquery(_config(EXACT_CONFIG), f"{term}:*", type_=TSQUERY))
+
+    if not parts:
+        return None
+    query = parts[0]
+    for part in parts[1:]:
+        query = query.op('&&')(part)
+    return query
+
+
+def search_match(tsquery):
+    """WHERE condition: cleaned job matches the tsquery (GIN index)."""
+    return CleanedJob.search_vector.op('@@')(tsquery)
+
+
+def search_rank(tsquery):
+    """Relevance of a cleaned job (float8, so it round-trips through cursors)."""
+    return cast(func.ts_rank_cd(CleanedJob.search_vector, tsquery), DOUBLE_PRECISION)
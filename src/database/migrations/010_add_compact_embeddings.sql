@@ -0,0 +1,31 @@
+-- Migration 010: Add compact (reduced-dimension, half-precision) skill embeddings
+-- Date: 2026-10-19
+-- Purpose: Opt-in compact copy of skill_embeddings.embedding for similarity/clustering.
+--          Vectors are PCA-projected or truncated (see src/embedder/compression.py)
+--          and stored as halfvec (2 bytes per component instead of 4).
+-- Requires: pgvector >= 0.7.0 (halfvec type)
+
+-- Add compact columns (dimension depends on EMBEDDING_COMPACT_DIM, so halfvec is left unconstrained)
+ALTER TABLE skill_embeddings
+ADD COLUMN IF NOT EXISTS embedding_compact halfvec,
+ADD COLUMN IF NOT EXISTS compact_method VARCHAR(20),
+ADD COLUMN IF NOT EXISTS compact_dim INTEGER;
+
+-- Add comments for documentation
+COMMENT ON COLUMN skill_embeddings.embedding_compact IS 'Reduced-dimension, half-precision copy of embedding (L2-normalized). Populated by scripts/compact_skill_embeddings.py';
+COMMENT ON COLUMN skill_embeddings.compact_method IS 'Projection used for embedding_compact: pca or truncate';
+COMMENT ON COLUMN skill_embeddings.compact_dim IS 'Dimension of embedding_compact';
+
+-- Verify columns exist
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'skill_embeddings'
+        AND column_name = 'embedding_compact'
+    ) THEN
+        RAISE EXCEPTION 'Migration 010 failed: embedding_compact column not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 010 completed successfully';
+END $$;
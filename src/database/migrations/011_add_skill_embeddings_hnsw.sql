@@ -0,0 +1,32 @@
+-- Migration 011: Add HNSW index for cosine nearest-neighbour search on skill embeddings
+-- Date: 2026-10-19
+-- Purpose: Serve "similar skills" queries from PostgreSQL (GET /api/skills/{skill}/similar)
+--          instead of the offline FAISS IndexFlatIP only.
+-- Requires: pgvector >= 0.5.0 (HNSW)
+--
+-- Query-time recall/latency trade-off is controlled per transaction with:
+--     SELECT set_config('hnsw.ef_search', '<n>', true);   -- HNSW_EF_SEARCH setting, default 40
+--
+-- Build parameters: m = 16 (graph degree), ef_construction = 64 (pgvector defaults).
+-- Building on ~30k-100k vectors takes seconds to minutes; raise maintenance_work_mem
+-- for larger tables so the graph fits in memory during the build.
+
+CREATE INDEX IF NOT EXISTS idx_skill_embeddings_embedding_hnsw
+ON skill_embeddings USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64);
+
+COMMENT ON INDEX idx_skill_embeddings_embedding_hnsw IS 'HNSW cosine index for similar-skill lookups (ORDER BY embedding <=> query). Tune recall with hnsw.ef_search.';
+
+-- Verify index exists
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE tablename = 'skill_embeddings'
+        AND indexname = 'idx_skill_embeddings_embedding_hnsw'
+    ) THEN
+        RAISE EXCEPTION 'Migration 011 failed: idx_skill_embeddings_embedding_hnsw not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 011 completed successfully';
+END $$;
@@ -0,0 +1,39 @@
+-- Migration 012: Add raw → canonical skill text mapping for embeddings
+-- Date: 2026-10-19
+-- Purpose: Embed each canonical skill form once instead of every raw variant.
+--          "Python", "python", "PYTHON " and "Pythón" all map to canonical_text 'python'
+--          (SkillNormalizer.canonical_key: case, accents, whitespace, punctuation, aliases).
+--
+-- embedding_key is the skill_embeddings.skill_text holding the vector for the raw text:
+--   - canonical_text for new embeddings
+--   - an existing raw-keyed embedding of the same canonical group (legacy rows are reused,
+--     not re-encoded)
+-- Lookup: extracted_skills.skill_text → skill_canonical_map.embedding_key → skill_embeddings
+
+CREATE TABLE IF NOT EXISTS skill_canonical_map (
+    skill_text TEXT PRIMARY KEY,
+    canonical_text TEXT NOT NULL,
+    embedding_key TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_skill_canonical_map_canonical ON skill_canonical_map(canonical_text);
+CREATE INDEX IF NOT EXISTS idx_skill_canonical_map_embedding_key ON skill_canonical_map(embedding_key);
+
+-- Add comments for documentation
+COMMENT ON TABLE skill_canonical_map IS 'Raw skill text → canonical form used as embedding key. Populated by scripts/generate_all_extracted_skills_embeddings.py';
+COMMENT ON COLUMN skill_canonical_map.canonical_text IS 'Lowercase, accent-free, alias-resolved form (SkillNormalizer.canonical_key)';
+COMMENT ON COLUMN skill_canonical_map.embedding_key IS 'skill_embeddings.skill_text that holds the vector for this raw text';
+
+-- Verify table exists
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.tables
+        WHERE table_name = 'skill_canonical_map'
+    ) THEN
+        RAISE EXCEPTION 'Migration 012 failed: skill_canonical_map table not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 012 completed successfully';
+END $$;
@@ -0,0 +1,36 @@
+-- Migration 013: Add ESCO catalog version tracking
+-- Date: 2026-10-19
+-- Purpose: Record every taxonomy load (ESCO collections + O*NET Hot Technologies) with a
+--          content checksum, so consumers (e.g. NERExtractor EntityRuler cache) can detect
+--          whether esco_skills changed without re-reading it.
+--          Rows are written by scripts/load_esco_catalog.py after the staged table swap.
+
+CREATE TABLE IF NOT EXISTS esco_catalog_versions (
+    version_id SERIAL PRIMARY KEY,
+    checksum VARCHAR(64) NOT NULL,
+    row_counts JSONB,
+    source_files JSONB,
+    load_seconds FLOAT,
+    loaded_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_esco_catalog_versions_loaded_at ON esco_catalog_versions(loaded_at DESC);
+
+-- Add comments for documentation
+COMMENT ON TABLE esco_catalog_versions IS 'One row per staged ESCO/O*NET load. The latest row describes the live esco_skills table.';
+COMMENT ON COLUMN esco_catalog_versions.checksum IS 'md5 of esco_skills content (uri, labels, type, group, active) ordered by skill_uri';
+COMMENT ON COLUMN esco_catalog_versions.row_counts IS 'Rows per source: {"esco": n, "onet": n, "manual": n, "skill_groups": n}';
+COMMENT ON COLUMN esco_catalog_versions.source_files IS 'sha256 of each source file used for the load';
+
+-- Verify table exists
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.tables
+        WHERE table_name = 'esco_catalog_versions'
+    ) THEN
+        RAISE EXCEPTION 'Migration 013 failed: esco_catalog_versions table not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 013 completed successfully';
+END $$;
@@ -0,0 +1,69 @@
+-- Migration 014: Add skill × period count cube
+-- Date: 2026-10-19
+-- Purpose: Pre-aggregated mention counts per skill, month, country, portal and extraction
+--          method, so temporal analytics (/api/temporal/*, temporal_clustering_analysis.py,
+--          clustering_esco_30k_final.py) read a small table instead of scanning
+--          extracted_skills JOIN raw_jobs. Quarters are rolled up from months at query time.
+--          Maintained incrementally by src/database/temporal_cube.py: months touched by rows
+--          newer than the stored watermark are recomputed.
+
+CREATE TABLE IF NOT EXISTS skill_period_counts (
+    month_start DATE NOT NULL,
+    skill_text TEXT NOT NULL,
+    skill_type VARCHAR(50) NOT NULL DEFAULT '',
+    country CHAR(2) NOT NULL,
+    portal VARCHAR(50) NOT NULL,
+    source VARCHAR(20) NOT NULL,               -- 'extracted' | 'gold_standard'
+    extraction_method VARCHAR(50) NOT NULL DEFAULT '',
+    has_esco BOOLEAN NOT NULL DEFAULT FALSE,
+    mention_count INTEGER NOT NULL,
+    job_count INTEGER NOT NULL,
+    refreshed_at TIMESTAMP DEFAULT NOW(),
+
+    CONSTRAINT pk_skill_period_counts PRIMARY KEY (
+        month_start, source, skill_text, skill_type, country, portal, extraction_method, has_esco
+    )
+);
+
+CREATE INDEX IF NOT EXISTS idx_skill_period_counts_source_month ON skill_period_counts(source, month_start);
+CREATE INDEX IF NOT EXISTS idx_skill_period_counts_skill_lower ON skill_period_counts(LOWER(skill_text));
+
+-- Incremental refresh looks up rows newer than the watermark
+CREATE INDEX IF NOT EXISTS idx_extracted_skills_extracted_at ON extracted_skills(extracted_at);
+
+CREATE TABLE IF NOT EXISTS skill_period_counts_state (
+    source VARCHAR(20) PRIMARY KEY,
+    watermark TIMESTAMP,
+    last_refresh_at TIMESTAMP,
+    last_refresh_months INTEGER,
+    last_refresh_seconds FLOAT
+);
+
+-- Add comments for documentation
+COMMENT ON TABLE skill_period_counts IS 'Skill mention counts by month × country × portal × extraction method. Rebuilt per month by src/database/temporal_cube.py';
+COMMENT ON COLUMN skill_period_counts.month_start IS 'DATE_TRUNC(''month'', raw_jobs.posted_date)';
+COMMENT ON COLUMN skill_period_counts.source IS 'extracted = extracted_skills (Pipeline A), gold_standard = gold_standard_annotations';
+COMMENT ON COLUMN skill_period_counts.has_esco IS 'extracted_skills.esco_uri IS NOT NULL (always FALSE for gold_standard)';
+COMMENT ON COLUMN skill_period_counts.mention_count IS 'COUNT(*) of skill rows (what the temporal endpoints report)';
+COMMENT ON COLUMN skill_period_counts.job_count IS 'COUNT(DISTINCT job_id)';
+COMMENT ON TABLE skill_period_counts_state IS 'Refresh watermark per source (max extracted_at / annotation_date already aggregated)';
+
+-- Verify tables exist
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.tables
+        WHERE table_name = 'skill_period_counts'
+    ) THEN
+        RAISE EXCEPTION 'Migration 014 failed: skill_period_counts table not created';
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.tables
+        WHERE table_name = 'skill_period_counts_state'
+    ) THEN
+        RAISE EXCEPTION 'Migration 014 failed: skill_period_counts_state table not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 014 completed successfully';
+END $$;
@@ -0,0 +1,278 @@
+-- Migration 015: Add skill demand rollup tables
+-- Date: 2026-10-19
+-- Purpose: Pre-aggregated skill demand for /api/skills/* and /api/stats/*, which used to run
+--          GROUP BY skill_text / COUNT(DISTINCT job_id) over all of extracted_skills,
+--          enhanced_skills and gold_standard_annotations on every request.
+--            skill_demand_counts  skill × skill_type × ESCO URI × country × portal × method
+--            job_skill_profile    job × method × skill_type × ESCO-mapped (distinct job counts)
+--          Both are kept current by statement triggers on the three skill tables, so every
+--          writer (Celery tasks, pipelines, scripts, ON CONFLICT updates) updates them in the
+--          same transaction. Backfill / repair: python src/orchestrator.py rebuild-demand-rollups
+
+CREATE TABLE IF NOT EXISTS skill_demand_counts (
+    source VARCHAR(20) NOT NULL,               -- 'extracted' | 'enhanced' | 'gold_standard'
+    skill_text TEXT NOT NULL,
+    skill_type VARCHAR(50) NOT NULL DEFAULT '',
+    esco_uri TEXT NOT NULL DEFAULT '',
+    country VARCHAR(2) NOT NULL DEFAULT '',
+    portal VARCHAR(50) NOT NULL DEFAULT '',
+    extraction_method VARCHAR(100) NOT NULL DEFAULT '',
+    mention_count INTEGER NOT NULL,
+    job_count INTEGER NOT NULL,
+    refreshed_at TIMESTAMP DEFAULT NOW(),
+
+    CONSTRAINT pk_skill_demand_counts PRIMARY KEY (
+        source, skill_text, skill_type, esco_uri, country, portal, extraction_method
+    )
+);
+
+CREATE INDEX IF NOT EXISTS idx_skill_demand_counts_source_country ON skill_demand_counts(source, country);
+CREATE INDEX IF NOT EXISTS idx_skill_demand_counts_source_method ON skill_demand_counts(source, extraction_method);
+
+CREATE TABLE IF NOT EXISTS job_skill_profile (
+    job_id UUID NOT NULL,
+    source VARCHAR(20) NOT NULL,
+    extraction_method VARCHAR(100) NOT NULL DEFAULT '',
+    skill_type VARCHAR(50) NOT NULL DEFAULT '',
+    has_esco BOOLEAN NOT NULL,
+    country VARCHAR(2) NOT NULL DEFAULT '',
+    portal VARCHAR(50) NOT NULL DEFAULT '',
+    mention_count INTEGER NOT NULL,
+
+    CONSTRAINT pk_job_skill_profile PRIMARY KEY (job_id, source, extraction_method, skill_type, has_esco)
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_skill_profile_source_country ON job_skill_profile(source, country);
+
+-- Skill tables: the triggers recount rows of the same job and skill
+CREATE INDEX IF NOT EXISTS idx_enhanced_skills_job_normalized ON enhanced_skills(job_id, normalized_skill);
+CREATE INDEX IF NOT EXISTS idx_gold_standard_job_skill ON gold_standard_annotations(job_id, skill_text);
+
+-- ---------------------------------------------------------------------------
+-- Statement-level maintenance: each INSERT/UPDATE/DELETE statement on a skill
+-- table passes its transition rows (+1 new, -1 old) to apply_skill_demand_changes,
+-- which recounts only the touched (job, skill) pairs to keep job_count distinct.
+-- ---------------------------------------------------------------------------
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'skill_demand_change') THEN
+        CREATE TYPE skill_demand_change AS (
+            job_id UUID,
+            skill_text TEXT,
+            skill_type VARCHAR,
+            esco_uri TEXT,
+            method VARCHAR,
+            delta INTEGER
+        );
+    END IF;
+END $$;
+
+-- p_count_sql: rows of the source table matching change "c" (after the statement)
+CREATE OR REPLACE FUNCTION apply_skill_demand_changes(
+    p_source VARCHAR,
+    p_changes skill_demand_change[],
+    p_count_sql TEXT
+) RETURNS VOID AS $$
+BEGIN
+    IF p_changes IS NULL OR cardinality(p_changes) = 0 THEN
+        RETURN;
+    END IF;
+
+    EXECUTE format($q$
+        WITH c AS (
+            SELECT job_id, skill_text, skill_type, esco_uri, method, SUM(delta)::int AS delta
+            FROM unnest($1)
+            GROUP BY 1, 2, 3, 4, 5
+        ),
+        d AS (
+            SELECT c.*, n.n_now,
+                   (n.n_now > 0)::int - ((n.n_now - c.delta) > 0)::int AS job_delta,
+                   COALESCE(j.country, '') AS country,
+                   COALESCE(j.portal, '') AS portal
+            FROM c
+            CROSS JOIN LATERAL (%s) AS n(n_now)
+            JOIN raw_jobs j ON j.job_id = c.job_id
+        ),
+        counts AS (
+            INSERT INTO skill_demand_counts AS t (
+                source, skill_text, skill_type, esco_uri, country, portal, extraction_method,
+                mention_count, job_count, refreshed_at
+            )
+            SELECT $2, skill_text, COALESCE(skill_type, ''), COALESCE(esco_uri, ''), country, portal,
+                   COALESCE(method, ''), SUM(delta), SUM(job_delta), NOW()
+            FROM d
+            GROUP BY 2, 3, 4, 5, 6, 7
+            HAVING SUM(delta) <> 0 OR SUM(job_delta) <> 0
+            ON CONFLICT ON CONSTRAINT pk_skill_demand_counts DO UPDATE SET
+                mention_count = t.mention_count + EXCLUDED.mention_count,
+                job_count = t.job_count + EXCLUDED.job_count,
+                refreshed_at = NOW()
+        )
+        INSERT INTO job_skill_profile AS t (
+            job_id, source, extraction_method, skill_type, has_esco, country, portal, mention_count
+        )
+        SELECT job_id, $2, COALESCE(method, ''), COALESCE(skill_type, ''), esco_uri IS NOT NULL,
+               country, portal, SUM(delta)
+        FROM d
+        GROUP BY 1, 3, 4, 5, 6, 7
+        HAVING SUM(delta) <> 0
+        ON CONFLICT ON CONSTRAINT pk_job_skill_profile DO UPDATE SET
+            mention_count = t.mention_count + EXCLUDED.mention_count
+    $q$, p_count_sql) USING p_changes, p_source;
+
+    DELETE FROM skill_demand_counts WHERE mention_count <= 0;
+    DELETE FROM job_skill_profile WHERE mention_count <= 0;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Emptied rows are deleted after every statement; keep finding them cheap
+CREATE INDEX IF NOT EXISTS idx_skill_demand_counts_empty ON skill_demand_counts(source) WHERE mention_count <= 0;
+CREATE INDEX IF NOT EXISTS idx_job_skill_profile_empty ON job_skill_profile(source) WHERE mention_count <= 0;
+
+CREATE OR REPLACE FUNCTION extracted_skills_demand_trigger() RETURNS TRIGGER AS $$
+DECLARE
+    v_changes skill_demand_change[] := '{}';
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        v_changes := v_changes || ARRAY(
+            SELECT ROW(job_id, skill_text, skill_type, esco_uri, extraction_method, 1)::skill_demand_change
+            FROM new_rows
+        );
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        v_changes := v_changes || ARRAY(
+            SELECT ROW(job_id, skill_text, skill_type, esco_uri, extraction_method, -1)::skill_demand_change
+            FROM old_rows
+        );
+    END IF;
+    PERFORM apply_skill_demand_changes('extracted', v_changes, $c$
+        SELECT COUNT(*) FROM extracted_skills s
+        WHERE s.job_id = c.job_id AND s.skill_text = c.skill_text
+          AND s.skill_type IS NOT DISTINCT FROM c.skill_type
+          AND s.esco_uri IS NOT DISTINCT FROM c.esco_uri
+          AND s.extraction_method IS NOT DISTINCT FROM c.method
+    $c$);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION enhanced_skills_demand_trigger() RETURNS TRIGGER AS $$
+DECLARE
+    v_changes skill_demand_change[] := '{}';
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        v_changes := v_changes || ARRAY(
+            SELECT ROW(job_id, normalized_skill, skill_type, esco_concept_uri, llm_model, 1)::skill_demand_change
+            FROM new_rows
+        );
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        v_changes := v_changes || ARRAY(
+            SELECT ROW(job_id, normalized_skill, skill_type, esco_concept_uri, llm_model, -1)::skill_demand_change
+            FROM old_rows
+        );
+    END IF;
+    PERFORM apply_skill_demand_changes('enhanced', v_changes, $c$
+        SELECT COUNT(*) FROM enhanced_skills s
+        WHERE s.job_id = c.job_id AND s.normalized_skill = c.skill_text
+          AND s.skill_type IS NOT DISTINCT FROM c.skill_type
+          AND s.esco_concept_uri IS NOT DISTINCT FROM c.esco_uri
+          AND s.llm_model IS NOT DISTINCT FROM c.method
+    $c$);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION gold_standard_demand_trigger() RETURNS TRIGGER AS $$
+DECLARE
+    v_changes skill_demand_change[] := '{}';
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        v_changes := v_changes || ARRAY(
+            SELECT ROW(job_id, skill_text, skill_type, esco_concept_uri, NULL, 1)::skill_demand_change
+            FROM new_rows
+        );
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        v_changes := v_changes || ARRAY(
+            SELECT ROW(job_id, skill_text, skill_type, esco_concept_uri, NULL, -1)::skill_demand_change
+            FROM old_rows
+        );
+    END IF;
+    PERFORM apply_skill_demand_changes('gold_standard', v_changes, $c$
+        SELECT COUNT(*) FROM gold_standard_annotations s
+        WHERE s.job_id = c.job_id AND s.skill_text = c.skill_text
+          AND s.skill_type IS NOT DISTINCT FROM c.skill_type
+          AND s.esco_concept_uri IS NOT DISTINCT FROM c.esco_uri
+    $c$);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables require one trigger per event
+DROP TRIGGER IF EXISTS trg_extracted_skills_demand_insert ON extracted_skills;
+CREATE TRIGGER trg_extracted_skills_demand_insert AFTER INSERT ON extracted_skills
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION extracted_skills_demand_trigger();
+DROP TRIGGER IF EXISTS trg_extracted_skills_demand_update ON extracted_skills;
+CREATE TRIGGER trg_extracted_skills_demand_update AFTER UPDATE ON extracted_skills
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION extracted_skills_demand_trigger();
+DROP TRIGGER IF EXISTS trg_extracted_skills_demand_delete ON extracted_skills;
+CREATE TRIGGER trg_extracted_skills_demand_delete AFTER DELETE ON extracted_skills
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION extracted_skills_demand_trigger();
+
+DROP TRIGGER IF EXISTS trg_enhanced_skills_demand_insert ON enhanced_skills;
+CREATE TRIGGER trg_enhanced_skills_demand_insert AFTER INSERT ON enhanced_skills
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION enhanced_skills_demand_trigger();
+DROP TRIGGER IF EXISTS trg_enhanced_skills_demand_update ON enhanced_skills;
+CREATE TRIGGER trg_enhanced_skills_demand_update AFTER UPDATE ON enhanced_skills
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION enhanced_skills_demand_trigger();
+DROP TRIGGER IF EXISTS trg_enhanced_skills_demand_delete ON enhanced_skills;
+CREATE TRIGGER trg_enhanced_skills_demand_delete AFTER DELETE ON enhanced_skills
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION enhanced_skills_demand_trigger();
+
+DROP TRIGGER IF EXISTS trg_gold_standard_demand_insert ON gold_standard_annotations;
+CREATE TRIGGER trg_gold_standard_demand_insert AFTER INSERT ON gold_standard_annotations
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION gold_standard_demand_trigger();
+DROP TRIGGER IF EXISTS trg_gold_standard_demand_update ON gold_standard_annotations;
+CREATE TRIGGER trg_gold_standard_demand_update AFTER UPDATE ON gold_standard_annotations
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION gold_standard_demand_trigger();
+DROP TRIGGER IF EXISTS trg_gold_standard_demand_delete ON gold_standard_annotations;
+CREATE TRIGGER trg_gold_standard_demand_delete AFTER DELETE ON gold_standard_annotations
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION gold_standard_demand_trigger();
+
+-- Add comments for documentation
+COMMENT ON TABLE skill_demand_counts IS 'Skill mentions by skill × type × ESCO URI × country × portal × method. Trigger-maintained (migration 015), rebuilt by src/database/demand_rollup.py';
+COMMENT ON COLUMN skill_demand_counts.skill_text IS 'extracted_skills.skill_text, enhanced_skills.normalized_skill or gold_standard_annotations.skill_text';
+COMMENT ON COLUMN skill_demand_counts.esco_uri IS 'ESCO URI, '''' when unmapped';
+COMMENT ON COLUMN skill_demand_counts.extraction_method IS 'extracted: ner/regex, enhanced: llm_model, gold_standard: ''''';
+COMMENT ON COLUMN skill_demand_counts.job_count IS 'COUNT(DISTINCT job_id) of the row';
+COMMENT ON TABLE job_skill_profile IS 'Skill mentions per job × method × type × ESCO-mapped; COUNT(DISTINCT job_id) over it answers "jobs with skills" under any filter';
+
+-- Verify tables exist
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.tables
+        WHERE table_name = 'skill_demand_counts'
+    ) THEN
+        RAISE EXCEPTION 'Migration 015 failed: skill_demand_counts table not created';
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.tables
+        WHERE table_name = 'job_skill_profile'
+    ) THEN
+        RAISE EXCEPTION 'Migration 015 failed: job_skill_profile table not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 015 completed successfully';
+END $$;
@@ -0,0 +1,27 @@
+-- Migration 016: Add trigram index for substring skill lookups on the period cube
+-- Date: 2026-10-19
+-- Purpose: /api/temporal/trends?match=contains filters skill_period_counts with
+--          skill_text ILIKE '%skill%', which a btree cannot serve. A pg_trgm GIN index
+--          turns it into an index scan. match=exact uses idx_skill_period_counts_skill_lower
+--          (migration 014).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_skill_period_counts_skill_trgm
+    ON skill_period_counts USING gin (skill_text gin_trgm_ops);
+
+-- Add comments for documentation
+COMMENT ON INDEX idx_skill_period_counts_skill_trgm IS 'Trigram index for ILIKE substring lookups (/api/temporal/trends)';
+
+-- Verify index exists
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE indexname = 'idx_skill_period_counts_skill_trgm'
+    ) THEN
+        RAISE EXCEPTION 'Migration 016 failed: idx_skill_period_counts_skill_trgm not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 016 completed successfully';
+END $$;
@@ -0,0 +1,42 @@
+-- Migration 017: Add trigram indexes on skill text columns
+-- Date: 2026-10-19
+-- Purpose: Substring skill search (skill_text ILIKE '%q%'), as used by /api/skills/search
+--          on skill_demand_counts and by ad-hoc lookups on the three skill tables, cannot
+--          use a btree. pg_trgm GIN indexes serve ILIKE with any wildcard position.
+--          Prefix type-ahead (/api/skills/autocomplete) does not query the database; it
+--          uses an in-memory index built from skill_demand_counts (src/api/autocomplete.py).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_skill_demand_counts_skill_trgm
+    ON skill_demand_counts USING gin (skill_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_extracted_skills_skill_trgm
+    ON extracted_skills USING gin (skill_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_enhanced_skills_normalized_trgm
+    ON enhanced_skills USING gin (normalized_skill gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_gold_standard_skill_trgm
+    ON gold_standard_annotations USING gin (skill_text gin_trgm_ops);
+
+-- Add comments for documentation
+COMMENT ON INDEX idx_skill_demand_counts_skill_trgm IS 'Trigram index for ILIKE substring search (/api/skills/search)';
+COMMENT ON INDEX idx_extracted_skills_skill_trgm IS 'Trigram index for ILIKE substring search on Pipeline A skills';
+COMMENT ON INDEX idx_enhanced_skills_normalized_trgm IS 'Trigram index for ILIKE substring search on Pipeline B skills';
+COMMENT ON INDEX idx_gold_standard_skill_trgm IS 'Trigram index for ILIKE substring search on gold standard annotations';
+
+-- Verify indexes exist
+DO $$
+BEGIN
+    IF (
+        SELECT COUNT(*) FROM pg_indexes
+        WHERE indexname IN (
+            'idx_skill_demand_counts_skill_trgm',
+            'idx_extracted_skills_skill_trgm',
+            'idx_enhanced_skills_normalized_trgm',
+            'idx_gold_standard_skill_trgm'
+        )
+    ) < 4 THEN
+        RAISE EXCEPTION 'Migration 017 failed: trigram indexes not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 017 completed successfully';
+END $$;
@@ -0,0 +1,25 @@
+-- Migration 018: Add indexes for keyset pagination
+-- Date: 2026-10-19
+-- Purpose: /api/jobs pages with cursors on (scraped_at, job_id) instead of OFFSET
+--          (src/api/pagination.py). A composite index in the same order lets each page
+--          start at the cursor and read only `limit` rows, at any depth.
+--          /api/skills/search cursors sort aggregated rollup rows and need no new index.
+
+CREATE INDEX IF NOT EXISTS idx_raw_jobs_scraped_at_job_id
+    ON raw_jobs (scraped_at DESC, job_id DESC);
+
+-- Add comments for documentation
+COMMENT ON INDEX idx_raw_jobs_scraped_at_job_id IS 'Keyset pagination order of /api/jobs (ORDER BY scraped_at DESC, job_id DESC)';
+
+-- Verify index exists
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE indexname = 'idx_raw_jobs_scraped_at_job_id'
+    ) THEN
+        RAISE EXCEPTION 'Migration 018 failed: idx_raw_jobs_scraped_at_job_id not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 018 completed successfully';
+END $$;
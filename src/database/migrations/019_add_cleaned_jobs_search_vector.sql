@@ -0,0 +1,75 @@
+-- Migration 019: Add full-text search vector to cleaned_jobs
+-- Date: 2026-10-19
+-- Purpose: /api/jobs?search= used ILIKE '%term%' over raw_jobs title/description/company
+--          (sequential scan of the largest text columns). cleaned_jobs gets a weighted,
+--          unaccented tsvector (Spanish stems + simple words) behind a GIN index, searched
+--          with websearch_to_tsquery and ranked with ts_rank_cd (src/database/job_search.py).
+--          scripts/clean_raw_jobs.py fills it when it writes a cleaned job.
+--
+--          Weights: A title, B company, C body (Spanish stems), D body (exact words).
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- Accent-insensitive configurations ("gestión" = "gestion")
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'spanish_unaccent') THEN
+        CREATE TEXT SEARCH CONFIGURATION spanish_unaccent (COPY = spanish);
+        ALTER TEXT SEARCH CONFIGURATION spanish_unaccent
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'simple_unaccent') THEN
+        CREATE TEXT SEARCH CONFIGURATION simple_unaccent (COPY = simple);
+        ALTER TEXT SEARCH CONFIGURATION simple_unaccent
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, simple;
+    END IF;
+END $$;
+
+-- Single definition of the document, shared by the cleaning step and the backfill
+CREATE OR REPLACE FUNCTION job_search_vector(p_title TEXT, p_company TEXT, p_body TEXT)
+RETURNS tsvector AS $$
+    SELECT
+        setweight(to_tsvector('public.spanish_unaccent', COALESCE(p_title, '')), 'A') ||
+        setweight(to_tsvector('public.simple_unaccent', COALESCE(p_title, '')), 'A') ||
+        setweight(to_tsvector('public.simple_unaccent', COALESCE(p_company, '')), 'B') ||
+        setweight(to_tsvector('public.spanish_unaccent', COALESCE(p_body, '')), 'C') ||
+        setweight(to_tsvector('public.simple_unaccent', COALESCE(p_body, '')), 'D')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+ALTER TABLE cleaned_jobs
+ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+-- Backfill jobs cleaned before this migration
+UPDATE cleaned_jobs c
+SET search_vector = job_search_vector(c.title_cleaned, r.company, c.combined_text)
+FROM raw_jobs r
+WHERE r.job_id = c.job_id
+  AND c.search_vector IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_cleaned_jobs_search_vector
+ON cleaned_jobs USING gin(search_vector);
+
+-- Add comments for documentation
+COMMENT ON COLUMN cleaned_jobs.search_vector IS 'job_search_vector(title_cleaned, raw_jobs.company, combined_text), written by clean_raw_jobs.py';
+COMMENT ON FUNCTION job_search_vector(TEXT, TEXT, TEXT) IS 'Weighted unaccented tsvector (A title, B company, C/D body) for /api/jobs?search=';
+
+-- Verify migration
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'cleaned_jobs' AND column_name = 'search_vector'
+    ) THEN
+        RAISE EXCEPTION 'Migration 019 failed: cleaned_jobs.search_vector not created';
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE indexname = 'idx_cleaned_jobs_search_vector'
+    ) THEN
+        RAISE EXCEPTION 'Migration 019 failed: idx_cleaned_jobs_search_vector not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 019 completed successfully';
+END $$;
@@ -1,9 +1,9 @@
 from sqlalchemy import Column, String, Text, Boolean, Float, Integer, DateTime, Date, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import Vector, HALFVEC
 import uuid
 
 Base = declarative_base()
@@ -52,6 +52,7 @@ class CleanedJob(Base):
     cleaned_at = Column(DateTime, server_default=func.now())
     combined_word_count = Column(Integer)
     combined_char_count = Column(Integer)
+    search_vector = Column(TSVECTOR)  # job_search_vector(), migration 019
 
 class ExtractedSkill(Base):
     __tablename__ = 'extracted_skills'
@@ -99,6 +100,17 @@ class SkillEmbedding(Base):
     embedding = Column(Vector(768), nullable=False)
     model_name = Column(String(100), nullable=False)
     model_version = Column(String(50))
+    embedding_compact = Column(HALFVEC())  # Migration 010: reduced-dim halfvec copy
+    compact_method = Column(String(20))
+    compact_dim = Column(Integer)
+    created_at = Column(DateTime, server_default=func.now())
+
+class SkillCanonicalMap(Base):
+    __tablename__ = 'skill_canonical_map'
+
+    skill_text = Column(Text, primary_key=True)
+    canonical_text = Column(Text, nullable=False)
+    embedding_key = Column(Text, nullable=False)  # skill_embeddings.skill_text holding the vector
     created_at = Column(DateTime, server_default=func.now())
 
 class AnalysisResult(Base):
@@ -131,4 +143,49 @@ class GoldStandardAnnotation(Base):
     job = relationship("RawJob", back_populates="gold_standard_annotations")
 
     def __repr__(self):
-        return f"<GoldStandardAnnotation(job_id={self.job_id}, skill='{self.skill_text[:30]}...', type={self.skill_type})>" 
\ No newline at end of file
+        return f"<GoldStandardAnnotation(job_id={self.job_id}, skill='{self.skill_text[:30]}...', type={self.skill_type})>" 
+
+
+class SkillPeriodCount(Base):
+    """Monthly skill mention counts (migration 014), maintained by database.temporal_cube"""
+    __tablename__ = 'skill_period_counts'
+
+    month_start = Column(Date, primary_key=True)
+    source = Column(String(20), primary_key=True)  # 'extracted' or 'gold_standard'
+    skill_text = Column(Text, primary_key=True)
+    skill_type = Column(String(50), primary_key=True)
+    country = Column(String(2), primary_key=True)
+    portal = Column(String(50), primary_key=True)
+    extraction_method = Column(String(50), primary_key=True)
+    has_esco = Column(Boolean, primary_key=True)
+    mention_count = Column(Integer, nullable=False)
+    job_count = Column(Integer, nullable=False)
+    refreshed_at = Column(DateTime, server_default=func.now())
+
+class SkillDemandCount(Base):
+    """Skill demand rollup (migration 015), trigger-maintained; see database.demand_rollup"""
+    __tablename__ = 'skill_demand_counts'
+
+    source = Column(String(20), primary_key=True)  # 'extracted', 'enhanced' or 'gold_standard'
+    skill_text = Column(Text, primary_key=True)
+    skill_type = Column(String(50), primary_key=True)
+    esco_uri = Column(Text, primary_key=True)  # '' when unmapped
+    country = Column(String(2), primary_key=True)
+    portal = Column(String(50), primary_key=True)
+    extraction_method = Column(String(100), primary_key=True)  # llm_model for 'enhanced'
+    mention_count = Column(Integer, nullable=False)
+    job_count = Column(Integer, nullable=False)
+    refreshed_at = Column(DateTime, server_default=func.now())
+
+class JobSkillProfile(Base):
+    """Skill mentions per job × method × type × ESCO-mapped (migration 015)"""
+    __tablename__ = 'job_skill_profile'
+
+    job_id = Column(UUID(as_uuid=True), primary_key=True)
+    source = Column(String(20), primary_key=True)
+    extraction_method = Column(String(100), primary_key=True)
+    skill_type = Column(String(50), primary_key=True)
+    has_esco = Column(Boolean, primary_key=True)
+    country = Column(String(2), nullable=False)
+    portal = Column(String(50), nullable=False)
+    mention_count = Column(Integer, nullable=False)
@@ -0,0 +1,236 @@
+"""
+Skill × period count cube for temporal analytics.
+
+skill_period_counts (migration 014) holds mention counts per
+month × skill × skill_type × country × portal × extraction method, for two
+sources:
+
+    extracted       extracted_skills (Pipeline A), keyed by extracted_at
+    gold_standard   gold_standard_annotations, keyed by annotation_date
+
+Refreshes are incremental: every month that contains a skill row newer than
+the stored watermark (minus a small overlap, for transactions that commit
+late) is deleted and re-aggregated from scratch, so recomputation is
+idempotent. Rows deleted from the source tables are only reflected by a
+full refresh.
+
+Quarter (or year) series are rolled up from months at query time with
+period_counts_query().
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+CUBE_TABLE = 'skill_period_counts'
+STATE_TABLE = 'skill_period_counts_state'
+
+# Rows committed up to this long after their timestamp are still picked up
+WATERMARK_OVERLAP = '1 hour'
+
+PERIODS = ('month', 'quarter', 'year')
+
+SOURCES: Dict[str, Dict[str, str]] = {
+    'extracted': {
+        'table': 'extracted_skills',
+        'timestamp': 'extracted_at',
+        'skill_type': "COALESCE(s.skill_type, '')",
+        'extraction_method': "COALESCE(s.extraction_method, '')",
+        'has_esco': 's.esco_uri IS NOT NULL',
+    },
+    'gold_standard': {
+        'table': 'gold_standard_annotations',
+        'timestamp': 'annotation_date',
+        'skill_type': "COALESCE(s.skill_type, '')",
+        'extraction_method': "''",
+        'has_esco': 'FALSE',
+    },
+}
+
+
+def cube_available(cursor) -> bool:
+    """True if migration 014 is applied (safe to call before it is)."""
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (CUBE_TABLE,))
+    return bool(cursor.fetchone()[0])
+
+
+def _aggregate_sql(source: str, month_filter: bool) -> str:
+    spec = SOURCES[source]
+    where = "WHERE j.posted_date IS NOT NULL"
+    if month_filter:
+        where += " AND DATE_TRUNC('month', j.posted_date)::date = ANY(%s::date[])"
+    return f"""
+        INSERT INTO {CUBE_TABLE} (
+            month_start, skill_text, skill_type, country, portal, source,
+            extraction_method, has_esco, mention_count, job_count
+        )
+        SELECT
+            DATE_TRUNC('month', j.posted_date)::date,
+            s.skill_text,
+            {spec['skill_type']},
+            j.country,
+            j.portal,
+            '{source}',
+            {spec['extraction_method']},
+            {spec['has_esco']},
+            COUNT(*),
+            COUNT(DISTINCT s.job_id)
+        FROM {spec['table']} s
+        JOIN raw_jobs j ON s.job_id = j.job_id
+        {where}
+        GROUP BY 1, 2, 3, 4, 5, 7, 8
+    """
+
+
+def _get_watermark(cursor, source: str):
+    cursor.execute(f"SELECT watermark FROM {STATE_TABLE} WHERE source = %s", (source,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def refresh_source(conn, source: str, full: bool = False) -> Dict[str, Any]:
+    """
+    Bring one source of the cube up to date and commit.
+
+    Returns a summary: {'source', 'mode', 'months', 'rows', 'seconds'}.
+    """
+    if source not in SOURCES:
+        raise ValueError(f"Unknown source '{source}'. Use one of {tuple(SOURCES)}")
+
+    spec = SOURCES[source]
+    start = time.time()
+    cursor = conn.cursor()
+
+    try:
+        watermark = None if full else _get_watermark(cursor, source)
+
+        # Read the new watermark first: rows arriving during the refresh are
+        # picked up (and their months recomputed) by the next run.
+        cursor.execute(f"SELECT MAX({spec['timestamp']}) FROM {spec['table']}")
+        new_watermark = cursor.fetchone()[0]
+
+        if watermark is None:
+            mode = 'full'
+            cursor.execute(f"DELETE FROM {CUBE_TABLE} WHERE source = %s", (source,))
+            cursor.execute(_aggregate_sql(source, month_filter=False))
+            inserted = cursor.rowcount
+            cursor.execute(
+                f"SELECT COUNT(DISTINCT month_start) FROM {CUBE_TABLE} WHERE source = %s", (source,)
+            )
+            months = cursor.fetchone()[0]
+        else:
+            mode = 'incremental'
+            cursor.execute(f"""
+                SELECT DISTINCT DATE_TRUNC('month', j.posted_date)::date
+                FROM {spec['table']} s
+                JOIN raw_jobs j ON s.job_id = j.job_id
+                WHERE s.{spec['timestamp']} > %s - INTERVAL '{WATERMARK_OVERLAP}'
+                  AND j.posted_date IS NOT NULL
+            """, (watermark,))
+            affected = [row[0] for row in cursor.fetchall()]
+            months = len(affected)
+            inserted = 0
+            if affected:
+                cursor.execute(
+                    f"DELETE FROM {CUBE_TABLE} WHERE source = %s AND month_start = ANY(%s::date[])",
+                    (source, affected)
+                )
+                cursor.execute(_aggregate_sql(source, month_filter=True), (affected,))
+                inserted = cursor.rowcount
+
+        seconds = time.time() - start
+        cursor.execute(f"""
+            INSERT INTO {STATE_TABLE} (source, watermark, last_refresh_at, last_refresh_months, last_refresh_seconds)
+            VALUES (%s, %s, NOW(), %s, %s)
+            ON CONFLICT (source) DO UPDATE SET
+                watermark = EXCLUDED.watermark,
+                last_refresh_at = EXCLUDED.last_refresh_at,
+                last_refresh_months = EXCLUDED.last_refresh_months,
+                last_refresh_seconds = EXCLUDED.last_refresh_seconds
+        """, (source, new_watermark if new_watermark is not None else watermark, months, seconds))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    logger.info(f"Cube refresh [{source}] {mode}: {months} months, {inserted} rows ({seconds:.1f}s)")
+    return {
+        'source': source,
+        'mode': mode,
+        'months': months,
+        'rows': inserted,
+        'seconds': round(seconds, 3)
+    }
+
+
+def refresh_skill_period_counts(conn, sources: Optional[Iterable[str]] = None,
+                                full: bool = False) -> List[Dict[str, Any]]:
+    """Refresh every source (or the given ones); see refresh_source()."""
+    return [refresh_source(conn, source, full=full) for source in (sources or SOURCES)]
+
+
+def period_counts_query(
+    source: str = 'extracted',
+    period: str = 'quarter',
+    skill_types: Optional[Sequence[str]] = None,
+    extraction_methods: Optional[Sequence[str]] = None,
+    has_esco: Optional[bool] = None,
+    country: Optional[str] = None,
+    portal: Optional[str] = None,
+    year: Optional[int] = None,
+    skill_texts: Optional[Sequence[str]] = None,
+    by_skill: bool = True
+) -> Tuple[str, List[Any]]:
+    """
+    SQL + params for mention counts rolled up to ``period``.
+
+    Columns: period_start (date), [skill_text,] frequency. Usable with
+    cursor.execute(sql, params) or pd.read_sql_query(sql, conn, params=params).
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period '{period}'. Use one of {PERIODS}")
+
+    conditions = ["source = %s"]
+    params: List[Any] = [source]
+
+    if skill_types:
+        conditions.append("skill_type = ANY(%s)")
+        params.append(list(skill_types))
+    if extraction_methods:
+        conditions.append("extraction_method = ANY(%s)")
+        params.append(list(extraction_methods))
+    if has_esco is not None:
+        conditions.append("has_esco = %s")
+        params.append(has_esco)
+    if country:
+        conditions.append("country = %s")
+        params.append(country.upper())
+    if portal:
+        conditions.append("portal = %s")
+        params.append(portal)
+    if year:
+        conditions.append("month_start >= make_date(%s, 1, 1) AND month_start < make_date(%s, 1, 1)")
+        params.extend([year, year + 1])
+    if skill_texts:
+        conditions.append("skill_text = ANY(%s)")
+        params.append(list(skill_texts))
+
+    period_expr = f"DATE_TRUNC('{period}', month_start)::date"
+    select = f"{period_expr} AS period_start"
+    group = "1"
+    if by_skill:
+        select += ", skill_text"
+        group += ", 2"
+
+    sql = f"""
+        SELECT {select}, SUM(mention_count)::bigint AS frequency
+        FROM {CUBE_TABLE}
+        WHERE {' AND '.join(conditions)}
+        GROUP BY {group}
+        ORDER BY 1, frequency DESC
+    """
+    return sql, params
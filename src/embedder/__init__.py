@@ -1,5 +1,13 @@
 from .vectorizer import Vectorizer
 from .model_loader import ModelLoader
 from .batch_processor import BatchProcessor
+from .snapshot import EmbeddingSnapshot, SnapshotWriter, load_snapshot
+from .compression import EmbeddingCompressor, quantize_int8, dequantize_int8
+from .query_cache import QueryEmbeddingCache
 
-__all__ = ['Vectorizer', 'ModelLoader', 'BatchProcessor']
+__all__ = [
+    'Vectorizer', 'ModelLoader', 'BatchProcessor',
+    'EmbeddingSnapshot', 'SnapshotWriter', 'load_snapshot',
+    'EmbeddingCompressor', 'quantize_int8', 'dequantize_int8',
+    'QueryEmbeddingCache'
+]
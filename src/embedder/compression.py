@@ -0,0 +1,216 @@
+"""
+Compact embedding representations.
+
+Two independent knobs, both opt-in:
+
+    1. Dimension reduction: PCA projection fitted on the corpus, or
+       Matryoshka-style truncation (keep the first ``dim`` components).
+       Output vectors are re-normalized so inner product stays cosine.
+    2. Storage precision: float16 (pgvector halfvec, FAISS SQfp16) or int8
+       with one float32 scale per vector (x ≈ codes * scale).
+
+The fitted projection is saved as a small .npz next to whatever artifact was
+built with it (FAISS index, snapshot, halfvec column) so query vectors can be
+projected the same way at search time.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from pathlib import Path
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_METHODS = ('pca', 'truncate')
+STORAGE_DTYPES = ('float32', 'float16', 'int8')
+
+
+def l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """Row-wise L2 normalization (zero rows are left as zeros)."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
+
+
+class EmbeddingCompressor:
+    """
+    Project 768D embeddings to a smaller dimension.
+
+    Usage:
+        compressor = EmbeddingCompressor(method='pca', dim=256).fit(embeddings)
+        compact = compressor.transform(embeddings)
+        compressor.save('data/embeddings/esco_projection.npz')
+    """
+
+    def __init__(self, method: str = 'pca', dim: int = 256):
+        """
+        Initialize compressor.
+
+        Args:
+            method: 'pca' (fitted projection) or 'truncate' (Matryoshka-style prefix)
+            dim: Output dimension
+        """
+        if method not in COMPRESSION_METHODS:
+            raise ValueError(f"Unknown compression method '{method}'. Use one of {COMPRESSION_METHODS}")
+        if dim <= 0:
+            raise ValueError(f"dim must be positive, got {dim}")
+
+        self.method = method
+        self.dim = dim
+        self.input_dim: Optional[int] = None
+        self.mean_: Optional[np.ndarray] = None
+        self.components_: Optional[np.ndarray] = None
+        self.explained_variance_ratio_: Optional[float] = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.input_dim is not None
+
+    def fit(self, embeddings: np.ndarray) -> 'EmbeddingCompressor':
+        """
+        Fit the projection.
+
+        For PCA, components come from an SVD of the centered matrix (for 30k×768
+        this is a few seconds). Truncation only records the input dimension.
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        n, input_dim = embeddings.shape
+
+        if self.dim > input_dim:
+            raise ValueError(f"dim={self.dim} is larger than input dimension {input_dim}")
+
+        self.input_dim = input_dim
+
+        if self.method == 'pca':
+            self.mean_ = embeddings.mean(axis=0)
+            centered = embeddings - self.mean_
+            _, singular_values, vt = np.linalg.svd(centered, full_matrices=False)
+            self.components_ = vt[:self.dim].astype(np.float32)
+
+            variance = singular_values ** 2
+            self.explained_variance_ratio_ = float(variance[:self.dim].sum() / variance.sum())
+
+            logger.info(
+                f"PCA fitted on {n} vectors: {input_dim}D → {self.dim}D "
+                f"(explained variance: {self.explained_variance_ratio_:.1%})"
+            )
+        else:
+            logger.info(f"Truncation configured: {input_dim}D → {self.dim}D")
+
+        return self
+
+    def transform(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Project embeddings and re-normalize them.
+
+        Args:
+            embeddings: Array of shape (n, input_dim) or (input_dim,)
+
+        Returns:
+            float32 array of shape (n, dim)
+        """
+        if not self.is_fitted:
+            raise RuntimeError("EmbeddingCompressor must be fitted before transform()")
+
+        embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if embeddings.shape[1] != self.input_dim:
+            raise ValueError(
+                f"Expected {self.input_dim}D embeddings, got {embeddings.shape[1]}D"
+            )
+
+        if self.method == 'pca':
+            projected = (embeddings - self.mean_) @ self.components_.T
+        else:
+            projected = embeddings[:, :self.dim]
+
+        return l2_normalize(projected)
+
+    def fit_transform(self, embeddings: np.ndarray) -> np.ndarray:
+        return self.fit(embeddings).transform(embeddings)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary recorded in manifests and reports."""
+        return {
+            'method': self.method,
+            'dim': self.dim,
+            'input_dim': self.input_dim,
+            'explained_variance_ratio': self.explained_variance_ratio_
+        }
+
+    def save(self, path: str) -> Path:
+        """Save the fitted projection as .npz."""
+        if not self.is_fitted:
+            raise RuntimeError("Cannot save an unfitted EmbeddingCompressor")
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        arrays = {
+            'method': np.array(self.method),
+            'dim': np.array(self.dim),
+            'input_dim': np.array(self.input_dim),
+        }
+        if self.method == 'pca':
+            arrays['mean'] = self.mean_
+            arrays['components'] = self.components_
+            arrays['explained_variance_ratio'] = np.array(self.explained_variance_ratio_)
+
+        np.savez(path, **arrays)
+        logger.info(f"Projection saved: {path}")
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'EmbeddingCompressor':
+        """Load a projection saved with save()."""
+        with np.load(path, allow_pickle=False) as data:
+            compressor = cls(method=str(data['method']), dim=int(data['dim']))
+            compressor.input_dim = int(data['input_dim'])
+            if compressor.method == 'pca':
+                compressor.mean_ = data['mean']
+                compressor.components_ = data['components']
+                compressor.explained_variance_ratio_ = float(data['explained_variance_ratio'])
+        return compressor
+
+
+def quantize_int8(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetric int8 quantization with one scale per vector.
+
+    Args:
+        embeddings: float array of shape (n, dim)
+
+    Returns:
+        (codes, scales): int8 array (n, dim) and float32 array (n,)
+        such that embeddings ≈ codes * scales[:, None]
+    """
+    embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+    scales = np.abs(embeddings).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.clip(np.rint(embeddings / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantize_int8(codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Inverse of quantize_int8()."""
+    return codes.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+
+
+def apply_storage_dtype(embeddings: np.ndarray, storage_dtype: str) -> np.ndarray:
+    """
+    Round-trip embeddings through a storage dtype.
+
+    Returns float32 vectors carrying the precision loss of ``storage_dtype``,
+    which is what downstream similarity/clustering code sees after reading
+    the compact representation back.
+    """
+    if storage_dtype not in STORAGE_DTYPES:
+        raise ValueError(f"Unknown storage dtype '{storage_dtype}'. Use one of {STORAGE_DTYPES}")
+
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if storage_dtype == 'float16':
+        return embeddings.astype(np.float16).astype(np.float32)
+    if storage_dtype == 'int8':
+        return dequantize_int8(*quantize_int8(embeddings))
+    return embeddings
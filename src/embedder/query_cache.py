@@ -0,0 +1,70 @@
+"""
+In-process LRU cache for query embeddings.
+
+Similar-skill lookups need one query vector per request. Popular skills are
+requested over and over, and encoding an unseen skill with E5 costs far more
+than the HNSW search itself, so vectors are kept in memory keyed by the
+normalized skill text.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(text: str) -> str:
+    """Cache key: same rule as the LOWER(TRIM(skill_text)) lookups."""
+    return text.strip().lower()
+
+
+class QueryEmbeddingCache:
+    """
+    Thread-safe LRU mapping normalized query text → embedding.
+
+    FastAPI runs sync endpoints in a thread pool, so all access goes
+    through a lock.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str) -> Optional[Any]:
+        key = normalize_query(text)
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, text: str, value: Any) -> None:
+        key = normalize_query(text)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 4) if total else 0.0
+            }
@@ -0,0 +1,414 @@
+"""
+Versioned embedding snapshots for analysis scripts.
+
+A snapshot is a directory with three aligned files:
+
+    <snapshot_dir>/<version>/
+        embeddings.npy    (n_skills, dim) matrix, opened with np.load(mmap_mode='r')
+        metadata.parquet  skill_text, frequency, skill_type, esco_uri (row i ↔ vector i)
+        manifest.json     version, shape, dtype, model, content hash
+        scales.npy        per-vector float32 scales (int8 snapshots only)
+
+Clustering scripts load the matrix zero-copy from the page cache instead of
+pulling 768D vectors out of PostgreSQL row by row, and the same snapshot can be
+reused across parameter sweeps. The content hash identifies the exact input of
+a clustering run.
+
+Snapshots can also be compact (see embedder.compression): vectors projected to
+a lower dimension before writing, and/or stored as float16 or int8 with one
+scale per vector. Readers always get float32 back from select()/as_float32().
+"""
+
+from typing import Dict, Any, List, Optional, Tuple, Iterable
+from datetime import datetime
+from pathlib import Path
+import hashlib
+import json
+import logging
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .compression import quantize_int8, dequantize_int8
+
+logger = logging.getLogger(__name__)
+
+EMBEDDINGS_FILE = "embeddings.npy"
+METADATA_FILE = "metadata.parquet"
+MANIFEST_FILE = "manifest.json"
+LATEST_FILE = "LATEST"
+SCALES_FILE = "scales.npy"
+
+SNAPSHOT_DTYPES = ('float32', 'float16', 'int8')
+
+METADATA_SCHEMA = pa.schema([
+    ('skill_text', pa.string()),
+    ('frequency', pa.int64()),
+    ('skill_type', pa.string()),
+    ('esco_uri', pa.string()),
+])
+
+
+def _normalize_key(skill_text: str) -> str:
+    """Same matching rule as the SQL lookups (LOWER(TRIM(skill_text)))."""
+    return skill_text.strip().lower()
+
+
+class SnapshotWriter:
+    """
+    Stream embeddings into a new snapshot without holding them all in memory.
+
+    The number of rows must be known up front (the .npy file is preallocated
+    with ``np.lib.format.open_memmap``). Rows are appended with
+    ``write_batch`` and the snapshot becomes visible only after ``close``,
+    which writes the metadata sidecar, the manifest and the LATEST pointer.
+
+    Usage:
+        writer = SnapshotWriter(base_dir, n_rows=30000, dim=768)
+        for batch in batches:
+            writer.write_batch(texts, vectors, frequencies, types, uris)
+        snapshot_path = writer.close()
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        n_rows: int,
+        dim: int = 768,
+        version: Optional[str] = None,
+        dtype: str = 'float32',
+        model_name: str = 'intfloat/multilingual-e5-base',
+        source: Optional[Dict[str, Any]] = None,
+        compression: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize snapshot writer.
+
+        Args:
+            base_dir: Root directory holding all snapshot versions
+            n_rows: Exact number of skills that will be written
+            dim: Embedding dimension (768 for E5-base)
+            version: Snapshot version name (defaults to a timestamp)
+            dtype: Storage dtype for the matrix ('float32', 'float16' or
+                'int8' with per-vector scales)
+            model_name: Embedding model, recorded in the manifest
+            source: Free-form description of the export query/filters
+            compression: Projection applied before writing (EmbeddingCompressor.to_dict())
+        """
+        if dtype not in SNAPSHOT_DTYPES:
+            raise ValueError(f"Unsupported snapshot dtype '{dtype}'. Use one of {SNAPSHOT_DTYPES}")
+
+        self.base_dir = Path(base_dir)
+        self.version = version or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.path = self.base_dir / self.version
+        self.n_rows = n_rows
+        self.dim = dim
+        self.dtype = np.dtype(dtype)
+        self.model_name = model_name
+        self.source = source or {}
+        self.compression = compression
+
+        if self.path.exists():
+            raise FileExistsError(f"Snapshot version already exists: {self.path}")
+        self.path.mkdir(parents=True)
+
+        self._matrix = np.lib.format.open_memmap(
+            self.path / EMBEDDINGS_FILE,
+            mode='w+',
+            dtype=self.dtype,
+            shape=(n_rows, dim)
+        )
+        self._scales = None
+        if self.dtype == np.int8:
+            self._scales = np.lib.format.open_memmap(
+                self.path / SCALES_FILE,
+                mode='w+',
+                dtype=np.float32,
+                shape=(n_rows,)
+            )
+        self._columns: Dict[str, List[Any]] = {name: [] for name in METADATA_SCHEMA.names}
+        self._hasher = hashlib.sha256()
+        self._offset = 0
+
+        logger.info(
+            f"SnapshotWriter initialized: {self.path} "
+            f"(rows={n_rows}, dim={dim}, dtype={self.dtype})"
+        )
+
+    def write_batch(
+        self,
+        skill_texts: List[str],
+        embeddings: np.ndarray,
+        frequencies: Optional[Iterable[int]] = None,
+        skill_types: Optional[Iterable[Optional[str]]] = None,
+        esco_uris: Optional[Iterable[Optional[str]]] = None
+    ) -> None:
+        """
+        Append a batch of rows to the snapshot.
+
+        Args:
+            skill_texts: Skill names for this batch
+            embeddings: Array of shape (len(skill_texts), dim)
+            frequencies: Optional mention counts (default 1)
+            skill_types: Optional skill types ('hard', 'soft', ...)
+            esco_uris: Optional ESCO concept URIs
+        """
+        n = len(skill_texts)
+        embeddings = np.asarray(embeddings)
+
+        if embeddings.shape != (n, self.dim):
+            raise ValueError(
+                f"Batch shape {embeddings.shape} does not match ({n}, {self.dim})"
+            )
+        if self._offset + n > self.n_rows:
+            raise ValueError(
+                f"Snapshot overflow: {self._offset + n} rows > declared {self.n_rows}"
+            )
+
+        if self._scales is not None:
+            embeddings, scales = quantize_int8(embeddings)
+            self._scales[self._offset:self._offset + n] = scales
+        else:
+            embeddings = embeddings.astype(self.dtype, copy=False)
+
+        self._matrix[self._offset:self._offset + n] = embeddings
+        self._offset += n
+
+        self._columns['skill_text'].extend(skill_texts)
+        self._columns['frequency'].extend(
+            [int(f) for f in frequencies] if frequencies is not None else [1] * n
+        )
+        self._columns['skill_type'].extend(
+            list(skill_types) if skill_types is not None else [None] * n
+        )
+        self._columns['esco_uri'].extend(
+            list(esco_uris) if esco_uris is not None else [None] * n
+        )
+
+        self._hasher.update(embeddings.tobytes())
+        self._hasher.update('\n'.join(skill_texts).encode('utf-8'))
+
+    def close(self, update_latest: bool = True) -> Path:
+        """
+        Finalize the snapshot.
+
+        Args:
+            update_latest: Point base_dir/LATEST at this version
+
+        Returns:
+            Path to the snapshot directory
+        """
+        if self._offset != self.n_rows:
+            raise ValueError(
+                f"Snapshot incomplete: wrote {self._offset} of {self.n_rows} rows"
+            )
+
+        self._matrix.flush()
+        del self._matrix
+        if self._scales is not None:
+            self._scales.flush()
+            del self._scales
+
+        table = pa.table(self._columns, schema=METADATA_SCHEMA)
+        pq.write_table(table, self.path / METADATA_FILE)
+
+        manifest = {
+            'version': self.version,
+            'created_at': datetime.now().isoformat(),
+            'n_skills': self.n_rows,
+            'dim': self.dim,
+            'dtype': self.dtype.name,
+            'model_name': self.model_name,
+            'content_hash': self._hasher.hexdigest(),
+            'source': self.source,
+            'compression': self.compression,
+            'files': {
+                'embeddings': EMBEDDINGS_FILE,
+                'metadata': METADATA_FILE
+            }
+        }
+        if self.dtype == np.int8:
+            manifest['files']['scales'] = SCALES_FILE
+        with open(self.path / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+        if update_latest:
+            (self.base_dir / LATEST_FILE).write_text(self.version, encoding='utf-8')
+
+        logger.info(
+            f"Snapshot {self.version} written: {self.n_rows} skills, "
+            f"hash={manifest['content_hash'][:12]}"
+        )
+
+        return self.path
+
+
+class EmbeddingSnapshot:
+    """
+    Read-only view over a snapshot directory.
+
+    ``embeddings`` is a memory-mapped array: opening a 30k×768 snapshot only
+    maps the file, and pages are read on first access. Metadata is loaded
+    through Arrow and exposed as plain lists/arrays. For int8 snapshots
+    ``embeddings`` holds the codes and ``scales`` the per-vector scales.
+    """
+
+    def __init__(self, path: Path, embeddings: np.ndarray, metadata: pa.Table,
+                 manifest: Dict[str, Any], scales: Optional[np.ndarray] = None):
+        self.path = Path(path)
+        self.embeddings = embeddings
+        self.scales = scales
+        self.metadata = metadata
+        self.manifest = manifest
+        self._index: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return self.embeddings.shape[0]
+
+    @property
+    def version(self) -> str:
+        return self.manifest['version']
+
+    @property
+    def content_hash(self) -> str:
+        return self.manifest['content_hash']
+
+    @property
+    def skill_texts(self) -> List[str]:
+        return self.metadata.column('skill_text').to_pylist()
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        return self.metadata.column('frequency').to_numpy()
+
+    @property
+    def skill_types(self) -> List[Optional[str]]:
+        return self.metadata.column('skill_type').to_pylist()
+
+    @property
+    def esco_uris(self) -> List[Optional[str]]:
+        return self.metadata.column('esco_uri').to_pylist()
+
+    def to_pandas(self):
+        """Return metadata as a pandas DataFrame (row i ↔ embeddings[i])."""
+        return self.metadata.to_pandas()
+
+    def select(self, skill_texts: List[str]) -> Tuple[np.ndarray, List[str], List[int]]:
+        """
+        Align the snapshot with an externally ordered list of skills.
+
+        Matching is case/whitespace-insensitive, like the LOWER(TRIM())
+        lookups it replaces. Skills not present in the snapshot are skipped.
+
+        Args:
+            skill_texts: Skills in the caller's order
+
+        Returns:
+            (embeddings, found_skills, found_indices) — same contract as the
+            scripts' fetch_embeddings_batch(). ``found_indices`` index into
+            ``skill_texts``.
+        """
+        if self._index is None:
+            self._index = {}
+            for row, text in enumerate(self.skill_texts):
+                self._index.setdefault(_normalize_key(text), row)
+
+        rows = []
+        found_skills = []
+        found_indices = []
+        for i, skill_text in enumerate(skill_texts):
+            row = self._index.get(_normalize_key(skill_text))
+            if row is not None:
+                rows.append(row)
+                found_skills.append(skill_text)
+                found_indices.append(i)
+
+        rows = np.asarray(rows, dtype=np.int64)
+        if self.scales is not None:
+            embeddings = dequantize_int8(self.embeddings[rows], self.scales[rows])
+        else:
+            embeddings = np.asarray(self.embeddings[rows], dtype=np.float32)
+
+        return embeddings, found_skills, found_indices
+
+    def as_float32(self) -> np.ndarray:
+        """Return the matrix as float32 (copy only if stored in another dtype)."""
+        if self.scales is not None:
+            return dequantize_int8(self.embeddings, self.scales)
+        if self.embeddings.dtype == np.float32:
+            return self.embeddings
+        return np.asarray(self.embeddings, dtype=np.float32)
+
+
+def resolve_snapshot_path(path_or_version: Optional[str] = None,
+                          base_dir: Optional[str] = None) -> Path:
+    """
+    Resolve a snapshot location.
+
+    Args:
+        path_or_version: Snapshot directory, version name under base_dir,
+            or None/'latest' for the version referenced by base_dir/LATEST
+        base_dir: Snapshot root (defaults to settings.embedding_snapshot_dir)
+
+    Returns:
+        Path to the snapshot directory
+    """
+    if path_or_version and Path(path_or_version).is_dir():
+        return Path(path_or_version)
+
+    if base_dir is None:
+        from config.settings import get_settings
+        base_dir = get_settings().embedding_snapshot_dir
+    base = Path(base_dir)
+
+    if not path_or_version or path_or_version == 'latest':
+        latest_file = base / LATEST_FILE
+        if not latest_file.exists():
+            raise FileNotFoundError(f"No snapshot found in {base} (missing {LATEST_FILE})")
+        path_or_version = latest_file.read_text(encoding='utf-8').strip()
+
+    path = base / path_or_version
+    if not path.is_dir():
+        raise FileNotFoundError(f"Snapshot not found: {path}")
+    return path
+
+
+def load_snapshot(path_or_version: Optional[str] = None,
+                  base_dir: Optional[str] = None,
+                  mmap: bool = True) -> EmbeddingSnapshot:
+    """
+    Open an embedding snapshot.
+
+    Args:
+        path_or_version: See resolve_snapshot_path()
+        base_dir: Snapshot root directory
+        mmap: Memory-map the matrix (zero-copy). Set False to read it into RAM.
+
+    Returns:
+        EmbeddingSnapshot
+    """
+    path = resolve_snapshot_path(path_or_version, base_dir)
+
+    with open(path / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    embeddings = np.load(path / EMBEDDINGS_FILE, mmap_mode='r' if mmap else None)
+    metadata = pq.read_table(path / METADATA_FILE, memory_map=True)
+
+    scales = None
+    if 'scales' in manifest.get('files', {}):
+        scales = np.load(path / manifest['files']['scales'], mmap_mode='r' if mmap else None)
+
+    if embeddings.shape[0] != metadata.num_rows:
+        raise ValueError(
+            f"Corrupted snapshot {path}: {embeddings.shape[0]} vectors "
+            f"but {metadata.num_rows} metadata rows"
+        )
+
+    logger.info(
+        f"Loaded snapshot {manifest['version']}: {embeddings.shape} "
+        f"{embeddings.dtype} (mmap={mmap})"
+    )
+
+    return EmbeddingSnapshot(path, embeddings, metadata, manifest, scales)
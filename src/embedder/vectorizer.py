@@ -1,28 +1,43 @@
 from typing import List, Dict, Any
 import logging
+import numpy as np
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 class Vectorizer:
     """Manages embedding model loading and inference."""
-    
+
     def __init__(self, model_name: str = "intfloat/multilingual-e5-base"):
         self.settings = get_settings()
         self.model_name = model_name
         self.model = self._load_model()
-    
+
     def _load_model(self):
         """Load the embedding model."""
-        # TODO: Implement model loading
-        pass
-    
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                "sentence-transformers not installed. Install with: pip install sentence-transformers"
+            )
+
+        logger.info(f"Loading embedding model: {self.model_name}")
+        return SentenceTransformer(self.model_name, cache_folder=self.settings.embedding_cache_dir)
+
     def embed_text(self, text: str) -> List[float]:
         """Generate embedding for a single text."""
-        # TODO: Implement single text embedding
-        pass
-    
+        return self.embed_batch([text])[0]
+
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for multiple texts."""
-        # TODO: Implement batch embedding
-        pass 
\ No newline at end of file
+        # Same encoding as skill_embeddings (phase0_generate_embeddings.py):
+        # raw skill text, L2-normalized so inner product = cosine similarity
+        embeddings = self.model.encode(
+            texts,
+            batch_size=self.settings.embedding_batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        return np.asarray(embeddings, dtype=np.float32).tolist()
@@ -16,15 +16,15 @@ Comparaciones:
 - Análisis de impacto ESCO
 """
 
-from .normalizer import SkillNormalizer, normalize_skill, normalize_skills_list
+from .normalizer import SkillNormalizer, normalize_skill, normalize_skills_list, get_canonical_key
 from .metrics import MetricsCalculator, calculate_metrics, print_metrics
-from .dual_comparator import DualPipelineComparator, PipelineData
 
 __all__ = [
     # Normalización
     'SkillNormalizer',
     'normalize_skill',
     'normalize_skills_list',
+    'get_canonical_key',
 
     # Métricas
     'MetricsCalculator',
@@ -35,3 +35,12 @@ __all__ = [
     'DualPipelineComparator',
     'PipelineData',
 ]
+
+
+# The comparator loads the ESCO matcher (sentence-transformers); import it on
+# demand so the normalizer stays cheap to import (e.g. from the API)
+def __getattr__(name):
+    if name in ('DualPipelineComparator', 'PipelineData'):
+        from . import dual_comparator
+        return getattr(dual_comparator, name)
+    raise AttributeError(f"module {__name__} has no attribute {name}")
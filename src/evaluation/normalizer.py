@@ -299,6 +299,46 @@ class SkillNormalizer:
         logger.debug(f"Normalized '{skill_text}' -> '{normalized}' (title case)")
         return normalized
 
+    def canonical_key(self, skill_text: str) -> str:
+        """
+        Clave canónica usada para embeddings (skill_embeddings.skill_text).
+
+        Variantes triviales comparten la misma clave y por lo tanto un solo
+        vector: "Python", "python", "PYTHON " y "Pythón" -> "python";
+        "js" y "JavaScript" -> "javascript". A diferencia de normalize(),
+        no aplica blacklist ni title case: la clave es siempre minúscula,
+        sin acentos, con espacios colapsados y puntuación periférica removida.
+
+        Args:
+            skill_text: Texto del skill
+
+        Returns:
+            Clave canónica ("" si no queda texto)
+        """
+        if not skill_text or not isinstance(skill_text, str):
+            return ""
+
+        key = self._remove_accents(skill_text).lower()
+        # Conservar + # . / & - (c++, c#, node.js, ci/cd, r&d); el resto es separador
+        key = re.sub(r"[^\w\s+#./&-]", " ", key)
+        key = re.sub(r"\s+", " ", key).strip()
+        key = re.sub(r"^[-/&\s]+|[-/.&\s]+$", "", key)
+
+        canonical = self._alias_lookup().get(key)
+        if canonical is not None:
+            return self._remove_accents(canonical).lower()
+        return key
+
+    @classmethod
+    def _alias_lookup(cls) -> Dict[str, str]:
+        """CANONICAL_NAMES indexado por clave sin acentos (se construye una vez)."""
+        if not hasattr(cls, '_ALIAS_LOOKUP'):
+            cls._ALIAS_LOOKUP = {
+                unicode_normalize('NFKD', alias).encode('ASCII', 'ignore').decode('ASCII'): canonical
+                for alias, canonical in cls.CANONICAL_NAMES.items()
+            }
+        return cls._ALIAS_LOOKUP
+
     def normalize_list(self, skills: List[str]) -> List[str]:
         """
         Normaliza una lista de skills y elimina duplicados.
@@ -411,3 +451,16 @@ def get_canonical_name(skill_text: str) -> str:
     normalizer = get_normalizer()
     key = normalizer._remove_accents(skill_text.strip().lower())
     return normalizer.CANONICAL_NAMES.get(key, skill_text)
+
+
+def get_canonical_key(skill_text: str) -> str:
+    """
+    Obtiene la clave canónica de embedding de un skill.
+
+    Args:
+        skill_text: Texto del skill
+
+    Returns:
+        Clave canónica (minúscula, sin acentos, alias resueltos)
+    """
+    return get_normalizer().canonical_key(skill_text)
@@ -4,10 +4,40 @@ Listens to Redis Pub/Sub events and enqueues appropriate tasks
 """
 import logging
 import threading
+import time
 from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# skills_extracted arrives once per job: the skill × month cube refresh is
+# queued at most once per window (it is incremental, so one run covers every
+# job extracted before it starts)
+PERIOD_COUNTS_REFRESH_DELAY = 120  # seconds
+_period_counts_refresh_lock = threading.Lock()
+_period_counts_refresh_due = 0.0
+
+
+def schedule_period_counts_refresh() -> bool:
+    """
+    Queue refresh_skill_period_counts_task unless one is already pending.
+
+    Returns:
+        True if a refresh was queued
+    """
+    global _period_counts_refresh_due
+    with _period_counts_refresh_lock:
+        now = time.time()
+        if now < _period_counts_refresh_due:
+            return False
+        _period_counts_refresh_due = now + PERIOD_COUNTS_REFRESH_DELAY
+
+    # Import here to avoid circular dependency
+    from src.tasks.extraction_tasks import refresh_skill_period_counts_task
+
+    task = refresh_skill_period_counts_task.apply_async(countdown=PERIOD_COUNTS_REFRESH_DELAY)
+    logger.info(f"✅ Skill period counts refresh {task.id} queued in {PERIOD_COUNTS_REFRESH_DELAY}s")
+    return True
+
 
 def handle_jobs_scraped(event_data: Dict[str, Any]) -> None:
     """
@@ -56,7 +86,8 @@ def handle_jobs_scraped(event_data: Dict[str, Any]) -> None:
 def handle_skills_extracted(event_data: Dict[str, Any]) -> None:
     """
     Handle 'skills_extracted' event.
-    Auto-triggers enhancement tasks for newly extracted skills.
+    Auto-triggers enhancement tasks for newly extracted skills and a
+    (debounced) refresh of the skill × month count cube.
 
     Event data format:
         {
@@ -87,6 +118,8 @@ def handle_skills_extracted(event_data: Dict[str, Any]) -> None:
 
         logger.info(f"✅ Auto-triggered enhancement task {task.id} for job {job_id}")
 
+        schedule_period_counts_refresh()
+
     except Exception as exc:
         logger.error(f"❌ Error handling skills_extracted event: {exc}")
 
@@ -33,6 +33,7 @@ from sentence_transformers import SentenceTransformer
 from dataclasses import dataclass
 
 from config.settings import get_settings
+from embedder.compression import EmbeddingCompressor
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +78,8 @@ class ESCOMatcher3Layers:
 
     def _load_faiss_index(self):
         """Load FAISS index and skill mapping for semantic search."""
+        self.projection = None
+
         # Skip loading FAISS if not available
         if not FAISS_AVAILABLE:
             logger.warning("FAISS library not available - Layer 3 disabled")
@@ -112,6 +115,10 @@ class ESCOMatcher3Layers:
             with open(mapping_path, 'rb') as f:
                 self.skill_texts = pickle.load(f)
 
+            # Compact indexes (phase0_build_faiss_index.py --compact-dim) ship a query projection
+            projection_path = index_path.parent / "esco_projection.npz"
+            self.projection = EmbeddingCompressor.load(str(projection_path)) if projection_path.exists() else None
+
             # Load embedding model
             self.model = SentenceTransformer('intfloat/multilingual-e5-base')
 
@@ -411,6 +418,8 @@ class ESCOMatcher3Layers:
         try:
             # Generate embedding for query
             query_embedding = self.model.encode([skill_text], normalize_embeddings=True, convert_to_numpy=True)
+            if self.projection is not None:
+                query_embedding = self.projection.transform(query_embedding)
 
             # Search in FAISS (k=5 for top 5 matches)
             distances, indices = self.faiss_index.search(query_embedding.astype(np.float32), k=5)
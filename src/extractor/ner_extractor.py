@@ -1,6 +1,7 @@
 import spacy
 from spacy.tokens import Doc, Span
 from typing import List, Dict, Tuple, Optional, Any
+import json
 import logging
 import os
 from pathlib import Path
@@ -198,83 +199,25 @@ class NERExtractor:
             if db_url.startswith('postgresql://'):
                 db_url = db_url.replace('postgresql://', 'postgres://')
 
-            # Query technical skills from ESCO
-            with psycopg2.connect(db_url) as conn:
-                cursor = conn.cursor()
+            from database.esco_catalog import get_current_catalog_version
 
-                # Get technical skills (hot tech + in-demand + critical + technical knowledge)
-                # EXPANDED (Mejora 2.3 - 2025-11-05): Include technical "knowledge" skills
-                cursor.execute("""
-                    SELECT DISTINCT
-                        preferred_label_es,
-                        preferred_label_en
-                    FROM esco_skills
-                    WHERE is_active = TRUE
-                      AND (
-                        -- Hot tech, in-demand, critical
-                        skill_type IN ('onet_hot_tech', 'onet_in_demand',
-                                       'tier1_critical', 'tier0_critical')
-                        -- OR technical knowledge (filtered by keywords)
-                        OR (skill_type = 'knowledge' AND (
-                            preferred_label_es ILIKE '%programación%' OR
-                            preferred_label_es ILIKE '%software%' OR
-                            preferred_label_es ILIKE '%base de datos%' OR
-                            preferred_label_es ILIKE '%cloud%' OR
-                            preferred_label_es ILIKE '%desarrollo%' OR
-                            preferred_label_es ILIKE '%web%' OR
-                            preferred_label_es ILIKE '%API%' OR
-                            preferred_label_es ILIKE '%aplicación%' OR
-                            preferred_label_es ILIKE '%sistema informático%' OR
-                            preferred_label_es ILIKE '%tecnología de la información%' OR
-                            preferred_label_es ILIKE '%seguridad informática%' OR
-                            preferred_label_es ILIKE '%machine learning%' OR
-                            preferred_label_es ILIKE '%inteligencia artificial%' OR
-                            preferred_label_es ILIKE '%DevOps%' OR
-                            preferred_label_en ILIKE '%programming%' OR
-                            preferred_label_en ILIKE '%software%' OR
-                            preferred_label_en ILIKE '%database%' OR
-                            preferred_label_en ILIKE '%machine learning%' OR
-                            preferred_label_en ILIKE '%artificial intelligence%'
-                        ))
-                      )
-                    ORDER BY preferred_label_es;
-                """)
-
-                esco_skills = cursor.fetchall()
-
-            # Create patterns for EntityRuler
-            patterns = []
+            cache_path = Path(self.settings.ner_cache_dir) / 'esco_tech_skills.json'
 
-            for label_es, label_en in esco_skills:
-                # Spanish label
-                if label_es:
-                    # Exact match (case-insensitive)
-                    patterns.append({
-                        "label": "TECH_SKILL",
-                        "pattern": [{"LOWER": label_es.lower()}]
-                    })
+            with psycopg2.connect(db_url) as conn:
+                cursor = conn.cursor()
 
-                    # Handle multi-word skills (e.g., "React Native")
-                    if ' ' in label_es:
-                        words = label_es.split()
-                        patterns.append({
-                            "label": "TECH_SKILL",
-                            "pattern": [{"LOWER": w.lower()} for w in words]
-                        })
+                # Reuse the cached skill list while the catalog version is unchanged
+                catalog = get_current_catalog_version(cursor)
+                checksum = catalog['checksum'] if catalog else None
+                esco_skills = self._read_tech_skills_cache(cache_path, checksum)
 
-                # English label (if different from Spanish)
-                if label_en and label_en != label_es:
-                    patterns.append({
-                        "label": "TECH_SKILL",
-                        "pattern": [{"LOWER": label_en.lower()}]
-                    })
+            # Query technical skills from ESCO
+            if esco_skills is None:
+                esco_skills = self._query_tech_skills(db_url)
+                self._write_tech_skills_cache(cache_path, checksum, esco_skills)
 
-                    if ' ' in label_en:
-                        words = label_en.split()
-                        patterns.append({
-                            "label": "TECH_SKILL",
-                            "pattern": [{"LOWER": w.lower()} for w in words]
-                        })
+            # Create patterns for EntityRuler
+            patterns = self._esco_patterns(esco_skills)
 
             # Add EntityRuler to pipeline BEFORE NER
             ruler = self.nlp.add_pipe("entity_ruler", before="ner")
@@ -389,7 +332,121 @@ class NERExtractor:
             ruler = self.nlp.add_pipe("entity_ruler", before="ner")
             ruler.add_patterns(basic_patterns)
             logger.info(f"Added EntityRuler with {len(basic_patterns)} basic patterns (fallback)")
-    
+
+    def _query_tech_skills(self, db_url: str) -> List[Tuple[str, str]]:
+        """Query the technical ESCO skills used as EntityRuler patterns."""
+        import psycopg2
+
+        with psycopg2.connect(db_url) as conn:
+            cursor = conn.cursor()
+
+            # Get technical skills (hot tech + in-demand + critical + technical knowledge)
+            # EXPANDED (Mejora 2.3 - 2025-11-05): Include technical "knowledge" skills
+            cursor.execute("""
+                SELECT DISTINCT
+                    preferred_label_es,
+                    preferred_label_en
+                FROM esco_skills
+                WHERE is_active = TRUE
+                  AND (
+                    -- Hot tech, in-demand, critical
+                    skill_type IN ('onet_hot_tech', 'onet_in_demand',
+                                   'tier1_critical', 'tier0_critical')
+                    -- OR technical knowledge (filtered by keywords)
+                    OR (skill_type = 'knowledge' AND (
+                        preferred_label_es ILIKE '%programación%' OR
+                        preferred_label_es ILIKE '%software%' OR
+                        preferred_label_es ILIKE '%base de datos%' OR
+                        preferred_label_es ILIKE '%cloud%' OR
+                        preferred_label_es ILIKE '%desarrollo%' OR
+                        preferred_label_es ILIKE '%web%' OR
+                        preferred_label_es ILIKE '%API%' OR
+                        preferred_label_es ILIKE '%aplicación%' OR
+                        preferred_label_es ILIKE '%sistema informático%' OR
+                        preferred_label_es ILIKE '%tecnología de la información%' OR
+                        preferred_label_es ILIKE '%seguridad informática%' OR
+                        preferred_label_es ILIKE '%machine learning%' OR
+                        preferred_label_es ILIKE '%inteligencia artificial%' OR
+                        preferred_label_es ILIKE '%DevOps%' OR
+                        preferred_label_en ILIKE '%programming%' OR
+                        preferred_label_en ILIKE '%software%' OR
+                        preferred_label_en ILIKE '%database%' OR
+                        preferred_label_en ILIKE '%machine learning%' OR
+                        preferred_label_en ILIKE '%artificial intelligence%'
+                    ))
+                  )
+                ORDER BY preferred_label_es;
+            """)
+
+            return [tuple(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _esco_patterns(esco_skills: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """EntityRuler patterns for (label_es, label_en) ESCO skills."""
+        patterns = []
+
+        for label_es, label_en in esco_skills:
+            # Spanish label
+            if label_es:
+                # Exact match (case-insensitive)
+                patterns.append({
+                    "label": "TECH_SKILL",
+                    "pattern": [{"LOWER": label_es.lower()}]
+                })
+
+                # Handle multi-word skills (e.g., "React Native")
+                if ' ' in label_es:
+                    words = label_es.split()
+                    patterns.append({
+                        "label": "TECH_SKILL",
+                        "pattern": [{"LOWER": w.lower()} for w in words]
+                    })
+
+            # English label (if different from Spanish)
+            if label_en and label_en != label_es:
+                patterns.append({
+                    "label": "TECH_SKILL",
+                    "pattern": [{"LOWER": label_en.lower()}]
+                })
+
+                if ' ' in label_en:
+                    words = label_en.split()
+                    patterns.append({
+                        "label": "TECH_SKILL",
+                        "pattern": [{"LOWER": w.lower()} for w in words]
+                    })
+
+        return patterns
+
+    @staticmethod
+    def _read_tech_skills_cache(cache_path: Path, checksum: Optional[str]) -> Optional[List[Tuple[str, str]]]:
+        """Cached skill list if it was built from the same catalog checksum."""
+        if checksum is None or not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('catalog_checksum') != checksum or not cached.get('skills'):
+            # An empty list is never a valid catalog result: query again
+            return None
+        logger.info(f"Loaded {len(cached['skills'])} ESCO tech skills from cache (catalog {checksum[:12]})")
+        return [tuple(row) for row in cached['skills']]
+
+    @staticmethod
+    def _write_tech_skills_cache(cache_path: Path, checksum: Optional[str],
+                                 esco_skills: List[Tuple[str, str]]) -> None:
+        """Persist the skill list keyed by catalog checksum (no-op without a catalog version)."""
+        if checksum is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'catalog_checksum': checksum, 'skills': esco_skills}, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Could not write ESCO tech skills cache: {e}")
+
     def extract_skills(self, text: str) -> List[NERSkill]:
         """Extract skills from text using NER."""
         if not text or not self.nlp:
@@ -1,4 +1,4 @@
 # LLM Processor Package
 # Lazy imports to avoid circular dependencies
 
-__all__ = ['LLMExtractionPipeline', 'LLMHandler', 'PromptTemplates']
+__all__ = ['ClusterLabeler', 'LLMExtractionPipeline', 'LLMHandler', 'PromptTemplates']
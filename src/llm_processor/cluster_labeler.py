@@ -0,0 +1,221 @@
+"""
+Cluster Labeler - Batched LLM labels for skill clusters with a signature cache.
+
+Each cluster is described by its signature: the sorted, normalized set of its
+top-k skills. Labels are cached per signature hash (JSON file), so a weekly
+re-clustering only sends new clusters to the LLM:
+
+    exact      same signature as a cached cluster → cached label
+    similar    Jaccard(signature, cached signature) >= reuse_threshold
+               (a lightly changed cluster) → that cluster's label, stored
+               under the new signature as well
+    llm        remaining clusters, packed ``batch_size`` per prompt
+    fallback   LLM unavailable or no label returned → top-3 skills (not cached)
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from pathlib import Path
+import hashlib
+import json
+import logging
+import time
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+def cluster_signature(top_skills: List[str], top_k: int = 10) -> Tuple[str, List[str]]:
+    """Hash and normalized skill list of a cluster's top-k skills."""
+    skills = sorted({skill.strip().lower() for skill in top_skills[:top_k] if skill and skill.strip()})
+    digest = hashlib.sha256('\n'.join(skills).encode('utf-8')).hexdigest()
+    return digest, skills
+
+
+def fallback_label(top_skills: List[str]) -> str:
+    """Same label the clusterer produces without an LLM."""
+    return ", ".join(top_skills[:3])
+
+
+class ClusterLabeler:
+    """Labels clusters from their top skills, reusing cached labels across runs."""
+
+    def __init__(
+        self,
+        handler=None,
+        cache_path: Optional[str] = None,
+        top_k: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        reuse_threshold: Optional[float] = None
+    ):
+        """
+        Initialize labeler.
+
+        Args:
+            handler: LLMHandler to use (created on first cache miss if None)
+            cache_path: Label cache file (default: CLUSTER_LABEL_CACHE_PATH)
+            top_k: Top skills per cluster used for the signature and prompt
+            batch_size: Clusters per prompt
+            reuse_threshold: Min signature Jaccard to reuse a label of a changed cluster
+        """
+        self.settings = get_settings()
+        self.handler = handler
+        self.cache_path = Path(cache_path or self.settings.cluster_label_cache_path)
+        self.top_k = top_k or self.settings.cluster_label_top_k
+        self.batch_size = batch_size or self.settings.cluster_label_batch_size
+        self.reuse_threshold = (
+            reuse_threshold if reuse_threshold is not None else self.settings.cluster_label_reuse_threshold
+        )
+        self.cache = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable label cache {self.cache_path}: {e}")
+            return {}
+        if data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('entries', {})
+
+    def _save_cache(self):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'entries': self.cache}, f, ensure_ascii=False)
+        tmp_path.replace(self.cache_path)
+
+    def _find_similar(self, skills: List[str], used: set) -> Optional[str]:
+        """Cached signature with the highest Jaccard >= reuse_threshold (each reused once per run)."""
+        skill_set = set(skills)
+        best_key, best_score = None, self.reuse_threshold
+        for key, entry in self.cache.items():
+            if key in used:
+                continue
+            cached = set(entry['skills'])
+            score = len(skill_set & cached) / len(skill_set | cached) if skill_set | cached else 0.0
+            if score >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def _get_handler(self):
+        if self.handler is None:
+            from llm_processor.llm_handler import LLMHandler
+            self.handler = LLMHandler()
+        return self.handler
+
+    def _label_batch(self, batch: List[Dict[str, Any]]) -> Tuple[Dict[int, str], int]:
+        """One packed prompt for a batch of clusters; returns (labels, tokens used)."""
+        from llm_processor.prompts import PromptTemplates
+
+        lines = "\n".join(
+            f"{c['cluster_id']}: {', '.join(c['top_skills'][:self.top_k])}" for c in batch
+        )
+        prompt = PromptTemplates().get_prompt(
+            "label_clusters", clusters=lines, example_id=batch[0]['cluster_id']
+        )
+        response = self._get_handler().generate_json(
+            prompt,
+            max_tokens=min(self.settings.llm_max_tokens, 32 * len(batch) + 64),
+            temperature=0.1
+        )
+
+        parsed = response.get('parsed_json') or {}
+        labels = {}
+        for cluster in batch:
+            label = parsed.get(str(cluster['cluster_id']))
+            if isinstance(label, str) and label.strip():
+                labels[cluster['cluster_id']] = label.strip()[:80]
+        return labels, int(response.get('tokens_used') or 0)
+
+    def label_clusters(self, clusters: List[Dict[str, Any]]) -> Tuple[Dict[int, Dict[str, str]], Dict[str, Any]]:
+        """
+        Label clusters (dicts with 'cluster_id' and 'top_skills'; noise is skipped).
+
+        Returns:
+            (labels, stats): labels maps cluster_id → {'label', 'source'};
+            stats has hit counts, LLM calls, tokens and seconds of the run
+        """
+        start = time.time()
+        labels: Dict[int, Dict[str, str]] = {}
+        pending: List[Dict[str, Any]] = []
+        signatures: Dict[int, Tuple[str, List[str]]] = {}
+        used_similar: set = set()
+        now = datetime.now().isoformat()
+        stats = {
+            'n_clusters': 0, 'exact_hits': 0, 'similar_hits': 0, 'llm_labelled': 0,
+            'fallback': 0, 'llm_calls': 0, 'tokens_used': 0, 'llm_seconds': 0.0
+        }
+
+        for cluster in clusters:
+            cluster_id = cluster['cluster_id']
+            if cluster_id == -1:
+                continue
+            stats['n_clusters'] += 1
+
+            key, skills = cluster_signature(cluster['top_skills'], self.top_k)
+            signatures[cluster_id] = (key, skills)
+
+            if key in self.cache:
+                self.cache[key]['last_used'] = now
+                labels[cluster_id] = {'label': self.cache[key]['label'], 'source': 'exact'}
+                stats['exact_hits'] += 1
+                continue
+
+            similar = self._find_similar(skills, used_similar)
+            if similar:
+                used_similar.add(similar)
+                label = self.cache[similar]['label']
+                self.cache[key] = {
+                    'skills': skills, 'label': label, 'model': self.cache[similar].get('model'),
+                    'created_at': now, 'last_used': now
+                }
+                labels[cluster_id] = {'label': label, 'source': 'similar'}
+                stats['similar_hits'] += 1
+                continue
+
+            pending.append(cluster)
+
+        if pending:
+            llm_start = time.time()
+            try:
+                handler = self._get_handler()
+                for i in range(0, len(pending), self.batch_size):
+                    batch = pending[i:i + self.batch_size]
+                    batch_labels, tokens = self._label_batch(batch)
+                    stats['llm_calls'] += 1
+                    stats['tokens_used'] += tokens
+                    for cluster_id, label in batch_labels.items():
+                        key, skills = signatures[cluster_id]
+                        self.cache[key] = {
+                            'skills': skills, 'label': label, 'model': handler.model_name,
+                            'created_at': now, 'last_used': now
+                        }
+                        labels[cluster_id] = {'label': label, 'source': 'llm'}
+                        stats['llm_labelled'] += 1
+            except Exception as e:
+                logger.warning(f"LLM labelling unavailable, using top-skill labels: {e}")
+                stats['llm_error'] = str(e)
+            stats['llm_seconds'] = round(time.time() - llm_start, 2)
+
+        for cluster in pending:
+            if cluster['cluster_id'] not in labels:
+                labels[cluster['cluster_id']] = {'label': fallback_label(cluster['top_skills']), 'source': 'fallback'}
+                stats['fallback'] += 1
+
+        if stats['n_clusters']:
+            self._save_cache()
+
+        stats['total_seconds'] = round(time.time() - start, 2)
+        logger.info(
+            f"Cluster labels: {stats['exact_hits']} cached, {stats['similar_hits']} similar, "
+            f"{stats['llm_labelled']} from LLM ({stats['llm_calls']} calls, {stats['tokens_used']} tokens, "
+            f"{stats['llm_seconds']}s), {stats['fallback']} fallback"
+        )
+        return labels, stats
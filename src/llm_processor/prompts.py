@@ -21,6 +21,7 @@ class PromptTemplates:
         return {
             "extract_skills": self.EXTRACT_SKILLS_TEMPLATE,
             "extract_skills_structured": self.EXTRACT_SKILLS_STRUCTURED_TEMPLATE,
+            "label_clusters": self.LABEL_CLUSTERS_TEMPLATE,
         }
 
     # === DIRECT SKILL EXTRACTION PROMPTS ===
@@ -215,6 +216,32 @@ Analiza esta oferta de trabajo y extrae todas las habilidades técnicas, clasifi
 
 SOLO el JSON, sin explicaciones."""
 
+    # === CLUSTER LABELLING PROMPT ===
+
+    LABEL_CLUSTERS_TEMPLATE = """Eres un analista del mercado laboral tecnológico en América Latina.
+
+Cada línea es un cluster de habilidades (ID: habilidades más frecuentes del cluster).
+Asigna a cada cluster una etiqueta corta (2 a 5 palabras, en español) que describa el área común de esas habilidades.
+
+**Clusters:**
+{clusters}
+
+**Reglas:**
+- Una etiqueta por ID, usando exactamente los IDs dados
+- Etiquetas específicas ("Desarrollo Backend Java", no "Tecnología")
+- Sin explicaciones
+
+**Responde con JSON:**
+```json
+{{
+  "{example_id}": "Etiqueta del cluster"
+}}
+```
+
+SOLO el JSON, sin explicaciones.
+
+JSON:"""
+
     # === HELPER METHODS ===
 
     def get_prompt(self, template_name: str, **kwargs) -> str:
@@ -878,7 +878,11 @@ def generate_embeddings(
 
 
 @app.command()
-def build_faiss_index():
+def build_faiss_index(
+    compact_dim: int = typer.Option(0, "--compact-dim", help="Reduce vectors to this dimension (0 = full 768D)"),
+    compact_method: str = typer.Option("pca", "--compact-method", help="Dimension reduction: pca or truncate"),
+    storage: str = typer.Option("float32", "--storage", help="Index precision: float32, float16 or int8")
+):
     """Build FAISS index from skill embeddings for fast semantic search."""
     import subprocess
 
@@ -889,7 +893,10 @@ def build_faiss_index():
 
     # Build command
     script_path = Path(__file__).parent.parent / "scripts" / "phase0_build_faiss_index.py"
-    cmd = [sys.executable, str(script_path)]
+    cmd = [sys.executable, str(script_path), "--storage", storage]
+
+    if compact_dim:
+        cmd.extend(["--compact-dim", str(compact_dim), "--compact-method", compact_method])
 
     # Run script
     try:
@@ -903,6 +910,128 @@ def build_faiss_index():
         raise typer.Exit(code=1)
 
 
+@app.command("export-embedding-snapshot")
+def export_embedding_snapshot(
+    version: Optional[str] = typer.Option(None, "--version", help="Snapshot version name (default: timestamp)"),
+    esco_only: bool = typer.Option(False, "--esco-only", help="Only skills with an ESCO mapping"),
+    skill_type: Optional[str] = typer.Option(None, "--skill-type", help="Only skills of this type (hard, soft)"),
+    dtype: str = typer.Option("float32", "--dtype", help="Storage dtype: float32, float16 or int8"),
+    projection: Optional[str] = typer.Option(None, "--projection", help="Fitted projection (.npz) for a compact snapshot")
+):
+    """Export skill embeddings to a versioned memory-mapped snapshot (.npy + Parquet)."""
+    import subprocess
+
+    typer.echo("\n" + "="*60)
+    typer.echo("EXPORT EMBEDDING SNAPSHOT")
+    typer.echo("="*60)
+    typer.echo()
+
+    # Build command
+    project_dir = Path(__file__).parent.parent
+    script_path = project_dir / "scripts" / "export_embedding_snapshot.py"
+    cmd = [sys.executable, str(script_path)]
+
+    if version:
+        cmd.extend(["--version", version])
+    if esco_only:
+        cmd.append("--esco-only")
+    if skill_type:
+        cmd.extend(["--skill-type", skill_type])
+    if projection:
+        cmd.extend(["--projection", projection])
+    cmd.extend(["--dtype", dtype])
+
+    # Set environment
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(project_dir / "src")
+    env["DATABASE_URL"] = settings.database_url
+
+    # Run export
+    try:
+        result = subprocess.run(cmd, env=env, check=True, cwd=project_dir)
+        if result.returncode == 0:
+            typer.echo("\n Snapshot exported successfully!")
+            typer.echo(f"Saved to: {settings.embedding_snapshot_dir}")
+        else:
+            typer.echo(f"\n Failed to export snapshot (exit code: {result.returncode})")
+    except subprocess.CalledProcessError as e:
+        typer.echo(f"\n Error exporting snapshot: {e}")
+        raise typer.Exit(code=1)
+
+
+@app.command("load-esco-catalog")
+def load_esco_catalog(
+    no_onet: bool = typer.Option(False, "--no-onet", help="Skip O*NET Hot Technologies"),
+    force: bool = typer.Option(False, "--force", help="Swap even if the catalog checksum is unchanged")
+):
+    """Bulk-load ESCO + O*NET into staging tables and swap them in atomically."""
+    import subprocess
+
+    typer.echo("\n" + "="*60)
+    typer.echo("LOAD ESCO CATALOG")
+    typer.echo("="*60)
+    typer.echo()
+
+    project_dir = Path(__file__).parent.parent
+
+    # Set environment
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(project_dir / "src")
+    env["DATABASE_URL"] = settings.database_url
+
+    cmd = [sys.executable, str(project_dir / "scripts" / "load_esco_catalog.py")]
+    if no_onet:
+        cmd.append("--no-onet")
+    if force:
+        cmd.append("--force")
+
+    try:
+        subprocess.run(cmd, env=env, check=True, cwd=project_dir)
+        typer.echo("\n ESCO catalog loaded!")
+    except subprocess.CalledProcessError as e:
+        typer.echo(f"\n Error loading ESCO catalog: {e}")
+        raise typer.Exit(code=1)
+
+
+@app.command("compact-embeddings")
+def compact_embeddings(
+    method: str = typer.Option(None, "--method", help="Dimension reduction: pca or truncate (default: EMBEDDING_COMPACT_METHOD)"),
+    dim: int = typer.Option(None, "--dim", help="Compact dimension (default: EMBEDDING_COMPACT_DIM)"),
+    evaluate: bool = typer.Option(False, "--evaluate", help="Also run the full vs compact evaluation")
+):
+    """Populate halfvec compact embeddings (migration 010) and optionally evaluate them."""
+    import subprocess
+
+    typer.echo("\n" + "="*60)
+    typer.echo("COMPACT SKILL EMBEDDINGS")
+    typer.echo("="*60)
+    typer.echo()
+
+    project_dir = Path(__file__).parent.parent
+    method = method or settings.embedding_compact_method
+    dim = dim or settings.embedding_compact_dim
+
+    # Set environment
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(project_dir / "src")
+    env["DATABASE_URL"] = settings.database_url
+
+    cmd = [sys.executable, str(project_dir / "scripts" / "compact_skill_embeddings.py"),
+           "--method", method, "--dim", str(dim)]
+
+    try:
+        subprocess.run(cmd, env=env, check=True, cwd=project_dir)
+        typer.echo("\n Compact embeddings written!")
+
+        if evaluate:
+            eval_cmd = [sys.executable, str(project_dir / "scripts" / "evaluate_embedding_compression.py"),
+                        "--method", method, "--dims", str(dim)]
+            subprocess.run(eval_cmd, env=env, check=True, cwd=project_dir)
+    except subprocess.CalledProcessError as e:
+        typer.echo(f"\n Error compacting embeddings: {e}")
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def test_embeddings(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output")
@@ -1006,6 +1135,47 @@ def cluster(
         raise typer.Exit(code=1)
 
 
+@app.command("cluster-stability")
+def cluster_stability(
+    pipeline: str = typer.Argument(..., help="Pipeline in the clustering model store (e.g. 'pipeline_a_30k_pre')"),
+    replicates: Optional[int] = typer.Option(None, "--replicates", "-k", help="Replicates (default: CLUSTER_STABILITY_REPLICATES)"),
+    method: str = typer.Option("subsample", "--method", "-m", help="subsample or bootstrap"),
+    fraction: float = typer.Option(0.8, "--fraction", help="Share of points per subsample"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Worker processes (0 = all cores)"),
+    no_db: bool = typer.Option(False, "--no-db", help="Only write the JSON report")
+):
+    """Refit HDBSCAN on bootstrap/subsample replicates and report per-cluster stability."""
+    import subprocess
+
+    typer.echo("\n" + "="*60)
+    typer.echo("CLUSTER STABILITY")
+    typer.echo("="*60)
+    typer.echo()
+
+    project_dir = Path(__file__).parent.parent
+
+    # Set environment
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(project_dir / "src")
+    env["DATABASE_URL"] = settings.database_url
+
+    cmd = [sys.executable, str(project_dir / "scripts" / "cluster_stability.py"), pipeline,
+           "--method", method, "--fraction", str(fraction)]
+    if replicates is not None:
+        cmd.extend(["--replicates", str(replicates)])
+    if workers is not None:
+        cmd.extend(["--workers", str(workers)])
+    if no_db:
+        cmd.append("--no-db")
+
+    try:
+        subprocess.run(cmd, env=env, check=True, cwd=project_dir)
+        typer.echo("\n Stability analysis completed!")
+    except subprocess.CalledProcessError as e:
+        typer.echo(f"\n Error during stability analysis: {e}")
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def cluster_all_final(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output")
@@ -1600,6 +1770,69 @@ def generate_extracted_embeddings(
 # TEMPORAL ANALYSIS COMMANDS
 # =====================================================================
 
+@app.command("refresh-temporal-cube")
+def refresh_temporal_cube(
+    full: bool = typer.Option(False, "--full", help="Rebuild every month instead of only the ones with new skills"),
+    source: Optional[str] = typer.Option(None, "--source", help="extracted or gold_standard (default: both)")
+):
+    """Update the skill × month count cube (skill_period_counts) read by temporal analytics."""
+    try:
+        import psycopg2
+        from config.database import get_database_url
+        from database.temporal_cube import refresh_skill_period_counts
+
+        typer.echo("\n" + "="*60)
+        typer.echo("REFRESH SKILL PERIOD COUNTS")
+        typer.echo("="*60)
+        typer.echo()
+
+        conn = psycopg2.connect(get_database_url())
+        try:
+            summaries = refresh_skill_period_counts(conn, sources=[source] if source else None, full=full)
+        finally:
+            conn.close()
+
+        for summary in summaries:
+            typer.echo(
+                f"  {summary['source']:<14} {summary['mode']:<12} "
+                f"{summary['months']} months, {summary['rows']:,} rows ({summary['seconds']:.1f}s)"
+            )
+    except Exception as e:
+        typer.echo(f"\n Error refreshing temporal cube: {e}")
+        raise typer.Exit(code=1)
+
+
+@app.command("rebuild-demand-rollups")
+def rebuild_demand_rollups_command(
+    source: Optional[str] = typer.Option(None, "--source", help="extracted, enhanced or gold_standard (default: all)")
+):
+    """Recompute the skill demand rollups read by /api/skills and /api/stats (backfill or repair)."""
+    try:
+        import psycopg2
+        from config.database import get_database_url
+        from database.demand_rollup import rebuild_demand_rollups
+
+        typer.echo("\n" + "="*60)
+        typer.echo("REBUILD SKILL DEMAND ROLLUPS")
+        typer.echo("="*60)
+        typer.echo()
+
+        conn = psycopg2.connect(get_database_url())
+        try:
+            summaries = rebuild_demand_rollups(conn, sources=[source] if source else None)
+        finally:
+            conn.close()
+
+        for summary in summaries:
+            typer.echo(
+                f"  {summary['source']:<14} {summary['rows']:,} rows, "
+                f"{summary['profile_rows']:,} job profile rows ({summary['seconds']:.1f}s)"
+            )
+    except Exception as e:
+        typer.echo(f"\n Error rebuilding demand rollups: {e}")
+        raise typer.Exit(code=1)
+
+
 @app.command("temporal-analysis")
 def temporal_analysis(
     config: Optional[str] = typer.Option(None, "--config", "-c",
@@ -134,6 +134,14 @@ celery_app.conf.beat_schedule = {
         'args': (500,)  # Process up to 500 pending jobs
     },
 
+    # 6:45 AM - Update the skill × month count cube read by /api/temporal/*
+    # (backstop: skills_extracted events already queue a refresh after extraction)
+    'daily-skill-period-counts-refresh': {
+        'task': 'src.tasks.extraction_tasks.refresh_skill_period_counts_task',
+        'schedule': crontab(hour=6, minute=45),
+        'args': ()
+    },
+
     # 7:00 AM - Generate embeddings for new extracted skills
     'daily-embeddings-generation': {
         'task': 'src.tasks.embeddings_tasks.generate_embeddings_task',
@@ -142,22 +150,37 @@ celery_app.conf.beat_schedule = {
     },
 
     # ===== CLUSTERING SCHEDULES =====
-    # Weekly clustering on Sunday at 2:00 AM (2 configurations: PRE and POST ESCO)
-
-    # Sunday 2:00 AM - Pipeline A 30k PRE-ESCO (all extracted skills)
-    'weekly-clustering-pipeline-a-pre-esco': {
-        'task': 'src.tasks.clustering_tasks.run_clustering_task',
-        'schedule': crontab(day_of_week=0, hour=2, minute=0),
+    # Nightly incremental assignment after embeddings (2 configurations: PRE and POST ESCO).
+    # New skills are placed with the persisted UMAP/HDBSCAN models; a full refit
+    # (run_clustering_task) is only queued when drift/noise passes the thresholds
+    # or no model exists yet.
+
+    # 8:00 AM - Pipeline A 30k PRE-ESCO (all extracted skills)
+    'nightly-cluster-assignment-pipeline-a-pre-esco': {
+        'task': 'src.tasks.clustering_tasks.assign_new_skills_task',
+        'schedule': crontab(hour=8, minute=0),
         'args': ('pipeline_a_30k_pre', 50, None)
     },
 
-    # Sunday 2:30 AM - Pipeline A 30k POST-ESCO (only skills with ESCO mapping)
-    'weekly-clustering-pipeline-a-post-esco': {
-        'task': 'src.tasks.clustering_tasks.run_clustering_task',
-        'schedule': crontab(day_of_week=0, hour=2, minute=30),
+    # 8:30 AM - Pipeline A 30k POST-ESCO (only skills with ESCO mapping)
+    'nightly-cluster-assignment-pipeline-a-post-esco': {
+        'task': 'src.tasks.clustering_tasks.assign_new_skills_task',
+        'schedule': crontab(hour=8, minute=30),
         'args': ('pipeline_a_30k_post', 50, None)
     },
 
+    # Sunday 9:00 AM - Weekly HDBSCAN stability (20 subsample replicates per pipeline)
+    'weekly-cluster-stability-pipeline-a-pre-esco': {
+        'task': 'src.tasks.clustering_tasks.cluster_stability_task',
+        'schedule': crontab(hour=9, minute=0, day_of_week=0),
+        'args': ('pipeline_a_30k_pre',)
+    },
+    'weekly-cluster-stability-pipeline-a-post-esco': {
+        'task': 'src.tasks.clustering_tasks.cluster_stability_task',
+        'schedule': crontab(hour=10, minute=0, day_of_week=0),
+        'args': ('pipeline_a_30k_post',)
+    },
+
     # ===== MAINTENANCE SCHEDULES =====
     # Daily database backup at 1:00 AM (before scraping starts)
     'daily-database-backup': {
@@ -8,6 +8,7 @@ import os
 from pathlib import Path
 from celery import Task
 from src.tasks.celery_app import celery_app
+from src.events import publish_event
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ def clean_jobs_task(
     1. Fetch unprocessed raw_jobs
     2. Clean and normalize text fields
     3. Save to cleaned_jobs table
+    4. Publish jobs_cleaned (invalidates cached API job listings and counts)
 
     Args:
         batch_size: Number of jobs to process per batch
@@ -82,6 +84,18 @@ def clean_jobs_task(
         logger.info(f"✅ Cleaning completed successfully")
         logger.info(f"Output: {result.stdout[-500:]}")  # Last 500 chars
 
+        # Emit event to Redis Pub/Sub (cleaned_jobs changed)
+        try:
+            publish_event('jobs_cleaned', {
+                'batch_size': batch_size,
+                'portal': portal,
+                'country': country,
+                'task_id': self.request.id
+            })
+            logger.info("📢 Event published: jobs_cleaned")
+        except Exception as exc:
+            logger.error(f"Failed to publish jobs_cleaned event: {exc}")
+
         return {
             'status': 'success',
             'batch_size': batch_size,
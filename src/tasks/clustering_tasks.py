@@ -6,40 +6,126 @@ import logging
 import psycopg2
 import os
 import json
+import time
 import numpy as np
 from datetime import datetime
 from celery import Task
 from src.tasks.celery_app import celery_app
 from src.analyzer.dimension_reducer import DimensionReducer
 from src.analyzer.clustering import SkillClusterer
+from src.analyzer.microclustering import MicroClusterer, default_n_micro_clusters
+from src.analyzer.artifacts import save_array_artifact, load_array_artifact
+from src.analyzer.model_store import (
+    ClusteringModelStore,
+    assess_drift,
+    assignment_agreement,
+    input_hash
+)
+from src.config.settings import get_settings
+from src.events import publish_event
+from src.embedder.snapshot import load_snapshot
+from pgvector.psycopg2 import register_vector
 
 logger = logging.getLogger(__name__)
 
 
+def _skill_population_query(country_filter: str = None, exclude_keys: list = None):
+    """
+    SQL and params of the clustering population: one row per embedding key
+    (LOWER(TRIM(skill_text)), the key snapshots match on) with its
+    occurrences in enhanced_skills.
+
+    Rows: (embedding_id, embedding, skill_text, skill_type, occurrences, skill_key).
+    Embeddings whose texts differ only by case/whitespace share a key; one
+    of them is kept so the key's occurrences are weighted once.
+
+    exclude_keys leaves out keys already in a fitted model (incremental
+    assignment selects from the same population as the fit).
+    """
+    country_condition = "AND rj.country = %s" if country_filter else ""
+    exclude_condition = "WHERE NOT (counts.skill_key = ANY(%s))" if exclude_keys is not None else ""
+    query = f"""
+        SELECT
+            se.embedding_id,
+            se.embedding,
+            se.skill_text,
+            counts.skill_type,
+            counts.occurrences,
+            counts.skill_key
+        FROM (
+            SELECT
+                LOWER(TRIM(COALESCE(m.embedding_key, enh.normalized_skill))) AS skill_key,
+                MODE() WITHIN GROUP (ORDER BY enh.skill_type) AS skill_type,
+                COUNT(*) AS occurrences
+            FROM enhanced_skills enh
+            JOIN raw_jobs rj ON enh.job_id = rj.job_id
+            LEFT JOIN skill_canonical_map m ON m.skill_text = enh.normalized_skill
+            WHERE enh.normalized_skill IS NOT NULL
+              {country_condition}
+            GROUP BY 1
+        ) counts
+        JOIN (
+            SELECT DISTINCT ON (LOWER(TRIM(skill_text)))
+                embedding_id,
+                LOWER(TRIM(skill_text)) AS skill_key
+            FROM skill_embeddings
+            ORDER BY LOWER(TRIM(skill_text)), skill_text
+        ) keys ON keys.skill_key = counts.skill_key
+        JOIN skill_embeddings se ON se.embedding_id = keys.embedding_id
+        {exclude_condition}
+        ORDER BY counts.occurrences DESC, se.skill_text
+    """
+    params = [country_filter] if country_filter else []
+    if exclude_keys is not None:
+        params.append(list(exclude_keys))
+    return query, params
+
+
 @celery_app.task(bind=True, max_retries=2, default_retry_delay=120)
 def run_clustering_task(
     self: Task,
     pipeline_name: str,
     n_clusters: int = 50,
-    country_filter: str = None
+    country_filter: str = None,
+    snapshot: str = None,
+    silhouette_method: str = None,
+    mode: str = None
 ) -> dict:
     """
     Run clustering analysis on enhanced skills.
 
     This task:
-    1. Loads enhanced skills and embeddings from database
+    1. Loads unique enhanced skills (with occurrence counts, per country if
+       filtered) and their embeddings from database
     2. Runs clustering algorithm (KMeans, HDBSCAN, etc.)
-    3. Generates cluster labels using LLM
+    3. Generates cluster labels using LLM (batched, cached by top-skill signature)
     4. Saves results to analysis_results table
 
     Args:
         pipeline_name: Name of the clustering pipeline (e.g., 'pipeline_b_300_post')
         n_clusters: Number of clusters to generate
         country_filter: Optional country code filter (e.g., 'CO', 'MX')
+        snapshot: Optional embedding snapshot version/path ('latest' allowed).
+            When given, vectors are read from the memory-mapped snapshot
+            instead of the database (country_filter is ignored).
+        silhouette_method: auto/exact/chunked/sampled/none
+            (default: CLUSTER_SILHOUETTE_METHOD)
+        mode: 'exact' (UMAP+HDBSCAN on every skill) or 'microcluster'
+            (streamed micro-clusters + HDBSCAN on their centroids, for
+            million-scale snapshots; requires snapshot). Default: CLUSTER_MODE.
+            Micro-cluster runs do not save an incremental-assignment model.
 
     Returns:
         dict: Clustering results with statistics
     """
+    run_start = time.time()
+    settings = get_settings()
+    mode = mode or settings.cluster_mode
+    if mode not in ('exact', 'microcluster'):
+        raise ValueError(f"Unknown clustering mode '{mode}'. Use 'exact' or 'microcluster'")
+    if mode == 'microcluster' and not snapshot:
+        raise ValueError("Micro-cluster mode streams embeddings from a snapshot; pass snapshot='latest' or a version")
+
     try:
         # Update task state: Starting
         self.update_state(
@@ -58,6 +144,7 @@ def run_clustering_task(
 
         # Connect to database
         conn = psycopg2.connect(os.getenv('DATABASE_URL'))
+        register_vector(conn)
         cursor = conn.cursor()
 
         # Update task state: Loading data
@@ -70,27 +157,31 @@ def run_clustering_task(
             }
         )
 
-        # Load embeddings from database
-        query = """
-            SELECT
-                se.embedding_id,
-                se.embedding_vector,
-                enh.normalized_skill,
-                enh.skill_type,
-                rj.country
-            FROM skill_embeddings se
-            JOIN enhanced_skills enh ON se.enhancement_id = enh.enhancement_id
-            JOIN raw_jobs rj ON enh.job_id = rj.job_id
-            WHERE se.embedding_vector IS NOT NULL
-        """
-
-        params = []
-        if country_filter:
-            query += " AND rj.country = %s"
-            params.append(country_filter)
-
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        # Rows: (embedding_id, embedding, skill_text, skill_type, occurrences, skill_key)
+        if snapshot:
+            # Load embeddings from a memory-mapped snapshot (no per-row transfer)
+            emb_snapshot = load_snapshot(snapshot)
+            rows = [
+                (skill_text, None, skill_text, skill_type, int(frequency), skill_text.strip().lower())
+                for skill_text, skill_type, frequency in zip(
+                    emb_snapshot.skill_texts, emb_snapshot.skill_types, emb_snapshot.frequencies
+                )
+            ]
+            # Micro-cluster mode streams batches from the mapped matrix instead
+            snapshot_vectors = emb_snapshot.as_float32() if mode == 'exact' else None
+            logger.info(f"📦 Using embedding snapshot {emb_snapshot.version} ({len(rows)} skills)")
+        else:
+            rows = None
+            snapshot_vectors = None
+
+        # Load unique skills with occurrence counts from database: one row per
+        # embedding instead of one per posting (identical vectors repeated
+        # thousands of times only inflate density for UMAP/HDBSCAN)
+        query, params = _skill_population_query(country_filter)
+
+        if rows is None:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
 
         if len(rows) < n_clusters:
             cursor.close()
@@ -100,7 +191,11 @@ def run_clustering_task(
                 f"Need at least {n_clusters} skills with embeddings."
             )
 
-        logger.info(f"📊 Loaded {len(rows)} skill embeddings for clustering")
+        skill_occurrences = np.array([row[4] for row in rows], dtype=np.int64)
+        logger.info(
+            f"📊 Loaded {len(rows)} unique skill embeddings for clustering "
+            f"({int(skill_occurrences.sum())} occurrences)"
+        )
 
         # Update task state: Running UMAP
         self.update_state(
@@ -115,66 +210,153 @@ def run_clustering_task(
 
         # Extract embeddings and metadata
         embedding_ids = [str(row[0]) for row in rows]
-        embedding_vectors = np.array([row[1] for row in rows])  # Already numpy-compatible
         skill_names = [row[2] for row in rows]
         skill_types = [row[3] for row in rows]
 
-        logger.info(f"   Embeddings shape: {embedding_vectors.shape}")
-
-        # Step 1: UMAP dimension reduction (to 2D for visualization)
-        umap_reducer = DimensionReducer(
-            n_components=2,
-            n_neighbors=15,
-            min_dist=0.1,
-            metric='cosine',
-            random_state=42,
-            verbose=True
-        )
-        embedding_2d = umap_reducer.fit_transform(embedding_vectors)
-        logger.info(f"   ✅ UMAP completed: {embedding_2d.shape}")
-
-        # Update task state: Running HDBSCAN
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': f'Running HDBSCAN clustering...',
-                'progress': 50,
-                'pipeline': pipeline_name,
-                'skills_loaded': len(rows)
-            }
-        )
-
-        # Step 2: HDBSCAN clustering on reduced embeddings
-        # min_cluster_size based on n_clusters (heuristic: total_skills / n_clusters)
-        estimated_min_cluster_size = max(5, len(rows) // n_clusters)
+        if mode == 'microcluster':
+            # Micro-clusters streamed from the snapshot, HDBSCAN on their centroids
+            n_micro = settings.cluster_micro_clusters or default_n_micro_clusters(len(rows))
+            micro = MicroClusterer(
+                method=settings.cluster_micro_method,
+                n_micro_clusters=n_micro,
+                batch_size=settings.cluster_micro_batch_size,
+                min_cluster_size=max(5, n_micro // n_clusters),
+                min_samples=5,
+                random_state=42
+            )
+            labels = micro.fit_predict(
+                emb_snapshot.embeddings, emb_snapshot.frequencies, scales=emb_snapshot.scales
+            )
+            embedding_2d = micro.embedding_2d_
+            clusterer = micro.clusterer
+            estimated_min_cluster_size = micro.min_cluster_size
+            algorithm = f"{settings.cluster_micro_method}+umap+hdbscan"
+        else:
+            micro = None
+            if snapshot_vectors is not None:
+                embedding_vectors = snapshot_vectors
+            else:
+                embedding_vectors = np.vstack([row[1] for row in rows]).astype(np.float32)
+
+            logger.info(f"   Embeddings shape: {embedding_vectors.shape}")
+
+            # Step 1: UMAP dimension reduction (to 2D for visualization)
+            umap_reducer = DimensionReducer(
+                n_components=2,
+                n_neighbors=15,
+                min_dist=0.1,
+                metric='cosine',
+                random_state=42,
+                verbose=True
+            )
+            embedding_2d = umap_reducer.fit_transform(embedding_vectors)
+            logger.info(f"   ✅ UMAP completed: {embedding_2d.shape}")
+
+            # Update task state: Running HDBSCAN
+            self.update_state(
+                state='PROGRESS',
+                meta={
+                    'current': f'Running HDBSCAN clustering...',
+                    'progress': 50,
+                    'pipeline': pipeline_name,
+                    'skills_loaded': len(rows)
+                }
+            )
 
-        clusterer = SkillClusterer(
-            min_cluster_size=estimated_min_cluster_size,
-            min_samples=5,
-            metric='euclidean',  # Euclidean on UMAP-reduced space
-            cluster_selection_method='eom',
-            allow_single_cluster=False
+            # Step 2: HDBSCAN clustering on reduced embeddings
+            # min_cluster_size based on n_clusters (heuristic: total_skills / n_clusters)
+            estimated_min_cluster_size = max(5, len(rows) // n_clusters)
+
+            clusterer = SkillClusterer(
+                min_cluster_size=estimated_min_cluster_size,
+                min_samples=5,
+                metric='euclidean',  # Euclidean on UMAP-reduced space
+                cluster_selection_method='eom',
+                allow_single_cluster=False,
+                prediction_data=True,  # Needed by assign_new_skills_task (approximate_predict)
+                gen_min_span_tree=True  # Needed for relative validity
+            )
+            labels = clusterer.fit_predict(embedding_2d)
+            algorithm = 'hdbscan+umap'
+
+        # Calculate metrics (silhouette method scales with the number of skills)
+        metrics = clusterer.calculate_metrics(
+            embedding_2d,
+            labels,
+            silhouette_method=silhouette_method or settings.cluster_silhouette_method,
+            silhouette_sample_size=settings.cluster_silhouette_sample_size,
+            validity='relative'
         )
-        labels = clusterer.fit_predict(embedding_2d)
 
-        # Calculate metrics
-        metrics = clusterer.calculate_metrics(embedding_2d, labels)
+        if micro is not None:
+            # No reducer/clusterer pair that places raw embeddings: nothing to persist
+            metrics['microcluster_timing'] = micro.timing_
+            model_version = datetime.now().strftime('%Y%m%d_%H%M%S')
+            fit_input_hash = emb_snapshot.content_hash
+        else:
+            # Agreement with what the previous model would assign to the same skills
+            model_store = ClusteringModelStore()
+            if model_store.has_model(pipeline_name):
+                try:
+                    previous_model = model_store.load(pipeline_name)
+                    previous_labels, _, _ = previous_model.assign(embedding_vectors)
+                    metrics['agreement_with_previous'] = {
+                        'model_version': previous_model.version,
+                        **assignment_agreement(previous_labels, labels)
+                    }
+                    logger.info(
+                        f"      Agreement with previous model: "
+                        f"ARI={metrics['agreement_with_previous']['adjusted_rand_index']:.3f}"
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not compare with previous clustering model: {e}")
+
+            # Persist fitted models for nightly incremental assignment
+            fit_input_hash = (
+                emb_snapshot.content_hash if snapshot
+                else input_hash(skill_names, embedding_vectors)
+            )
+            model_path = model_store.save(
+                pipeline_name,
+                umap_reducer,
+                clusterer,
+                skill_names,
+                embedding_vectors,
+                embedding_2d,
+                labels,
+                input_hash=fit_input_hash,
+                skill_keys=[row[5] for row in rows],
+                metadata={
+                    'n_clusters_requested': n_clusters,
+                    'country_filter': country_filter,
+                    'fit_seconds': round(time.time() - run_start, 2)
+                }
+            )
+            model_version = model_path.name
 
         logger.info(f"   ✅ HDBSCAN completed:")
         logger.info(f"      Clusters found: {metrics['n_clusters']}")
         logger.info(f"      Noise points: {metrics['n_noise']} ({metrics['noise_percentage']:.1f}%)")
         logger.info(f"      Silhouette: {metrics.get('silhouette_score', 0):.3f}")
 
-        # Build cluster assignments
-        cluster_assignments = {}
-        for i, embedding_id in enumerate(embedding_ids):
-            cluster_assignments[embedding_id] = int(labels[i])
+        # Count skills and skill occurrences per cluster (excluding noise=-1)
+        clustered = labels != -1
+        counts = np.bincount(labels[clustered]) if metrics['n_clusters'] else np.array([], dtype=np.int64)
+        occurrences = (
+            np.bincount(labels[clustered], weights=skill_occurrences[clustered])
+            if metrics['n_clusters'] else np.array([])
+        )
+        cluster_counts = {cluster_id: int(count) for cluster_id, count in enumerate(counts) if count}
+        cluster_occurrences = {
+            cluster_id: int(occurrences[cluster_id]) for cluster_id in cluster_counts
+        }
 
-        # Count skills per cluster (excluding noise=-1)
-        cluster_counts = {}
-        for cluster_id in labels:
-            if cluster_id != -1:
-                cluster_counts[int(cluster_id)] = cluster_counts.get(int(cluster_id), 0) + 1
+        # Occurrence-weighted view of the result (what share of demand is clustered)
+        total_occurrences = int(skill_occurrences.sum())
+        metrics['n_occurrences'] = total_occurrences
+        metrics['noise_occurrence_percentage'] = (
+            float(skill_occurrences[~clustered].sum() / total_occurrences * 100) if total_occurrences else 0.0
+        )
 
         # Update task state: Generating labels
         self.update_state(
@@ -187,30 +369,53 @@ def run_clustering_task(
             }
         )
 
-        # Generate cluster labels based on top skills
+        # Label clusters from their most frequent skills: cached LLM labels
+        # (batched prompts for new clusters), top-3 skills as fallback
+        cluster_summaries = clusterer.analyze_clusters(
+            labels,
+            skill_names,
+            skill_frequencies=skill_occurrences,
+            top_k=settings.cluster_label_top_k,
+            include_all_skills=False
+        )
+        llm_labels, labelling_stats = {}, None
+        if settings.cluster_llm_labels:
+            from src.llm_processor.cluster_labeler import ClusterLabeler
+            llm_labels, labelling_stats = ClusterLabeler().label_clusters(cluster_summaries)
+
         cluster_labels = {}
-        for cluster_id in sorted(set(labels)):
-            if cluster_id == -1:
-                cluster_labels[int(cluster_id)] = {
+        for summary in cluster_summaries:
+            if summary['cluster_id'] == -1:
+                cluster_labels[-1] = {
                     'label': 'Noise/Unclustered',
                     'description': 'Skills that did not fit into any cluster',
                     'size': metrics['n_noise']
                 }
             else:
-                # Get skills in this cluster
-                cluster_mask = labels == cluster_id
-                cluster_skills = [skill_names[i] for i in range(len(skill_names)) if cluster_mask[i]]
-
-                # Get top 5 most common skills (simple approach: first 5)
-                top_skills = cluster_skills[:5] if len(cluster_skills) > 5 else cluster_skills
-
-                cluster_labels[int(cluster_id)] = {
-                    'label': ', '.join(top_skills[:3]),
-                    'description': f'Cluster containing {len(cluster_skills)} skills',
-                    'size': len(cluster_skills),
-                    'top_skills': top_skills
+                llm_label = llm_labels.get(summary['cluster_id'], {})
+                cluster_labels[summary['cluster_id']] = {
+                    'label': llm_label.get('label', summary['auto_label']),
+                    'label_source': llm_label.get('source', 'top_skills'),
+                    'auto_label': summary['auto_label'],
+                    'description': f"Cluster containing {summary['size']} skills",
+                    'size': summary['size'],
+                    'occurrences': summary['total_frequency'],
+                    'top_skills': summary['top_skills']
                 }
 
+        # 2D coordinates and per-skill assignments (labels ↔ embedding ids, row i)
+        # go to binary artifacts, referenced from the results row
+        embedding_2d_artifact = save_array_artifact(
+            embedding_2d, f"{pipeline_name}/{model_version}/embedding_2d.npy"
+        )
+        labels_artifact = save_array_artifact(
+            labels, f"{pipeline_name}/{model_version}/labels.npy", dtype='int32'
+        )
+        embedding_ids_artifact = save_array_artifact(
+            np.array(embedding_ids, dtype=str), f"{pipeline_name}/{model_version}/embedding_ids.npy",
+            dtype=str
+        )
+
         # Save analysis results
         cursor.execute("""
             INSERT INTO analysis_results
@@ -224,14 +429,24 @@ def run_clustering_task(
                 'n_clusters_requested': n_clusters,
                 'n_clusters_found': metrics['n_clusters'],
                 'country_filter': country_filter,
-                'algorithm': 'hdbscan+umap',
+                'algorithm': algorithm,
+                'mode': mode,
                 'skills_analyzed': len(rows),
+                'occurrences_analyzed': total_occurrences,
+                'input': 'unique skills weighted by occurrences',
+                'snapshot': (
+                    {'version': emb_snapshot.version, 'content_hash': emb_snapshot.content_hash}
+                    if snapshot else None
+                ),
+                'model': {'version': model_version, 'input_hash': fit_input_hash, 'saved': micro is None},
                 'umap_params': {
                     'n_components': 2,
                     'n_neighbors': 15,
                     'min_dist': 0.1,
                     'metric': 'cosine'
                 },
+                'silhouette_method': metrics.get('silhouette_method'),
+                'microcluster_params': micro.get_parameters() if micro is not None else None,
                 'hdbscan_params': {
                     'min_cluster_size': estimated_min_cluster_size,
                     'min_samples': 5,
@@ -241,10 +456,18 @@ def run_clustering_task(
             }),
             json.dumps({
                 'cluster_labels': cluster_labels,
-                'cluster_assignments': cluster_assignments,
+                'cluster_assignments': {
+                    'labels_artifact': labels_artifact,
+                    'embedding_ids_artifact': embedding_ids_artifact,
+                    'n_skills': len(embedding_ids),
+                    'n_assigned': int(clustered.sum())
+                },
                 'cluster_counts': cluster_counts,
+                'cluster_occurrences': cluster_occurrences,
                 'metrics': metrics,
-                'embedding_2d': embedding_2d.tolist()  # Save for visualization
+                'labelling': labelling_stats,
+                'wall_seconds': round(time.time() - run_start, 2),
+                'embedding_2d_artifact': embedding_2d_artifact  # npy under CLUSTER_ARTIFACT_DIR
             }),
             datetime.now()
         ))
@@ -261,6 +484,19 @@ def run_clustering_task(
             f"(Silhouette: {metrics.get('silhouette_score', 0):.3f})"
         )
 
+        # Emit event to Redis Pub/Sub (invalidates cached API responses)
+        try:
+            publish_event('clustering_completed', {
+                'analysis_id': str(analysis_id),
+                'pipeline': pipeline_name,
+                'n_clusters': metrics['n_clusters'],
+                'skills_analyzed': len(rows),
+                'task_id': self.request.id
+            })
+            logger.info(f"📢 Event published: clustering_completed for {pipeline_name}")
+        except Exception as exc:
+            logger.error(f"Failed to publish clustering_completed event: {exc}")
+
         return {
             'status': 'success',
             'analysis_id': str(analysis_id),
@@ -268,12 +504,21 @@ def run_clustering_task(
             'n_clusters_requested': n_clusters,
             'n_clusters_found': metrics['n_clusters'],
             'skills_analyzed': len(rows),
+            'occurrences_analyzed': total_occurrences,
             'noise_points': metrics['n_noise'],
             'noise_percentage': metrics['noise_percentage'],
             'silhouette_score': metrics.get('silhouette_score', 0),
             'davies_bouldin_score': metrics.get('davies_bouldin_score', 0),
+            'relative_validity': metrics.get('relative_validity'),
+            'silhouette_method': metrics.get('silhouette_method'),
+            'silhouette_ci95': metrics.get('silhouette_ci95'),
             'country_filter': country_filter,
-            'algorithm': 'hdbscan+umap',
+            'algorithm': algorithm,
+            'mode': mode,
+            'model_version': model_version,
+            'agreement_with_previous': metrics.get('agreement_with_previous'),
+            'labelling': labelling_stats,
+            'wall_seconds': round(time.time() - run_start, 2),
             'task_id': self.request.id,
             'progress': 100,
             'completed_at': datetime.now().isoformat()
@@ -297,6 +542,272 @@ def run_clustering_task(
         raise self.retry(exc=exc, countdown=120 * (self.request.retries + 1))
 
 
+@celery_app.task(bind=True, max_retries=2, default_retry_delay=120)
+def assign_new_skills_task(
+    self: Task,
+    pipeline_name: str,
+    n_clusters: int = 50,
+    country_filter: str = None,
+    snapshot: str = None
+) -> dict:
+    """
+    Assign skills embedded since the last fit to the existing clusters.
+
+    This task:
+    1. Loads the pipeline's latest UMAP/HDBSCAN models from the model store
+    2. Finds skills of the fit population (snapshot, or the enhanced-skills
+       population of run_clustering_task) that were not part of the fit
+    3. Places them with reducer.transform + HDBSCAN approximate_predict
+    4. Queues a full refit (run_clustering_task) only if there is no model yet
+       or noise ratio / centroid drift / new-skill share pass the thresholds
+    5. Saves the assignments to analysis_results
+
+    Only exact fits save a model, so refits queued here always run in exact
+    mode. With CLUSTER_MODE=microcluster a lineage without a model is skipped:
+    micro-cluster runs are refitted on their own, not through this task.
+
+    Args:
+        pipeline_name: Clustering pipeline (model lineage) to update
+        n_clusters: Passed to run_clustering_task when a refit is needed
+        country_filter: Passed to run_clustering_task when a refit is needed
+        snapshot: Optional embedding snapshot to read new skills from
+            (default: skill_embeddings table)
+
+    Returns:
+        dict: Assignment summary, drift signals and wall time
+    """
+    run_start = time.time()
+    try:
+        settings = get_settings()
+        model_store = ClusteringModelStore()
+
+        if not model_store.has_model(pipeline_name):
+            if settings.cluster_mode == 'microcluster':
+                logger.info(
+                    f"🔬 No clustering model for {pipeline_name}: micro-cluster runs save none, "
+                    f"nothing to assign to"
+                )
+                return {
+                    'status': 'skipped',
+                    'pipeline': pipeline_name,
+                    'reasons': ['no model (micro-cluster mode)'],
+                    'wall_seconds': round(time.time() - run_start, 2)
+                }
+
+            logger.info(f"🔬 No clustering model for {pipeline_name} yet, queueing full refit")
+            refit = run_clustering_task.delay(
+                pipeline_name, n_clusters, country_filter, snapshot, mode='exact'
+            )
+            return {
+                'status': 'refit_queued',
+                'pipeline': pipeline_name,
+                'reasons': ['no model'],
+                'refit_task_id': refit.id,
+                'wall_seconds': round(time.time() - run_start, 2)
+            }
+
+        model = model_store.load(pipeline_name)
+        # Keys of the fit population: everything else in that population is new
+        known = set(model.skill_keys)
+
+        self.update_state(
+            state='PROGRESS',
+            meta={
+                'current': f'Loading skills added since model {model.version}...',
+                'progress': 20,
+                'pipeline': pipeline_name
+            }
+        )
+
+        conn = psycopg2.connect(os.getenv('DATABASE_URL'))
+
+        if snapshot:
+            # Snapshot fits use every snapshot row
+            emb_snapshot = load_snapshot(snapshot)
+            new_indices = [
+                i for i, text in enumerate(emb_snapshot.skill_texts)
+                if text.strip().lower() not in known
+            ]
+            new_texts = [emb_snapshot.skill_texts[i] for i in new_indices]
+            new_embeddings = (
+                emb_snapshot.as_float32()[new_indices] if new_indices
+                else np.empty((0, model.manifest['dim']), dtype=np.float32)
+            )
+        else:
+            # Same source, joins and filters as the fit (run_clustering_task)
+            register_vector(conn)
+            cursor = conn.cursor()
+            query, params = _skill_population_query(
+                model.manifest.get('country_filter', country_filter), exclude_keys=known
+            )
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            cursor.close()
+            new_texts = [row[2] for row in rows]
+            new_embeddings = (
+                np.vstack([row[1] for row in rows]).astype(np.float32) if rows
+                else np.empty((0, model.manifest['dim']), dtype=np.float32)
+            )
+
+        logger.info(f"📊 {len(new_texts)} new skills since model {pipeline_name}/{model.version}")
+
+        if not new_texts:
+            conn.close()
+            return {
+                'status': 'up_to_date',
+                'pipeline': pipeline_name,
+                'model_version': model.version,
+                'new_skills': 0,
+                'wall_seconds': round(time.time() - run_start, 2)
+            }
+
+        self.update_state(
+            state='PROGRESS',
+            meta={
+                'current': f'Assigning {len(new_texts)} new skills...',
+                'progress': 50,
+                'pipeline': pipeline_name
+            }
+        )
+
+        assign_start = time.time()
+        labels, strengths, coordinates = model.assign(new_embeddings)
+        assign_seconds = time.time() - assign_start
+
+        drift = assess_drift(
+            model,
+            new_embeddings,
+            labels,
+            noise_threshold=settings.cluster_refit_noise_ratio,
+            drift_threshold=settings.cluster_refit_drift,
+            new_fraction_threshold=settings.cluster_refit_new_fraction
+        )
+
+        coordinates_artifact = save_array_artifact(
+            coordinates,
+            f"{pipeline_name}/{model.version}/assigned_{datetime.now().strftime('%Y%m%d_%H%M%S')}.npy"
+        )
+
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO analysis_results
+            (analysis_type, parameters, results, created_at)
+            VALUES (%s, %s, %s, %s)
+            RETURNING analysis_id
+        """, (
+            'clustering_assignment',
+            json.dumps({
+                'pipeline': pipeline_name,
+                'model_version': model.version,
+                'model_input_hash': model.input_hash,
+                'snapshot': snapshot,
+                'algorithm': 'umap.transform+hdbscan.approximate_predict'
+            }),
+            json.dumps({
+                'cluster_assignments': {text: int(label) for text, label in zip(new_texts, labels)},
+                'membership_strengths': {text: float(p) for text, p in zip(new_texts, strengths)},
+                'embedding_2d_artifact': coordinates_artifact,
+                'drift': drift,
+                'assign_seconds': round(assign_seconds, 3),
+                'wall_seconds': round(time.time() - run_start, 2)
+            }),
+            datetime.now()
+        ))
+        analysis_id = cursor.fetchone()[0]
+        conn.commit()
+        cursor.close()
+        conn.close()
+
+        refit_task_id = None
+        if drift['needs_refit']:
+            logger.info(f"🔁 Refit needed for {pipeline_name}: {'; '.join(drift['reasons'])}")
+            refit_task_id = run_clustering_task.delay(
+                pipeline_name, n_clusters, country_filter, snapshot, mode='exact'
+            ).id
+
+        logger.info(
+            f"✅ Celery Worker: Assigned {len(new_texts)} new skills to {pipeline_name} "
+            f"(noise={drift['noise_ratio']:.1%}, drift={drift['centroid_drift']:.4f}, "
+            f"{assign_seconds:.2f}s)"
+        )
+
+        return {
+            'status': 'refit_queued' if refit_task_id else 'assigned',
+            'analysis_id': str(analysis_id),
+            'pipeline': pipeline_name,
+            'model_version': model.version,
+            'new_skills': len(new_texts),
+            'noise_ratio': drift['noise_ratio'],
+            'centroid_drift': drift['centroid_drift'],
+            'new_fraction': drift['new_fraction'],
+            'reasons': drift['reasons'],
+            'refit_task_id': refit_task_id,
+            'assign_seconds': round(assign_seconds, 3),
+            'wall_seconds': round(time.time() - run_start, 2),
+            'task_id': self.request.id,
+            'completed_at': datetime.now().isoformat()
+        }
+
+    except Exception as exc:
+        logger.error(f"❌ Celery Worker: Cluster assignment failed - {pipeline_name}: {str(exc)}")
+        raise self.retry(exc=exc, countdown=120 * (self.request.retries + 1))
+
+
+@celery_app.task(bind=True)
+def cluster_stability_task(
+    self: Task,
+    pipeline_name: str,
+    n_replicates: int = None,
+    method: str = 'subsample'
+) -> dict:
+    """
+    Weekly stability check of a pipeline's latest clustering model.
+
+    Runs scripts/cluster_stability.py in a subprocess: its process pool
+    cannot be started from a (daemonic) Celery worker process. The script
+    stores the result in analysis_results (analysis_type='clustering_stability').
+
+    Args:
+        pipeline_name: Clustering pipeline (model lineage) to assess
+        n_replicates: Replicates (default: settings.cluster_stability_replicates)
+        method: 'subsample' or 'bootstrap'
+
+    Returns:
+        dict: Status and wall time
+    """
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    run_start = time.time()
+    project_dir = Path(__file__).parent.parent.parent
+    cmd = [sys.executable, str(project_dir / "scripts" / "cluster_stability.py"), pipeline_name,
+           "--method", method]
+    if n_replicates:
+        cmd.extend(["--replicates", str(n_replicates)])
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(project_dir / "src")
+
+    logger.info(f"🔬 Celery Worker: Starting stability analysis - {pipeline_name} ({method})")
+    result = subprocess.run(cmd, env=env, cwd=project_dir, capture_output=True, text=True)
+
+    if result.returncode != 0:
+        logger.error(f"❌ Stability analysis failed - {pipeline_name}: {result.stderr[-2000:]}")
+        raise RuntimeError(f"cluster_stability.py exited with {result.returncode}")
+
+    logger.info(f"✅ Celery Worker: Stability analysis completed - {pipeline_name}")
+    return {
+        'status': 'success',
+        'pipeline': pipeline_name,
+        'method': method,
+        'output': result.stdout[-2000:],
+        'wall_seconds': round(time.time() - run_start, 2),
+        'task_id': self.request.id,
+        'completed_at': datetime.now().isoformat()
+    }
+
+
 @celery_app.task(bind=True)
 def analyze_cluster_task(
     self: Task,
@@ -339,14 +850,21 @@ def analyze_cluster_task(
             conn.close()
             raise ValueError(f"Analysis {analysis_id} not found")
 
-        results = json.loads(row[0])
+        results = row[0] if isinstance(row[0], dict) else json.loads(row[0])
         cluster_assignments = results.get('cluster_assignments', {})
 
         # Get skills in this cluster
-        skills_in_cluster = [
-            emb_id for emb_id, c_id in cluster_assignments.items()
-            if c_id == cluster_id
-        ]
+        if 'labels_artifact' in cluster_assignments:
+            # Memory-mapped labels; only the ids of this cluster are materialized
+            labels = load_array_artifact(cluster_assignments['labels_artifact'])
+            embedding_ids = load_array_artifact(cluster_assignments['embedding_ids_artifact'])
+            skills_in_cluster = embedding_ids[np.flatnonzero(labels == cluster_id)].tolist()
+        else:
+            # Results saved before assignments moved to artifacts
+            skills_in_cluster = [
+                emb_id for emb_id, c_id in cluster_assignments.items()
+                if c_id == cluster_id
+            ]
 
         logger.info(f"📊 Found {len(skills_in_cluster)} skills in cluster {cluster_id}")
 
@@ -388,6 +906,10 @@ def analyze_cluster_task(
 # result = task.get(timeout=3600)
 # print(f"Analysis ID: {result['analysis_id']}")
 #
+# # Nightly: place new skills with the persisted models (refit only on drift)
+# task = assign_new_skills_task.delay('pipeline_b_300_post')
+# print(task.get(timeout=600)['status'])
+#
 # # Analyze specific cluster
 # task = analyze_cluster_task.delay(result['analysis_id'], cluster_id=0)
 # analysis = task.get(timeout=600)
@@ -382,6 +382,43 @@ def process_pending_extractions(
         raise exc
 
 
+
+@celery_app.task
+def refresh_skill_period_counts_task(full: bool = False) -> dict:
+    """
+    Update the skill × month count cube (skill_period_counts) for temporal analytics.
+
+    Only months containing skills extracted since the last refresh are recomputed.
+    Queued shortly after skills_extracted events (events.handlers) and nightly
+    as a backstop; publishes skill_period_counts_refreshed when done.
+
+    Args:
+        full: Rebuild every month
+
+    Returns:
+        dict: Refresh summary per source
+    """
+    from src.database.temporal_cube import refresh_skill_period_counts
+
+    conn = psycopg2.connect(os.getenv('DATABASE_URL'))
+    try:
+        summaries = refresh_skill_period_counts(conn, full=full)
+    finally:
+        conn.close()
+
+    logger.info(f"📊 Skill period counts refreshed: {summaries}")
+
+    # Emit event to Redis Pub/Sub (invalidates cached /api/temporal responses)
+    try:
+        publish_event('skill_period_counts_refreshed', {'sources': summaries})
+    except Exception as exc:
+        logger.error(f"Failed to publish skill_period_counts_refreshed event: {exc}")
+
+    return {
+        'status': 'success',
+        'sources': summaries
+    }
+
 # Example usage:
 # from src.tasks.extraction_tasks import extract_skills_task, process_pending_extractions
 #
@@ -0,0 +1,92 @@
+"""
+Test the skill prefix index behind /api/skills/autocomplete.
+"""
+
+from types import SimpleNamespace
+import pytest
+from api import autocomplete
+from api.autocomplete import SkillAutocomplete, SkillPrefixIndex, normalize_prefix
+
+
+SKILLS = [
+    ('Python', 120),
+    ('Machine Learning', 80),
+    ('Deep Learning', 40),
+    ('PostgreSQL', 60),
+    ('Power BI', 60),
+    ('Learning Management Systems', 5),
+]
+
+
+class TestSkillPrefixIndex:
+    """Test prefix search over skill texts."""
+
+    @pytest.fixture
+    def index(self):
+        return SkillPrefixIndex(SKILLS)
+
+    def test_first_word_prefix(self, index):
+        """Skills starting with the prefix, most mentioned first (ties by name)."""
+        assert index.search('po') == [('PostgreSQL', 60), ('Power BI', 60)]
+
+    def test_later_word_prefix(self, index):
+        """Any word start matches; each skill is returned once."""
+        assert index.search('lear') == [
+            ('Machine Learning', 80), ('Deep Learning', 40), ('Learning Management Systems', 5)
+        ]
+
+    def test_case_and_whitespace(self, index):
+        """Prefixes are casefolded and whitespace-normalized."""
+        assert normalize_prefix('  MACHINE   le ') == 'machine le'
+        assert index.search('MACHINE   le') == [('Machine Learning', 80)]
+
+    def test_no_mid_word_match(self, index):
+        """Only word starts match ('ython' does not find Python)."""
+        assert index.search('ython') == []
+        assert index.search('') == []
+
+    def test_limit(self, index):
+        assert index.search('l', limit=2) == [('Machine Learning', 80), ('Deep Learning', 40)]
+
+    def test_precomputed_large_prefixes(self, monkeypatch):
+        """Answers precomputed for large slices equal a full ranking."""
+        monkeypatch.setattr(autocomplete, 'PRECOMPUTED_SLICE_SIZE', 5)
+        names = [f"{a}{b} skill" for a in 'ab' for b in 'abcdefgh']
+        skills = [(name, (i * 37) % 101) for i, name in enumerate(names)]
+        index = SkillPrefixIndex(skills)
+
+        assert 'a' in index.large_prefix_top
+        for prefix in ('a', 'b', 's', 'sk'):
+            expected = sorted(
+                (s for s in skills if any(w.startswith(prefix) for w in s[0].split())),
+                key=lambda s: (-s[1], s[0])
+            )[:10]
+            assert index.search(prefix) == expected
+
+
+class TestSkillAutocomplete:
+    """Test index builds and staleness."""
+
+    def stub_session(self, rows):
+        rows = [SimpleNamespace(source=source, skill_text=skill, count=count) for source, skill, count in rows]
+        result = SimpleNamespace(fetchall=lambda: rows)
+        return SimpleNamespace(execute=lambda statement: result)
+
+    def test_build_per_source(self):
+        """One index per source, built on the first request."""
+        completer = SkillAutocomplete()
+        session = self.stub_session([('extracted', 'Python', 3), ('enhanced', 'Pandas', 2)])
+
+        index = completer.get_index('extracted', session)
+
+        assert index.search('py') == [('Python', 3)]
+        assert completer.summary()['skills'] == {'extracted': 1, 'enhanced': 1}
+
+    def test_build_clears_stale(self):
+        """A rebuild started after the event clears the stale flag."""
+        completer = SkillAutocomplete()
+        completer.mark_stale()
+        assert completer.summary()['stale']
+
+        completer.build(self.stub_session([('extracted', 'Python', 3)]))
+        assert not completer.summary()['stale']
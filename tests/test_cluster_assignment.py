@@ -0,0 +1,58 @@
+"""
+Test the model lookup of the nightly cluster assignment task.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("celery")
+pytest.importorskip("hdbscan")
+
+from src.tasks import clustering_tasks
+
+
+class StubModelStore:
+    """Model store without any saved model."""
+
+    def has_model(self, pipeline_name):
+        return False
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    """Record run_clustering_task.delay() calls instead of queueing them."""
+    calls = []
+
+    def delay(*args, **kwargs):
+        calls.append((args, kwargs))
+        return SimpleNamespace(id='refit-task')
+
+    monkeypatch.setattr(clustering_tasks, 'ClusteringModelStore', StubModelStore)
+    monkeypatch.setattr(clustering_tasks.run_clustering_task, 'delay', delay)
+    return calls
+
+
+def use_mode(monkeypatch, mode):
+    settings = clustering_tasks.get_settings()
+    monkeypatch.setattr(clustering_tasks, 'get_settings', lambda: settings.model_copy(update={'cluster_mode': mode}))
+
+
+def test_microcluster_lineage_skipped(monkeypatch, queued):
+    """Micro-cluster runs save no model: nothing is assigned and no refit is queued."""
+    use_mode(monkeypatch, 'microcluster')
+
+    result = clustering_tasks.assign_new_skills_task('pipeline_a_30k_pre', 50, None)
+
+    assert result['status'] == 'skipped'
+    assert queued == []
+
+
+def test_missing_model_refits_exact(monkeypatch, queued):
+    """The first fit of a lineage runs in exact mode, which saves the model."""
+    use_mode(monkeypatch, 'exact')
+
+    result = clustering_tasks.assign_new_skills_task('pipeline_a_30k_pre', 50, 'CO')
+
+    assert result['status'] == 'refit_queued'
+    assert queued == [(('pipeline_a_30k_pre', 50, 'CO', None), {'mode': 'exact'})]
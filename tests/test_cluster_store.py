@@ -0,0 +1,88 @@
+"""
+Test the in-memory store of clustering result files.
+"""
+
+import os
+import json
+import pytest
+from api import cluster_store
+from api.cluster_store import ClusterResultStore
+
+
+def write_results(path, clusters):
+    """Write a minimal final/ results file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "metadata": {"created_at": "2026-01-01", "n_skills": 3, "algorithm": "hdbscan", "parameters": {}},
+        "metrics": {
+            "n_clusters": len(clusters), "n_samples": 3, "n_noise": 0, "noise_percentage": 0.0,
+            "silhouette_score": 0.5, "davies_bouldin_score": 1.0, "largest_cluster_size": 2,
+            "smallest_cluster_size": 1, "mean_cluster_size": 1.5
+        },
+        "clusters": clusters,
+        "skills": ["Python", "SQL", "Docker"],
+        "embedding_2d": [[0, 0], [1, 1], [2, 2]]
+    }), encoding="utf-8")
+
+
+class TestClusterResultStore:
+    """Test parse-once / reload-on-change behaviour."""
+
+    CLUSTERS = [
+        {"cluster_id": 0, "size": 2, "label": "Data", "top_skills": ["Python", "SQL"],
+         "all_skills": ["Python", "SQL"], "mean_frequency": 3.0},
+        {"cluster_id": 1, "size": 1, "auto_label": "DevOps", "top_skills": ["Docker"],
+         "all_skills": ["Docker"], "mean_frequency": 1.0},
+    ]
+
+    @pytest.fixture
+    def results_path(self, tmp_path, monkeypatch):
+        """Results file of config 'cfg' in a temporary clustering directory."""
+        monkeypatch.setattr(cluster_store, "CLUSTERING_DIR", tmp_path)
+        path = tmp_path / "final" / "cfg" / "cfg_final_results.json"
+        write_results(path, self.CLUSTERS)
+        return path
+
+    def test_parsed_once(self, results_path):
+        """Repeated requests reuse the parsed results."""
+        store = ClusterResultStore()
+        first = store.get("cfg")
+        second = store.get("cfg")
+
+        assert first is second
+        assert store.loads == 1
+        assert store.hits == 1
+
+    def test_reload_when_file_changes(self, results_path):
+        """A new size or mtime re-parses the file."""
+        store = ClusterResultStore()
+        first = store.get("cfg")
+
+        write_results(results_path, self.CLUSTERS[:1])
+        second = store.get("cfg")
+        assert second is not first
+        assert len(second.clusters) == 1
+
+        # Same size, new mtime
+        stat = results_path.stat()
+        os.utime(results_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        third = store.get("cfg")
+        assert third is not second
+        assert third.version != second.version
+        assert store.loads == 3
+
+    def test_include_skills(self, results_path):
+        """Member lists are only returned on request."""
+        results = ClusterResultStore().get("cfg")
+
+        assert all(c.all_skills is None for c in results.all_clusters())
+        assert [c.all_skills for c in results.all_clusters(include_skills=True)] == [["Python", "SQL"], ["Docker"]]
+        assert results.cluster(1).label == "DevOps"
+        assert results.cluster(1, include_skills=True).all_skills == ["Docker"]
+        assert results.cluster(1).all_skills is None
+        assert results.cluster(7) is None
+
+    def test_missing_config(self, results_path):
+        """Unknown configs raise FileNotFoundError (404 in the router)."""
+        with pytest.raises(FileNotFoundError):
+            ClusterResultStore().get("other")
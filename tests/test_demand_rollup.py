@@ -0,0 +1,48 @@
+"""
+Test the API filter translation of the skill demand rollups.
+"""
+
+import pytest
+from database.demand_rollup import demand_filter, resolve_extraction_method
+
+
+class TestDemandFilter:
+    """Test demand_filter() / resolve_extraction_method()."""
+
+    def test_extraction_methods(self):
+        """API extraction_method values map to a source and its methods."""
+        assert resolve_extraction_method(None) == ('extracted', None)
+        assert resolve_extraction_method('pipeline_a') == ('extracted', ('ner', 'regex'))
+        assert resolve_extraction_method('pipeline_b') == ('enhanced', None)
+        assert resolve_extraction_method('manual') == ('gold_standard', None)
+        assert resolve_extraction_method('unknown') == ('extracted', None)
+
+    def test_counts_filter(self):
+        """Filters become bound parameters over skill_demand_counts."""
+        where, params = demand_filter(
+            'extracted', ('ner',), country='co', skill_type='HARD', mapping_status='esco_mapped'
+        )
+
+        assert where.startswith("WHERE skill_demand_counts.source = :source")
+        assert "skill_demand_counts.extraction_method = ANY(:methods)" in where
+        assert "skill_demand_counts.esco_uri <> ''" in where
+        assert params == {'source': 'extracted', 'methods': ['ner'], 'country': 'CO', 'skill_type': 'hard'}
+
+    def test_ignored_values(self):
+        """Unknown skill types and mapping statuses do not filter."""
+        where, params = demand_filter('enhanced', skill_type='other', mapping_status='all')
+
+        assert where == "WHERE skill_demand_counts.source = :source"
+        assert params == {'source': 'enhanced'}
+
+    def test_profile_filter(self):
+        """job_status and the ESCO flag use job_skill_profile's columns."""
+        where, _ = demand_filter('extracted', mapping_status='unmapped', job_status='cleaned', profile=True)
+
+        assert "NOT (job_skill_profile.has_esco)" in where
+        assert "cj.job_id = job_skill_profile.job_id" in where
+
+    def test_job_status_needs_profile(self):
+        """job_status is per job: not available on skill_demand_counts."""
+        with pytest.raises(ValueError):
+            demand_filter('extracted', job_status='golden')
@@ -0,0 +1,66 @@
+"""
+Test embedding snapshot export/load round trip.
+"""
+
+import pytest
+import numpy as np
+from embedder.snapshot import SnapshotWriter, load_snapshot
+
+
+class TestEmbeddingSnapshot:
+    """Test versioned memory-mapped embedding snapshots."""
+
+    @pytest.fixture
+    def snapshot_dir(self, tmp_path):
+        """Write a small two-batch snapshot."""
+        rng = np.random.default_rng(0)
+        self.vectors = rng.standard_normal((5, 8)).astype(np.float32)
+        writer = SnapshotWriter(tmp_path, n_rows=5, dim=8, version='v1')
+        writer.write_batch(['Python', 'SQL', 'Docker'], self.vectors[:3], [10, 5, 3],
+                           ['hard', 'hard', 'hard'])
+        writer.write_batch(['Liderazgo', 'Git'], self.vectors[3:], [2, 1], ['soft', 'hard'])
+        writer.close()
+        return tmp_path
+
+    def test_round_trip(self, snapshot_dir):
+        """Vectors and metadata come back aligned and memory-mapped."""
+        snapshot = load_snapshot('latest', base_dir=snapshot_dir)
+
+        assert snapshot.version == 'v1'
+        assert len(snapshot) == 5
+        assert isinstance(snapshot.embeddings, np.memmap)
+        assert snapshot.skill_texts == ['Python', 'SQL', 'Docker', 'Liderazgo', 'Git']
+        assert snapshot.frequencies.tolist() == [10, 5, 3, 2, 1]
+        np.testing.assert_array_equal(snapshot.as_float32(), self.vectors)
+
+    def test_select_matches_case_insensitive(self, snapshot_dir):
+        """select() follows the caller's order and skips unknown skills."""
+        snapshot = load_snapshot('v1', base_dir=snapshot_dir)
+
+        embeddings, found, indices = snapshot.select([' git', 'Kotlin', 'python'])
+
+        assert found == [' git', 'python']
+        assert indices == [0, 2]
+        np.testing.assert_array_equal(embeddings, self.vectors[[4, 0]])
+
+    def test_incomplete_snapshot_rejected(self, tmp_path):
+        """close() refuses to publish a partially written snapshot."""
+        writer = SnapshotWriter(tmp_path, n_rows=3, dim=4, version='partial')
+        writer.write_batch(['a'], np.zeros((1, 4)))
+
+        with pytest.raises(ValueError):
+            writer.close()
+
+    def test_int8_snapshot_dequantizes(self, tmp_path):
+        """int8 snapshots store per-vector scales and return float32 on read."""
+        vectors = np.random.default_rng(1).standard_normal((4, 16)).astype(np.float32)
+        writer = SnapshotWriter(tmp_path, n_rows=4, dim=16, version='q8', dtype='int8')
+        writer.write_batch(['a', 'b', 'c', 'd'], vectors)
+        writer.close()
+
+        snapshot = load_snapshot('q8', base_dir=tmp_path)
+
+        assert snapshot.embeddings.dtype == np.int8
+        restored = snapshot.as_float32()
+        assert restored.dtype == np.float32
+        np.testing.assert_allclose(restored, vectors, atol=np.abs(vectors).max() / 127)
@@ -0,0 +1,58 @@
+"""
+Test the tasks queued by the skills_extracted event handler.
+"""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src.events import handlers
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    """Record the enhancement and cube-refresh tasks instead of queueing them."""
+    calls = {'enhance': [], 'refresh': []}
+
+    def enhance_delay(job_id):
+        calls['enhance'].append(job_id)
+        return SimpleNamespace(id=f'enhance-{job_id}')
+
+    def refresh_apply_async(countdown=None):
+        calls['refresh'].append(countdown)
+        return SimpleNamespace(id='refresh')
+
+    monkeypatch.setitem(sys.modules, 'src.tasks.enhancement_tasks', SimpleNamespace(
+        enhance_job_task=SimpleNamespace(delay=enhance_delay)
+    ))
+    monkeypatch.setitem(sys.modules, 'src.tasks.extraction_tasks', SimpleNamespace(
+        refresh_skill_period_counts_task=SimpleNamespace(apply_async=refresh_apply_async)
+    ))
+    monkeypatch.setattr(handlers, '_period_counts_refresh_due', 0.0)
+    return calls
+
+
+def extracted(job_id):
+    return {'event': 'skills_extracted', 'data': {'job_id': job_id, 'skills_count': 3}}
+
+
+def test_refresh_queued_once_per_window(queued):
+    """Every job is enhanced; the cube refresh is queued once for the burst."""
+    for job_id in ('a', 'b', 'c'):
+        handlers.handle_skills_extracted(extracted(job_id))
+
+    assert queued['enhance'] == ['a', 'b', 'c']
+    assert queued['refresh'] == [handlers.PERIOD_COUNTS_REFRESH_DELAY]
+
+
+def test_refresh_queued_again_after_window(queued, monkeypatch):
+    """Extractions after the pending refresh has started queue another one."""
+    now = [1000.0]
+    monkeypatch.setattr(handlers.time, 'time', lambda: now[0])
+
+    handlers.handle_skills_extracted(extracted('a'))
+    now[0] += handlers.PERIOD_COUNTS_REFRESH_DELAY + 1
+    handlers.handle_skills_extracted(extracted('b'))
+
+    assert len(queued['refresh']) == 2
@@ -0,0 +1,160 @@
+"""
+Test conditional GET (ETag / If-None-Match) and response compression.
+"""
+
+import json
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from api import http_cache
+from api.http_cache import (
+    ConditionalCompressionMiddleware,
+    FastJSONResponse,
+    accepted_encodings,
+    mark_uncacheable,
+    set_data_version,
+)
+
+LARGE = {'skills': ['Python'] * 500}
+
+
+@pytest.fixture
+def state():
+    return {'version': 'v1'}
+
+
+@pytest.fixture
+def client(state):
+    app = FastAPI()
+
+    @app.get('/versioned', response_class=FastJSONResponse)
+    def versioned(limit: int = 10):
+        set_data_version(state['version'])
+        return LARGE
+
+    @app.get('/small')
+    async def small():
+        set_data_version(state['version'])
+        return {'ok': True}
+
+    @app.get('/unversioned')
+    def unversioned():
+        return LARGE
+
+    @app.get('/stale')
+    def stale():
+        set_data_version(state['version'])
+        mark_uncacheable()
+        return LARGE
+
+    @app.get('/missing')
+    def missing():
+        set_data_version(state['version'])
+        raise HTTPException(status_code=404, detail='Not found')
+
+    @app.get('/stream')
+    def stream():
+        def chunks():
+            for i in range(3):
+                yield b'x' * 1000
+        return StreamingResponse(chunks(), media_type='text/plain')
+
+    app.add_middleware(ConditionalCompressionMiddleware, minimum_size=1024)
+    return TestClient(app)
+
+
+class TestConditionalGet:
+    """Test ETags and 304 responses."""
+
+    def test_not_modified(self, client):
+        """A matching If-None-Match gets 304 with no body."""
+        first = client.get('/versioned', headers={'Accept-Encoding': 'gzip'})
+        etag = first.headers['etag']
+        assert first.headers['cache-control'] == 'no-cache'
+
+        second = client.get('/versioned', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        assert second.status_code == 304
+        assert second.content == b''
+        assert second.headers['etag'] == etag
+        assert 'content-encoding' not in second.headers
+
+    def test_etag_follows_version_and_query(self, client, state):
+        """New data or other parameters give another ETag."""
+        etag = client.get('/versioned').headers['etag']
+        assert client.get('/versioned', params={'limit': 20}).headers['etag'] != etag
+
+        state['version'] = 'v2'
+        response = client.get('/versioned', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['etag'] != etag
+
+    def test_etag_per_encoding(self, client):
+        """A compressed representation has its own ETag."""
+        plain = client.get('/versioned', headers={'Accept-Encoding': 'identity'}).headers['etag']
+        gzipped = client.get('/versioned', headers={'Accept-Encoding': 'gzip'}).headers['etag']
+        assert plain != gzipped
+
+        response = client.get('/versioned', headers={'Accept-Encoding': 'identity', 'If-None-Match': gzipped})
+        assert response.status_code == 200
+
+    def test_no_validator(self, client):
+        """No ETag without a version, for stale payloads or for errors."""
+        assert 'etag' not in client.get('/unversioned').headers
+        assert 'etag' not in client.get('/stale').headers
+        response = client.get('/missing')
+        assert response.status_code == 404
+        assert 'etag' not in response.headers
+
+
+class TestCompression:
+    """Test gzip/brotli content encoding."""
+
+    def test_gzip(self, client):
+        response = client.get('/versioned', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['content-encoding'] == 'gzip'
+        assert 'accept-encoding' in response.headers['vary'].lower()
+        assert response.json() == LARGE
+        assert int(response.headers['content-length']) < len(FastJSONResponse(LARGE).body)
+
+    def test_brotli_preferred(self, client):
+        pytest.importorskip('brotli')
+        response = client.get('/versioned', headers={'Accept-Encoding': 'gzip, br'})
+        assert response.headers['content-encoding'] == 'br'
+
+    def test_gzip_without_brotli(self, client, monkeypatch):
+        monkeypatch.setattr(http_cache, 'BROTLI_AVAILABLE', False)
+        response = client.get('/versioned', headers={'Accept-Encoding': 'gzip, br'})
+        assert response.headers['content-encoding'] == 'gzip'
+
+    def test_small_and_identity(self, client):
+        """Small bodies and clients without gzip/br get the body as is."""
+        small = client.get('/small', headers={'Accept-Encoding': 'gzip'})
+        assert 'content-encoding' not in small.headers
+        assert 'etag' in small.headers
+
+        plain = client.get('/versioned', headers={'Accept-Encoding': 'gzip;q=0'})
+        assert 'content-encoding' not in plain.headers
+
+    def test_streaming_passthrough(self, client):
+        """Streaming bodies are forwarded untouched."""
+        response = client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+        assert response.content == b'x' * 3000
+        assert 'content-encoding' not in response.headers
+
+
+class TestFastJSONResponse:
+    """Test orjson rendering and its json fallback."""
+
+    def test_fallback_renders_same_json(self, monkeypatch):
+        content = {'skill': 'Programación', 'counts': {1: 2}}
+        fast = json.loads(FastJSONResponse(content).body)
+        monkeypatch.setattr(http_cache, 'ORJSON_AVAILABLE', False)
+        assert json.loads(FastJSONResponse(content).body) == fast == {'skill': 'Programación', 'counts': {'1': 2}}
+
+
+def test_accepted_encodings():
+    """q=0 refuses a coding; parameters and case are ignored."""
+    assert accepted_encodings('GZip;q=0.5, br;q=0, zstd') == {'gzip', 'zstd'}
+    assert accepted_encodings(None) == set()
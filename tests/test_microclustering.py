@@ -0,0 +1,25 @@
+"""
+Test the streamed micro-cluster fit.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("hdbscan")
+pytest.importorskip("umap")
+
+from analyzer.microclustering import MicroClusterer
+
+
+def test_batches_smaller_than_k():
+    """Batches are buffered until the first partial_fit has k rows."""
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(4, 32))
+    embeddings = (centers[rng.integers(0, 4, size=600)] + 0.05 * rng.normal(size=(600, 32))).astype(np.float32)
+
+    micro = MicroClusterer(n_micro_clusters=120, n_components=8, batch_size=50, min_cluster_size=5)
+    labels = micro.fit_predict(embeddings, np.ones(600))
+
+    assert labels.shape == (600,)
+    assert 0 < len(micro.micro_centroids_) <= 120
+    assert micro.micro_labels_.max() == len(micro.micro_centroids_) - 1
@@ -0,0 +1,68 @@
+"""
+Test the ESCO EntityRuler patterns of the NER extractor.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+pytest.importorskip("spacy")
+
+from extractor.ner_extractor import NERExtractor
+
+
+class StubCursor:
+    """Cursor whose result set is consumed by the first fetchall(), like psycopg2's."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def execute(self, sql, params=None):
+        pass
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+
+class TestESCOPatterns:
+    """Test the ESCO query → EntityRuler patterns path."""
+
+    ROWS = [('Python', 'Python'), ('base de datos', 'database'), ('aprendizaje automático', 'machine learning')]
+
+    @pytest.fixture
+    def extractor(self):
+        """NERExtractor without loading a spaCy model."""
+        return NERExtractor.__new__(NERExtractor)
+
+    def test_query_returns_rows(self, extractor):
+        """The queried skills reach the caller (result set read once)."""
+        conn = MagicMock()
+        conn.__enter__.return_value.cursor.return_value = StubCursor(self.ROWS)
+
+        with patch('psycopg2.connect', return_value=conn):
+            esco_skills = extractor._query_tech_skills('postgres://stub')
+
+        assert esco_skills == self.ROWS
+
+    def test_patterns_from_query(self, extractor):
+        """Every label becomes a pattern, multi-word labels also token patterns."""
+        conn = MagicMock()
+        conn.__enter__.return_value.cursor.return_value = StubCursor(self.ROWS)
+
+        with patch('psycopg2.connect', return_value=conn):
+            patterns = NERExtractor._esco_patterns(extractor._query_tech_skills('postgres://stub'))
+
+        assert patterns
+        assert {"label": "TECH_SKILL", "pattern": [{"LOWER": "python"}]} in patterns
+        assert {"label": "TECH_SKILL", "pattern": [{"LOWER": "machine"}, {"LOWER": "learning"}]} in patterns
+        # Same ES/EN label: one pattern only
+        assert sum(p["pattern"] == [{"LOWER": "python"}] for p in patterns) == 1
+
+    def test_empty_cache_is_a_miss(self, tmp_path):
+        """A cached empty skill list is queried again."""
+        cache_path = tmp_path / 'esco_tech_skills.json'
+        NERExtractor._write_tech_skills_cache(cache_path, 'abc', [])
+        assert NERExtractor._read_tech_skills_cache(cache_path, 'abc') is None
+
+        NERExtractor._write_tech_skills_cache(cache_path, 'abc', self.ROWS)
+        assert NERExtractor._read_tech_skills_cache(cache_path, 'abc') == self.ROWS
@@ -0,0 +1,101 @@
+"""
+Test keyset pagination cursors and listing totals.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import column, select, table
+
+from api import pagination
+from api.cache import JOB_EVENTS, ResponseCache
+from api.pagination import decode_cursor, encode_cursor, estimated_count, query_total
+
+
+class TestCursor:
+    """Test cursor encoding and decoding."""
+
+    def test_round_trip(self):
+        """Datetimes and UUIDs come back as their string forms."""
+        job_id = UUID('12345678-1234-5678-1234-567812345678')
+        cursor = encode_cursor([datetime(2026, 1, 2, 3, 4, 5), job_id])
+
+        assert '=' not in cursor and '/' not in cursor and '+' not in cursor
+        assert decode_cursor(cursor, 2) == ['2026-01-02T03:04:05', str(job_id)]
+
+    def test_numbers_and_text(self):
+        """Counts and skill texts (any unicode) survive the round trip."""
+        cursor = encode_cursor([120, 'Programación orientada a objetos'])
+        assert decode_cursor(cursor, 2) == [120, 'Programación orientada a objetos']
+
+    @pytest.mark.parametrize('cursor', ['not a cursor!', 'e30', encode_cursor(['only one'])])
+    def test_invalid_cursor(self, cursor):
+        """Garbage, non-list payloads and wrong key sizes are HTTP 400."""
+        with pytest.raises(HTTPException) as excinfo:
+            decode_cursor(cursor, 2)
+        assert excinfo.value.status_code == 400
+
+
+class StubSession:
+    """AsyncSession stand-in returning a fixed EXPLAIN plan."""
+
+    def __init__(self, plan_rows):
+        self.plan = json.dumps([{'Plan': {'Plan Rows': plan_rows}}])
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append((str(statement), params))
+        return SimpleNamespace(scalar=lambda: self.plan)
+
+
+class TestTotals:
+    """Test estimated and exact totals."""
+
+    def test_estimated_count_of_select(self):
+        """Selects are rendered with named params inside EXPLAIN."""
+        jobs = table('raw_jobs', column('job_id'), column('country'))
+        session = StubSession(4200)
+
+        total = asyncio.run(estimated_count(session, select(jobs.c.job_id).where(jobs.c.country == 'CO')))
+
+        assert total == 4200
+        sql, params = session.statements[0]
+        assert sql.startswith('EXPLAIN (FORMAT JSON) SELECT')
+        assert list(params.values()) == ['CO']
+
+    def test_query_total(self, monkeypatch):
+        """Estimates unless exact; exact counts are cached per filters until an event."""
+        cache = ResponseCache()
+        monkeypatch.setattr(pagination, 'get_settings', lambda: SimpleNamespace(api_cache_enabled=True))
+        monkeypatch.setattr(pagination, 'get_response_cache', lambda: cache)
+        calls = []
+
+        async def exact_count():
+            calls.append(1)
+            return 17
+
+        async def estimate():
+            return 20
+
+        def total(exact):
+            return asyncio.run(query_total('jobs', {'country': 'CO'}, exact, exact_count, estimate, JOB_EVENTS))
+
+        assert total(False) == (20, True)
+        assert total(True) == (17, False)
+        assert total(True) == (17, False)
+        assert len(calls) == 1
+
+        cache.invalidate('jobs_scraped')
+        total(True)
+        assert len(calls) == 2
+
+        # cleaned_jobs backs job_status=cleaned and search=
+        cache.invalidate('jobs_cleaned')
+        total(True)
+        assert len(calls) == 3
+        cache._executor.shutdown(wait=True)
@@ -0,0 +1,122 @@
+"""
+Test the API response cache (event invalidation, stale-while-revalidate).
+"""
+
+import asyncio
+import time
+import pytest
+from api.cache import ResponseCache, normalize_params
+
+EVENTS = ('skills_extracted',)
+
+
+class Counter:
+    """compute() callable returning an increasing payload."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {'n': self.calls}
+
+    async def async_call(self):
+        return self()
+
+
+class TestResponseCache:
+    """Test ResponseCache lookups without Redis."""
+
+    @pytest.fixture
+    def cache(self):
+        cache = ResponseCache(max_entries=3, ttl_seconds=600, max_stale_seconds=3600)
+        yield cache
+        cache._executor.shutdown(wait=True)
+
+    def test_hit(self, cache):
+        """A fresh entry is served without computing again."""
+        compute = Counter()
+        assert cache.get_or_compute('k', EVENTS, compute) == {'n': 1}
+        assert cache.get_or_compute('k', EVENTS, compute) == {'n': 1}
+        assert compute.calls == 1
+        assert cache.stats['hits'] == 1
+
+    def test_event_invalidates_dependent_entries(self, cache):
+        """Only entries depending on the event become stale."""
+        compute, other = Counter(), Counter()
+        cache.get_or_compute('k', EVENTS, compute)
+        cache.get_or_compute('other', ('jobs_scraped',), other)
+
+        cache.invalidate('skills_extracted')
+
+        assert cache.get_or_compute('k', EVENTS, compute) == {'n': 2}
+        assert cache.get_or_compute('other', ('jobs_scraped',), other) == {'n': 1}
+
+    def test_stale_while_revalidate(self, cache):
+        """A stale entry is served once while a background refresh recomputes it."""
+        compute, background = Counter(), Counter()
+        cache.get_or_compute('k', EVENTS, compute, background)
+        cache.invalidate('skills_extracted')
+
+        assert cache.get_or_compute('k', EVENTS, compute, background) == {'n': 1}
+        assert cache.stats['stale_hits'] == 1
+
+        cache._executor.shutdown(wait=True)
+        assert background.calls == 1
+        assert cache.get_or_compute('k', EVENTS, compute, background) == {'n': 1}
+        assert compute.calls == 1
+
+    def test_too_stale_is_recomputed(self, cache):
+        """Entries past TTL + max stale are recomputed in the request."""
+        compute, background = Counter(), Counter()
+        cache._put_local('k', time.time() - 600 - 3600 - 1, {'n': 0})
+
+        assert cache.get_or_compute('k', EVENTS, compute, background) == {'n': 1}
+        assert background.calls == 0
+
+    def test_ttl_expiry(self, cache):
+        """Entries older than the TTL are stale even without events."""
+        compute = Counter()
+        cache._put_local('k', time.time() - 601, {'n': 0})
+
+        assert cache.get_or_compute('k', EVENTS, compute) == {'n': 1}
+
+    def test_async_stale_while_revalidate(self, cache):
+        """Async lookups refresh stale entries as event loop tasks."""
+        compute, background = Counter(), Counter()
+
+        async def scenario():
+            await cache.get_or_compute_async('k', EVENTS, compute.async_call, background.async_call)
+            cache.invalidate('skills_extracted')
+            stale = await cache.get_or_compute_async('k', EVENTS, compute.async_call, background.async_call)
+            await asyncio.gather(*cache._tasks)
+            fresh = await cache.get_or_compute_async('k', EVENTS, compute.async_call, background.async_call)
+            return stale, fresh
+
+        stale, fresh = asyncio.run(scenario())
+        assert stale == {'n': 1}
+        assert fresh == {'n': 1}
+        assert background.calls == 1
+        assert compute.calls == 1
+
+    def test_lru_eviction(self, cache):
+        """The least recently used entry goes first."""
+        for key in ('a', 'b', 'c'):
+            cache.get_or_compute(key, EVENTS, Counter())
+        cache.get_or_compute('a', EVENTS, Counter())
+        cache.get_or_compute('d', EVENTS, Counter())
+
+        assert list(cache._data) == ['c', 'a', 'd']
+
+    def test_data_version_changes_with_events(self, cache):
+        """The ETag version follows the endpoint's events only."""
+        before = cache.data_version(EVENTS)
+        cache.invalidate('jobs_scraped', version='t1')
+        assert cache.data_version(EVENTS) == before
+        cache.invalidate('skills_extracted', version='t2')
+        assert cache.data_version(EVENTS) != before
+
+
+def test_normalize_params():
+    """Empty values are dropped, strings trimmed, keys sorted."""
+    assert normalize_params({'b': ' CO ', 'a': 1, 'c': None, 'd': ''}) == normalize_params({'a': 1, 'b': 'CO'})
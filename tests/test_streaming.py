@@ -0,0 +1,110 @@
+"""
+Test the encoders of the streaming bulk exports.
+"""
+
+import csv
+import gzip
+import io
+import json
+from datetime import date
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from api import streaming
+from api.streaming import RowEncoder, _compressor, negotiate_encoding
+
+COLUMNS = [
+    ('job_id', pa.string()),
+    ('skill_text', pa.string()),
+    ('posted_date', pa.date32()),
+    ('mention_count', pa.int64()),
+]
+
+JOB_ID = UUID('12345678-1234-5678-1234-567812345678')
+BATCHES = [
+    [(JOB_ID, 'Python', date(2026, 1, 2), 3), (JOB_ID, 'SQL', None, 1)],
+    [(JOB_ID, 'Programación', date(2026, 2, 1), 2)],
+]
+
+
+def export(export_format, batches):
+    encoder = RowEncoder(export_format, COLUMNS)
+    return b''.join(encoder.encode(batch) for batch in batches) + encoder.finish()
+
+
+class TestRowEncoder:
+    """Test NDJSON, CSV and Parquet output."""
+
+    def test_ndjson(self):
+        """One object per row; UUIDs and dates as strings."""
+        lines = export('ndjson', BATCHES).decode('utf-8').splitlines()
+
+        assert len(lines) == 3
+        assert json.loads(lines[0]) == {
+            'job_id': str(JOB_ID), 'skill_text': 'Python', 'posted_date': '2026-01-02', 'mention_count': 3
+        }
+        assert json.loads(lines[1])['posted_date'] is None
+
+    def test_csv(self):
+        """Header once, then the rows of every batch."""
+        rows = list(csv.reader(io.StringIO(export('csv', BATCHES).decode('utf-8'))))
+
+        assert rows[0] == ['job_id', 'skill_text', 'posted_date', 'mention_count']
+        assert rows[1:] == [
+            [str(JOB_ID), 'Python', '2026-01-02', '3'],
+            [str(JOB_ID), 'SQL', '', '1'],
+            [str(JOB_ID), 'Programación', '2026-02-01', '2'],
+        ]
+
+    def test_empty_csv_has_header(self):
+        """An export without rows is still a valid CSV with its header."""
+        rows = list(csv.reader(io.StringIO(export('csv', []).decode('utf-8'))))
+        assert rows == [['job_id', 'skill_text', 'posted_date', 'mention_count']]
+
+    def test_parquet_row_group_per_batch(self):
+        """Each batch is written (and sent) as its own row group."""
+        encoder = RowEncoder('parquet', COLUMNS)
+        chunks = [encoder.encode(batch) for batch in BATCHES]
+        data = b''.join(chunks) + encoder.finish()
+
+        assert all(chunks)  # bytes leave the encoder batch by batch
+        parquet = pq.ParquetFile(io.BytesIO(data))
+        assert parquet.num_row_groups == 2
+        assert parquet.metadata.row_group(0).column(0).compression == 'ZSTD'
+        table = parquet.read()
+        assert table.schema == pa.schema(COLUMNS)
+        assert table.column('skill_text').to_pylist() == ['Python', 'SQL', 'Programación']
+        assert table.column('job_id').to_pylist() == [str(JOB_ID)] * 3
+
+    def test_empty_parquet(self):
+        """An export without rows is a valid Parquet file with the schema."""
+        table = pq.read_table(io.BytesIO(export('parquet', [])))
+        assert table.num_rows == 0
+        assert table.schema == pa.schema(COLUMNS)
+
+
+class TestEncoding:
+    """Test Content-Encoding negotiation and compressors."""
+
+    def test_negotiate(self, monkeypatch):
+        monkeypatch.setattr(streaming, 'ZSTD_AVAILABLE', True)
+        assert negotiate_encoding('gzip, zstd', 'csv') == 'zstd'
+        assert negotiate_encoding('gzip, zstd;q=0', 'csv') == 'gzip'
+        assert negotiate_encoding('*', 'ndjson') == 'gzip'
+        assert negotiate_encoding(None, 'csv') is None
+        assert negotiate_encoding('zstd, gzip', 'parquet') is None  # already compressed
+
+    def test_gzip_stream(self):
+        """Chunks compressed one by one decode as a single gzip member."""
+        compressor = _compressor('gzip')
+        body = b''.join(compressor.compress(chunk) for chunk in (b'a,b\n', b'1,2\n')) + compressor.flush()
+        assert gzip.decompress(body) == b'a,b\n1,2\n'
+
+    def test_zstd_stream(self):
+        zstandard = pytest.importorskip('zstandard')
+        compressor = _compressor('zstd')
+        body = compressor.compress(b'a,b\n1,2\n') + compressor.flush()
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(body) == b'a,b\n1,2\n'